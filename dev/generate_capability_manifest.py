@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+"""Script to generate the capability manifest of the plugin implementations that is shipped with the package.
+
+All plugin packages have to be installed, i.e., install with ``pip install -e .[all_plugins]`` before running it.
+"""
+
+
+def main():
+    """Generate the capability manifest and write it to the package."""
+    import json
+
+    from aiida import load_profile
+    from aiida_common_workflows.plugins.manifest import MANIFEST_FILEPATH, generate_capability_manifest
+
+    load_profile()
+
+    manifest = generate_capability_manifest()
+
+    with MANIFEST_FILEPATH.open('w', encoding='utf-8') as handle:
+        json.dump(manifest, handle, indent=2, ensure_ascii=False)
+        handle.write('\n')
+
+    print(f'Capability manifest with {len(manifest)} entries written to `{MANIFEST_FILEPATH}`.')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,21 @@
-"""Module for the command line interface."""
-from .launch import cmd_launch  # noqa: F401
-from .plot import cmd_plot  # noqa: F401
+"""Module for the command line interface.
+
+The subcommands of ``cmd_root`` are loaded lazily, so importing this module does not import the modules that define
+them. The ``cmd_launch`` and ``cmd_plot`` groups remain accessible as attributes and are only imported when accessed.
+"""
+import importlib
+
 from .root import cmd_root  # noqa: F401
+
+_LAZY_ATTRIBUTES = {
+    'cmd_launch': '.launch',
+    'cmd_plot': '.plot',
+}
+
+
+def __getattr__(name):
+    """Import the lazily loaded command groups upon first access."""
+    if name in _LAZY_ATTRIBUTES:
+        return getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
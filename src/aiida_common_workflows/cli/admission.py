@@ -0,0 +1,103 @@
+"""Commands to manage the quotas of the admission controller of the sub processes of the common workflows."""
+import click
+from aiida.cmdline.groups import VerdiCommandGroup
+from aiida.cmdline.utils import echo
+
+KIND = click.Choice(('computer', 'code', 'user'))
+
+
+def get_identifier(kind, value):
+    """Return the identifier of the resource of the given kind that is used by the admission controller.
+
+    :param kind: the kind of resource.
+    :param value: the label, pk or UUID of the computer or code, or the email of the user.
+    :raises click.BadParameter: if the resource cannot be loaded.
+    """
+    from aiida import orm
+    from aiida.common import exceptions
+
+    try:
+        if kind == 'computer':
+            return orm.load_computer(value).uuid
+        if kind == 'code':
+            return orm.load_code(value).uuid
+        return orm.User.collection.get(email=value).email
+    except (exceptions.NotExistent, exceptions.MultipleObjectsError) as exception:
+        raise click.BadParameter(f'could not load the {kind} `{value}`: {exception}', param_hint='IDENTIFIER')
+
+
+def get_label(kind, identifier):
+    """Return a human readable label of the resource of the given kind with the given identifier."""
+    from aiida import orm
+    from aiida.common import exceptions
+
+    try:
+        if kind == 'computer':
+            return orm.load_computer(identifier).label
+        if kind == 'code':
+            return orm.load_code(identifier).full_label
+    except exceptions.NotExistent:
+        pass
+
+    return identifier
+
+
+@click.group('admission', cls=VerdiCommandGroup)
+def cmd_admission():
+    """Manage the quotas on the number of active sub processes of the common workflows.
+
+    The equation of state and dissociation curve workflows only submit a sub process once it is admitted by the quotas
+    of the computers and codes it uses and of the user, counted over all workflows. Otherwise, they wait until one of
+    the active sub processes that hold the quota terminates.
+    """
+
+
+@cmd_admission.command('show')
+def cmd_admission_show():
+    """Show the quotas and the number of active sub processes that hold them."""
+    from tabulate import tabulate
+
+    from aiida_common_workflows.common.admission import get_quotas, get_usage
+
+    quotas = get_quotas()
+    usage = get_usage()
+    rows = [
+        (kind, get_label(kind, identifier), quota, len(usage[kind].get(identifier, [])))
+        for kind, entries in quotas.items()
+        for identifier, quota in sorted(entries.items())
+    ]
+
+    if not rows:
+        echo.echo_report('no quotas are defined.')
+        return
+
+    click.echo(tabulate(rows, headers=['Kind', 'Resource', 'Quota', 'Active']))
+
+
+@cmd_admission.command('set')
+@click.argument('kind', type=KIND)
+@click.argument('identifier', type=click.STRING)
+@click.argument('quota', type=click.IntRange(min=1))
+def cmd_admission_set(kind, identifier, quota):
+    """Set the QUOTA of active sub processes of a computer, code or user.
+
+    The IDENTIFIER is the label, pk or UUID of a computer or code, or the email of a user.
+    """
+    from aiida_common_workflows.common.admission import set_quota
+
+    set_quota(kind, get_identifier(kind, identifier), quota)
+    echo.echo_success(f'set the quota of the {kind} `{identifier}` to {quota}.')
+
+
+@cmd_admission.command('unset')
+@click.argument('kind', type=KIND)
+@click.argument('identifier', type=click.STRING)
+def cmd_admission_unset(kind, identifier):
+    """Remove the quota of a computer, code or user.
+
+    The IDENTIFIER is the label, pk or UUID of a computer or code, or the email of a user.
+    """
+    from aiida_common_workflows.common.admission import set_quota
+
+    set_quota(kind, get_identifier(kind, identifier), None)
+    echo.echo_success(f'removed the quota of the {kind} `{identifier}`.')
@@ -0,0 +1,42 @@
+"""Command to compare the results of workflows computed with different codes."""
+import click
+from aiida.cmdline.params import types
+from aiida.cmdline.utils import echo
+
+from . import options
+
+
+@click.command('compare')
+@click.argument('group_a', type=types.GroupParamType())
+@click.argument('group_b', type=types.GroupParamType())
+@options.OUTPUT_FILE(help='Write the comparison to this file instead of printing it.')
+@options.EXPORT_FORMAT()
+def cmd_compare(group_a, group_b, output_file, file_format):
+    """Compare the `EquationOfStateWorkChain` workflows in GROUP_A with those in GROUP_B.
+
+    The workflows of both groups, typically run with two different codes, are paired by their input structure. For each
+    pair the Δ-factor (meV/atom), the nu and ε metrics and the relative differences of the equilibrium volume (V0), the
+    bulk modulus (B0) and its pressure derivative (B1) are computed. The Birch-Murnaghan fit of each workflow is cached
+    in its extras, such that subsequent comparisons only need to fit new workflows.
+    """
+    from tabulate import tabulate
+
+    from aiida_common_workflows.common.comparison import compare_eos
+    from aiida_common_workflows.common.export import write_columns
+
+    columns = compare_eos(group_a, group_b)
+
+    if not len(columns['formula']):
+        echo.echo_critical(
+            f'no pairs of successfully fitted workflows found in `{group_a.label}` and `{group_b.label}`.'
+        )
+
+    if output_file is not None:
+        try:
+            write_columns(columns, output_file, file_format)
+        except (ImportError, ValueError) as exception:
+            echo.echo_critical(str(exception))
+        echo.echo_success(f'Comparison of {len(columns["formula"])} pairs written to {output_file}')
+    else:
+        rows = zip(*(column.tolist() for column in columns.values()))
+        click.echo(tabulate(rows, headers=list(columns), floatfmt='.4f'))
@@ -0,0 +1,73 @@
+"""Commands to export the results of many workflows."""
+import click
+from aiida.cmdline.groups import VerdiCommandGroup
+from aiida.cmdline.params import options as options_core
+from aiida.cmdline.utils import echo
+
+from . import options
+
+
+@click.group('export', cls=VerdiCommandGroup)
+def cmd_export():
+    """Export the results of many workflows to a columnar file."""
+
+
+def export_workflows(get_data, workflows, group, output_file, file_format):
+    """Export the data of the given workflows or the workflows in the given group to a columnar file.
+
+    :param get_data: the function of :mod:`aiida_common_workflows.common.export` that returns the columns.
+    :param workflows: tuple of workflow pks.
+    :param group: optional group containing the workflows.
+    :param output_file: the path of the file to write.
+    :param file_format: optional file format, otherwise it is determined from the extension of the output file.
+    """
+    from aiida_common_workflows.common.export import write_columns
+
+    if not workflows and group is None:
+        raise click.UsageError('specify the workflows either by their pks or with the `--group` option.')
+
+    if workflows and group is not None:
+        raise click.UsageError('specify the workflows either by their pks or with the `--group` option, not both.')
+
+    try:
+        columns = get_data(group if group is not None else workflows)
+        write_columns(columns, output_file, file_format)
+    except (ImportError, ValueError) as exception:
+        echo.echo_critical(str(exception))
+
+    number_workflows = len(set(columns['workflow'].tolist()))
+    echo.echo_success(f'Exported {len(columns["workflow"])} points of {number_workflows} workflows to {output_file}')
+
+
+@cmd_export.command('eos')
+@click.argument('workflows', nargs=-1, type=click.INT)
+@options_core.GROUP(help='Export all `EquationOfStateWorkChain` workflows contained in this group.')
+@options.OUTPUT_FILE(required=True)
+@options.EXPORT_FORMAT()
+def cmd_export_eos(workflows, group, output_file, file_format):
+    """Export the volumes, energies and magnetizations of `EquationOfStateWorkChain` workflows.
+
+    The workflows are specified either by their pks as WORKFLOWS or by a group with the `--group` option. The output
+    contains a row for each point of each workflow with the columns `workflow`, `index`, `volume`, `energy` and
+    `magnetization`, sorted by workflow and volume.
+    """
+    from aiida_common_workflows.common.export import get_eos_data
+
+    export_workflows(get_eos_data, workflows, group, output_file, file_format)
+
+
+@cmd_export.command('dissociation-curve')
+@click.argument('workflows', nargs=-1, type=click.INT)
+@options_core.GROUP(help='Export all `DissociationCurveWorkChain` workflows contained in this group.')
+@options.OUTPUT_FILE(required=True)
+@options.EXPORT_FORMAT()
+def cmd_export_dissociation_curve(workflows, group, output_file, file_format):
+    """Export the distances, energies and magnetizations of `DissociationCurveWorkChain` workflows.
+
+    The workflows are specified either by their pks as WORKFLOWS or by a group with the `--group` option. The output
+    contains a row for each point of each workflow with the columns `workflow`, `index`, `distance`, `energy` and
+    `magnetization`, sorted by workflow and distance.
+    """
+    from aiida_common_workflows.common.export import get_dissociation_curve_data
+
+    export_workflows(get_dissociation_curve_data, workflows, group, output_file, file_format)
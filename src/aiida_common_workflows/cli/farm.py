@@ -0,0 +1,43 @@
+"""Command to print the worker script of the task farm of the ``common_workflows.farm`` scheduler."""
+import click
+
+
+@click.command('farm-worker')
+@click.option(
+    '--slots', type=click.IntRange(min=1), required=True, help='Number of slots, typically the number of cores.'
+)
+@click.option(
+    '--idle-timeout',
+    type=click.IntRange(min=0),
+    default=300,
+    show_default=True,
+    help='Number of seconds without any jobs after which the worker stops, or zero to never stop.',
+)
+@click.option(
+    '--lifetime',
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help='Number of seconds after which the worker stops, typically the wallclock time of its allocation, or zero for '
+    'an unlimited lifetime. Jobs are only started if their wallclock time fits in the remaining lifetime.',
+)
+@click.option(
+    '--poll-interval',
+    type=click.IntRange(min=1),
+    default=5,
+    show_default=True,
+    help='Number of seconds between checks of the queue and the running jobs.',
+)
+def cmd_farm_worker(slots, idle_timeout, lifetime, poll_interval):
+    """Print the bash script of a worker of the task farm of the `common_workflows.farm` scheduler.
+
+    Calculation jobs submitted to a computer with the `common_workflows.farm` scheduler are added to the queue of a
+    task farm instead of that of the actual scheduler. They are run by the workers of the task farm, which should be
+    started inside allocations of the actual scheduler, for example by appending the script to a submit script.
+    """
+    from aiida_common_workflows.common.farm import get_worker_script
+
+    try:
+        click.echo(get_worker_script(slots, idle_timeout, lifetime, poll_interval), nl=False)
+    except ValueError as exception:
+        raise click.BadParameter(str(exception)) from exception
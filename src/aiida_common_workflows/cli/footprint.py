@@ -0,0 +1,43 @@
+"""Command to report the footprint of workflows on the provenance graph and the storage."""
+import click
+from aiida.cmdline.params import options as options_core
+
+
+@click.command('footprint')
+@click.argument('workflows', nargs=-1, type=click.INT)
+@options_core.GROUP(help='Report the footprint of all workflows contained in this group.')
+def cmd_footprint(workflows, group):
+    """Show the number of nodes, links, repository bytes and log records created by workflows.
+
+    The workflows are specified either by their pks as WORKFLOWS or by a group with the `--group` option. The footprint
+    of each workflow is broken down by the origin of the nodes: the inputs generated for its sub processes
+    (`generator`), the workflows and the calculation functions they call (`orchestration`), the conversion of the
+    outputs of the plugins to the common output specification (`conversion`) and the calculation jobs
+    (`calculation`). If multiple workflows are specified, the totals over all workflows are shown as well.
+    """
+    from tabulate import tabulate
+
+    from aiida_common_workflows.common.footprint import METRICS, get_footprint
+
+    if not workflows and group is None:
+        raise click.UsageError('specify the workflows either by their pks or with the `--group` option.')
+
+    if workflows and group is not None:
+        raise click.UsageError('specify the workflows either by their pks or with the `--group` option, not both.')
+
+    footprint = get_footprint(group if group is not None else workflows)
+    totals = {}
+    rows = []
+
+    for pk, origins in sorted(footprint.items()):
+        for origin, metrics in origins.items():
+            rows.append((pk, origin, *(metrics[metric] for metric in METRICS)))
+            totals.setdefault(origin, dict.fromkeys(METRICS, 0))
+            for metric in METRICS:
+                totals[origin][metric] += metrics[metric]
+
+    if len(footprint) > 1:
+        for origin, metrics in totals.items():
+            rows.append(('total', origin, *(metrics[metric] for metric in METRICS)))
+
+    click.echo(tabulate(rows, headers=['Workflow', 'Origin', 'Nodes', 'Links', 'Repository (bytes)', 'Logs']))
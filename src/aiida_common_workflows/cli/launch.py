@@ -2,12 +2,17 @@
 import functools
 
 import click
+from aiida.cmdline.groups import VerdiCommandGroup
 from aiida.cmdline.params import types
 
-from aiida_common_workflows.plugins import get_workflow_entry_point_names, load_workflow_entry_point
+from aiida_common_workflows.common.resources import size_engines
+from aiida_common_workflows.plugins import (
+    get_workflow_capabilities,
+    get_workflow_entry_point_names,
+    load_workflow_entry_point,
+)
 
 from . import options, utils
-from .root import cmd_root
 
 
 def validate_engine_options(engine_options, all_engines):
@@ -29,7 +34,57 @@ def validate_engine_options(engine_options, all_engines):
         raise click.BadParameter(message, param_hint='engine-options')
 
 
-@cmd_root.group('launch')
+def validate_profile_output(profiler, profile_output):
+    """Validate that the profile output is only specified if the input generation is profiled.
+
+    :param profiler: the :class:`~aiida_common_workflows.cli.utils.LaunchProfiler` of the command.
+    :param profile_output: the filepath passed to the `options.PROFILE_OUTPUT` option.
+    :raises click.BadParameter: if the profile output is specified without the `--profile` flag.
+    """
+    if profile_output is not None and not profiler.enabled:
+        raise click.BadParameter(
+            'can only be specified together with the `--profile` flag.', param_hint='--profile-output'
+        )
+
+
+def validate_auto_resources(auto_resources, number_machines, number_mpi_procs_per_machine, wallclock_seconds):
+    """Validate that the resources are not specified explicitly if they are estimated automatically.
+
+    :param auto_resources: the flag of the `options.AUTO_RESOURCES` option.
+    :param number_machines: the values of the `options.NUMBER_MACHINES` option.
+    :param number_mpi_procs_per_machine: the values of the `options.NUMBER_MPI_PROCS_PER_MACHINE` option.
+    :param wallclock_seconds: the values of the `options.WALLCLOCK_SECONDS` option.
+    :raises click.BadParameter: if the resources are estimated and also specified explicitly.
+    """
+    if auto_resources and any(
+        value is not None for value in (number_machines, number_mpi_procs_per_machine, wallclock_seconds)
+    ):
+        raise click.BadParameter(
+            'cannot be combined with `--number-machines`, `--number-mpi-procs-per-machine` or `--wallclock-seconds`.',
+            param_hint='--auto-resources',
+        )
+
+
+def profile_generator(profiler, profile_output, generator, generator_inputs, structures):
+    """Profile the input generation of the sub processes of a workflow and report the results.
+
+    The workflows that call the common relax workflow generate the inputs of their sub processes only once they run.
+    The input generator is therefore called directly, once for each of the given structures.
+
+    :param profiler: the :class:`~aiida_common_workflows.cli.utils.LaunchProfiler` of the command.
+    :param profile_output: optional filepath to which the recorded profile is written.
+    :param generator: the input generator of the common relax workflow.
+    :param generator_inputs: the inputs for the input generator, except for the structure.
+    :param structures: the structures for which to generate the inputs.
+    """
+    for structure in structures:
+        generator.get_builder(**generator_inputs, structure=structure)
+
+    profiler.lap('generate inputs')
+    profiler.report(profile_output)
+
+
+@click.group('launch', cls=VerdiCommandGroup)
 def cmd_launch():
     """Launch a common workflow."""
 
@@ -37,6 +92,7 @@ def cmd_launch():
 @cmd_launch.command('relax')
 @click.argument('plugin', type=types.LazyChoice(functools.partial(get_workflow_entry_point_names, 'relax', True)))
 @options.STRUCTURE()
+@options.STRUCTURES()
 @options.CODES()
 @options.PROTOCOL(
     type=click.Choice(['fast', 'moderate', 'precise', 'verification-PBE-v1', 'verification-PBE-v1-sirius']),
@@ -51,14 +107,21 @@ def cmd_launch():
 @options.NUMBER_MPI_PROCS_PER_MACHINE()
 @options.NUMBER_CORES_PER_MPIPROC()
 @options.WALLCLOCK_SECONDS()
+@options.AUTO_RESOURCES()
 @options.DAEMON()
+@options.MAX_CONCURRENT()
+@options.RATE_LIMIT()
+@options.MANIFEST()
 @options.MAGNETIZATION_PER_SITE()
 @options.REFERENCE_WORKCHAIN()
 @options.ENGINE_OPTIONS()
+@options.PROFILE_GENERATION()
+@options.PROFILE_OUTPUT()
 @click.option('--show-engines', is_flag=True, help='Show information on the required calculation engines.')
-def cmd_relax(  # noqa: PLR0912,PLR0913,PLR0915
+def cmd_relax(  # noqa: PLR0912, PLR0913, PLR0915
     plugin,
     structure,
+    structures,
     codes,
     protocol,
     relax_type,
@@ -70,10 +133,16 @@ def cmd_relax(  # noqa: PLR0912,PLR0913,PLR0915
     number_mpi_procs_per_machine,
     number_cores_per_mpiproc,
     wallclock_seconds,
+    auto_resources,
     daemon,
+    max_concurrent,
+    rate_limit,
+    manifest,
     magnetization_per_site,
     reference_workchain,
     engine_options,
+    profiler,
+    profile_output,
     show_engines,
 ):
     """Relax a crystal structure using the common relax workflow for one of the existing plugin implementations.
@@ -82,10 +151,27 @@ def cmd_relax(  # noqa: PLR0912,PLR0913,PLR0915
     however, if no code is passed, the command will automatically try to find and load the codes that are required.
     If no code is installed for at least one of the calculation engines, the command will fail.
     Use the `--show-engine` flag to display the required calculation engines for the selected plugin workflow.
+    Use the `--profile` flag to profile the input generation instead, without submitting anything.
+    Use the `--auto-resources` flag to estimate the resources of each engine step from the size of the structure.
     """
+    profiler.lap('parse arguments')
+    validate_profile_output(profiler, profile_output)
+    validate_auto_resources(auto_resources, number_machines, number_mpi_procs_per_machine, wallclock_seconds)
+
+    capabilities = get_workflow_capabilities('relax', plugin)
+
+    if protocol not in capabilities['protocols']:
+        protocols = capabilities['protocols']
+        message = f'`{protocol}` is not implemented by the `{plugin}` plugin: choose one of {protocols}'
+        raise click.BadParameter(message, param_hint='protocol')
+
+    if show_engines:
+        utils.echo_engines(capabilities['engines'])
+        return
 
     process_class = load_workflow_entry_point('relax', plugin)
     generator = process_class.get_input_generator()
+    profiler.lap('load plugin')
 
     number_engines = len(generator.spec().inputs['engines'])
 
@@ -119,23 +205,10 @@ def cmd_relax(  # noqa: PLR0912,PLR0913,PLR0915
             param_hint='--wallclock-seconds',
         )
 
-    if not generator.is_valid_protocol(protocol):
-        protocols = generator.get_protocol_names()
-        process_class_name = process_class.__name__
-        message = f'`{protocol}` is not implemented by `{process_class_name}` workflow: choose one of {protocols}'
-        raise click.BadParameter(message, param_hint='protocol')
-
-    if show_engines:
-        for engine, port in generator.spec().inputs['engines'].items():
-            click.secho(engine, fg='red', bold=True)
-            click.echo(f'Required code plugin: {port["code"].entry_point}')
-            click.echo(f'Engine description:   {port.help}')
-
-        return
-
     validate_engine_options(engine_options, generator.spec().inputs['engines'])
 
     engines = {}
+    resource_models = {}
 
     for index, engine in enumerate(generator.spec().inputs['engines']):
         port = generator.spec().inputs['engines'][engine]
@@ -166,6 +239,13 @@ def cmd_relax(  # noqa: PLR0912,PLR0913,PLR0915
         if number_cores_per_mpiproc is not None:
             engines[engine]['options']['resources']['num_cores_per_mpiproc'] = number_cores_per_mpiproc[index]
 
+        if auto_resources:
+            resource_model = utils.get_resource_model(code, entry_point)
+            if resource_model is not None:
+                resource_models[engine] = resource_model
+
+    profiler.lap('look up codes')
+
     inputs = {
         'structure': structure,
         'engines': engines,
@@ -187,13 +267,33 @@ def cmd_relax(  # noqa: PLR0912,PLR0913,PLR0915
     if reference_workchain is not None:
         inputs['reference_workchain'] = reference_workchain
 
-    builder = generator.get_builder(**inputs)
+    if structures:
+        processes = []
+        for entry in structures:
+            entry_engines = size_engines(engines, resource_models, entry)
+            processes.append(
+                (entry, generator.get_builder(**{**inputs, 'structure': entry, 'engines': entry_engines}), {})
+            )
+    else:
+        builder = generator.get_builder(**{**inputs, 'engines': size_engines(engines, resource_models, structure)})
+
+    profiler.lap('generate inputs')
+
+    if profiler.enabled:
+        profiler.report(profile_output)
+        return
+
+    if structures:
+        utils.submit_processes(processes, max_concurrent, rate_limit, manifest)
+        return
+
     utils.launch_process(builder, daemon)
 
 
 @cmd_launch.command('eos')
 @click.argument('plugin', type=types.LazyChoice(functools.partial(get_workflow_entry_point_names, 'relax', True)))
 @options.STRUCTURE()
+@options.STRUCTURES()
 @options.CODES()
 @options.PROTOCOL(type=click.Choice(['fast', 'moderate', 'precise']), default='fast')
 @options.RELAX_TYPE(type=types.LazyChoice(options.get_relax_types_eos))
@@ -205,13 +305,20 @@ def cmd_relax(  # noqa: PLR0912,PLR0913,PLR0915
 @options.NUMBER_MPI_PROCS_PER_MACHINE()
 @options.NUMBER_CORES_PER_MPIPROC()
 @options.WALLCLOCK_SECONDS()
+@options.AUTO_RESOURCES()
 @options.DAEMON()
+@options.MAX_CONCURRENT()
+@options.RATE_LIMIT()
+@options.MANIFEST()
 @options.MAGNETIZATION_PER_SITE()
 @options.ENGINE_OPTIONS()
+@options.PROFILE_GENERATION()
+@options.PROFILE_OUTPUT()
 @click.option('--show-engines', is_flag=True, help='Show information on the required calculation engines.')
-def cmd_eos(  # noqa: PLR0912,PLR0913,PLR0915
+def cmd_eos(  # noqa: PLR0912, PLR0913, PLR0915
     plugin,
     structure,
+    structures,
     codes,
     protocol,
     relax_type,
@@ -223,9 +330,15 @@ def cmd_eos(  # noqa: PLR0912,PLR0913,PLR0915
     number_mpi_procs_per_machine,
     number_cores_per_mpiproc,
     wallclock_seconds,
+    auto_resources,
     daemon,
+    max_concurrent,
+    rate_limit,
+    manifest,
     magnetization_per_site,
     engine_options,
+    profiler,
+    profile_output,
     show_engines,
 ):
     """Compute the equation of state of a crystal structure using the common relax workflow.
@@ -234,13 +347,30 @@ def cmd_eos(  # noqa: PLR0912,PLR0913,PLR0915
     however, if no code is passed, the command will automatically try to find and load the codes that are required.
     If no code is installed for at least one of the calculation engines, the command will fail.
     Use the `--show-engine` flag to display the required calculation engines for the selected plugin workflow.
+    Use the `--profile` flag to profile the input generation instead, without submitting anything.
+    Use the `--auto-resources` flag to estimate the resources of each engine step from the size of the structure.
     """
+    profiler.lap('parse arguments')
+    validate_profile_output(profiler, profile_output)
+    validate_auto_resources(auto_resources, number_machines, number_mpi_procs_per_machine, wallclock_seconds)
 
     from aiida_common_workflows.plugins import get_entry_point_name_from_class
     from aiida_common_workflows.workflows.eos import EquationOfStateWorkChain
 
+    capabilities = get_workflow_capabilities('relax', plugin)
+
+    if protocol not in capabilities['protocols']:
+        protocols = capabilities['protocols']
+        message = f'`{protocol}` is not implemented by the `{plugin}` plugin: choose one of {protocols}'
+        raise click.BadParameter(message, param_hint='protocol')
+
+    if show_engines:
+        utils.echo_engines(capabilities['engines'])
+        return
+
     process_class = load_workflow_entry_point('relax', plugin)
     generator = process_class.get_input_generator()
+    profiler.lap('load plugin')
 
     number_engines = len(generator.spec().inputs['engines'])
 
@@ -274,23 +404,11 @@ def cmd_eos(  # noqa: PLR0912,PLR0913,PLR0915
             param_hint='--wallclock-seconds',
         )
 
-    if not generator.is_valid_protocol(protocol):
-        protocols = generator.get_protocol_names()
-        process_class_name = process_class.__name__
-        message = f'`{protocol}` is not implemented by `{process_class_name}` workflow: choose one of {protocols}'
-        raise click.BadParameter(message, param_hint='protocol')
-
-    if show_engines:
-        for engine, port in generator.spec().inputs['engines'].items():
-            click.secho(engine, fg='red', bold=True)
-            click.echo(f'Required code plugin: {port["code"].entry_point}')
-            click.echo(f'Engine description:   {port.help}')
-
-        return
-
     validate_engine_options(engine_options, generator.spec().inputs['engines'])
 
     engines = {}
+    engine_pools = {}
+    resource_models = {}
 
     for index, engine in enumerate(generator.spec().inputs['engines']):
         port = generator.spec().inputs['engines'][engine]
@@ -321,6 +439,17 @@ def cmd_eos(  # noqa: PLR0912,PLR0913,PLR0915
         if number_cores_per_mpiproc is not None:
             engines[engine]['options']['resources']['num_cores_per_mpiproc'] = number_cores_per_mpiproc[index]
 
+        pool = [entry for entry in codes or [] if entry.default_calc_job_plugin == entry_point]
+        if len(pool) > 1:
+            engine_pools[engine] = [{'code': entry.full_label} for entry in pool]
+
+        if auto_resources:
+            resource_model = utils.get_resource_model(code, entry_point)
+            if resource_model is not None:
+                resource_models[engine] = resource_model
+
+    profiler.lap('look up codes')
+
     inputs = {
         'structure': structure,
         'generator_inputs': {
@@ -342,12 +471,28 @@ def cmd_eos(  # noqa: PLR0912,PLR0913,PLR0915
     if magnetization_per_site is not None:
         inputs['generator_inputs']['magnetization_per_site'] = magnetization_per_site
 
+    if resource_models:
+        inputs['resource_models'] = resource_models
+
+    if engine_pools:
+        inputs['engine_pools'] = engine_pools
+
+    if profiler.enabled:
+        profile_generator(profiler, profile_output, generator, inputs['generator_inputs'], structures or [structure])
+        return
+
+    if structures:
+        processes = [(entry, EquationOfStateWorkChain, {**inputs, 'structure': entry}) for entry in structures]
+        utils.submit_processes(processes, max_concurrent, rate_limit, manifest)
+        return
+
     utils.launch_process(EquationOfStateWorkChain, daemon, **inputs)
 
 
 @cmd_launch.command('dissociation-curve')
 @click.argument('plugin', type=types.LazyChoice(functools.partial(get_workflow_entry_point_names, 'relax', True)))
 @options.STRUCTURE(default='H2')
+@options.STRUCTURES()
 @options.CODES()
 @options.PROTOCOL(type=click.Choice(['fast', 'moderate', 'precise']), default='fast')
 @options.ELECTRONIC_TYPE()
@@ -356,13 +501,20 @@ def cmd_eos(  # noqa: PLR0912,PLR0913,PLR0915
 @options.NUMBER_MPI_PROCS_PER_MACHINE()
 @options.NUMBER_CORES_PER_MPIPROC()
 @options.WALLCLOCK_SECONDS()
+@options.AUTO_RESOURCES()
 @options.DAEMON()
+@options.MAX_CONCURRENT()
+@options.RATE_LIMIT()
+@options.MANIFEST()
 @options.MAGNETIZATION_PER_SITE()
 @options.ENGINE_OPTIONS()
+@options.PROFILE_GENERATION()
+@options.PROFILE_OUTPUT()
 @click.option('--show-engines', is_flag=True, help='Show information on the required calculation engines.')
-def cmd_dissociation_curve(  # noqa: PLR0912, PLR0913
+def cmd_dissociation_curve(  # noqa: PLR0912, PLR0913, PLR0915
     plugin,
     structure,
+    structures,
     codes,
     protocol,
     electronic_type,
@@ -371,9 +523,15 @@ def cmd_dissociation_curve(  # noqa: PLR0912, PLR0913
     number_mpi_procs_per_machine,
     number_cores_per_mpiproc,
     wallclock_seconds,
+    auto_resources,
     daemon,
+    max_concurrent,
+    rate_limit,
+    manifest,
     magnetization_per_site,
     engine_options,
+    profiler,
+    profile_output,
     show_engines,
 ):
     """Compute the dissociation curve of a diatomic molecule using the common relax workflow.
@@ -385,14 +543,31 @@ def cmd_dissociation_curve(  # noqa: PLR0912, PLR0913
     however, if no code is passed, the command will automatically try to find and load the codes that are required.
     If no code is installed for at least one of the calculation engines, the command will fail.
     Use the `--show-engine` flag to display the required calculation engines for the selected plugin workflow.
+    Use the `--profile` flag to profile the input generation instead, without submitting anything.
+    Use the `--auto-resources` flag to estimate the resources of each engine step from the size of the structure.
     """
+    profiler.lap('parse arguments')
+    validate_profile_output(profiler, profile_output)
+    validate_auto_resources(auto_resources, number_machines, number_mpi_procs_per_machine, wallclock_seconds)
 
     from aiida_common_workflows.plugins import get_entry_point_name_from_class
     from aiida_common_workflows.workflows.dissociation import DissociationCurveWorkChain
     from aiida_common_workflows.workflows.relax.generator import RelaxType
 
+    capabilities = get_workflow_capabilities('relax', plugin)
+
+    if protocol not in capabilities['protocols']:
+        protocols = capabilities['protocols']
+        message = f'`{protocol}` is not implemented by the `{plugin}` plugin: choose one of {protocols}'
+        raise click.BadParameter(message, param_hint='protocol')
+
+    if show_engines:
+        utils.echo_engines(capabilities['engines'])
+        return
+
     process_class = load_workflow_entry_point('relax', plugin)
     generator = process_class.get_input_generator()
+    profiler.lap('load plugin')
 
     number_engines = len(generator.spec().inputs['engines'])
 
@@ -426,23 +601,11 @@ def cmd_dissociation_curve(  # noqa: PLR0912, PLR0913
             param_hint='--wallclock-seconds',
         )
 
-    if not generator.is_valid_protocol(protocol):
-        protocols = generator.get_protocol_names()
-        process_class_name = process_class.__name__
-        message = f'`{protocol}` is not implemented by `{process_class_name}` workflow: choose one of {protocols}'
-        raise click.BadParameter(message, param_hint='protocol')
-
-    if show_engines:
-        for engine, port in generator.spec().inputs['engines'].items():
-            click.secho(engine, fg='red', bold=True)
-            click.echo(f'Required code plugin: {port["code"].entry_point}')
-            click.echo(f'Engine description:   {port.help}')
-
-        return
-
     validate_engine_options(engine_options, generator.spec().inputs['engines'].keys())
 
     engines = {}
+    engine_pools = {}
+    resource_models = {}
 
     for index, engine in enumerate(generator.spec().inputs['engines']):
         port = generator.spec().inputs['engines'][engine]
@@ -473,6 +636,17 @@ def cmd_dissociation_curve(  # noqa: PLR0912, PLR0913
         if number_cores_per_mpiproc is not None:
             engines[engine]['options']['resources']['num_cores_per_mpiproc'] = number_cores_per_mpiproc[index]
 
+        pool = [entry for entry in codes or [] if entry.default_calc_job_plugin == entry_point]
+        if len(pool) > 1:
+            engine_pools[engine] = [{'code': entry.full_label} for entry in pool]
+
+        if auto_resources:
+            resource_model = utils.get_resource_model(code, entry_point)
+            if resource_model is not None:
+                resource_models[engine] = resource_model
+
+    profiler.lap('look up codes')
+
     inputs = {
         'molecule': structure,
         'generator_inputs': {
@@ -488,4 +662,19 @@ def cmd_dissociation_curve(  # noqa: PLR0912, PLR0913
     if magnetization_per_site is not None:
         inputs['generator_inputs']['magnetization_per_site'] = magnetization_per_site
 
+    if resource_models:
+        inputs['resource_models'] = resource_models
+
+    if engine_pools:
+        inputs['engine_pools'] = engine_pools
+
+    if profiler.enabled:
+        profile_generator(profiler, profile_output, generator, inputs['generator_inputs'], structures or [structure])
+        return
+
+    if structures:
+        processes = [(entry, DissociationCurveWorkChain, {**inputs, 'molecule': entry}) for entry in structures]
+        utils.submit_processes(processes, max_concurrent, rate_limit, manifest)
+        return
+
     utils.launch_process(DissociationCurveWorkChain, daemon, **inputs)
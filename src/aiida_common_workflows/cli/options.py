@@ -73,7 +73,7 @@ class StructureDataParamType(click.Choice):
     @with_dbenv()
     def convert(self, value, param, ctx):
         """Attempt to interpret the value as a file first and if that fails try to load as a node."""
-        from aiida.orm import QueryBuilder, StructureData
+        from aiida_common_workflows.common.structures import import_structures
 
         try:
             filepath = pathlib.Path(__file__).parent.parent / 'common' / 'data' / DEFAULT_STRUCTURES_MAPPING[value]
@@ -84,7 +84,7 @@ class StructureDataParamType(click.Choice):
                 filepath = value
 
         try:
-            import ase.io
+            import ase.io  # noqa: F401
         except ImportError as exception:
             raise click.BadParameter(
                 f'failed to load a structure with identifier `{value}`.\n'
@@ -99,22 +99,71 @@ class StructureDataParamType(click.Choice):
             ) from exception
 
         try:
-            structure = StructureData(ase=ase.io.read(filepath))
-        except Exception as exception:
-            raise click.BadParameter(
-                f'file `{value}` could not be parsed into a `StructureData`: {exception}'
-            ) from exception
+            return import_structures([filepath], store=False)[0]
+        except ValueError as exception:
+            raise click.BadParameter(str(exception)) from exception
+
+
+class StructuresParamType(click.ParamType):
+    """CLI parameter type that can load multiple `StructureData` from a directory, glob pattern, file or group.
+
+    The value is interpreted in order as a directory, in which case all the files it contains are loaded, a file on
+    disk, a glob pattern matching one or more files and finally as the identifier of a `Group` whose structures are
+    loaded. A list of structures is returned, even if the value corresponds to a single structure.
+    """
+
+    name = 'structures'
+
+    def convert(self, value, param, ctx):
+        """Convert the value into a list of structures."""
+        import glob
 
-        duplicate = (
-            QueryBuilder()
-            .append(StructureData, filters={'extras._aiida_hash': structure.base.caching._compute_hash()})
-            .first()
-        )
+        filepath = pathlib.Path(value).expanduser()
 
-        if duplicate:
-            return duplicate[0]
+        if filepath.is_dir():
+            filepaths = sorted(path for path in filepath.iterdir() if path.is_file() and not path.name.startswith('.'))
+        elif filepath.is_file():
+            filepaths = [filepath]
+        else:
+            filepaths = [
+                pathlib.Path(path) for path in sorted(glob.glob(str(filepath))) if pathlib.Path(path).is_file()
+            ]
 
-        return structure
+        if filepaths:
+            return self._load_from_filepaths(filepaths, param, ctx)
+
+        return self._load_from_group(value, param, ctx)
+
+    @with_dbenv()
+    def _load_from_filepaths(self, filepaths, param, ctx):
+        """Return the structures parsed from the given files, reusing structures that already exist in the database."""
+        from aiida_common_workflows.common.structures import import_structures
+
+        try:
+            return import_structures(filepaths, store=False)
+        except (ImportError, ValueError) as exception:
+            self.fail(str(exception), param, ctx)
+
+    @with_dbenv()
+    def _load_from_group(self, value, param, ctx):
+        """Return the structures contained in the group with the given identifier."""
+        from aiida.orm import StructureData
+
+        try:
+            group = types.GroupParamType().convert(value, param, ctx)
+        except click.BadParameter:
+            self.fail(
+                f'`{value}` is not a directory, file or glob pattern matching any files, nor a group identifier.',
+                param,
+                ctx,
+            )
+
+        structures = sorted((node for node in group.nodes if isinstance(node, StructureData)), key=lambda node: node.pk)
+
+        if not structures:
+            self.fail(f'group `{group.label}` does not contain any `StructureData` nodes.', param, ctx)
+
+        return structures
 
 
 CODES = options.OverridableOption(
@@ -126,7 +175,8 @@ CODES = options.OverridableOption(
     help='One or multiple codes identified by their ID, UUID or label. What codes are required is dependent on the '
     'selected plugin and can be shown using the `--show-engines` option. If no explicit codes are specified, one will '
     'be loaded from the database based on the required input plugins. If multiple codes are matched, a random one will '
-    'be selected.',
+    'be selected. For the `eos` and `dissociation-curve` commands, multiple codes for the same plugin form a pool '
+    'across which the sub processes are balanced.',
 )
 
 STRUCTURE = options.OverridableOption(
@@ -138,6 +188,17 @@ STRUCTURE = options.OverridableOption(
     'identifier, or a file on disk with a structure definition that can be parsed by `ase`.',
 )
 
+STRUCTURES = options.OverridableOption(
+    '--structures',
+    type=StructuresParamType(),
+    cls=options.MultipleValueOption,
+    required=False,
+    callback=lambda ctx, param, value: [structure for structures in value or () for structure in structures] or None,
+    help='Launch the workflow for multiple structures at once, in which case the `--structure` option is ignored and '
+    'all workflows are submitted to the daemon. Each value can be a directory, in which case all files it contains are '
+    'parsed, a file, a glob pattern or the identifier of a group containing `StructureData` nodes.',
+)
+
 PROTOCOL = options.OverridableOption(
     '-p',
     '--protocol',
@@ -239,6 +300,16 @@ NUMBER_CORES_PER_MPIPROC = options.OverridableOption(
     help='Define the number of cores (threads) per MPI processes to use for each engine step.',
 )
 
+AUTO_RESOURCES = options.OverridableOption(
+    '--auto-resources',
+    is_flag=True,
+    default=False,
+    help='Estimate the resources and wallclock time to request for each engine step from the size of the structure, '
+    'with a model calibrated on the calculation jobs of its code plugin that finished successfully in the database. '
+    'Engine steps without enough calculation jobs to calibrate the model fall back to the defaults. Cannot be combined '
+    'with the `--number-machines`, `--number-mpi-procs-per-machine` and `--wallclock-seconds` options.',
+)
+
 MAGNETIZATION_PER_SITE = options.OverridableOption(
     '--magnetization-per-site',
     type=click.FLOAT,
@@ -272,6 +343,86 @@ OUTPUT_FILE = options.OverridableOption(
     '-o', '--output-file', type=click.STRING, required=False, help='Save the output to a specified file.'
 )
 
+MAX_CONCURRENT = options.OverridableOption(
+    '--max-concurrent',
+    type=click.IntRange(min=1),
+    required=False,
+    help='Maximum number of submitted workflows that are allowed to be active at the same time when launching for '
+    'multiple structures. Submission waits until active workflows terminate once the limit is reached.',
+)
+
+RATE_LIMIT = options.OverridableOption(
+    '--rate-limit',
+    type=click.FloatRange(min=0, min_open=True),
+    required=False,
+    help='Maximum number of workflows submitted per second when launching for multiple structures.',
+)
+
+MANIFEST = options.OverridableOption(
+    '--manifest',
+    type=click.Path(dir_okay=False, writable=True),
+    required=False,
+    help='Write a manifest with the submitted workflows in JSON format to this file when launching for multiple '
+    'structures.',
+)
+
+OUTPUT_DIRECTORY = options.OverridableOption(
+    '-O',
+    '--output-directory',
+    type=click.Path(file_okay=False, writable=True, path_type=pathlib.Path),
+    required=False,
+    help='Save the output of each workflow to a separate file in this directory.',
+)
+
+MAX_WORKERS = options.OverridableOption(
+    '--max-workers',
+    type=click.IntRange(min=1),
+    required=False,
+    help='Maximum number of processes used in parallel. By default the number of processors on the machine.',
+)
+
+EXPORT_FORMAT = options.OverridableOption(
+    '-F',
+    '--format',
+    'file_format',
+    type=click.Choice(['csv', 'parquet', 'npz']),
+    required=False,
+    help='The format of the output file. By default it is determined from the extension of the output file.',
+)
+
+
+def start_launch_profiler(ctx, _, value):
+    """Return a profiler of the launch command that records the function calls if the option is set.
+
+    The option is eager, such that the profiler is started before the remaining parameters, like the structures, are
+    processed. The profiler is always disabled when the command finishes.
+    """
+    from .utils import LaunchProfiler
+
+    profiler = LaunchProfiler(enabled=value)
+    ctx.call_on_close(profiler.disable)
+
+    return profiler
+
+
+PROFILE_GENERATION = options.OverridableOption(
+    '--profile',
+    'profiler',
+    is_flag=True,
+    is_eager=True,
+    callback=start_launch_profiler,
+    help='Profile the input generation instead of launching the workflow. A breakdown of the time spent in each phase '
+    'and the most expensive functions is displayed and nothing is submitted.',
+)
+
+PROFILE_OUTPUT = options.OverridableOption(
+    '--profile-output',
+    type=click.Path(dir_okay=False, writable=True),
+    required=False,
+    help='Write the profile recorded with `--profile` to this file, e.g. `launch.prof`, which can be loaded with the '
+    '`pstats` module or visualized with tools like `snakeviz`.',
+)
+
 ENGINE_OPTIONS = options.OverridableOption(
     '--engine-options',
     type=JsonParamType(),
@@ -1,33 +1,94 @@
 """Commands to plot results from a workflow."""
 import click
+from aiida.cmdline.groups import VerdiCommandGroup
 from aiida.cmdline.params import arguments
+from aiida.cmdline.params import options as options_core
 from aiida.cmdline.utils import echo
-from aiida.plugins import WorkflowFactory
 
 from . import options
-from .root import cmd_root
 
-EquationOfStateWorkChain = WorkflowFactory('common_workflows.eos')
-DissociationCurveWorkChain = WorkflowFactory('common_workflows.dissociation_curve')
 
-
-@cmd_root.group('plot')
+@click.group('plot', cls=VerdiCommandGroup)
 def cmd_plot():
     """Plot results from a workflow."""
 
 
+def plot_group(get_data, get_figure, name, group, output_directory, max_workers):  # noqa: PLR0913
+    """Render a plot for each workflow in the given group to a file in the output directory.
+
+    The data of all workflows is retrieved in bulk and the figures are rendered in a pool of processes with the
+    non-interactive Agg backend. The plot of each workflow is saved to ``<output_directory>/<pk>.png``.
+
+    :param get_data: the function of :mod:`aiida_common_workflows.common.export` that returns the columns.
+    :param get_figure: the function of :mod:`aiida_common_workflows.common.visualization` that returns the figure.
+    :param name: the name of the column of the independent variable.
+    :param group: the group containing the workflows.
+    :param output_directory: the directory to which the plots are written.
+    :param max_workers: the maximum number of processes used to render the plots.
+    """
+    import numpy
+
+    from aiida_common_workflows.common.visualization.render import save_figures
+
+    if output_directory is None:
+        raise click.UsageError('the `--output-directory` option is required when plotting a group.')
+
+    columns = get_data(group)
+    output_directory.mkdir(parents=True, exist_ok=True)
+    datasets = []
+
+    for pk in numpy.unique(columns['workflow']).tolist():
+        mask = columns['workflow'] == pk
+        datasets.append(
+            (output_directory / f'{pk}.png', (columns[name][mask].tolist(), columns['energy'][mask].tolist()))
+        )
+
+    if not datasets:
+        echo.echo_report(f'Group `{group.label}` does not contain any workflows with results to plot.')
+        return
+
+    number_saved = 0
+
+    for filepath, exception in save_figures(get_figure, datasets, max_workers):
+        if exception is not None:
+            echo.echo_warning(f'Failed to plot {filepath}: {exception}')
+        else:
+            number_saved += 1
+
+    echo.echo_success(f'Saved {number_saved} of {len(datasets)} plots to {output_directory}')
+
+
 @cmd_plot.command('eos')
-@arguments.WORKFLOW()
+@arguments.WORKFLOW(required=False)
+@options_core.GROUP(help='Plot all `EquationOfStateWorkChain` workflows contained in this group.')
 @options.PRECISIONS()
 @options.PRINT_TABLE()
 @options.OUTPUT_FILE()
-def cmd_plot_eos(workflow, precisions, print_table, output_file):
-    """Plot the results from an `EquationOfStateWorkChain`."""
-
+@options.OUTPUT_DIRECTORY()
+@options.MAX_WORKERS()
+def cmd_plot_eos(  # noqa: PLR0912, PLR0913
+    workflow, group, precisions, print_table, output_file, output_directory, max_workers
+):
+    """Plot the results from an `EquationOfStateWorkChain`.
+
+    Alternatively, the workflows in a group can be plotted with the `--group` option, in which case the plot of each
+    workflow is rendered in parallel to a separate file in the directory specified with `--output-directory`.
+    """
     from aiida.common import LinkType
     from tabulate import tabulate
 
-    from aiida_common_workflows.common.visualization.eos import get_eos_plot
+    from aiida_common_workflows.common.export import get_eos_data
+    from aiida_common_workflows.common.visualization.eos import get_eos_figure, get_eos_plot
+    from aiida_common_workflows.workflows.eos import EquationOfStateWorkChain
+
+    if group is not None:
+        if workflow is not None:
+            raise click.UsageError('specify either a WORKFLOW or the `--group` option, not both.')
+        plot_group(get_eos_data, get_eos_figure, 'volume', group, output_directory, max_workers)
+        return
+
+    if workflow is None:
+        raise click.UsageError('specify either a WORKFLOW or the `--group` option.')
 
     if workflow.process_class is not EquationOfStateWorkChain:
         echo.echo_critical(
@@ -90,17 +151,38 @@ def cmd_plot_eos(workflow, precisions, print_table, output_file):
 
 
 @cmd_plot.command('dissociation-curve')
-@arguments.WORKFLOW()
+@arguments.WORKFLOW(required=False)
+@options_core.GROUP(help='Plot all `DissociationCurveWorkChain` workflows contained in this group.')
 @options.PRECISIONS()
 @options.PRINT_TABLE()
 @options.OUTPUT_FILE()
-def cmd_plot_dissociation_curve(workflow, precisions, print_table, output_file):
-    """Plot the results from a `DissociationCurveWorkChain`."""
-
+@options.OUTPUT_DIRECTORY()
+@options.MAX_WORKERS()
+def cmd_plot_dissociation_curve(  # noqa: PLR0912, PLR0913
+    workflow, group, precisions, print_table, output_file, output_directory, max_workers
+):
+    """Plot the results from a `DissociationCurveWorkChain`.
+
+    Alternatively, the workflows in a group can be plotted with the `--group` option, in which case the plot of each
+    workflow is rendered in parallel to a separate file in the directory specified with `--output-directory`.
+    """
     from aiida.common import LinkType
     from tabulate import tabulate
 
-    from aiida_common_workflows.common.visualization.dissociation import get_dissociation_plot
+    from aiida_common_workflows.common.export import get_dissociation_curve_data
+    from aiida_common_workflows.common.visualization.dissociation import get_dissociation_figure, get_dissociation_plot
+    from aiida_common_workflows.workflows.dissociation import DissociationCurveWorkChain
+
+    if group is not None:
+        if workflow is not None:
+            raise click.UsageError('specify either a WORKFLOW or the `--group` option, not both.')
+        plot_group(
+            get_dissociation_curve_data, get_dissociation_figure, 'distance', group, output_directory, max_workers
+        )
+        return
+
+    if workflow is None:
+        raise click.UsageError('specify either a WORKFLOW or the `--group` option.')
 
     if workflow.process_class is not DissociationCurveWorkChain:
         echo.echo_critical(
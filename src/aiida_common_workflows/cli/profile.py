@@ -0,0 +1,39 @@
+"""Command to profile where the wall time of workflows is spent."""
+import click
+from aiida.cmdline.params import options as options_core
+from aiida.cmdline.utils import echo
+
+
+@click.command('profile')
+@click.argument('workflows', nargs=-1, type=click.INT)
+@options_core.GROUP(help='Profile all workflows contained in this group.')
+def cmd_profile(workflows, group):
+    """Show where the wall time of workflows and all their descendants is spent.
+
+    The workflows are specified either by their pks as WORKFLOWS or by a group with the `--group` option. The timings
+    of the steps and of launching the children that are recorded by the common workflows are aggregated per phase,
+    together with the time that the calculation jobs spent waiting for the daemon (`daemon`), in the queue of the
+    scheduler (`queue`) and running (`run`), as reported by the scheduler. The phases are sorted by their total time.
+    """
+    from tabulate import tabulate
+
+    from aiida_common_workflows.common.timing import get_timings
+
+    if not workflows and group is None:
+        raise click.UsageError('specify the workflows either by their pks or with the `--group` option.')
+
+    if workflows and group is not None:
+        raise click.UsageError('specify the workflows either by their pks or with the `--group` option, not both.')
+
+    timings = get_timings(group if group is not None else workflows)
+
+    if not timings:
+        echo.echo_critical('no timings were recorded for the specified workflows.')
+
+    rows = [
+        (phase, len(durations), sum(durations), sum(durations) / len(durations), max(durations))
+        for phase, durations in timings.items()
+    ]
+    rows.sort(key=lambda row: row[2], reverse=True)
+
+    click.echo(tabulate(rows, headers=['Phase', 'Count', 'Total (s)', 'Mean (s)', 'Max (s)'], floatfmt='.3f'))
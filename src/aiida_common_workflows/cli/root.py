@@ -1,10 +1,70 @@
 """Command line interface ``acwf``."""
+import importlib
+import typing as t
+
 import click
 from aiida.cmdline.groups import VerdiCommandGroup
 from aiida.cmdline.params import options, types
 
 
-@click.group('acwf', cls=VerdiCommandGroup, context_settings={'help_option_names': ['-h', '--help']})
+class LazyVerdiCommandGroup(VerdiCommandGroup):
+    """Subclass of :class:`aiida.cmdline.groups.VerdiCommandGroup` that loads its subcommands lazily.
+
+    The subcommands are defined by a mapping of their name onto the import path of the command, formatted as
+    ``module:attribute``. The module is only imported once the subcommand is actually requested, which keeps the
+    startup time of the command line interface independent of the dependencies of the individual subcommands.
+    """
+
+    def __init__(self, *args: t.Any, lazy_subcommands: t.Optional[t.Dict[str, str]] = None, **kwargs: t.Any):
+        """Construct a new instance.
+
+        :param lazy_subcommands: mapping of subcommand names onto the import path ``module:attribute`` of the command.
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> t.List[str]:
+        """Return the names of all subcommands, including those that have not yet been loaded."""
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> t.Optional[click.Command]:
+        """Return the command that corresponds to the requested ``cmd_name``, loading it first if necessary."""
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self._load_lazy_command(cmd_name), cmd_name)
+
+        return super().get_command(ctx, cmd_name)
+
+    def _load_lazy_command(self, cmd_name: str) -> click.Command:
+        """Import and return the lazily defined command with the given name.
+
+        :param cmd_name: the name of the subcommand.
+        :raises ValueError: if the import path does not point to a click command.
+        """
+        module_name, attribute = self.lazy_subcommands[cmd_name].split(':')
+        command = getattr(importlib.import_module(module_name), attribute)
+
+        if not isinstance(command, click.Command):
+            raise ValueError(f'lazy subcommand `{cmd_name}` does not point to a click command: {command}')
+
+        return command
+
+
+@click.group(
+    'acwf',
+    cls=LazyVerdiCommandGroup,
+    lazy_subcommands={
+        'admission': 'aiida_common_workflows.cli.admission:cmd_admission',
+        'compare': 'aiida_common_workflows.cli.compare:cmd_compare',
+        'export': 'aiida_common_workflows.cli.export:cmd_export',
+        'farm-worker': 'aiida_common_workflows.cli.farm:cmd_farm_worker',
+        'footprint': 'aiida_common_workflows.cli.footprint:cmd_footprint',
+        'import-structures': 'aiida_common_workflows.cli.structures:cmd_import_structures',
+        'launch': 'aiida_common_workflows.cli.launch:cmd_launch',
+        'plot': 'aiida_common_workflows.cli.plot:cmd_plot',
+        'profile': 'aiida_common_workflows.cli.profile:cmd_profile',
+    },
+    context_settings={'help_option_names': ['-h', '--help']},
+)
 @options.PROFILE(type=types.ProfileParamType(load_profile=True), expose_value=False)
 def cmd_root():
     """CLI for the ``aiida-common-workflows`` plugin."""
@@ -0,0 +1,49 @@
+"""Commands to import structures."""
+import click
+from aiida.cmdline.utils import echo
+
+
+@click.command('import-structures')
+@click.argument('filepaths', nargs=-1, required=True, type=click.Path(exists=True, path_type=str))
+@click.option('-G', '--group-label', type=click.STRING, help='Add the structures to the group with this label.')
+@click.option('--max-workers', type=click.IntRange(min=1), help='Maximum number of processes used to parse the files.')
+def cmd_import_structures(filepaths, group_label, max_workers):
+    """Import the structures defined in FILEPATHS in bulk.
+
+    Each value of FILEPATHS can be a file with a structure definition that can be parsed by `ase` or a directory, in
+    which case all the files it contains are imported. Structures that already exist in the database are not imported
+    again but are reused.
+    """
+    import pathlib
+
+    from aiida.orm import Group
+    from tabulate import tabulate
+
+    from aiida_common_workflows.common.structures import import_structures
+
+    paths = []
+
+    for filepath in map(pathlib.Path, filepaths):
+        if filepath.is_dir():
+            paths.extend(
+                sorted(path for path in filepath.iterdir() if path.is_file() and not path.name.startswith('.'))
+            )
+        else:
+            paths.append(filepath)
+
+    try:
+        structures = import_structures(paths, max_workers=max_workers)
+    except (ImportError, ValueError) as exception:
+        echo.echo_critical(str(exception))
+
+    rows = [(str(path), structure.pk, structure.get_formula()) for path, structure in zip(paths, structures)]
+    click.echo(tabulate(rows, headers=['Filepath', 'PK', 'Formula']))
+
+    unique = list({structure.uuid: structure for structure in structures}.values())
+
+    if group_label is not None:
+        group, _ = Group.collection.get_or_create(label=group_label)
+        group.add_nodes(unique)
+        echo.echo_success(f'Added {len(unique)} structures to group `{group.label}`.')
+
+    echo.echo_success(f'Imported {len(paths)} files corresponding to {len(unique)} unique structures.')
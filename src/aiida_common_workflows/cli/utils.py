@@ -1,5 +1,6 @@
 """Module with utitlies for the CLI."""
 import sys
+import time
 
 import click
 
@@ -67,6 +68,76 @@ def launch_process(process, daemon, **inputs):
         echo_process_results(node)
 
 
+def submit_processes(processes, max_concurrent=None, rate_limit=None, manifest=None, poll_interval=5):
+    """Submit multiple processes to the daemon.
+
+    The submission respects an optional concurrency window and rate limit. When the number of submitted processes that
+    are still active reaches ``max_concurrent``, the submission waits until some of them have terminated. The manifest
+    is written even if the submission is interrupted, such that it always contains all processes that were submitted.
+
+    :param processes: list of tuples of the structure, the process class or process builder and the inputs of the
+        process for that structure.
+    :param max_concurrent: optional maximum number of submitted processes that are allowed to be active simultaneously.
+    :param rate_limit: optional maximum number of processes that are submitted per second.
+    :param manifest: optional filepath to which the manifest of submitted processes is written in JSON format.
+    :param poll_interval: number of seconds to wait between checks of the active processes.
+    :return: list of the nodes of the submitted processes.
+    """
+    import json
+    import time
+
+    from aiida.engine import ProcessState, launch
+    from aiida.orm import ProcessNode, QueryBuilder
+
+    active_states = [state.value for state in (ProcessState.CREATED, ProcessState.WAITING, ProcessState.RUNNING)]
+    nodes = []
+    entries = []
+    last_submission = None
+
+    try:
+        for structure, process, inputs in processes:
+            while max_concurrent is not None and nodes:
+                filters = {'id': {'in': [node.pk for node in nodes]}, 'attributes.process_state': {'in': active_states}}
+                if QueryBuilder().append(ProcessNode, filters=filters).count() < max_concurrent:
+                    break
+                time.sleep(poll_interval)
+
+            if rate_limit is not None and last_submission is not None:
+                time.sleep(max(0, 1 / rate_limit - (time.monotonic() - last_submission)))
+
+            node = launch.submit(process, **inputs)
+            last_submission = time.monotonic()
+            nodes.append(node)
+            entries.append(
+                {
+                    'pk': node.pk,
+                    'uuid': node.uuid,
+                    'process_label': node.process_label,
+                    'structure': {'pk': structure.pk, 'uuid': structure.uuid, 'formula': structure.get_formula()},
+                }
+            )
+            click.echo(f'Submitted {node.process_label}<{node.pk}> for {structure.get_formula()} to the daemon')
+    finally:
+        if manifest is not None:
+            with click.open_file(manifest, 'w') as handle:
+                json.dump(entries, handle, indent=2)
+            click.echo(f'Manifest of {len(entries)} submitted processes written to {manifest}')
+
+    return nodes
+
+
+def echo_engines(engines):
+    """Display the calculation engines of a common workflow implementation and the code plugin they require.
+
+    :param engines: dictionary of the engines as returned in the ``engines`` key of the capabilities of a plugin
+        implementation by :func:`aiida_common_workflows.plugins.get_workflow_capabilities`.
+    """
+    for engine, details in engines.items():
+        click.secho(engine, fg='red', bold=True)
+        click.echo(f'Required code plugin: {details["code_entry_point"]}')
+        click.echo(f'Engine description:   {details["description"]}')
+
+
 def get_code_from_list_or_database(codes, entry_point: str):
     """Return a code that is configured for the given calculation job entry point.
 
@@ -89,3 +160,96 @@ def get_code_from_list_or_database(codes, entry_point: str):
         return result[0]
 
     return None
+
+
+def get_resource_model(code, entry_point: str):
+    """Return the resource model of an engine calibrated on the calculation jobs of its plugin in the database.
+
+    The model only uses the features of the structure, since the other features are only known once the inputs have
+    been generated. If there are not enough calculation jobs to calibrate the model, a warning is displayed.
+
+    :param code: the code of the engine, whose computer defines the number of cores of a single machine.
+    :param entry_point: calculation job entry point name.
+    :return: a dictionary with the serialized model under the key ``model`` and the ``cores_per_machine``, or ``None``
+        if the model could not be calibrated.
+    """
+    from aiida.cmdline.utils import echo
+
+    from aiida_common_workflows.common.resources import STRUCTURE_FEATURES, ResourceModel, get_cores_per_machine
+
+    try:
+        model = ResourceModel.calibrate(entry_point, features=STRUCTURE_FEATURES)
+    except ValueError as exception:
+        echo.echo_warning(f'{exception} Using the default resources instead.')
+        return None
+
+    return {'model': model.serialize(), 'cores_per_machine': get_cores_per_machine(code) or 1}
+
+
+class LaunchProfiler:
+    """Profiler of the input generation of the launch commands.
+
+    The wall time is attributed to consecutive phases by calling ``lap`` at the end of each phase. If enabled, all
+    function calls are additionally recorded with :mod:`cProfile`, starting from the moment the profiler is constructed.
+    When disabled, the laps are still recorded but the overhead is negligible.
+    """
+
+    def __init__(self, enabled: bool = True):
+        """Construct a new instance and start the first phase.
+
+        :param enabled: whether to record the function calls with :mod:`cProfile`.
+        """
+        import cProfile
+
+        self.enabled = enabled
+        self.phases = {}
+        self._profile = cProfile.Profile() if enabled else None
+        self._start = time.perf_counter()
+
+        if self._profile is not None:
+            self._profile.enable()
+
+    def lap(self, phase: str) -> None:
+        """Attribute the wall time since the end of the previous phase to the given phase and start the next phase.
+
+        :param phase: the name of the phase that ended.
+        """
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0) + now - self._start
+        self._start = now
+
+    def disable(self) -> None:
+        """Stop recording the function calls."""
+        if self._profile is not None:
+            self._profile.disable()
+
+    def report(self, filepath=None, limit: int = 25) -> None:
+        """Stop recording and display the phases ranked by their wall time, followed by the most expensive functions.
+
+        :param filepath: optional filepath to which the recorded profile is written, which can be loaded with
+            :mod:`pstats` or visualized with tools like ``snakeviz``.
+        :param limit: the maximum number of functions to display, ranked by their cumulative time.
+        """
+        import io
+        import pstats
+
+        from tabulate import tabulate
+
+        self.disable()
+
+        total = sum(self.phases.values())
+        rows = [(phase, duration, 100 * duration / total) for phase, duration in self.phases.items()]
+        rows.sort(key=lambda row: row[1], reverse=True)
+
+        click.echo(tabulate(rows, headers=['Phase', 'Time (s)', 'Share (%)'], floatfmt=('', '.3f', '.1f')))
+
+        if self._profile is None:
+            return
+
+        stream = io.StringIO()
+        pstats.Stats(self._profile, stream=stream).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+        click.echo(stream.getvalue())
+
+        if filepath is not None:
+            self._profile.dump_stats(filepath)
+            click.echo(f'Profile written to {filepath}')
@@ -1,4 +1,5 @@
 """Module for resources common to the entire `aiida-common-workflows` package."""
+from .structures import import_structures
 from .types import ElectronicType, RelaxType, SpinType
 
-__all__ = ('ElectronicType', 'SpinType', 'RelaxType')
+__all__ = ('ElectronicType', 'SpinType', 'RelaxType', 'import_structures')
@@ -0,0 +1,172 @@
+"""Admission control of the sub processes of the common workflows with quotas per computer, code and user.
+
+The multi-point workflows, like the equation of state and the dissociation curve, can each launch many sub processes at
+once, such that many concurrent workflows can exceed the limits of the policy of a site on the number of jobs in the
+queue. The admission controller limits the number of sub processes that are active simultaneously, across all
+workflows, with quotas that are stored in the database and that are defined per:
+
+* ``computer``: the computers of the codes used by the sub process, identified by their UUID;
+* ``code``: the codes used by the sub process, identified by their UUID;
+* ``user``: the user that launched the sub process, identified by their email.
+
+Before a workflow submits a sub process, it requests its admission for the computers, codes and user it uses. If the
+quota of any of them is exhausted, the workflow waits until the oldest of the active processes that hold the quota
+terminates, since it is the most likely to terminate first, and then requests the admission again. A work chain can only
+wait for all the processes in its context, so the workflow does not wait for the sub processes that it submitted while
+it is still requesting admissions, but only once all of them were admitted.
+
+The admitted sub processes store the resources they hold in their extras, such that the usage is determined from the
+database and shared by all workflows, without any separate bookkeeping. Since the workflows run concurrently in multiple
+daemon workers, the quotas are soft limits: workflows that request an admission at the same time can all be admitted
+for the last slot of a quota.
+
+The quotas are stored in the extras of the ``common_workflows.admission`` group and are managed with the functions of
+this module or the ``acwf admission`` command.
+"""
+import typing as t
+
+__all__ = ('KINDS', 'get_quotas', 'get_resources', 'get_usage', 'register_admission', 'request_admission', 'set_quota')
+
+KINDS = ('computer', 'code', 'user')
+ADMISSION_GROUP = 'common_workflows.admission'
+ADMISSION_EXTRA = 'common_workflows_admission'
+QUOTAS_EXTRA = 'quotas'
+ACTIVE_PROCESS_STATES = ('created', 'waiting', 'running')
+
+ResourcesType = t.Dict[str, t.List[str]]
+
+
+def _get_group(create: bool = False):
+    """Return the group that stores the quotas, or ``None`` if it does not exist and ``create`` is ``False``."""
+    from aiida.common import exceptions
+    from aiida.orm import Group
+
+    if create:
+        return Group.collection.get_or_create(label=ADMISSION_GROUP)[0]
+
+    try:
+        return Group.collection.get(label=ADMISSION_GROUP)
+    except exceptions.NotExistent:
+        return None
+
+
+def get_quotas() -> t.Dict[str, t.Dict[str, int]]:
+    """Return the quotas of the admission controller.
+
+    :return: mapping of each kind in ``KINDS`` onto a mapping of the identifiers of the resources onto their quota.
+    """
+    group = _get_group()
+    quotas = {kind: {} for kind in KINDS}
+
+    for entry in group.base.extras.get(QUOTAS_EXTRA, []) if group is not None else []:
+        quotas[entry['kind']][entry['identifier']] = entry['quota']
+
+    return quotas
+
+
+def set_quota(kind: str, identifier: str, quota: t.Optional[int]) -> None:
+    """Set the quota of a resource, i.e. the maximum number of active sub processes that use it.
+
+    :param kind: the kind of resource, one of ``KINDS``.
+    :param identifier: the UUID of the computer or code, or the email of the user.
+    :param quota: the maximum number of active sub processes, or ``None`` to remove the quota.
+    :raises ValueError: if the kind is unknown or the quota is not a positive integer.
+    """
+    if kind not in KINDS:
+        raise ValueError(f'the kind `{kind}` is not one of {KINDS}.')
+
+    if quota is not None and (not isinstance(quota, int) or quota < 1):
+        raise ValueError('the quota should be a positive integer.')
+
+    group = _get_group(create=True)
+    entries = [
+        entry
+        for entry in group.base.extras.get(QUOTAS_EXTRA, [])
+        if (entry['kind'], entry['identifier']) != (kind, identifier)
+    ]
+
+    if quota is not None:
+        entries.append({'kind': kind, 'identifier': identifier, 'quota': quota})
+
+    group.base.extras.set(QUOTAS_EXTRA, entries)
+
+
+def get_resources(engines: dict, user) -> ResourcesType:
+    """Return the resources that are used by a sub process with the given engines.
+
+    :param engines: the engines of the generator inputs of the sub process, whose codes are nodes or their labels.
+    :param user: the user that launches the sub process.
+    :return: mapping of each kind in ``KINDS`` onto the sorted identifiers of the resources of that kind.
+    """
+    from aiida.orm import load_code
+
+    codes = [
+        load_code(engine['code']) if isinstance(engine['code'], str) else engine['code'] for engine in engines.values()
+    ]
+
+    return {
+        'computer': sorted({code.computer.uuid for code in codes}),
+        'code': sorted({code.uuid for code in codes}),
+        'user': [user.email],
+    }
+
+
+def get_usage() -> t.Dict[str, t.Dict[str, t.List[int]]]:
+    """Return the active admitted processes that hold each resource.
+
+    :return: mapping of each kind in ``KINDS`` onto a mapping of the identifiers of the resources onto the pks of the
+        active processes that hold them.
+    """
+    from aiida.orm import ProcessNode, QueryBuilder
+
+    query = QueryBuilder().append(
+        ProcessNode,
+        filters={
+            'attributes.process_state': {'in': list(ACTIVE_PROCESS_STATES)},
+            'extras': {'has_key': ADMISSION_EXTRA},
+        },
+        project=['id', f'extras.{ADMISSION_EXTRA}'],
+    )
+    usage = {kind: {} for kind in KINDS}
+
+    for pk, resources in query.iterall():
+        for kind in KINDS:
+            for identifier in resources.get(kind, []):
+                usage[kind].setdefault(identifier, []).append(pk)
+
+    return usage
+
+
+def request_admission(resources: ResourcesType) -> t.List[int]:
+    """Request the admission of a sub process that uses the given resources.
+
+    :param resources: the resources used by the sub process, as returned by :func:`get_resources`.
+    :return: the sorted pks of the active processes that hold the exhausted quotas, which is empty if the sub process
+        is admitted. The sub process should only be submitted once one of these processes has terminated.
+    """
+    quotas = get_quotas()
+    limited = [
+        (kind, identifier) for kind in KINDS for identifier in resources.get(kind, []) if identifier in quotas[kind]
+    ]
+
+    if not limited:
+        return []
+
+    usage = get_usage()
+    blocking = set()
+
+    for kind, identifier in limited:
+        holders = usage[kind].get(identifier, [])
+        if len(holders) >= quotas[kind][identifier]:
+            blocking.update(holders)
+
+    return sorted(blocking)
+
+
+def register_admission(node, resources: ResourcesType) -> None:
+    """Register that the process of the given node was admitted and holds the given resources while it is active.
+
+    :param node: the node of the admitted process.
+    :param resources: the resources used by the process, as returned by :func:`get_resources`.
+    """
+    node.base.extras.set(ADMISSION_EXTRA, resources)
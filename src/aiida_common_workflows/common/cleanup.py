@@ -0,0 +1,184 @@
+"""Cleanup of the remote working directories of the calculation jobs of a workflow that finished successfully.
+
+The remote working directories of the calculation jobs contain large files, like wavefunctions, charge densities and
+restart files, that remain on the file system of the remote computer after the workflow finished. If a workflow defines
+a ``cleanup`` policy, the remote folders of all the calculation jobs that it called, directly or through its sub
+processes, are cleaned once it finished successfully, except for the remote folders that are still referenced:
+
+* the remote folders that are an input of an active process that is not part of the workflow, e.g. the ``parent_folder``
+  of a bands workflow that continues from the relaxation;
+* the remote folders of the sub processes that are reused by an active workflow that was restarted from the workflow,
+  for example as its ``reference_workchain``, see :mod:`aiida_common_workflows.common.restart`.
+
+The policy has the keys:
+
+* ``keep_outputs``: whether to keep the remote folders that are returned as an output by the workflow itself, like the
+  ``remote_folder`` of the common relax workflow, such that a bands workflow can still be continued from them once the
+  relaxation finished. This is the default, since the bands workflow can only be launched after the cleanup. The remote
+  folders that are only returned by its sub processes, like those of the relaxations of an equation of state, are
+  cleaned;
+* ``batch_size``: the maximum number of remote folders that are cleaned over a single transport connection, such that
+  the remote folders on the same computer share the connection without keeping it open indefinitely.
+
+Contrary to the input generators, which do not open transports since they are called in the steps of the workflows, the
+cleanup opens its transports directly, without the transport queue of the daemon runner. The cleanup is called from
+``on_terminated``, which is a synchronous callback of the event loop that cannot wait for a transport of the queue, and
+only once the workflow terminated, after which it cannot launch another process that does the cleanup. This is the same
+as the ``clean_workdir`` input of the ``BaseRestartWorkChain`` of ``aiida-core``. The event loop of the daemon worker is
+blocked while the remote folders are cleaned, which is why the remote folders of the same computer are cleaned over
+shared connections instead of opening a connection for each of them.
+"""
+import typing as t
+
+from .restart import REUSED_EXTRA
+
+__all__ = (
+    'DEFAULT_POLICY',
+    'clean_remote_folders',
+    'clean_workdir',
+    'get_remote_folders',
+    'get_reused_uuids',
+    'validate_policy',
+)
+
+ACTIVE_PROCESS_STATES = ('created', 'waiting', 'running')
+DEFAULT_POLICY = {
+    'keep_outputs': True,
+    'batch_size': 20,
+}
+
+
+def validate_policy(value: dict, _) -> t.Optional[str]:
+    """Validate the cleanup policy."""
+    unknown = set(value).difference(DEFAULT_POLICY)
+    if unknown:
+        return f'the cleanup policy contains unknown keys: {unknown}'
+
+    policy = {**DEFAULT_POLICY, **value}
+
+    if not isinstance(policy['keep_outputs'], bool):
+        return 'the `keep_outputs` should be a boolean.'
+
+    if not isinstance(policy['batch_size'], int) or isinstance(policy['batch_size'], bool) or policy['batch_size'] < 1:
+        return 'the `batch_size` should be a positive integer.'
+
+
+def get_reused_uuids() -> t.Set[str]:
+    """Return the UUIDs of the sub processes that are reused by the workflows that are still active.
+
+    :return: the set of UUIDs registered in the ``REUSED_EXTRA`` of the active workflows.
+    """
+    from aiida.orm import QueryBuilder, WorkflowNode
+
+    query = QueryBuilder().append(
+        WorkflowNode,
+        filters={'attributes.process_state': {'in': list(ACTIVE_PROCESS_STATES)}},
+        project=f'extras.{REUSED_EXTRA}',
+    )
+
+    return {uuid for uuids in query.all(flat=True) if uuids for uuid in uuids}
+
+
+def _is_used_by_active_process(remote, excluded: t.Set[int]) -> bool:
+    """Return whether the remote folder is an input of an active process whose pk is not in the excluded set."""
+    from aiida.common.links import LinkType
+
+    outgoing = remote.base.links.get_outgoing(link_type=(LinkType.INPUT_CALC, LinkType.INPUT_WORK)).all_nodes()
+
+    return any(node.pk not in excluded and not node.is_terminated for node in outgoing)
+
+
+def get_remote_folders(node, keep_outputs: bool = True) -> list:
+    """Return the remote folders of the calculation jobs called by the given workflow that can be cleaned.
+
+    :param node: the node of the workflow.
+    :param keep_outputs: whether to keep the remote folders that are returned as an output by the given workflow.
+    :return: the ``RemoteData`` nodes that are not cleaned yet and are not referenced by another active process.
+    """
+    from aiida.common.links import LinkType
+    from aiida.orm import CalcJobNode
+
+    descendants = node.called_descendants
+    excluded = {descendant.pk for descendant in descendants}
+    reused = get_reused_uuids()
+    protected = set()
+
+    for descendant in descendants:
+        if descendant.uuid in reused:
+            protected.update(child.pk for child in descendant.called_descendants)
+
+    remote_folders = []
+
+    for descendant in sorted(descendants, key=lambda descendant: descendant.ctime):
+        if not isinstance(descendant, CalcJobNode) or descendant.pk in protected:
+            continue
+
+        if 'remote_folder' not in descendant.outputs:
+            continue
+
+        remote = descendant.outputs.remote_folder
+
+        if remote.is_cleaned or _is_used_by_active_process(remote, excluded):
+            continue
+
+        returned_by = {link.node.pk for link in remote.base.links.get_incoming(link_type=LinkType.RETURN).all()}
+
+        if keep_outputs and node.pk in returned_by:
+            continue
+
+        remote_folders.append(remote)
+
+    return remote_folders
+
+
+def clean_remote_folders(remote_folders: t.Sequence, batch_size: int) -> t.Tuple[t.List[int], t.List[int]]:
+    """Clean the given remote folders in batches that share a transport connection to their computer.
+
+    An error while connecting to a computer or cleaning a remote folder does not stop the cleanup of the others, since
+    the workflow already finished and the remote folders that could not be cleaned can be cleaned manually.
+
+    :param remote_folders: the ``RemoteData`` nodes to clean.
+    :param batch_size: the maximum number of remote folders that are cleaned over a single transport connection.
+    :return: the pks of the remote folders that were cleaned and of those that could not be cleaned.
+    """
+    groups = {}
+
+    for remote in remote_folders:
+        authinfo = remote.get_authinfo()
+        groups.setdefault(authinfo.pk, (authinfo, []))[1].append(remote)
+
+    cleaned = []
+    failed = []
+
+    for authinfo, remotes in groups.values():
+        for start in range(0, len(remotes), batch_size):
+            batch = remotes[start : start + batch_size]
+
+            try:
+                with authinfo.get_transport() as transport:
+                    for remote in batch:
+                        try:
+                            remote._clean(transport=transport)
+                        except (OSError, ValueError):
+                            failed.append(remote.pk)
+                        else:
+                            cleaned.append(remote.pk)
+            except Exception:
+                # The connection could not be opened, so none of the remaining remote folders in the batch were cleaned.
+                handled = set(cleaned).union(failed)
+                failed.extend(remote.pk for remote in batch if remote.pk not in handled)
+
+    return cleaned, failed
+
+
+def clean_workdir(node, policy: dict) -> t.Tuple[t.List[int], t.List[int]]:
+    """Clean the remote folders of the calculation jobs called by the given workflow following the cleanup policy.
+
+    :param node: the node of the workflow.
+    :param policy: the cleanup policy, whose missing keys take the values of ``DEFAULT_POLICY``.
+    :return: the pks of the remote folders that were cleaned and of those that could not be cleaned.
+    """
+    policy = {**DEFAULT_POLICY, **policy}
+    remote_folders = get_remote_folders(node, keep_outputs=policy['keep_outputs'])
+
+    return clean_remote_folders(remote_folders, policy['batch_size'])
@@ -0,0 +1,262 @@
+"""Utilities to compare the equations of state computed with different codes.
+
+The comparison uses the metrics that were introduced for the verification of DFT implementations with the
+``verification-PBE-v1`` protocols:
+
+* the Δ-factor: the root-mean-square energy difference per atom between the two fitted Birch-Murnaghan curves over the
+  volume interval of ±6% around the average equilibrium volume, in meV/atom;
+* the nu metric: the weighted relative difference of the equilibrium volume, bulk modulus and its pressure derivative;
+* the ε metric: the root-mean-square energy difference of the two curves normalized by their average variation.
+
+The Birch-Murnaghan fit of each workflow that finished successfully is computed only once and is cached in the extras of
+the workflow node under the key ``FIT_EXTRA_KEY``. Failed fits are not cached, such that they are retried on the next
+call. All metrics are computed for all pairs of workflows at once with vectorized operations.
+"""
+import collections
+import typing as t
+
+import numpy
+
+from .export import WorkflowsType, _get_workflows_filter
+
+__all__ = (
+    'calculate_delta',
+    'calculate_epsilon',
+    'calculate_nu',
+    'compare_eos',
+    'get_eos_fits',
+    'get_relative_difference',
+)
+
+FIT_EXTRA_KEY = 'common_workflows_eos_fit'
+FIT_VERSION = 1
+PROCESS_TYPE_EOS = 'aiida.workflows:common_workflows.eos'
+RELATIVE_VOLUME_RANGE = 0.06
+NUMBER_SAMPLING_POINTS = 201
+
+
+def _get_formula(sites: t.List[dict], kinds: t.List[dict]) -> str:
+    """Return the chemical formula from the serialized sites and kinds of a ``StructureData``."""
+    from aiida.orm.nodes.data.structure import get_formula
+
+    symbols = {kind['name']: kind['symbols'] for kind in kinds}
+    return get_formula([''.join(symbols[site['kind_name']]) for site in sites])
+
+
+def _fit_workflows(pks: t.List[int], number_of_atoms: t.Dict[int, int]) -> t.Dict[int, dict]:
+    """Fit the Birch-Murnaghan equation of state to the results of the given workflows and cache them in their extras.
+
+    Only the successful fits are cached, the error of a failed fit is returned but not stored.
+
+    :param pks: the pks of the ``EquationOfStateWorkChain`` workflows to fit.
+    :param number_of_atoms: mapping of the pk of each workflow onto the number of atoms of its structure.
+    :return: mapping of the pk of each workflow onto the fit, which contains either the fitted parameters per atom, or
+        an error message if the fit failed.
+    """
+    from aiida.orm import load_node
+
+    from aiida_common_workflows.common.visualization.eos import fit_birch_murnaghan_params
+
+    from .export import get_eos_data
+
+    columns = get_eos_data(pks)
+    fits = {}
+
+    for pk in pks:
+        mask = columns['workflow'] == pk
+        volumes = columns['volume'][mask] / number_of_atoms[pk]
+        energies = columns['energy'][mask] / number_of_atoms[pk]
+
+        if len(volumes) < 4:
+            fit = {'error': f'at least 4 points are required for the fit but only {len(volumes)} are available.'}
+        else:
+            try:
+                (e0, v0, b0, b1), _ = fit_birch_murnaghan_params(volumes, energies)
+            except (RuntimeError, ValueError) as exception:
+                fit = {'error': f'the fit failed: {exception}'}
+            else:
+                fit = {'E0': float(e0), 'V0': float(v0), 'B0': float(b0), 'B1': float(b1)}
+
+        if 'error' not in fit:
+            fit['version'] = FIT_VERSION
+            load_node(pk).base.extras.set(FIT_EXTRA_KEY, fit)
+
+        fits[pk] = fit
+
+    return fits
+
+
+def get_eos_fits(workflows: WorkflowsType) -> t.Dict[int, dict]:
+    """Return the Birch-Murnaghan fits of the given ``EquationOfStateWorkChain`` workflows.
+
+    Fits that are cached in the extras of the workflow nodes are reused, all other workflows that finished successfully
+    are fitted and the results are cached. Workflows that are still running or that failed are not fitted and get an
+    error instead. The cached fits are retrieved together with the structure of each workflow in a single query.
+
+    :param workflows: a group or a list of workflow nodes or their pks.
+    :return: mapping of the pk of each workflow onto a dictionary with the key ``hash`` and ``formula`` of its input
+        structure, the ``number_of_atoms`` and either the fitted parameters ``E0``, ``V0``, ``B0`` and ``B1`` per atom,
+        or the ``error`` message if the fit failed.
+    """
+    from aiida.common import LinkType
+    from aiida.orm import Group, QueryBuilder, StructureData, WorkflowNode
+    from plumpy.process_states import ProcessState
+
+    group, filters = _get_workflows_filter(workflows, PROCESS_TYPE_EOS)
+    query = QueryBuilder()
+
+    if group is not None:
+        query.append(Group, filters={'id': group}, tag='group')
+        query.append(WorkflowNode, with_group='group', filters=filters, tag='workflow')
+    else:
+        query.append(WorkflowNode, filters=filters, tag='workflow')
+
+    query.add_projection(
+        'workflow', ['id', f'extras.{FIT_EXTRA_KEY}', 'attributes.process_state', 'attributes.exit_status']
+    )
+    query.append(
+        StructureData,
+        with_outgoing='workflow',
+        edge_filters={'type': LinkType.INPUT_WORK.value, 'label': 'structure'},
+        project=['extras._aiida_hash', 'attributes.sites', 'attributes.kinds'],
+    )
+
+    results = {}
+    uncached = []
+
+    for pk, fit, process_state, exit_status, structure_hash, sites, kinds in query.iterall():
+        results[pk] = {'hash': structure_hash, 'formula': _get_formula(sites, kinds), 'number_of_atoms': len(sites)}
+
+        if process_state != ProcessState.FINISHED.value or exit_status != 0:
+            results[pk]['error'] = 'the workflow did not finish successfully.'
+        elif fit is not None and fit.get('version') == FIT_VERSION:
+            results[pk].update(fit)
+        else:
+            uncached.append(pk)
+
+    if uncached:
+        number_of_atoms = {pk: results[pk]['number_of_atoms'] for pk in uncached}
+        for pk, fit in _fit_workflows(uncached, number_of_atoms).items():
+            results[pk].update(fit)
+
+    for result in results.values():
+        result.pop('version', None)
+
+    return results
+
+
+def _get_volume_grid(v0_a: numpy.ndarray, v0_b: numpy.ndarray, relative_range: float) -> numpy.ndarray:
+    """Return a grid of volumes for each pair over the given relative range around the average equilibrium volume.
+
+    :return: array with shape ``(number of pairs, NUMBER_SAMPLING_POINTS)``.
+    """
+    v0_average = (numpy.asarray(v0_a) + numpy.asarray(v0_b)) / 2
+    factors = numpy.linspace(1 - relative_range, 1 + relative_range, NUMBER_SAMPLING_POINTS)
+    return numpy.atleast_1d(v0_average)[:, numpy.newaxis] * factors
+
+
+def _get_energies(volumes: numpy.ndarray, v0, b0, b1) -> numpy.ndarray:
+    """Return the Birch-Murnaghan energies with zero minimum energy on the volume grid of each pair."""
+    from aiida_common_workflows.common.visualization.eos import birch_murnaghan
+
+    def expand(values):
+        return numpy.atleast_1d(numpy.asarray(values, dtype=float))[:, numpy.newaxis]
+
+    return birch_murnaghan(volumes, 0.0, expand(v0), expand(b0), expand(b1))
+
+
+def calculate_delta(params_a, params_b, relative_range: float = RELATIVE_VOLUME_RANGE) -> numpy.ndarray:
+    """Return the Δ-factor in meV/atom between pairs of equations of state.
+
+    :param params_a: sequence of the arrays of the equilibrium volume per atom in Å^3, the bulk modulus in eV/Å^3 and
+        its dimensionless pressure derivative, with one entry for each pair.
+    :param params_b: the parameters of the other equation of state of each pair, in the same format as ``params_a``.
+    :param relative_range: the relative range around the average equilibrium volume over which to integrate.
+    :return: array with the Δ-factor of each pair.
+    """
+    volumes = _get_volume_grid(params_a[0], params_b[0], relative_range)
+    difference = (_get_energies(volumes, *params_a) - _get_energies(volumes, *params_b)) ** 2
+    integral = numpy.sum((difference[:, 1:] + difference[:, :-1]) / 2 * numpy.diff(volumes, axis=1), axis=1)
+    return 1000 * numpy.sqrt(integral / (volumes[:, -1] - volumes[:, 0]))
+
+
+def calculate_epsilon(params_a, params_b, relative_range: float = RELATIVE_VOLUME_RANGE) -> numpy.ndarray:
+    """Return the dimensionless ε metric between pairs of equations of state.
+
+    :param params_a: sequence of the arrays of the equilibrium volume per atom in Å^3, the bulk modulus in eV/Å^3 and
+        its dimensionless pressure derivative, with one entry for each pair.
+    :param params_b: the parameters of the other equation of state of each pair, in the same format as ``params_a``.
+    :param relative_range: the relative range around the average equilibrium volume over which to average.
+    :return: array with the ε metric of each pair.
+    """
+    volumes = _get_volume_grid(params_a[0], params_b[0], relative_range)
+    energies_a = _get_energies(volumes, *params_a)
+    energies_b = _get_energies(volumes, *params_b)
+
+    difference = numpy.mean((energies_a - energies_b) ** 2, axis=1)
+    variance_a = numpy.mean((energies_a - energies_a.mean(axis=1, keepdims=True)) ** 2, axis=1)
+    variance_b = numpy.mean((energies_b - energies_b.mean(axis=1, keepdims=True)) ** 2, axis=1)
+
+    return numpy.sqrt(difference / numpy.sqrt(variance_a * variance_b))
+
+
+def get_relative_difference(values_a, values_b) -> numpy.ndarray:
+    """Return the relative difference of the values with respect to their average."""
+    values_a = numpy.asarray(values_a, dtype=float)
+    values_b = numpy.asarray(values_b, dtype=float)
+    return 2 * (values_a - values_b) / (values_a + values_b)
+
+
+def calculate_nu(params_a, params_b, weight_b0: float = 1 / 8, weight_b1: float = 1 / 64) -> numpy.ndarray:
+    """Return the dimensionless nu metric between pairs of equations of state.
+
+    :param params_a: sequence of the arrays of the equilibrium volume per atom, the bulk modulus and its pressure
+        derivative, with one entry for each pair.
+    :param params_b: the parameters of the other equation of state of each pair, in the same format as ``params_a``.
+    :param weight_b0: the weight of the relative difference of the bulk modulus.
+    :param weight_b1: the weight of the relative difference of the pressure derivative of the bulk modulus.
+    :return: array with the nu metric of each pair.
+    """
+    weights = (1, weight_b0, weight_b1)
+    differences = [weight * get_relative_difference(a, b) for weight, a, b in zip(weights, params_a, params_b)]
+    return 100 * numpy.sqrt(sum(difference**2 for difference in differences))
+
+
+def compare_eos(workflows_a: WorkflowsType, workflows_b: WorkflowsType) -> t.Dict[str, numpy.ndarray]:
+    """Compare the equations of state of two sets of ``EquationOfStateWorkChain`` workflows, e.g. of two codes.
+
+    The workflows of both sets are paired by the hash of their input structure. If a set contains multiple workflows for
+    the same structure, the most recent one is used. Pairs for which the fit of either workflow failed are skipped.
+
+    :param workflows_a: a group or a list of workflow nodes or their pks.
+    :param workflows_b: a group or a list of workflow nodes or their pks.
+    :return: dictionary with the columns ``formula``, ``workflow_a``, ``workflow_b``, ``delta``, ``nu``, ``epsilon``
+        and the relative differences ``V0_rel``, ``B0_rel`` and ``B1_rel``, sorted by formula.
+    """
+    paired = collections.defaultdict(dict)
+
+    for name, workflows in (('a', workflows_a), ('b', workflows_b)):
+        for pk, fit in sorted(get_eos_fits(workflows).items()):
+            if 'error' not in fit:
+                paired[fit['hash']][name] = (pk, fit)
+
+    pairs = [(entry['a'], entry['b']) for entry in paired.values() if len(entry) == 2]
+    pairs.sort(key=lambda pair: (pair[0][1]['formula'], pair[0][0]))
+
+    def get_column(index, key):
+        return numpy.array([pair[index][1][key] for pair in pairs], dtype=float)
+
+    params_a = [get_column(0, key) for key in ('V0', 'B0', 'B1')]
+    params_b = [get_column(1, key) for key in ('V0', 'B0', 'B1')]
+
+    return {
+        'formula': numpy.array([pair[0][1]['formula'] for pair in pairs], dtype=str),
+        'workflow_a': numpy.array([pair[0][0] for pair in pairs], dtype=int),
+        'workflow_b': numpy.array([pair[1][0] for pair in pairs], dtype=int),
+        'delta': calculate_delta(params_a, params_b),
+        'nu': calculate_nu(params_a, params_b),
+        'epsilon': calculate_epsilon(params_a, params_b),
+        'V0_rel': get_relative_difference(params_a[0], params_b[0]),
+        'B0_rel': get_relative_difference(params_a[1], params_b[1]),
+        'B1_rel': get_relative_difference(params_a[2], params_b[2]),
+    }
@@ -0,0 +1,232 @@
+"""Utilities to export the results of many equation of state and dissociation curve workflows in bulk.
+
+The results are retrieved with a few projected queries, one for each output namespace, without loading any of the
+nodes themselves. They are returned in columnar format: a dictionary of arrays of equal length with one row for each
+point of each workflow, which can be written to a CSV, Parquet or NPZ file with ``write_columns``.
+"""
+import csv
+import pathlib
+import typing as t
+
+import numpy
+
+if t.TYPE_CHECKING:
+    from aiida.orm import Group, WorkflowNode
+
+__all__ = ('get_eos_data', 'get_dissociation_curve_data', 'write_columns')
+
+FILE_FORMATS = ('csv', 'parquet', 'npz')
+
+WorkflowsType = t.Union['Group', t.Iterable[t.Union['WorkflowNode', int]]]
+
+
+def _get_workflows_filter(workflows: WorkflowsType, process_type: str) -> t.Tuple[t.Optional[int], dict]:
+    """Return the pk of the group and the filters for the workflows that should be exported.
+
+    :param workflows: a group or a list of workflow nodes or their pks.
+    :param process_type: the process type of the workflows that should be exported.
+    :return: tuple of the pk of the group, or ``None`` if a list of workflows is specified, and the workflow filters.
+    :raises ValueError: if any of the workflows in the list does not have the expected process type.
+    """
+    from aiida.orm import Group, QueryBuilder, WorkflowNode
+
+    if isinstance(workflows, Group):
+        return workflows.pk, {'process_type': process_type}
+
+    pks = {getattr(workflow, 'pk', workflow) for workflow in workflows}
+    filters = {'id': {'in': list(pks)}, 'process_type': process_type}
+    invalid = pks.difference(QueryBuilder().append(WorkflowNode, filters=filters, project='id').all(flat=True))
+
+    if invalid:
+        raise ValueError(f'the workflows with pks {sorted(invalid)} do not have the process type `{process_type}`.')
+
+    return None, filters
+
+
+def _query_call_tree(workflows: WorkflowsType, project: t.Sequence[str]) -> t.Dict[int, t.Tuple[t.Optional[int], list]]:
+    """Return the given workflows and all the processes in their call trees with the projected properties.
+
+    The call tree is traversed one level at a time, such that the number of queries is set by its depth rather than by
+    the number of processes.
+
+    :param workflows: a group or a list of workflow nodes or their pks.
+    :param project: the properties of the process nodes to project.
+    :return: mapping of the pk of each process onto a tuple of the pk of the process that called it, which is ``None``
+        for the given workflows, and the list of its projected properties. Each caller precedes the processes it called.
+    """
+    from aiida.common import LinkType
+    from aiida.orm import Group, ProcessNode, QueryBuilder, WorkflowNode
+
+    project = ['id', *project]
+    query = QueryBuilder()
+
+    if isinstance(workflows, Group):
+        query.append(Group, filters={'id': workflows.pk}, tag='group')
+        query.append(WorkflowNode, with_group='group', project=project)
+    else:
+        pks = [getattr(workflow, 'pk', workflow) for workflow in workflows]
+        if not pks:
+            return {}
+        query.append(WorkflowNode, filters={'id': {'in': pks}}, project=project)
+
+    processes = {row[0]: (None, row[1:]) for row in query.all()}
+    callers = list(processes)
+
+    while callers:
+        query = QueryBuilder()
+        query.append(ProcessNode, filters={'id': {'in': callers}}, project='id', tag='caller')
+        query.append(
+            ProcessNode,
+            with_incoming='caller',
+            edge_filters={'type': {'in': [LinkType.CALL_CALC.value, LinkType.CALL_WORK.value]}},
+            project=project,
+        )
+        callers = []
+
+        for caller, pk, *values in query.all():
+            if pk not in processes:
+                processes[pk] = (caller, values)
+                callers.append(pk)
+
+    return processes
+
+
+def _query_outputs(group: t.Optional[int], filters: dict, namespace: str, project: str) -> dict:
+    """Return a projected attribute of the outputs in the given output namespace of the selected workflows.
+
+    :param group: the pk of the group containing the workflows or ``None`` if the filters select the workflows.
+    :param filters: the filters for the workflows.
+    :param namespace: the output namespace, whose outputs are expected to have link labels ``{namespace}__{index}``.
+    :param project: the attribute of the output nodes to project.
+    :return: dictionary mapping tuples of the workflow pk and the index of the output onto the projected attribute.
+    """
+    from aiida.common import LinkType
+    from aiida.orm import Data, Group, QueryBuilder, WorkflowNode
+
+    query = QueryBuilder()
+
+    if group is not None:
+        query.append(Group, filters={'id': group}, tag='group')
+        query.append(WorkflowNode, with_group='group', filters=filters, project='id', tag='workflow')
+    else:
+        query.append(WorkflowNode, filters=filters, project='id', tag='workflow')
+
+    query.append(
+        Data,
+        with_incoming='workflow',
+        edge_filters={'type': LinkType.RETURN.value, 'label': {'like': f'{namespace}__%'}},
+        edge_project='label',
+        edge_tag='link',
+        project=project,
+        tag='output',
+    )
+
+    return {
+        (entry['workflow']['id'], int(entry['link']['label'][len(namespace) + 2 :])): entry['output'][project]
+        for entry in query.iterdict()
+    }
+
+
+def _get_columns(  # noqa: PLR0913
+    workflows: WorkflowsType,
+    process_type: str,
+    namespace: str,
+    project: str,
+    name: str,
+    convert: t.Callable[[list], numpy.ndarray],
+) -> t.Dict[str, numpy.ndarray]:
+    """Return the columns of the results of the given workflows, sorted by workflow and the column ``name``.
+
+    Only points for which both the total energy and the output in the given namespace exist are included.
+
+    :param workflows: a group or a list of workflow nodes or their pks.
+    :param process_type: the process type of the workflows that should be exported.
+    :param namespace: the output namespace that defines the independent variable of the workflow.
+    :param project: the attribute of the outputs in the namespace that is projected.
+    :param name: the name of the column of the independent variable.
+    :param convert: callable that converts the list of projected attributes into the column ``name``.
+    :return: dictionary with the columns ``workflow``, ``index``, ``name``, ``energy`` and ``magnetization``.
+    """
+    group, filters = _get_workflows_filter(workflows, process_type)
+    values = _query_outputs(group, filters, namespace, project)
+    energies = _query_outputs(group, filters, 'total_energies', 'attributes.value')
+    magnetizations = _query_outputs(group, filters, 'total_magnetizations', 'attributes.value')
+
+    keys = sorted(set(values).intersection(energies))
+    columns = {
+        'workflow': numpy.array([key[0] for key in keys], dtype=int),
+        'index': numpy.array([key[1] for key in keys], dtype=int),
+        name: convert([values[key] for key in keys]),
+        'energy': numpy.array([energies[key] for key in keys], dtype=float),
+        'magnetization': numpy.array([magnetizations.get(key, numpy.nan) for key in keys], dtype=float),
+    }
+
+    order = numpy.lexsort((columns[name], columns['workflow']))
+
+    return {key: column[order] for key, column in columns.items()}
+
+
+def _get_volumes(cells: list) -> numpy.ndarray:
+    """Return the volumes of the given cells."""
+    return numpy.abs(numpy.linalg.det(numpy.array(cells, dtype=float).reshape(-1, 3, 3)))
+
+
+def get_eos_data(workflows: WorkflowsType) -> t.Dict[str, numpy.ndarray]:
+    """Return the volumes, energies and magnetizations of the given ``EquationOfStateWorkChain`` workflows.
+
+    :param workflows: a group or a list of workflow nodes or their pks.
+    :return: dictionary with the columns ``workflow``, ``index``, ``volume``, ``energy`` and ``magnetization``, sorted
+        by workflow and volume. The magnetization is ``nan`` for points where it is not defined.
+    :raises ValueError: if any of the workflows in the list is not an ``EquationOfStateWorkChain``.
+    """
+    process_type = 'aiida.workflows:common_workflows.eos'
+    return _get_columns(workflows, process_type, 'structures', 'attributes.cell', 'volume', _get_volumes)
+
+
+def get_dissociation_curve_data(workflows: WorkflowsType) -> t.Dict[str, numpy.ndarray]:
+    """Return the distances, energies and magnetizations of the given ``DissociationCurveWorkChain`` workflows.
+
+    :param workflows: a group or a list of workflow nodes or their pks.
+    :return: dictionary with the columns ``workflow``, ``index``, ``distance``, ``energy`` and ``magnetization``, sorted
+        by workflow and distance. The magnetization is ``nan`` for points where it is not defined.
+    :raises ValueError: if any of the workflows in the list is not a ``DissociationCurveWorkChain``.
+    """
+    process_type = 'aiida.workflows:common_workflows.dissociation_curve'
+    return _get_columns(
+        workflows, process_type, 'distances', 'attributes.value', 'distance', lambda values: numpy.array(values, float)
+    )
+
+
+def write_columns(
+    columns: t.Dict[str, numpy.ndarray], filepath: t.Union[str, pathlib.Path], file_format: t.Optional[str] = None
+) -> None:
+    """Write the columns to a file in CSV, Parquet or NPZ format.
+
+    :param columns: dictionary of arrays of equal length.
+    :param filepath: the path of the file to write.
+    :param file_format: the file format, one of ``FILE_FORMATS``. By default it is determined from the file extension.
+    :raises ValueError: if the file format is not supported.
+    :raises ImportError: if the Parquet format is requested but ``pyarrow`` is not installed.
+    """
+    filepath = pathlib.Path(filepath)
+    file_format = file_format or filepath.suffix.lstrip('.').lower()
+
+    if file_format not in FILE_FORMATS:
+        raise ValueError(f'unsupported file format `{file_format}`, choose one of {FILE_FORMATS}.')
+
+    if file_format == 'csv':
+        with filepath.open('w', newline='', encoding='utf-8') as handle:
+            writer = csv.writer(handle)
+            writer.writerow(columns.keys())
+            writer.writerows(zip(*(column.tolist() for column in columns.values())))
+    elif file_format == 'npz':
+        with filepath.open('wb') as handle:
+            numpy.savez(handle, **columns)
+    else:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as exception:
+            raise ImportError('writing the Parquet format requires `pyarrow` to be installed.') from exception
+
+        pyarrow.parquet.write_table(pyarrow.table(columns), str(filepath))
@@ -0,0 +1,224 @@
+"""Scheduler that packs many small calculation jobs into the allocations of a task farm.
+
+Small calculation jobs, like those of the molecular codes or of the points of a dissociation curve, run for seconds to
+minutes but can wait much longer in the queue of the scheduler. With the ``common_workflows.farm`` scheduler, submitting
+a job merely adds it to the queue of a task farm, which is a directory on the file system of the computer. The jobs in
+the queue are run by workers that are started inside one or more allocations of the actual scheduler, such that a single
+allocation runs many jobs side by side or back to back. Each job remains a separate calculation job in the provenance
+graph, such that the results of each workflow map to its own nodes.
+
+A worker is a bash script, as returned by :func:`get_worker_script` or the ``acwf farm-worker`` command, that runs the
+queued jobs in order of submission as long as enough of its slots are free. Each job occupies as many slots as its total
+number of MPI processes. Jobs that need more slots than the worker has are skipped and left in the queue for a larger
+worker, such that they do not oversubscribe the allocation. The directory of the task farm is defined by the
+``ACWF_FARM_DIRECTORY`` environment variable, which defaults to ``$HOME/.acwf-farm``, and should be on a file system
+shared by the login node and the compute nodes. Multiple workers can serve the same task farm, since they claim jobs
+from the queue by moving them atomically.
+
+The task farm contains the following directories:
+
+* ``queue``: one file per queued job, named after its job id and containing its working directory and submit script;
+* ``running``: one directory per worker, whose modification time is updated by the worker as a heartbeat, containing
+  the files of the jobs that it is running. The jobs of workers without a heartbeat for ``STALE_MINUTES``, e.g. because
+  their allocation ended, are no longer reported, such that the engine considers them to be terminated;
+* ``cancel``: one file per job that was killed while running, which is picked up by the worker running it.
+"""
+import typing as t
+
+from aiida.common.escaping import escape_for_bash
+from aiida.schedulers import SchedulerError
+from aiida.schedulers.datastructures import JobInfo, JobState, JobTemplate
+from aiida.schedulers.plugins.direct import DirectScheduler
+
+__all__ = ('FarmScheduler', 'get_worker_script')
+
+FARM_DIRECTORY = '"${ACWF_FARM_DIRECTORY:-$HOME/.acwf-farm}"'
+STALE_MINUTES = 5
+
+WORKER_SCRIPT = """#!/bin/bash
+# Worker of the task farm of the `common_workflows.farm` scheduler of `aiida-common-workflows`.
+farm={farm_directory}
+slots={slots}
+idle_timeout={idle_timeout}
+lifetime={lifetime}
+worker="$(hostname)-$$"
+
+mkdir -p "$farm/queue" "$farm/running/$worker" "$farm/cancel"
+start=$(date +%s)
+last_active=$start
+free=$slots
+declare -A pids=() sizes=()
+
+terminate() {{
+    for pid in "${{pids[@]}}"; do kill "$pid" 2>/dev/null; done
+    wait
+    rm -rf "$farm/running/$worker"
+    exit
+}}
+trap terminate TERM INT
+
+while true; do
+    now=$(date +%s)
+    touch "$farm/running/$worker"
+
+    for task in "${{!pids[@]}}"; do
+        if [ -e "$farm/cancel/$task" ]; then
+            kill "${{pids[$task]}}" 2>/dev/null
+            rm -f "$farm/cancel/$task"
+        fi
+        if ! kill -0 "${{pids[$task]}}" 2>/dev/null; then
+            wait "${{pids[$task]}}"
+            free=$((free + sizes[$task]))
+            unset "pids[$task]" "sizes[$task]"
+            rm -f "$farm/running/$worker/$task"
+            last_active=$now
+        fi
+    done
+
+    for entry in "$farm"/queue/*; do
+        [ -e "$entry" ] || break
+        task="${{entry##*/}}"
+        {{ read -r directory; read -r script; }} < "$entry" || continue
+        size=$(sed -n 's/^#FARM slots=//p' "$directory/$script")
+        walltime=$(sed -n 's/^#FARM walltime=//p' "$directory/$script")
+        size=${{size:-1}}
+        walltime=${{walltime:-0}}
+        (( size > slots )) && continue
+        (( size > free )) && break
+        (( lifetime > 0 && (walltime == 0 || now + walltime > start + lifetime) )) && break
+        mv "$entry" "$farm/running/$worker/$task" 2>/dev/null || continue
+        (cd "$directory" && exec timeout "$walltime" bash "$script") > /dev/null 2>&1 &
+        pids[$task]=$!
+        sizes[$task]=$size
+        free=$((free - size))
+        last_active=$now
+    done
+
+    if (( ${{#pids[@]}} == 0 )); then
+        (( idle_timeout > 0 && now - last_active >= idle_timeout )) && break
+        (( lifetime > 0 && now - start >= lifetime )) && break
+    fi
+
+    sleep {poll_interval}
+done
+
+rm -rf "$farm/running/$worker"
+"""
+
+
+def get_worker_script(slots: int, idle_timeout: int = 300, lifetime: int = 0, poll_interval: int = 5) -> str:
+    """Return the bash script of a worker of the task farm.
+
+    The script should be run inside an allocation of the actual scheduler, e.g. as the body of its submit script. It
+    runs until it has been idle for ``idle_timeout`` seconds or until its lifetime is exhausted. A job is only started
+    if its wallclock time fits in the remaining lifetime, such that it is not killed when the allocation ends. Jobs that
+    do not define a wallclock time are therefore only run by workers with an unlimited lifetime.
+
+    :param slots: the number of slots of the worker, typically the number of cores of the allocation.
+    :param idle_timeout: the number of seconds without any jobs after which the worker stops, or zero to never stop.
+    :param lifetime: the number of seconds after which the worker stops, typically the wallclock time of the allocation,
+        or zero for an unlimited lifetime.
+    :param poll_interval: the number of seconds between checks of the queue and the running jobs.
+    :raises ValueError: if any of the arguments is invalid.
+    """
+    if slots < 1:
+        raise ValueError('the number of slots should be a positive integer.')
+
+    if min(idle_timeout, lifetime) < 0 or poll_interval < 1:
+        raise ValueError('the idle timeout and lifetime should be non-negative and the poll interval positive.')
+
+    if 0 < lifetime < poll_interval or 0 < idle_timeout < poll_interval:
+        raise ValueError('the idle timeout and lifetime should not be shorter than the poll interval.')
+
+    return WORKER_SCRIPT.format(
+        farm_directory=FARM_DIRECTORY,
+        slots=slots,
+        idle_timeout=idle_timeout,
+        lifetime=lifetime,
+        poll_interval=poll_interval,
+    )
+
+
+class FarmScheduler(DirectScheduler):
+    """Scheduler that submits jobs to a task farm whose workers run them inside the allocations of another scheduler.
+
+    See the module docstring of :mod:`aiida_common_workflows.common.farm` for the description of the task farm.
+    """
+
+    _logger = DirectScheduler._logger.getChild('farm')
+    _features: t.ClassVar[t.Dict[str, bool]] = {'can_query_by_user': False}
+
+    def _get_submit_script_header(self, job_tmpl: JobTemplate) -> str:
+        """Return the header of the submit script, which declares the slots and wallclock time needed by the job."""
+        slots = job_tmpl.job_resource.get_tot_num_mpiprocs() if job_tmpl.job_resource else 1
+        lines = [f'#FARM slots={slots}', f'#FARM walltime={int(job_tmpl.max_wallclock_seconds or 0)}']
+
+        return '\n'.join([*lines, super()._get_submit_script_header(job_tmpl)])
+
+    def _get_submit_command(self, submit_script: str) -> str:
+        """Return the command that adds the submit script to the queue of the task farm and prints the job id.
+
+        The entry of the queue is written under a hidden name first, such that workers never read a partial entry.
+
+        :param submit_script: the path of the submit script relative to the working directory, already bash-escaped.
+        """
+        return (
+            f'farm={FARM_DIRECTORY}; task="$(date +%s%N)-$$"; mkdir -p "$farm/queue" && '
+            f'printf "%s\\n%s\\n" "$PWD" {submit_script} > "$farm/queue/.$task" && '
+            'mv "$farm/queue/.$task" "$farm/queue/$task" && echo "$task"'
+        )
+
+    def _parse_submit_output(self, retval: int, stdout: str, stderr: str) -> str:
+        """Return the job id printed by the submit command.
+
+        :raises SchedulerError: if the submission failed.
+        """
+        if retval != 0 or not stdout.strip():
+            raise SchedulerError(f'failed to add the job to the task farm: retval={retval}, stderr={stderr.strip()}')
+
+        return stdout.strip()
+
+    def _get_joblist_command(self, jobs: t.Optional[t.List[str]] = None, user: t.Optional[str] = None) -> str:
+        """Return the command that lists the queued jobs and the running jobs of workers that are still alive.
+
+        All jobs of the task farm are listed, since the engine ignores the jobs it does not know about.
+        """
+        return (
+            f'farm={FARM_DIRECTORY}; ls -1 "$farm/queue" 2>/dev/null | sed "s/$/ Q/"; '
+            f'for worker in $(find "$farm/running" -mindepth 1 -maxdepth 1 -type d -mmin -{STALE_MINUTES} '
+            '2>/dev/null); do ls -1 "$worker" | sed "s/$/ R/"; done'
+        )
+
+    def _parse_joblist_output(self, retval: int, stdout: str, stderr: str) -> t.List[JobInfo]:
+        """Return the jobs listed by the joblist command.
+
+        :raises SchedulerError: if the command failed.
+        """
+        if retval != 0:
+            raise SchedulerError(f'failed to list the jobs of the task farm: retval={retval}, stderr={stderr.strip()}')
+
+        states = {'Q': JobState.QUEUED, 'R': JobState.RUNNING}
+        jobs = []
+
+        for line in stdout.splitlines():
+            if not line.strip():
+                continue
+            job_id, state = line.split()
+            job = JobInfo()
+            job.job_id = job_id
+            job.job_state = states[state]
+            jobs.append(job)
+
+        return jobs
+
+    def _get_kill_command(self, jobid: str) -> str:
+        """Return the command that removes the job from the queue or, if it is already running, cancels it."""
+        jobid = escape_for_bash(jobid)
+        return (
+            f'farm={FARM_DIRECTORY}; rm "$farm/queue/"{jobid} 2>/dev/null || '
+            f'{{ mkdir -p "$farm/cancel" && touch "$farm/cancel/"{jobid}; }}'
+        )
+
+    def _parse_kill_output(self, retval: int, stdout: str, stderr: str) -> bool:
+        """Return whether the kill command succeeded."""
+        return retval == 0
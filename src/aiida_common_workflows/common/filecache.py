@@ -0,0 +1,113 @@
+"""Content-addressed cache of static input files, like basis sets and pseudopotentials, on the remote computers.
+
+By default, the static input files of a calculation job are uploaded to its working directory, such that the same files
+are written to the file system of the remote computer again for every calculation job. Instead, the files can be
+uploaded once to a cache directory on the remote computer, in which each file is stored under the SHA-256 hash of its
+content::
+
+    <directory>/<hash>/<filename>
+
+The files are then symlinked into the working directory of each calculation job by the ``prepend_text`` of its job
+script. Since the path of a file only depends on its content, it is uploaded once for all the calculation jobs that use
+it, and a modified file never replaces the version that is used by calculation jobs that are running. A file is first
+uploaded to a temporary path and then renamed, such that concurrent uploads of the same file do not corrupt it.
+
+The cache is used by the input generators that support the ``file_cache`` optional feature, which is the absolute path
+of the cache directory on the computer of the code of the engine. The input generators only emit the symlinks, since
+they are also called in the steps of workflows that run in the daemon, where opening a transport would block the event
+loop and bypass the transport queue of the engine. The cache therefore has to be populated beforehand, for example in
+the submission script, with the static files returned by the ``get_static_files`` method of the input generator::
+
+    generator = RelaxWorkChain.get_input_generator()
+    upload_files(code.computer, directory, generator.get_static_files())
+    builder = generator.get_builder(..., file_cache=directory)
+
+Note that the cached files are not part of the provenance of the calculation jobs, which only record the symlinks in the
+``prepend_text`` of their options, and that they are not removed from the remote computer when the calculation jobs are
+cleaned.
+"""
+import hashlib
+import pathlib
+import shlex
+import tempfile
+import typing as t
+import uuid
+
+__all__ = ('get_cached_path', 'get_cached_paths', 'get_file_hash', 'get_symlink_commands', 'upload_files')
+
+
+def get_file_hash(node) -> str:
+    """Return the SHA-256 hash of the content of the given file.
+
+    :param node: the ``SinglefileData`` node of the file.
+    :return: the hexadecimal digest of the hash.
+    """
+    return hashlib.sha256(node.get_content(mode='rb')).hexdigest()
+
+
+def get_cached_path(directory: str, node) -> str:
+    """Return the path of the given file in the cache directory.
+
+    :param directory: the absolute path of the cache directory on the remote computer.
+    :param node: the ``SinglefileData`` node of the file.
+    :return: the absolute path of the file on the remote computer.
+    """
+    return str(pathlib.PurePosixPath(directory) / get_file_hash(node) / node.filename)
+
+
+def get_cached_paths(directory: str, nodes: t.Iterable) -> t.Dict[str, str]:
+    """Return the paths of the given files in the cache directory, without checking that they are cached.
+
+    :param directory: the absolute path of the cache directory on the remote computer.
+    :param nodes: the ``SinglefileData`` nodes of the files.
+    :return: mapping of the filenames onto the absolute paths of the cached files on the remote computer.
+    """
+    return {node.filename: get_cached_path(directory, node) for node in nodes}
+
+
+def upload_files(computer, directory: str, nodes: t.Iterable) -> t.Dict[str, str]:
+    """Upload the given files to the cache directory on the remote computer, unless they are already cached.
+
+    This opens a transport to the computer directly, so it should not be called from a process that runs in the daemon.
+
+    :param computer: the remote computer.
+    :param directory: the absolute path of the cache directory on the remote computer.
+    :param nodes: the ``SinglefileData`` nodes of the files.
+    :return: mapping of the filenames onto the absolute paths of the cached files on the remote computer.
+    """
+    nodes = list(nodes)
+    paths = get_cached_paths(directory, nodes)
+
+    with computer.get_transport() as transport:
+        for node in nodes:
+            path = paths[node.filename]
+            if transport.path_exists(path):
+                continue
+
+            transport.makedirs(str(pathlib.PurePosixPath(path).parent), ignore_existing=True)
+            temporary = f'{path}.{uuid.uuid4().hex}.tmp'
+
+            with tempfile.NamedTemporaryFile() as handle:
+                handle.write(node.get_content(mode='rb'))
+                handle.flush()
+                transport.putfile(handle.name, temporary)
+
+            try:
+                transport.rename(temporary, path)
+            except OSError:
+                # The file was cached by a concurrent upload in the meantime.
+                if not transport.path_exists(path):
+                    raise
+                transport.remove(temporary)
+
+    return paths
+
+
+def get_symlink_commands(paths: t.Mapping[str, str]) -> str:
+    """Return the commands that symlink the cached files into the working directory of a calculation job.
+
+    :param paths: mapping of the filenames onto the absolute paths of the cached files, as returned by
+        :func:`get_cached_paths`.
+    :return: the commands, one per line, to add to the ``prepend_text`` of the calculation job.
+    """
+    return '\n'.join(f'ln -sf {shlex.quote(path)} {shlex.quote(filename)}' for filename, path in sorted(paths.items()))
@@ -0,0 +1,226 @@
+"""Utilities to measure the footprint of the common workflows on the provenance graph and the storage.
+
+The footprint of a workflow consists of all the nodes that were created while it ran: the processes it called, directly
+or indirectly, the data that those processes created and the data that was generated as inputs for them. For each of
+these nodes, the footprint counts the node itself, its links, the bytes of the files in its repository and its log
+records. The footprint is broken down by the origin of the nodes:
+
+* ``generator``: data generated as inputs for the processes in the call tree, e.g. by the input generator, which are
+  the inputs that were created after the workflow itself and that were not created by any process;
+* ``orchestration``: the workflows in the call tree and the calculation functions they called, except for those of the
+  ``conversion`` origin, together with the data they created, e.g. the structures created by ``scale_structure``;
+* ``conversion``: the calculation functions called by the implementations of the ``CommonRelaxWorkChain`` to convert
+  the outputs of the plugin to the common output specification, together with the data they created;
+* ``calculation``: the calculation jobs in the call tree together with the data they created.
+
+The links of the footprint are the links to its nodes and the links from its processes. A link is attributed to the
+origin of its source node, or to the origin of its target node if the source node is not part of the footprint, e.g. for
+the input links of codes and pseudopotentials. The inputs of the workflow itself are provided by the caller and are not
+part of its footprint.
+"""
+import collections
+import os
+import typing as t
+
+from .export import WorkflowsType, _query_call_tree
+
+__all__ = ('get_footprint',)
+
+ORIGINS = ('generator', 'orchestration', 'conversion', 'calculation')
+METRICS = ('nodes', 'links', 'repository_bytes', 'logs')
+RELAX_PROCESS_TYPE_PREFIX = 'aiida.workflows:common_workflows.relax.'
+
+
+def _get_process_origin(node_type: str, caller_process_type: t.Optional[str]) -> str:
+    """Return the origin of a process in the call tree of a workflow.
+
+    :param node_type: the node type of the process.
+    :param caller_process_type: the process type of the workflow that called the process.
+    """
+    if node_type.startswith('process.calculation.calcjob.'):
+        return 'calculation'
+
+    if node_type.startswith('process.calculation.calcfunction.') and (caller_process_type or '').startswith(
+        RELAX_PROCESS_TYPE_PREFIX
+    ):
+        return 'conversion'
+
+    return 'orchestration'
+
+
+def _get_call_trees(workflows: WorkflowsType) -> t.Tuple[t.Dict[int, t.Any], t.Dict[int, int], t.Dict[int, str]]:
+    """Return all the processes in the call trees of the given workflows.
+
+    :param workflows: a group or a list of workflow nodes or their pks.
+    :return: tuple of a mapping of the pk of each workflow onto its creation time, a mapping of the pk of each process
+        onto the pk of the workflow at the root of its call tree and a mapping of the pk of each process onto its
+        origin.
+    """
+    tree = _query_call_tree(workflows, ['ctime', 'node_type', 'process_type'])
+    roots, processes, origins = {}, {}, {}
+
+    for pk, (caller, (ctime, node_type, _)) in tree.items():
+        if caller is None:
+            roots[pk] = ctime
+            processes[pk] = pk
+            origins[pk] = 'orchestration'
+        else:
+            processes[pk] = processes[caller]
+            origins[pk] = _get_process_origin(node_type, tree[caller][1][2])
+
+    return roots, processes, origins
+
+
+def _query_data(roots: t.Dict[int, t.Any], processes: t.Dict[int, int], origins: t.Dict[int, str]) -> None:
+    """Add the data nodes of the footprint to the processes of the call trees of the given workflows.
+
+    :param roots: mapping of the pk of each workflow onto its creation time.
+    :param processes: mapping of the pk of each process onto the pk of its workflow, which is updated in place with the
+        data nodes of the footprint.
+    :param origins: mapping of the pk of each process onto its origin, which is updated in place with the data nodes of
+        the footprint.
+    """
+    from aiida.common import LinkType
+    from aiida.orm import Data, ProcessNode, QueryBuilder
+
+    called = [pk for pk in processes if pk not in roots]
+
+    created = QueryBuilder()
+    created.append(ProcessNode, filters={'id': {'in': list(processes)}}, project='id', tag='process')
+    created.append(Data, with_incoming='process', edge_filters={'type': LinkType.CREATE.value}, project='id')
+
+    for process, pk in created.iterall():
+        processes[pk] = processes[process]
+        origins[pk] = origins[process]
+
+    if not called:
+        return
+
+    inputs = QueryBuilder()
+    inputs.append(ProcessNode, filters={'id': {'in': called}}, project='id', tag='process')
+    inputs.append(
+        Data,
+        with_outgoing='process',
+        edge_filters={'type': {'in': [LinkType.INPUT_CALC.value, LinkType.INPUT_WORK.value]}},
+        project=['id', 'ctime'],
+    )
+    candidates = {pk: process for process, pk, ctime in inputs.all() if ctime >= roots[processes[process]]}
+    candidates = {pk: process for pk, process in candidates.items() if pk not in processes}
+
+    if not candidates:
+        return
+
+    with_creator = QueryBuilder()
+    with_creator.append(Data, filters={'id': {'in': list(candidates)}}, project='id', tag='data')
+    with_creator.append(ProcessNode, with_outgoing='data', edge_filters={'type': LinkType.CREATE.value})
+
+    for pk in set(candidates).difference(with_creator.all(flat=True)):
+        processes[pk] = processes[candidates[pk]]
+        origins[pk] = 'generator'
+
+
+def _count_links(origins: t.Dict[int, str]) -> t.Dict[int, int]:
+    """Return the number of links attributed to each node of the footprint.
+
+    The links of the footprint are all the links whose target is part of the footprint and the links of the processes of
+    the footprint to nodes outside the footprint, e.g. existing nodes that are returned by a workflow. The links of the
+    data of the footprint to processes outside the footprint, i.e. subsequent uses of the data, are excluded. A link is
+    attributed to its source node, or to its target node if the source node is not part of the footprint.
+
+    :param origins: mapping of the pk of each node of the footprint onto its origin.
+    :return: mapping of the pk of each node onto the number of links attributed to it.
+    """
+    from aiida.orm import Node, ProcessNode, QueryBuilder
+
+    pks = list(origins)
+
+    incoming = QueryBuilder()
+    incoming.append(Node, filters={'id': {'in': pks}}, project='id', tag='target')
+    incoming.append(Node, with_outgoing='target', project='id')
+    counts = collections.Counter(source if source in origins else target for target, source in incoming.iterall())
+
+    outgoing = QueryBuilder()
+    outgoing.append(ProcessNode, filters={'id': {'in': pks}}, project='id', tag='source')
+    outgoing.append(Node, with_incoming='source', filters={'id': {'!in': pks}})
+    counts.update(outgoing.all(flat=True))
+
+    return counts
+
+
+def _get_object_keys(repository_metadata: t.Optional[dict]) -> t.Iterator[str]:
+    """Yield the keys of all the objects in the serialized repository metadata of a node."""
+    for entry in (repository_metadata or {}).get('o', {}).values():
+        if 'k' in entry:
+            yield entry['k']
+        else:
+            yield from _get_object_keys(entry)
+
+
+def _count_repository_bytes(origins: t.Dict[int, str]) -> t.Dict[int, int]:
+    """Return the number of bytes of the files in the repository of each node of the footprint.
+
+    Objects that are shared by multiple nodes, since the repository deduplicates identical files, are counted for each
+    node, such that the result corresponds to the size of the files of the node.
+
+    :param origins: mapping of the pk of each node of the footprint onto its origin.
+    :return: mapping of the pk of each node onto the number of bytes in its repository.
+    """
+    from aiida.manage import get_manager
+    from aiida.orm import Node, QueryBuilder
+
+    query = QueryBuilder().append(Node, filters={'id': {'in': list(origins)}}, project=['id', 'repository_metadata'])
+    keys = {pk: list(_get_object_keys(metadata)) for pk, metadata in query.iterall()}
+    unique_keys = {key for entries in keys.values() for key in entries}
+
+    sizes = {}
+
+    if unique_keys:
+        repository = get_manager().get_profile_storage().get_repository()
+        for key, stream in repository.iter_object_streams(unique_keys):
+            sizes[key] = stream.seek(0, os.SEEK_END)
+
+    return {pk: sum(sizes[key] for key in entries) for pk, entries in keys.items()}
+
+
+def _count_logs(origins: t.Dict[int, str]) -> t.Dict[int, int]:
+    """Return the number of log records of each node of the footprint.
+
+    :param origins: mapping of the pk of each node of the footprint onto its origin.
+    :return: mapping of the pk of each node onto the number of its log records.
+    """
+    from aiida.orm import Log, QueryBuilder
+
+    query = QueryBuilder().append(Log, filters={'dbnode_id': {'in': list(origins)}}, project='dbnode_id')
+    return collections.Counter(query.all(flat=True))
+
+
+def get_footprint(workflows: WorkflowsType) -> t.Dict[int, t.Dict[str, t.Dict[str, int]]]:
+    """Return the footprint of the given workflows on the provenance graph and the storage, broken down by origin.
+
+    See the module docstring for the definition of the footprint and its origins. The footprint is determined with a few
+    projected queries for all workflows at once, without loading any of the nodes.
+
+    :param workflows: a group or a list of workflow nodes or their pks.
+    :return: mapping of the pk of each workflow onto a mapping of each origin in ``ORIGINS`` onto a dictionary with the
+        number of ``nodes``, ``links``, ``repository_bytes`` and ``logs``.
+    """
+    roots, processes, origins = _get_call_trees(workflows)
+    footprint = {pk: {origin: dict.fromkeys(METRICS, 0) for origin in ORIGINS} for pk in roots}
+
+    if not roots:
+        return footprint
+
+    _query_data(roots, processes, origins)
+
+    links = _count_links(origins)
+    repository_bytes = _count_repository_bytes(origins)
+    logs = _count_logs(origins)
+
+    for pk, origin in origins.items():
+        metrics = footprint[processes[pk]][origin]
+        metrics['nodes'] += 1
+        metrics['links'] += links.get(pk, 0)
+        metrics['repository_bytes'] += repository_bytes.get(pk, 0)
+        metrics['logs'] += logs.get(pk, 0)
+
+    return footprint
@@ -0,0 +1,162 @@
+"""Balancing of the sub processes of the multi-point workflows across pools of equivalent codes.
+
+By default, all sub processes of a multi-point workflow, like the equation of state or the dissociation curve, run with
+the single code that is defined for each engine in the generator inputs. Instead, a pool of equivalent codes, e.g. the
+same code installed on different computers, can be defined for an engine, as a list of members with the keys:
+
+* ``code``: the code, or its label, which should have the same calculation job plugin as the code of the engine;
+* ``weight``: optional positive number, ``1`` by default, proportional to the share of the sub processes of the member;
+* ``options``: optional dictionary that is merged into the options of the engine, e.g. to set the queue or the number
+  of cores of the machines of its computer.
+
+Each sub process is assigned to the member with the lowest load, where the load of a member is its number of assigned
+sub processes divided by its weight. With the ``queue_depth`` policy, the number of calculation jobs that are waiting in
+the queue of the computer of the member, or that are about to be submitted to it, is added to its load, such that a busy
+computer receives fewer sub processes. The queue depth is determined from the database, since the calculation jobs are
+submitted by the engine, rather than by querying the scheduler of each computer.
+
+If the resources of the engines are estimated with resource models, the number of cores of a single machine of the
+computer of the selected member is used instead of that of the code of the engine, see :func:`get_resource_models`.
+"""
+import typing as t
+
+__all__ = ('POLICIES', 'balance_engines', 'get_queue_depths', 'get_resource_models', 'validate_engine_pools')
+
+POLICIES = ('weights', 'queue_depth')
+RUNNING_SCHEDULER_STATES = ('running', 'done')
+
+
+def _load_code(code):
+    """Return the code node for the given code or its label."""
+    from aiida.orm import load_code
+
+    return load_code(code) if isinstance(code, (str, int)) else code
+
+
+def validate_engine_pools(engine_pools: dict, engines: dict) -> t.Optional[str]:  # noqa: PLR0911
+    """Validate the pools of the engines.
+
+    :param engine_pools: mapping of the engine names onto the list of members of their pool.
+    :param engines: the engines of the generator inputs.
+    :return: an error message if the pools are invalid, ``None`` otherwise.
+    """
+    from aiida.common import exceptions
+
+    unknown = set(engine_pools).difference(engines)
+    if unknown:
+        return f'`engine_pools` defines pools for engines that are not in `generator_inputs.engines`: {unknown}'
+
+    for engine, pool in engine_pools.items():
+        if not isinstance(pool, (list, tuple)) or not pool:
+            return f'the pool of engine `{engine}` should be a non-empty list.'
+
+        try:
+            plugin = _load_code(engines[engine]['code']).default_calc_job_plugin
+        except (exceptions.NotExistent, exceptions.MultipleObjectsError, KeyError, TypeError):
+            return f'the code of engine `{engine}` could not be loaded.'
+
+        for member in pool:
+            if not isinstance(member, dict) or 'code' not in member:
+                return f'each member of the pool of engine `{engine}` should be a dictionary that defines the `code`.'
+
+            try:
+                code = _load_code(member['code'])
+            except (exceptions.NotExistent, exceptions.MultipleObjectsError) as exception:
+                return f'the code `{member["code"]}` of the pool of engine `{engine}` could not be loaded: {exception}'
+
+            if code.default_calc_job_plugin != plugin:
+                return f'the code `{code.full_label}` of the pool of engine `{engine}` is not a `{plugin}` code.'
+
+            weight = member.get('weight', 1)
+            if isinstance(weight, bool) or not isinstance(weight, (int, float)) or weight <= 0:
+                return f'the weight of `{code.full_label}` in the pool of engine `{engine}` should be positive.'
+
+            if not isinstance(member.get('options', {}), dict):
+                return f'the options of `{code.full_label}` in the pool of engine `{engine}` should be a dictionary.'
+
+    return None
+
+
+def get_queue_depths(engine_pools: dict) -> t.Dict[int, int]:
+    """Return the number of calculation jobs waiting in the queue of each computer of the pools.
+
+    A calculation job is considered to be waiting if it is active and the scheduler did not yet report it as running,
+    which includes the calculation jobs that are yet to be submitted by the engine.
+
+    :param engine_pools: mapping of the engine names onto the list of members of their pool.
+    :return: mapping of the pk of each computer onto its number of waiting calculation jobs.
+    """
+    from aiida.orm import CalcJobNode, QueryBuilder
+
+    computers = {_load_code(member['code']).computer.pk for pool in engine_pools.values() for member in pool}
+    depths = dict.fromkeys(computers, 0)
+
+    query = QueryBuilder().append(
+        CalcJobNode,
+        filters={'dbcomputer_id': {'in': list(computers)}, 'attributes.process_state': {'in': ['created', 'waiting']}},
+        project=['dbcomputer_id', 'attributes.scheduler_state'],
+    )
+
+    for computer, scheduler_state in query.iterall():
+        if scheduler_state not in RUNNING_SCHEDULER_STATES:
+            depths[computer] += 1
+
+    return depths
+
+
+def balance_engines(
+    engines: dict, engine_pools: dict, assignments: dict, queue_depths: t.Optional[t.Dict[int, int]] = None
+) -> dict:
+    """Return a copy of the engines in which each engine with a pool uses the member of its pool with the lowest load.
+
+    :param engines: the engines of the generator inputs.
+    :param engine_pools: mapping of the engine names onto the list of members of their pool.
+    :param assignments: mapping of the engine names onto the number of sub processes assigned to each member of their
+        pool, which is updated in place with the assignment of this sub process.
+    :param queue_depths: optional mapping of the pk of each computer onto the number of calculation jobs waiting in its
+        queue, as returned by :func:`get_queue_depths`, which is added to the load of the members of the computer.
+    :return: the engines with the code and options of the selected members.
+    """
+    balanced = {name: dict(engine) for name, engine in engines.items()}
+
+    for name, pool in engine_pools.items():
+        counts = assignments.setdefault(name, [0] * len(pool))
+        codes = [_load_code(member['code']) for member in pool]
+
+        def get_load(index, counts=counts, codes=codes, pool=pool):
+            depth = (queue_depths or {}).get(codes[index].computer.pk, 0)
+            return (depth + counts[index] + 1) / pool[index].get('weight', 1)
+
+        index = min(range(len(pool)), key=get_load)
+        counts[index] += 1
+
+        balanced[name]['code'] = codes[index]
+
+        if 'options' in pool[index]:
+            balanced[name]['options'] = {**balanced[name].get('options', {}), **pool[index]['options']}
+
+    return balanced
+
+
+def get_resource_models(resource_models: dict, engines: dict, engine_pools: dict) -> dict:
+    """Return a copy of the resource models with the ``cores_per_machine`` of the computers of the selected members.
+
+    The ``cores_per_machine`` of the resource models is that of the computer of the code of each engine, which is not
+    the computer on which the sub process runs if another member of its pool was selected.
+
+    :param resource_models: mapping of the engine names onto their resource model and ``cores_per_machine``.
+    :param engines: the engines with the codes of the selected members, as returned by :func:`balance_engines`.
+    :param engine_pools: mapping of the engine names onto the list of members of their pool.
+    :return: the resource models with the ``cores_per_machine`` of the selected members, if their computer defines it.
+    """
+    from .resources import get_cores_per_machine
+
+    resource_models = dict(resource_models)
+
+    for name in set(engine_pools).intersection(resource_models):
+        cores_per_machine = get_cores_per_machine(_load_code(engines[name]['code']))
+
+        if cores_per_machine is not None:
+            resource_models[name] = {**resource_models[name], 'cores_per_machine': cores_per_machine}
+
+    return resource_models
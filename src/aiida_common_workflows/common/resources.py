@@ -0,0 +1,356 @@
+"""Estimation of the computational resources required by the calculation jobs of the common workflows.
+
+The cost of a calculation job, measured in core seconds, i.e. its wallclock time multiplied by its number of MPI
+processes, is modelled as a power law of a few features of its inputs::
+
+    log(cost) = c_0 + c_1 log(feature_1) + ... + c_n log(feature_n)
+
+The coefficients are calibrated by a least-squares fit to the calculation jobs of a given plugin in the database that
+finished successfully and for which the scheduler recorded the wallclock time. The features are defined in ``FEATURES``:
+the number of atoms, the number of electrons, approximated by the sum of the atomic numbers, the volume of the cell, the
+number of k-points and the plane-wave cutoff. The last two are only available for plugins that take them as explicit
+inputs, see ``CUTOFF_KEYS``, and account for the protocol with which the inputs were generated.
+
+The memory of the calculation jobs is not estimated, since it is not recorded by the scheduler interface of AiiDA.
+"""
+import math
+import typing as t
+
+__all__ = ('ResourceModel', 'get_cores_per_machine', 'get_features', 'size_engines')
+
+FEATURES = ('atoms', 'electrons', 'volume', 'kpoints', 'cutoff')
+STRUCTURE_FEATURES = ('atoms', 'electrons', 'volume')
+CUTOFF_KEYS = {
+    'abinit': ('ecut',),
+    'castep.castep': ('PARAM', 'cut_off_energy'),
+    'quantumespresso.pw': ('SYSTEM', 'ecutwfc'),
+}
+MINIMUM_SAMPLES = 5
+CONFIDENCE = 2.0
+TARGET_WALLCLOCK_SECONDS = 3600
+MINIMUM_WALLCLOCK_SECONDS = 600
+KEPT_RESOURCES = ('num_cores_per_mpiproc',)
+
+
+def _get_structure_features(cell: list, sites: list, kinds: list) -> t.Dict[str, float]:
+    """Return the features of a structure from the attributes of its ``StructureData`` node.
+
+    :param cell: the three cell vectors.
+    :param sites: the sites, each with the name of its kind.
+    :param kinds: the kinds, each with its name, symbols and weights.
+    """
+    import numpy
+    from ase.data import atomic_numbers
+
+    electrons = {
+        kind['name']: sum(
+            atomic_numbers.get(symbol, 0) * weight for symbol, weight in zip(kind['symbols'], kind['weights'])
+        )
+        for kind in kinds
+    }
+
+    return {
+        'atoms': len(sites),
+        'electrons': sum(electrons[site['kind_name']] for site in sites),
+        'volume': abs(float(numpy.linalg.det(cell))),
+    }
+
+
+def _get_number_of_kpoints(attributes: dict) -> t.Optional[int]:
+    """Return the number of k-points from the attributes of a ``KpointsData`` node, defined by a mesh or a list."""
+    if attributes.get('mesh') is not None:
+        return math.prod(attributes['mesh'])
+
+    if attributes.get('array|kpoints') is not None:
+        return attributes['array|kpoints'][0]
+
+    return None
+
+
+def _get_cutoff(parameters: dict, keys: t.Sequence[str]) -> t.Optional[float]:
+    """Return the cutoff from the parameters of a calculation job following the sequence of nested keys."""
+    for key in keys:
+        if not isinstance(parameters, dict) or key not in parameters:
+            return None
+        parameters = parameters[key]
+
+    return float(parameters)
+
+
+def get_features(structure, kpoints=None, cutoff: t.Optional[float] = None) -> t.Dict[str, t.Optional[float]]:
+    """Return the features of the inputs of a calculation job that determine its cost.
+
+    :param structure: the ``StructureData`` of the calculation job.
+    :param kpoints: optional ``KpointsData`` of the calculation job, defined by a mesh or an explicit list.
+    :param cutoff: optional plane-wave cutoff of the calculation job.
+    :return: mapping of each feature in ``FEATURES`` onto its value, which is ``None`` if it is not defined.
+    """
+    attributes = structure.base.attributes
+    features = _get_structure_features(attributes.get('cell'), attributes.get('sites'), attributes.get('kinds'))
+    features['kpoints'] = _get_number_of_kpoints(kpoints.base.attributes.all) if kpoints is not None else None
+    features['cutoff'] = cutoff
+
+    return features
+
+
+def _get_core_seconds(job_info: t.Optional[dict], resources: t.Optional[dict]) -> t.Optional[float]:
+    """Return the cost in core seconds of a calculation job from its last job info and its requested resources."""
+    wallclock = (job_info or {}).get('wallclock_time_seconds')
+
+    if not wallclock:
+        return None
+
+    resources = resources or {}
+    mpiprocs = (job_info or {}).get('num_mpiprocs') or resources.get('tot_num_mpiprocs')
+
+    if not mpiprocs:
+        mpiprocs = resources.get('num_machines', 1) * resources.get('num_mpiprocs_per_machine', 1)
+
+    return float(wallclock) * mpiprocs
+
+
+def _query_samples(
+    entry_point: str, features: t.Sequence[str], limit: int
+) -> t.List[t.Tuple[t.Dict[str, t.Optional[float]], float]]:
+    """Return the features and costs of the most recent calculation jobs of the given plugin that finished successfully.
+
+    :param entry_point: the entry point name of the ``CalcJob`` plugin.
+    :param features: the features that are required, which determine the inputs that are queried.
+    :param limit: the maximum number of calculation jobs.
+    :return: list of tuples of the features and the cost in core seconds of each calculation job.
+    """
+    from aiida.orm import CalcJobNode, Dict, KpointsData, QueryBuilder, StructureData
+
+    query = QueryBuilder()
+    query.append(
+        CalcJobNode,
+        filters={'process_type': f'aiida.calculations:{entry_point}', 'attributes.exit_status': 0},
+        project=['id', 'attributes.last_job_info', 'attributes.resources'],
+        tag='calcjob',
+    )
+    query.append(
+        StructureData,
+        with_outgoing='calcjob',
+        edge_filters={'label': 'structure'},
+        project=['attributes.cell', 'attributes.sites', 'attributes.kinds'],
+    )
+    query.order_by({'calcjob': {'ctime': 'desc'}})
+    query.limit(limit)
+
+    samples = {}
+
+    for pk, job_info, resources, cell, sites, kinds in query.iterall():
+        cost = _get_core_seconds(job_info, resources)
+        if cost:
+            samples[pk] = ({**_get_structure_features(cell, sites, kinds), 'kpoints': None, 'cutoff': None}, cost)
+
+    if not samples:
+        return []
+
+    if 'kpoints' in features:
+        query = QueryBuilder()
+        query.append(CalcJobNode, filters={'id': {'in': list(samples)}}, project='id', tag='calcjob')
+        query.append(KpointsData, with_outgoing='calcjob', edge_filters={'label': 'kpoints'}, project='attributes')
+        for pk, attributes in query.iterall():
+            samples[pk][0]['kpoints'] = _get_number_of_kpoints(attributes)
+
+    if 'cutoff' in features and entry_point in CUTOFF_KEYS:
+        query = QueryBuilder()
+        query.append(CalcJobNode, filters={'id': {'in': list(samples)}}, project='id', tag='calcjob')
+        query.append(Dict, with_outgoing='calcjob', edge_filters={'label': 'parameters'}, project='attributes')
+        for pk, parameters in query.iterall():
+            samples[pk][0]['cutoff'] = _get_cutoff(parameters, CUTOFF_KEYS[entry_point])
+
+    return list(samples.values())
+
+
+class ResourceModel:
+    """Model of the cost in core seconds of the calculation jobs of a plugin as a power law of their features.
+
+    See the module docstring for the definition of the model. A model is obtained by calibrating it on the calculation
+    jobs in the database with :meth:`ResourceModel.calibrate`, or by fitting it to a list of samples directly with
+    :meth:`ResourceModel.fit`.
+    """
+
+    def __init__(self, features: t.Sequence[str], coefficients: t.Sequence[float], sigma: float, samples: int):
+        """Construct a new instance.
+
+        :param features: the features of the model, which is a subset of ``FEATURES``.
+        :param coefficients: the coefficients of the model, starting with the constant term followed by the exponent of
+            each of the features.
+        :param sigma: the standard deviation of the residuals of the logarithm of the cost.
+        :param samples: the number of samples on which the model was fitted.
+        """
+        if len(coefficients) != len(features) + 1:
+            raise ValueError('the number of coefficients should be the number of features plus one.')
+
+        self.features = tuple(features)
+        self.coefficients = tuple(float(coefficient) for coefficient in coefficients)
+        self.sigma = float(sigma)
+        self.samples = samples
+
+    @classmethod
+    def fit(
+        cls, samples: t.Sequence[t.Tuple[t.Dict[str, t.Optional[float]], float]], features: t.Sequence[str] = FEATURES
+    ) -> 'ResourceModel':
+        """Return the model fitted to the given samples.
+
+        The model only uses the requested features that are defined for all samples and that are not the same for all
+        samples, since their exponent cannot be determined otherwise. The last features are dropped if there are not
+        enough samples to determine the exponents and the spread of the residuals.
+
+        :param samples: sequence of tuples of the features and the cost in core seconds.
+        :param features: the features that the model is allowed to use.
+        :raises ValueError: if there are fewer than ``MINIMUM_SAMPLES`` samples with a positive cost.
+        """
+        import numpy
+
+        samples = [(values, cost) for values, cost in samples if cost and cost > 0]
+
+        if len(samples) < MINIMUM_SAMPLES:
+            raise ValueError(f'{len(samples)} samples are available while at least {MINIMUM_SAMPLES} are required.')
+
+        used = [
+            feature
+            for feature in features
+            if all(values.get(feature) and values[feature] > 0 for values, _ in samples)
+            and len({values[feature] for values, _ in samples}) > 1
+        ]
+        used = used[: max(len(samples) - 2, 0)]
+
+        matrix = numpy.ones((len(samples), len(used) + 1))
+        for column, feature in enumerate(used, start=1):
+            matrix[:, column] = [math.log(values[feature]) for values, _ in samples]
+
+        costs = numpy.log([cost for _, cost in samples])
+        coefficients = numpy.linalg.lstsq(matrix, costs, rcond=None)[0]
+        residuals = costs - matrix @ coefficients
+        sigma = math.sqrt(float(residuals @ residuals) / (len(samples) - len(used) - 1))
+
+        return cls(used, coefficients.tolist(), sigma, len(samples))
+
+    @classmethod
+    def calibrate(cls, entry_point: str, features: t.Sequence[str] = FEATURES, limit: int = 1000) -> 'ResourceModel':
+        """Return the model calibrated on the calculation jobs of the given plugin in the database.
+
+        :param entry_point: the entry point name of the ``CalcJob`` plugin, e.g. ``quantumespresso.pw``.
+        :param features: the features that the model is allowed to use, which should be restricted to the features that
+            are known when the model is used. For example, the k-points and cutoff are only known after the inputs have
+            been generated.
+        :param limit: the maximum number of the most recent calculation jobs on which the model is calibrated.
+        :raises ValueError: if there are not enough calculation jobs to calibrate the model.
+        """
+        try:
+            return cls.fit(_query_samples(entry_point, features, limit), features)
+        except ValueError as exception:
+            raise ValueError(f'cannot calibrate the model for `{entry_point}`: {exception}') from exception
+
+    @classmethod
+    def deserialize(cls, data: dict) -> 'ResourceModel':
+        """Return the model from its serialized form as returned by :meth:`ResourceModel.serialize`."""
+        return cls(data['features'], data['coefficients'], data['sigma'], data['samples'])
+
+    def serialize(self) -> dict:
+        """Return the model in a JSON-serializable form, which can for example be stored in a ``Dict`` node."""
+        return {
+            'features': list(self.features),
+            'coefficients': list(self.coefficients),
+            'sigma': self.sigma,
+            'samples': self.samples,
+        }
+
+    def estimate_core_seconds(self, features: t.Dict[str, t.Optional[float]], confidence: float = CONFIDENCE) -> float:
+        """Return the estimated cost in core seconds of a calculation job with the given features.
+
+        :param features: mapping of the features onto their values, as returned by :func:`get_features`.
+        :param confidence: the number of standard deviations of the residuals that is added to the logarithm of the
+            cost, such that the estimate is an upper bound for most calculation jobs.
+        :raises ValueError: if one of the features of the model is not defined.
+        """
+        missing = [feature for feature in self.features if not features.get(feature)]
+
+        if missing:
+            raise ValueError(f'the features {missing} of the model are not defined.')
+
+        logarithm = self.coefficients[0] + confidence * self.sigma
+        logarithm += sum(
+            coefficient * math.log(features[feature])
+            for feature, coefficient in zip(self.features, self.coefficients[1:])
+        )
+
+        return math.exp(logarithm)
+
+    def get_options(
+        self,
+        features: t.Dict[str, t.Optional[float]],
+        cores_per_machine: int,
+        target_wallclock_seconds: int = TARGET_WALLCLOCK_SECONDS,
+    ) -> dict:
+        """Return the resources and wallclock time of the options of a calculation job with the given features.
+
+        The number of cores is chosen such that the estimated cost is spent within the target wallclock time. A job that
+        needs more cores than available on a single machine is distributed over fully occupied machines. The wallclock
+        time is the estimated cost divided by the number of cores, with a minimum of ``MINIMUM_WALLCLOCK_SECONDS``.
+
+        :param features: mapping of the features onto their values, as returned by :func:`get_features`.
+        :param cores_per_machine: the number of cores of a single machine.
+        :param target_wallclock_seconds: the wallclock time within which the calculation job should finish.
+        :return: the ``resources`` and ``max_wallclock_seconds`` options, together with the ``withmpi`` option if the
+            calculation job is run on more than one core.
+        """
+        cost = self.estimate_core_seconds(features)
+        cores = max(1, math.ceil(cost / target_wallclock_seconds))
+        num_machines = math.ceil(cores / cores_per_machine)
+        num_mpiprocs_per_machine = cores_per_machine if num_machines > 1 else cores
+        total_cores = num_machines * num_mpiprocs_per_machine
+
+        options = {
+            'resources': {'num_machines': num_machines, 'num_mpiprocs_per_machine': num_mpiprocs_per_machine},
+            'max_wallclock_seconds': max(MINIMUM_WALLCLOCK_SECONDS, math.ceil(cost / total_cores)),
+        }
+
+        if total_cores > 1:
+            options['withmpi'] = True
+
+        return options
+
+
+def get_cores_per_machine(code) -> t.Optional[int]:
+    """Return the number of cores of a single machine of the computer of the given code.
+
+    :param code: the code, whose computer defines the number of cores through its default number of MPI processes per
+        machine.
+    :return: the number of cores, or ``None`` if the code has no computer or its computer does not define it.
+    """
+    computer = getattr(code, 'computer', None)
+    return computer.get_default_mpiprocs_per_machine() if computer is not None else None
+
+
+def size_engines(engines: dict, resource_models: dict, structure) -> dict:
+    """Return a copy of the ``engines`` input of an input generator with the options sized for the given structure.
+
+    :param engines: the ``engines`` input of the input generator.
+    :param resource_models: mapping of the names of the engines onto a dictionary with the serialized resource model
+        under the key ``model`` and the ``cores_per_machine``. The options of engines without a model are not changed.
+    :param structure: the ``StructureData`` for which the inputs are generated.
+    :return: the ``engines`` with the ``resources`` and ``max_wallclock_seconds`` options replaced by the estimates of
+        the resource models. Of the original ``resources``, only the keys in ``KEPT_RESOURCES`` are kept, since the
+        others, e.g. ``tot_num_mpiprocs``, would contradict the estimated number of machines and processes.
+    """
+    engines = {engine: dict(inputs) for engine, inputs in engines.items()}
+
+    if not resource_models:
+        return engines
+
+    features = get_features(structure)
+
+    for engine, resource_model in resource_models.items():
+        model = ResourceModel.deserialize(resource_model['model'])
+        sized = model.get_options(features, resource_model['cores_per_machine'])
+        options = dict(engines[engine].get('options', {}))
+        resources = {key: value for key, value in options.get('resources', {}).items() if key in KEPT_RESOURCES}
+        options['resources'] = {**resources, **sized.pop('resources')}
+        options.update(sized)
+        engines[engine]['options'] = options
+
+    return engines
@@ -0,0 +1,127 @@
+"""Restart of the multi-point workflows from the sub processes of a previous workflow.
+
+If a multi-point workflow, like the equation of state or the dissociation curve, is killed or fails after part of its
+sub processes finished, a new workflow can be restarted from it, such that the sub processes that finished successfully
+are reused rather than being run again. To determine whether a sub process can be reused, the workflow stores a hash of
+everything that defines the sub process in its extras under the key ``POINT_EXTRA`` when it is submitted. The hash is
+computed by :func:`hash_point` from:
+
+* the class of the sub process;
+* the content of the input structure of the workflow and the value of the point, e.g. the scale factor or distance;
+* the generator inputs, where only the code of each engine is considered, since the options only define the resources
+  of the calculations and do not affect their results;
+* the inputs of the ``sub_process`` namespace that override the inputs returned by the generator;
+* the UUID of the reference work chain of the sub process, if any, such that the points after the first are only
+  reused if the first point is reused as well.
+
+The sub processes that are reused by a workflow are not called by it, so their UUIDs are stored in the extras of the
+workflow under the key ``REUSED_EXTRA``, such that a workflow can in turn be restarted from a restarted workflow.
+"""
+import enum
+import hashlib
+import json
+import typing as t
+
+__all__ = ('get_reusable_children', 'hash_point', 'register_point', 'register_reused')
+
+POINT_EXTRA = 'common_workflows_point'
+REUSED_EXTRA = 'common_workflows_reused'
+
+
+def _serialize(value: t.Any) -> t.Any:
+    """Return a JSON serializable representation of the given value that only depends on its content."""
+    from collections.abc import Mapping
+
+    from aiida.orm import Node
+
+    if isinstance(value, Mapping):
+        return {str(key): _serialize(item) for key, item in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        return [_serialize(item) for item in value]
+
+    if isinstance(value, enum.Enum):
+        return value.value
+
+    if isinstance(value, Node):
+        return value.base.caching.get_hash()
+
+    return value
+
+
+def hash_point(  # noqa: PLR0913
+    sub_process_class: str,
+    structure,
+    point: float,
+    generator_inputs: t.Mapping[str, t.Any],
+    sub_process: t.Optional[t.Mapping[str, t.Any]] = None,
+    reference_workchain=None,
+) -> str:
+    """Return the hash that identifies a sub process of a multi-point workflow.
+
+    :param sub_process_class: the entry point name of the class of the sub process.
+    :param structure: the input structure of the workflow, which is modified for each point.
+    :param point: the value of the point, e.g. the scale factor or distance.
+    :param generator_inputs: the generator inputs of the workflow.
+    :param sub_process: the inputs that override the inputs returned by the generator.
+    :param reference_workchain: the node of the reference work chain of the sub process, if any.
+    :return: the hexadecimal digest of the hash.
+    """
+    generator_inputs = dict(generator_inputs)
+    generator_inputs['engines'] = {name: engine['code'] for name, engine in generator_inputs['engines'].items()}
+
+    content = {
+        'sub_process_class': sub_process_class,
+        'structure': _serialize(structure),
+        'point': point,
+        'generator_inputs': _serialize(generator_inputs),
+        'sub_process': _serialize(sub_process or {}),
+        'reference_workchain': reference_workchain.uuid if reference_workchain is not None else None,
+    }
+
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def register_point(node, point_hash: str) -> None:
+    """Register the hash of the point of the sub process of the given node.
+
+    :param node: the node of the sub process.
+    :param point_hash: the hash of the point, as returned by :func:`hash_point`.
+    """
+    node.base.extras.set(POINT_EXTRA, point_hash)
+
+
+def register_reused(node, child) -> None:
+    """Register that the given sub process of a previous workflow was reused by the workflow of the given node.
+
+    :param node: the node of the workflow.
+    :param child: the node of the reused sub process.
+    """
+    node.base.extras.set(REUSED_EXTRA, [*node.base.extras.get(REUSED_EXTRA, []), child.uuid])
+
+
+def get_reusable_children(node) -> t.Dict[str, t.Any]:
+    """Return the sub processes of the given workflow that can be reused by a workflow that is restarted from it.
+
+    These are the sub processes that were called or reused by the workflow, that finished successfully and whose point
+    was registered. If multiple sub processes have the same point, the one that was created last is returned.
+
+    :param node: the node of the previous workflow.
+    :return: mapping of the hashes of the points onto the nodes of the sub processes.
+    """
+    from aiida.common import exceptions
+    from aiida.orm import WorkflowNode, load_node
+
+    children = [child for child in node.called if isinstance(child, WorkflowNode)]
+
+    for uuid in node.base.extras.get(REUSED_EXTRA, []):
+        try:
+            children.append(load_node(uuid))
+        except exceptions.NotExistent:
+            continue
+
+    return {
+        child.base.extras.get(POINT_EXTRA): child
+        for child in sorted(children, key=lambda child: child.ctime)
+        if child.is_finished_ok and child.base.extras.get(POINT_EXTRA, None) is not None
+    }
@@ -0,0 +1,255 @@
+"""Recovery of the common workflows from calculation jobs that exhausted their wallclock time or memory.
+
+The base work chains of the plugins restart their calculation jobs for many failures, but not when the job was killed
+because its resources were insufficient, since they have no policy to increase them. Such a failure is recognized from
+the label of the exit code of the last calculation job of the failed work chain, see ``EXIT_CODE_LABELS``, which
+includes both the exit codes of ``aiida-core`` that are set by the scheduler plugins and the equivalent exit codes of
+the plugins that are set by their parsers.
+
+The work chain is then resubmitted with scaled resources, following a policy with the keys:
+
+* ``max_resubmissions``: the maximum number of resubmissions, zero to disable them;
+* ``wallclock_factor``: the factor by which the ``max_wallclock_seconds`` is multiplied if the wallclock time was
+  exhausted;
+* ``machines_factor``: the factor by which the ``num_machines`` is multiplied if the memory was exhausted, such that the
+  memory is distributed over more machines;
+* ``max_wallclock_seconds``: optional upper bound of the scaled ``max_wallclock_seconds``;
+* ``max_machines``: optional upper bound of the scaled ``num_machines``.
+
+The scaled options and the parameters that are updated with them are new ``Dict`` nodes, which are not stored until the
+work chain is resubmitted. Since unstored nodes cannot be checkpointed, they are kept as plain dictionaries in the
+context of the work chain with :func:`strip_unstored_nodes`, and are turned into nodes again just before the
+resubmission with :func:`restore_unstored_nodes`.
+"""
+import math
+import typing as t
+
+__all__ = (
+    'DEFAULT_POLICY',
+    'EXIT_CODE_LABELS',
+    'get_failed_calculation',
+    'get_resource_failure',
+    'restore_unstored_nodes',
+    'scale_resources',
+    'strip_unstored_nodes',
+    'validate_policy',
+)
+
+EXIT_CODE_LABELS = {
+    'walltime': (
+        'ERROR_SCHEDULER_OUT_OF_WALLTIME',
+        'ERROR_OUT_OF_WALLTIME',
+        'ERROR_OUT_OF_WALLTIME_INTERRUPTED',
+        'ERROR_TIMELIMIT_REACHED',
+        'ERROR_TIME_LIMIT',
+    ),
+    'memory': (
+        'ERROR_SCHEDULER_OUT_OF_MEMORY',
+        'ERROR_OUT_OF_MEMORY',
+        'ERROR_NOT_ENOUGH_MEMORY',
+    ),
+}
+DEFAULT_POLICY = {
+    'max_resubmissions': 2,
+    'wallclock_factor': 2.0,
+    'machines_factor': 2.0,
+    'max_wallclock_seconds': None,
+    'max_machines': None,
+}
+
+
+def validate_policy(value: dict, _) -> t.Optional[str]:
+    """Validate the resubmission policy."""
+    unknown = set(value).difference(DEFAULT_POLICY)
+    if unknown:
+        return f'the resubmission policy contains unknown keys: {unknown}'
+
+    policy = {**DEFAULT_POLICY, **value}
+
+    if not isinstance(policy['max_resubmissions'], int) or policy['max_resubmissions'] < 0:
+        return 'the `max_resubmissions` should be a non-negative integer.'
+
+    for key in ('wallclock_factor', 'machines_factor'):
+        if not isinstance(policy[key], (int, float)) or policy[key] < 1:
+            return f'the `{key}` should be a number not smaller than one.'
+
+    for key in ('max_wallclock_seconds', 'max_machines'):
+        if policy[key] is not None and (not isinstance(policy[key], int) or policy[key] < 1):
+            return f'the `{key}` should be a positive integer.'
+
+
+def get_failed_calculation(node):
+    """Return the last calculation job called by the given process or any of its descendants.
+
+    :param node: the node of the failed process.
+    :return: the ``CalcJobNode`` that was created last, or ``None`` if the process did not call any.
+    """
+    from aiida.orm import CalcJobNode
+
+    calculations = [child for child in node.called_descendants if isinstance(child, CalcJobNode)]
+
+    return max(calculations, key=lambda child: child.ctime, default=None)
+
+
+def _get_exit_code_label(node) -> t.Optional[str]:
+    """Return the label of the exit code of the given process node, or ``None`` if it cannot be determined."""
+    if node.exit_status is None:
+        return None
+
+    try:
+        exit_codes = node.process_class.exit_codes
+    except ValueError:
+        return None
+
+    return next((label for label, exit_code in exit_codes.items() if exit_code.status == node.exit_status), None)
+
+
+def get_resource_failure(node) -> t.Optional[str]:
+    """Return the resource that was exhausted by the given failed process or by its last calculation job.
+
+    :param node: the node of the failed process.
+    :return: ``walltime`` or ``memory`` if the failure is related to that resource, ``None`` otherwise.
+    """
+    calculation = get_failed_calculation(node)
+
+    for candidate in (node, calculation):
+        label = _get_exit_code_label(candidate) if candidate is not None else None
+
+        for failure, labels in EXIT_CODE_LABELS.items():
+            if label in labels:
+                return failure
+
+    return None
+
+
+def _scale_options(options: dict, failure: str, policy: dict) -> t.Optional[dict]:
+    """Return a copy of the options with the resource of the failure scaled, or ``None`` if it cannot be scaled."""
+    options = dict(options)
+
+    if failure == 'walltime':
+        current = options.get('max_wallclock_seconds')
+        if not current:
+            return None
+        scaled = math.ceil(current * policy['wallclock_factor'])
+        if policy['max_wallclock_seconds'] is not None:
+            scaled = min(scaled, policy['max_wallclock_seconds'])
+        if scaled <= current:
+            return None
+        options['max_wallclock_seconds'] = scaled
+
+    else:
+        resources = dict(options.get('resources', {}))
+        current = resources.get('num_machines')
+        if not current:
+            return None
+        scaled = math.ceil(current * policy['machines_factor'])
+        if policy['max_machines'] is not None:
+            scaled = min(scaled, policy['max_machines'])
+        if scaled <= current:
+            return None
+        resources['num_machines'] = scaled
+        options['resources'] = resources
+
+    return options
+
+
+def _is_options(value) -> bool:
+    """Return whether the given mapping defines the options of a calculation job."""
+    return 'resources' in value or 'max_wallclock_seconds' in value
+
+
+def scale_resources(inputs: dict, failure: str, policy: dict) -> t.Tuple[dict, bool]:
+    """Return a copy of the inputs of a work chain in which the options of all calculation jobs are scaled.
+
+    The options are recognized by their keys rather than their location in the inputs, since the plugins define them
+    either in the ``metadata.options`` of the calculation job or in a ``Dict`` input of the work chain.
+
+    :param inputs: the nested inputs of the work chain.
+    :param failure: the exhausted resource, as returned by :func:`get_resource_failure`.
+    :param policy: the resubmission policy.
+    :return: the scaled inputs and whether any of the options was scaled.
+    """
+    from collections.abc import Mapping
+
+    from aiida.orm import Dict
+
+    scaled = False
+
+    def scale(value):
+        nonlocal scaled
+
+        if isinstance(value, Dict) and _is_options(value.get_dict()):
+            options = _scale_options(value.get_dict(), failure, policy)
+            if options is not None:
+                scaled = True
+                return Dict(options)
+
+        elif isinstance(value, Mapping) and _is_options(value):
+            options = _scale_options(value, failure, policy)
+            if options is not None:
+                scaled = True
+                return options
+
+        elif isinstance(value, Mapping):
+            return {key: scale(item) for key, item in value.items()}
+
+        return value
+
+    inputs = scale(inputs)
+
+    return inputs, scaled
+
+
+def strip_unstored_nodes(inputs: dict) -> dict:
+    """Return a copy of the nested inputs in which the unstored ``Dict`` nodes are replaced by plain dictionaries.
+
+    :param inputs: the nested inputs of the work chain.
+    :return: the inputs that can be stored in the context of the work chain.
+    """
+    from collections.abc import Mapping
+
+    from aiida.orm import Dict
+
+    def strip(value):
+        if isinstance(value, Dict) and not value.is_stored:
+            return value.get_dict()
+
+        if isinstance(value, Mapping):
+            return {key: strip(item) for key, item in value.items()}
+
+        return value
+
+    return strip(inputs)
+
+
+def restore_unstored_nodes(inputs: dict, namespace) -> dict:
+    """Return a copy of the nested inputs in which the dictionaries of ``Dict`` input ports are turned into nodes.
+
+    This is the inverse of :func:`strip_unstored_nodes`: the dictionaries are recognized by the input port of the
+    process to which they are passed, such that the dictionaries of namespaces, e.g. ``metadata.options``, and of
+    non-database ports are left unchanged.
+
+    :param inputs: the nested inputs of the work chain, as returned by :func:`strip_unstored_nodes`.
+    :param namespace: the input ``PortNamespace`` of the process to which the inputs are passed.
+    :return: the inputs that can be passed to the process.
+    """
+    from collections.abc import Mapping
+
+    from aiida.orm import Dict
+    from plumpy.ports import PortNamespace
+
+    def restore(value, port):
+        if not isinstance(value, Mapping) or port is None:
+            return value
+
+        if isinstance(port, PortNamespace):
+            return {key: restore(item, port.get(key)) for key, item in value.items()}
+
+        valid_type = port.valid_type if isinstance(port.valid_type, tuple) else (port.valid_type,)
+
+        if not port.non_db and any(isinstance(cls, type) and issubclass(cls, Dict) for cls in valid_type):
+            return Dict(value)
+
+        return value
+
+    return restore(inputs, namespace)
@@ -0,0 +1,100 @@
+"""Utilities to import structures from files on disk in bulk."""
+import concurrent.futures
+import os
+import pathlib
+import typing as t
+
+if t.TYPE_CHECKING:
+    from aiida.orm import StructureData
+
+__all__ = ('import_structures',)
+
+
+def _read_structure(filepath: str):
+    """Read the structure from the given file using ``ase``.
+
+    This is defined as a module level function such that it can be pickled and executed in a process pool.
+
+    :param filepath: path of the file to read.
+    :return: the ``ase.Atoms`` instance.
+    """
+    import ase.io
+
+    return ase.io.read(filepath)
+
+
+def _read_structures(filepaths: t.List[str], max_workers: t.Optional[int]) -> list:
+    """Read the structures from the given files, in a process pool if there is more than a single file and worker.
+
+    :param filepaths: paths of the files to read.
+    :param max_workers: maximum number of worker processes.
+    :return: list of ``ase.Atoms`` instances in the order of ``filepaths``.
+    :raises ValueError: if any of the files cannot be parsed.
+    """
+    if len(filepaths) == 1 or max_workers == 1:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    else:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+
+    results = []
+
+    with executor:
+        futures = [executor.submit(_read_structure, filepath) for filepath in filepaths]
+        for filepath, future in zip(filepaths, futures):
+            try:
+                results.append(future.result())
+            except Exception as exception:
+                for pending in futures:
+                    pending.cancel()
+                raise ValueError(
+                    f'file `{filepath}` could not be parsed into a `StructureData`: {exception}'
+                ) from exception
+
+    return results
+
+
+def import_structures(
+    filepaths: t.Sequence[t.Union[str, os.PathLike]], store: bool = True, max_workers: t.Optional[int] = None
+) -> t.List['StructureData']:
+    """Import the structures defined in the given files, reusing structures that already exist in the database.
+
+    The files are parsed in parallel with ``ase``, after which the hashes of all structures are computed and the
+    existing structures with any of those hashes are retrieved with a single query. If ``store`` is ``True``, all new
+    structures are stored in a single transaction. Files that define identical structures are mapped onto the same node.
+
+    :param filepaths: paths of the files containing a structure definition that can be parsed by ``ase``.
+    :param store: whether to store the structures that do not yet exist in the database.
+    :param max_workers: maximum number of worker processes used for parsing, defaults to the number of processors.
+    :return: the structures in the order of ``filepaths``.
+    :raises ImportError: if ``ase`` is not installed.
+    :raises ValueError: if any of the files cannot be parsed.
+    """
+    import ase.io  # noqa: F401
+    from aiida.manage import get_manager
+    from aiida.orm import QueryBuilder, StructureData
+
+    filepaths = [str(pathlib.Path(filepath)) for filepath in filepaths]
+
+    if not filepaths:
+        return []
+
+    structures = [StructureData(ase=atoms) for atoms in _read_structures(filepaths, max_workers)]
+    hashes = [structure.base.caching._compute_hash() for structure in structures]
+
+    query = QueryBuilder().append(
+        StructureData, filters={'extras._aiida_hash': {'in': list(set(hashes))}}, project=['extras._aiida_hash', '*']
+    )
+    existing = dict(query.all())
+
+    unique = {}
+
+    for node_hash, structure in zip(hashes, structures):
+        if node_hash not in existing:
+            unique.setdefault(node_hash, structure)
+
+    if store and unique:
+        with get_manager().get_profile_storage().transaction():
+            for structure in unique.values():
+                structure.store()
+
+    return [existing.get(node_hash, unique.get(node_hash)) for node_hash in hashes]
@@ -0,0 +1,181 @@
+"""Instrumentation that records where the wall time of the common workflows is spent.
+
+The common workflows record the timings of their own steps and of the launching of their children in the extras of
+their node under the key ``TIMING_EXTRA_KEY``, with the following schema::
+
+    {
+        'version': 1,
+        'steps': {
+            '<step>': [{'start': <float>, 'duration': <float>}, ...],
+        },
+        'children': {
+            '<pk>': {'generate': <float>, 'submit': <float>},
+        },
+    }
+
+All durations are wall times in seconds and ``start`` is a POSIX timestamp. Each step of the outline has a list of
+entries, since a step can be executed more than once, e.g. in a loop. The ``children`` are keyed on the pk of the child
+process, as a string, where ``generate`` is the time spent by the input generator to create the builder and ``submit``
+the time it took to submit the child. The ``generate`` is omitted for children whose inputs are not generated when they
+are launched, like the wrapped workchain of the common relax workflow.
+
+The time spent in the queue of the scheduler and the actual run time are not recorded by the workflows, but are derived
+from the information that the scheduler reports for each calculation job. Together these define the phases that are
+aggregated by ``get_timings``:
+
+* ``step:<step>``: the time spent in a step of the outline of a workflow;
+* ``generate``: the time spent in the input generator to create the builder of a child;
+* ``submit``: the time spent submitting a child;
+* ``daemon``: the time between the creation of a calculation job and its submission to the scheduler, which includes
+  the time for the daemon to pick up the process and to upload the input files;
+* ``queue``: the time a calculation job waited in the queue of the scheduler;
+* ``run``: the run time of a calculation job as reported by the scheduler.
+"""
+import collections
+import functools
+import time
+import typing as t
+
+if t.TYPE_CHECKING:
+    from aiida.orm import Group, ProcessNode, WorkflowNode
+
+__all__ = ('Stopwatch', 'get_timings', 'record_child', 'record_step')
+
+TIMING_EXTRA_KEY = 'common_workflows_timing'
+TIMING_VERSION = 1
+
+WorkflowsType = t.Union['Group', t.Iterable[t.Union['WorkflowNode', int]]]
+
+
+class Stopwatch:
+    """Stopwatch that measures the wall time elapsed between consecutive laps."""
+
+    def __init__(self):
+        """Construct a new instance and start the first lap."""
+        self._start = time.perf_counter()
+
+    def lap(self) -> float:
+        """Return the time in seconds elapsed since the start of the current lap and start a new lap."""
+        now = time.perf_counter()
+        elapsed, self._start = now - self._start, now
+        return elapsed
+
+
+def _update_timings(node: 'ProcessNode', section: str, key: str, value: t.Any, append: bool = False) -> None:
+    """Update the timings stored in the extras of the given node.
+
+    :param node: the node whose timings to update.
+    :param section: the section of the timings, either ``steps`` or ``children``.
+    :param key: the key within the section.
+    :param value: the value to set, or to append if ``append`` is ``True``.
+    :param append: whether to append the value to the list under the given key instead of setting it.
+    """
+    timings = node.base.extras.get(TIMING_EXTRA_KEY, None)
+
+    if timings is None or timings.get('version') != TIMING_VERSION:
+        timings = {'version': TIMING_VERSION, 'steps': {}, 'children': {}}
+
+    if append:
+        timings[section].setdefault(key, []).append(value)
+    else:
+        timings[section][key] = value
+
+    node.base.extras.set(TIMING_EXTRA_KEY, timings)
+
+
+def record_step(func: t.Callable) -> t.Callable:
+    """Decorate an outline step of a workflow to record its wall time in the extras of the workflow node.
+
+    The timings are recorded even if the step raises an exception.
+
+    :param func: the outline step, which takes the workflow instance as its only argument.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self):
+        start = time.time()
+        stopwatch = Stopwatch()
+
+        try:
+            return func(self)
+        finally:
+            timing = {'start': start, 'duration': stopwatch.lap()}
+            _update_timings(self.node, 'steps', func.__name__, timing, append=True)
+
+    return wrapper
+
+
+def record_child(node: 'ProcessNode', child: 'ProcessNode', submit: float, generate: t.Optional[float] = None) -> None:
+    """Record the time it took to create and submit a child process in the extras of the given node.
+
+    :param node: the node of the workflow that submitted the child.
+    :param child: the node of the child process.
+    :param submit: the time in seconds spent to submit the child.
+    :param generate: the time in seconds spent to generate the builder of the child, if it was generated.
+    """
+    timings = {'submit': submit} if generate is None else {'generate': generate, 'submit': submit}
+    _update_timings(node, 'children', str(child.pk), timings)
+
+
+def _get_job_durations(ctime, job_info: t.Optional[dict]) -> t.Dict[str, float]:
+    """Return the durations of the phases of a calculation job from its creation time and its last job info.
+
+    :param ctime: the creation time of the calculation job node.
+    :param job_info: the serialized ``JobInfo`` last reported by the scheduler, or ``None``.
+    :return: dictionary with the durations of the ``daemon``, ``queue`` and ``run`` phases that can be determined.
+    """
+    from aiida.schedulers.datastructures import JobInfo
+
+    if not job_info:
+        return {}
+
+    job_info = JobInfo.load_from_dict(job_info)
+    durations = {}
+
+    # Naive datetimes reported by a scheduler are interpreted as local time.
+    submission = job_info.submission_time.astimezone() if job_info.submission_time else None
+    dispatch = job_info.dispatch_time.astimezone() if job_info.dispatch_time else None
+    finish = job_info.finish_time.astimezone() if job_info.finish_time else None
+
+    if submission is not None:
+        durations['daemon'] = (submission - ctime).total_seconds()
+
+    if submission is not None and dispatch is not None:
+        durations['queue'] = (dispatch - submission).total_seconds()
+
+    if job_info.wallclock_time_seconds is not None:
+        durations['run'] = float(job_info.wallclock_time_seconds)
+    elif dispatch is not None and finish is not None:
+        durations['run'] = (finish - dispatch).total_seconds()
+
+    return durations
+
+
+def get_timings(workflows: WorkflowsType) -> t.Dict[str, t.List[float]]:
+    """Return the timings of the given workflows and all the processes they called, aggregated per phase.
+
+    The timings recorded by the workflows and the scheduler information of the calculation jobs are retrieved with
+    projected queries without loading any of the nodes.
+
+    :param workflows: a group or a list of workflow nodes or their pks.
+    :return: mapping of each phase onto the list of durations in seconds, see the module docstring for the phases.
+    """
+    from .export import _query_call_tree
+
+    timings = collections.defaultdict(list)
+    project = [f'extras.{TIMING_EXTRA_KEY}', 'ctime', 'attributes.last_job_info']
+
+    for _, (timing, ctime, job_info) in _query_call_tree(workflows, project).values():
+        if timing and timing.get('version') == TIMING_VERSION:
+            for step, entries in timing['steps'].items():
+                timings[f'step:{step}'].extend(entry['duration'] for entry in entries)
+
+            for child in timing['children'].values():
+                if 'generate' in child:
+                    timings['generate'].append(child['generate'])
+                timings['submit'].append(child['submit'])
+
+        for phase, duration in _get_job_durations(ctime, job_info).items():
+            timings[phase].append(duration)
+
+    return dict(timings)
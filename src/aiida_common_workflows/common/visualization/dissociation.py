@@ -1,18 +1,18 @@
 """Utilities to visualize a dissociation curve based on set of distances and energies."""
 import typing
 
-import matplotlib.pyplot as plt
+if typing.TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
 
 
-def get_dissociation_plot(
-    distances: typing.List[float], energies: typing.List[float], unit_distance: str = 'Å', unit_energy: str = 'eV'
-) -> plt:
-    """Plot the dissociation curve for a given set of distances and energies.
+def _plot_dissociation(
+    axes: 'Axes', distances: typing.List[float], energies: typing.List[float], unit_distance: str, unit_energy: str
+) -> None:
+    """Plot the dissociation curve for a given set of distances and energies on the given axes.
 
-    :param distances: list of cell volumes.
-    :param energies: list of energies.
-    :param unit_distance: unit of distance, default is [Å].
-    :param unit_energy: unit of energy, default is [eV].
+    :raises ValueError: if the distances and energies are not lists of floats of the same length.
     """
     if len(distances) != len(energies):
         raise ValueError('`distances` and `energies` are not of the same length.')
@@ -21,9 +21,50 @@ def get_dissociation_plot(
     if any(not isinstance(e, float) for e in energies):
         raise ValueError('not all values provided in `energies` are of type `float`.')
 
-    plt.plot(distances, energies, 'o-')
+    axes.plot(distances, energies, 'o-')
+
+    axes.set_xlabel(f'Distance [{unit_distance}]')
+    axes.set_ylabel(f'Energy [{unit_energy}]')
 
-    plt.xlabel(f'Distance [{unit_distance}]')
-    plt.ylabel(f'Energy [{unit_energy}]')
+
+def get_dissociation_plot(
+    distances: typing.List[float], energies: typing.List[float], unit_distance: str = 'Å', unit_energy: str = 'eV'
+) -> 'plt':
+    """Plot the dissociation curve for a given set of distances and energies.
+
+    .. note:: this draws on the current figure of ``pyplot``. Use ``get_dissociation_figure`` to create an independent
+        figure.
+
+    :param distances: list of cell volumes.
+    :param energies: list of energies.
+    :param unit_distance: unit of distance, default is [Å].
+    :param unit_energy: unit of energy, default is [eV].
+    """
+    import matplotlib.pyplot as plt
+
+    _plot_dissociation(plt.gca(), distances, energies, unit_distance, unit_energy)
 
     return plt
+
+
+def get_dissociation_figure(
+    distances: typing.List[float], energies: typing.List[float], unit_distance: str = 'Å', unit_energy: str = 'eV'
+) -> 'Figure':
+    """Return a figure with the dissociation curve for a given set of distances and energies.
+
+    The figure uses the non-interactive Agg backend and is not registered with ``pyplot``, so no global state is
+    modified. This makes it safe to use in parallel and the figure is garbage collected as soon as it is released.
+
+    :param distances: list of distances.
+    :param energies: list of energies.
+    :param unit_distance: unit of distance, default is [Å].
+    :param unit_energy: unit of energy, default is [eV].
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    _plot_dissociation(figure.add_subplot(), distances, energies, unit_distance, unit_energy)
+
+    return figure
@@ -1,9 +1,13 @@
 """Utilities to fit and visualize a Equation of States based on set of volumes and energies."""
 import typing
 
-import matplotlib.pyplot as plt
 import numpy
 
+if typing.TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
 
 def birch_murnaghan(V, E0, V0, B0, B01):  # noqa: N803
     """Compute energy by Birch Murnaghan formula."""
@@ -32,15 +36,12 @@ def fit_birch_murnaghan_params(volumes, energies):
     return params, covariance
 
 
-def get_eos_plot(
-    volumes: typing.List[float], energies: typing.List[float], unit_volume: str = 'Å^3', unit_energy: str = 'eV'
-) -> plt:
-    """Plot the Equation of State for a given set of volumes and energies
+def _plot_eos(
+    axes: 'Axes', volumes: typing.List[float], energies: typing.List[float], unit_volume: str, unit_energy: str
+) -> None:
+    """Plot the Equation of State for a given set of volumes and energies on the given axes.
 
-    :param volumes: list of cell volumes.
-    :param energies: list of energies.
-    :param unit_volume: unit of volume, default is [Å^3].
-    :param unit_energy: unit of energy, default is [eV].
+    :raises ValueError: if the volumes and energies are not lists of floats of the same length.
     """
     if len(volumes) != len(energies):
         raise ValueError('`distances` and `energies` are not of the same length.')
@@ -55,10 +56,50 @@ def get_eos_plot(
     volume_max = max(volumes)
     volume_range = numpy.linspace(volume_min, volume_max, 300)
 
-    plt.plot(volumes, energies, 'o')
-    plt.plot(volume_range, birch_murnaghan(volume_range, *params))
+    axes.plot(volumes, energies, 'o')
+    axes.plot(volume_range, birch_murnaghan(volume_range, *params))
+
+    axes.set_xlabel(f'Volume [{unit_volume}]')
+    axes.set_ylabel(f'Energy [{unit_energy}]')
 
-    plt.xlabel(f'Volume [{unit_volume}]')
-    plt.ylabel(f'Energy [{unit_energy}]')
+
+def get_eos_plot(
+    volumes: typing.List[float], energies: typing.List[float], unit_volume: str = 'Å^3', unit_energy: str = 'eV'
+) -> 'plt':
+    """Plot the Equation of State for a given set of volumes and energies
+
+    .. note:: this draws on the current figure of ``pyplot``. Use ``get_eos_figure`` to create an independent figure.
+
+    :param volumes: list of cell volumes.
+    :param energies: list of energies.
+    :param unit_volume: unit of volume, default is [Å^3].
+    :param unit_energy: unit of energy, default is [eV].
+    """
+    import matplotlib.pyplot as plt
+
+    _plot_eos(plt.gca(), volumes, energies, unit_volume, unit_energy)
 
     return plt
+
+
+def get_eos_figure(
+    volumes: typing.List[float], energies: typing.List[float], unit_volume: str = 'Å^3', unit_energy: str = 'eV'
+) -> 'Figure':
+    """Return a figure with the Equation of State for a given set of volumes and energies.
+
+    The figure uses the non-interactive Agg backend and is not registered with ``pyplot``, so no global state is
+    modified. This makes it safe to use in parallel and the figure is garbage collected as soon as it is released.
+
+    :param volumes: list of cell volumes.
+    :param energies: list of energies.
+    :param unit_volume: unit of volume, default is [Å^3].
+    :param unit_energy: unit of energy, default is [eV].
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    _plot_eos(figure.add_subplot(), volumes, energies, unit_volume, unit_energy)
+
+    return figure
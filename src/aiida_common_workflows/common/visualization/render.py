@@ -0,0 +1,57 @@
+"""Utilities to render many figures to files in parallel without an interactive backend.
+
+The figures are created with the figure-object API, e.g. ``get_eos_figure``, which does not register them with
+``pyplot``. Each worker process renders a single figure at a time and clears it explicitly as soon as it is written, so
+the memory usage is bounded by the number of workers rather than by the number of figures.
+"""
+import concurrent.futures
+import pathlib
+import typing as t
+
+if t.TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+__all__ = ('save_figure', 'save_figures')
+
+FigureFactory = t.Callable[..., 'Figure']
+
+
+def save_figure(get_figure: FigureFactory, filepath: t.Union[str, pathlib.Path], *args: t.Any) -> str:
+    """Create a figure and save it to a file, after which the figure is cleared.
+
+    :param get_figure: callable that returns a ``Figure`` for the given positional arguments, e.g. ``get_eos_figure``.
+    :param filepath: the path of the file to write. The format is determined from the extension.
+    :param args: the positional arguments passed to ``get_figure``.
+    :return: the path of the written file.
+    """
+    figure = get_figure(*args)
+
+    try:
+        figure.savefig(filepath)
+    finally:
+        figure.clear()
+
+    return str(filepath)
+
+
+def save_figures(
+    get_figure: FigureFactory,
+    datasets: t.Iterable[t.Tuple[t.Union[str, pathlib.Path], t.Sequence[t.Any]]],
+    max_workers: t.Optional[int] = None,
+) -> t.Iterator[t.Tuple[str, t.Optional[Exception]]]:
+    """Render figures to files in a pool of processes.
+
+    The results are yielded as soon as each figure has been written, in the order in which they complete. A figure that
+    cannot be created, e.g. because the fit fails, does not interrupt the others but its exception is yielded instead.
+
+    :param get_figure: picklable callable that returns a ``Figure`` for the given positional arguments.
+    :param datasets: iterable of tuples of the path of the file to write and the positional arguments of ``get_figure``.
+    :param max_workers: the maximum number of processes, by default the number of processors on the machine.
+    :return: iterator over tuples of the path of each file and the exception that was raised, or ``None`` on success.
+    """
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        futures = {
+            executor.submit(save_figure, get_figure, filepath, *args): str(filepath) for filepath, args in datasets
+        }
+        for future in concurrent.futures.as_completed(futures):
+            yield futures[future], future.exception()
@@ -1,6 +1,9 @@
 """Base class for an input generator for a common workflow."""
 import abc
+import collections
 import copy
+import enum
+import typing as t
 
 from aiida import engine, orm
 
@@ -23,10 +26,34 @@ def recursively_check_stored_nodes(obj):
     return copy.deepcopy(obj)
 
 
+def get_validation_cache_key(obj) -> t.Hashable:
+    """Return a hashable key that uniquely represents ``obj`` for the purpose of memoizing input validation.
+
+    Stored nodes are immutable and so are represented by their UUID. Unstored nodes can still be mutated, so they are
+    represented by the hash of their content instead.
+
+    :param obj: the (nested) dictionary of inputs for which to compute the key.
+    :return: a hashable representation of ``obj``.
+    :raises TypeError: if ``obj`` contains a value that cannot be represented by a hashable.
+    """
+    if isinstance(obj, dict):
+        return tuple(sorted((key, get_validation_cache_key(value)) for key, value in obj.items()))
+    if isinstance(obj, (list, tuple)):
+        return tuple(get_validation_cache_key(value) for value in obj)
+    if isinstance(obj, orm.Node):
+        return obj.uuid if obj.is_stored else obj.base.caching._compute_hash()
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    hash(obj)
+    return obj
+
+
 class InputGenerator(OptionalFeatureMixin, metaclass=abc.ABCMeta):
     """Base class for an input generator for a common workflow."""
 
     _spec_cls: InputGeneratorSpec = InputGeneratorSpec
+    _validation_cache: t.ClassVar[collections.OrderedDict] = collections.OrderedDict()
+    _validation_cache_size: int = 256
 
     @classmethod
     def spec(cls) -> InputGeneratorSpec:
@@ -70,6 +97,46 @@ class InputGenerator(OptionalFeatureMixin, metaclass=abc.ABCMeta):
         Specific subclass implementations should construct and return a builder from the parsed arguments stored under
         the ``parsed_kwargs`` attribute.
         """
+        return self._construct_builder(**self._parse_kwargs(kwargs))
+
+    def validate(self, **kwargs) -> None:
+        """Validate the given inputs without constructing a builder.
+
+        The keyword arguments are validated against the input generator specification, exactly as in ``get_builder``,
+        followed by the plugin specific constraints implemented in ``_validate_constraints``. Contrary to
+        ``get_builder``, no builder is constructed and so no nodes are created or stored, unless the generator does not
+        implement ``_validate_constraints``, see its base implementation. Successful validations are memoized, such
+        that validating the same inputs again, for example once for each point of a workflow that calls the generator
+        multiple times, is essentially free.
+
+        :raises ValueError: if the inputs are invalid.
+        """
+        try:
+            cache_key = (self.__class__, self.process_class, get_validation_cache_key(kwargs))
+        except TypeError:
+            cache_key = None
+
+        if cache_key is not None and cache_key in self._validation_cache:
+            self._validation_cache.move_to_end(cache_key)
+            return
+
+        validation_error = self._validate_constraints(**self._parse_kwargs(kwargs))
+
+        if validation_error is not None:
+            raise ValueError(validation_error)
+
+        if cache_key is not None:
+            self._validation_cache[cache_key] = True
+            while len(self._validation_cache) > self._validation_cache_size:
+                self._validation_cache.popitem(last=False)
+
+    def _parse_kwargs(self, kwargs: dict) -> dict:
+        """Pre-process, serialize and validate the keyword arguments against the input generator specification.
+
+        :param kwargs: the keyword arguments passed to ``get_builder`` or ``validate``.
+        :return: the serialized keyword arguments.
+        :raises ValueError: if the keyword arguments do not validate against the specification.
+        """
         # Create a deep copy of the input arguments because the ``pre_process`` step may alter them and
         # the originals need to be preserved in case they are passed to the ``get_builder`` method again, as
         # for example within a loop of a code-agnostic wrapping workchain like the ``EquationOfStateWorkChain``.
@@ -91,7 +158,25 @@ class InputGenerator(OptionalFeatureMixin, metaclass=abc.ABCMeta):
         if validation_error is not None:
             raise ValueError(validation_error)
 
-        return self._construct_builder(**serialized_kwargs)
+        return serialized_kwargs
+
+    def _validate_constraints(self, **kwargs) -> t.Optional[str]:
+        """Validate plugin specific constraints on the inputs that cannot be expressed in the specification.
+
+        Subclasses should override this method to check all the constraints that would otherwise only be detected when
+        the builder is constructed. The implementation should not create or store any nodes.
+
+        The base implementation constructs the builder and discards it, such that the generators that do not implement
+        this method still detect all the invalid inputs, even though it is not free of side effects.
+
+        The keyword arguments will have been validated against the input generator specification.
+
+        :return: an error message if the inputs are invalid, ``None`` otherwise.
+        """
+        try:
+            self._construct_builder(**kwargs)
+        except Exception as exception:
+            return str(exception)
 
     @abc.abstractmethod
     def _construct_builder(self, **kwargs) -> engine.ProcessBuilder:
@@ -1,10 +1,13 @@
 """Module with utilities for working with the plugins provided by this plugin package."""
 from .entry_point import get_entry_point_name_from_class, get_workflow_entry_point_names, load_workflow_entry_point
 from .factories import WorkflowFactory
+from .manifest import get_capability_manifest, get_workflow_capabilities
 
 __all__ = (
     'WorkflowFactory',
     'get_workflow_entry_point_names',
     'get_entry_point_name_from_class',
     'load_workflow_entry_point',
+    'get_capability_manifest',
+    'get_workflow_capabilities',
 )
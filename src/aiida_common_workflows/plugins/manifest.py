@@ -0,0 +1,105 @@
+"""Module with a static manifest of the capabilities of the plugin implementations of the common workflows.
+
+Determining which protocols, relax types, spin types or calculation engines a plugin implementation supports requires
+loading its input generator, which imports the plugin package and all of its dependencies. This is slow and, for the
+command line interface in particular, unnecessary. The capabilities of all implementations provided by this package
+are therefore stored in a manifest that is shipped with the package and that can be queried without importing any
+plugin code. The manifest is generated from the input generator specifications by ``generate_capability_manifest``.
+"""
+import enum
+import functools
+import json
+import pathlib
+import typing as t
+
+__all__ = ('generate_capability_manifest', 'get_capability_manifest', 'get_workflow_capabilities')
+
+MANIFEST_FILEPATH = pathlib.Path(__file__).parent / 'manifest.json'
+
+
+def _serialize_choice(choice: t.Any) -> t.Any:
+    """Return the JSON-serializable representation of a choice of an input generator port."""
+    return choice.value if isinstance(choice, enum.Enum) else choice
+
+
+def get_generator_capabilities(generator) -> dict:
+    """Return the capabilities of the given input generator.
+
+    :param generator: an instance of an input generator.
+    :return: dictionary with the choices of each port of the specification that defines them, the supported optional
+        features, the calculation engines with the entry point of their required code, and the protocols if the
+        generator is a protocol registry.
+    """
+    from aiida_common_workflows.protocol import ProtocolRegistry
+
+    ports = generator.spec().inputs
+
+    capabilities = {
+        'choices': {
+            name: [_serialize_choice(choice) for choice in port.choices]
+            for name, port in ports.items()
+            if getattr(port, 'choices', None) is not None
+        },
+        'optional_features': sorted(feature.value for feature in generator.get_supported_optional_features()),
+        'engines': {
+            name: {'code_entry_point': port['code'].code_entry_point, 'description': port.help}
+            for name, port in ports['engines'].items()
+        },
+    }
+
+    if isinstance(generator, ProtocolRegistry):
+        capabilities['protocols'] = generator.get_protocol_names()
+        capabilities['default_protocol'] = generator.get_default_protocol_name()
+
+    return capabilities
+
+
+def generate_capability_manifest(workflows: t.Sequence[str] = ('relax', 'bands')) -> dict:
+    """Generate the capability manifest by loading the input generator of each registered plugin implementation.
+
+    .. note:: this requires all plugin packages to be installed, since each implementation is imported.
+
+    :param workflows: the common workflows whose plugin implementations should be included.
+    :return: dictionary with the capabilities for each entry point name.
+    """
+    from .entry_point import get_workflow_entry_point_names
+    from .factories import WorkflowFactory
+
+    manifest = {}
+
+    for workflow in workflows:
+        for entry_point_name in get_workflow_entry_point_names(workflow):
+            generator = WorkflowFactory(entry_point_name).get_input_generator()
+            manifest[entry_point_name] = get_generator_capabilities(generator)
+
+    return dict(sorted(manifest.items()))
+
+
+@functools.lru_cache(maxsize=1)
+def get_capability_manifest() -> dict:
+    """Return the capability manifest that is shipped with the package.
+
+    The manifest is read from disk only once and cached for the lifetime of the interpreter.
+
+    :return: dictionary with the capabilities for each entry point name.
+    """
+    with MANIFEST_FILEPATH.open('r', encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def get_workflow_capabilities(workflow: str, plugin_name: str) -> dict:
+    """Return the capabilities of the given plugin implementation of a certain common workflow.
+
+    The capabilities are taken from the capability manifest. Only if the implementation is not contained in the
+    manifest, for example because it is provided by another package, is the implementation loaded to determine them.
+
+    :param workflow: the name of the common workflow.
+    :param plugin_name: name of the plugin implementation.
+    :return: dictionary with the capabilities of the plugin implementation.
+    """
+    from .entry_point import PACKAGE_PREFIX, load_workflow_entry_point
+
+    try:
+        return get_capability_manifest()[f'{PACKAGE_PREFIX}.{workflow}.{plugin_name}']
+    except KeyError:
+        return get_generator_capabilities(load_workflow_entry_point(workflow, plugin_name).get_input_generator())
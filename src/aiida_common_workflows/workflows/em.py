@@ -25,9 +25,9 @@ def validate_inputs(value, _):
         )
 
     try:
-        generator.get_builder(structure=value['structure'], **value['generator_inputs'])
+        generator.validate(structure=value['structure'], **value['generator_inputs'])
     except Exception as exc:
-        return f'`{generator.__class__.__name__}.get_builder()` fails for the provided `generator_inputs`: {exc}'
+        return f'`{generator.__class__.__name__}.validate()` fails for the provided `generator_inputs`: {exc}'
 
 
 def validate_sub_process_class(value, _):
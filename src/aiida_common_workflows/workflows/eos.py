@@ -1,11 +1,25 @@
 """Equation of state workflow that can use any code plugin implementing the common relax workflow."""
+import copy
 import inspect
 
 from aiida import orm
 from aiida.common import exceptions
-from aiida.engine import WorkChain, append_, calcfunction
+from aiida.engine import WorkChain, append_, calcfunction, while_
 from aiida.plugins import WorkflowFactory
 
+from aiida_common_workflows.common.admission import get_resources, register_admission, request_admission
+from aiida_common_workflows.common.cleanup import clean_workdir
+from aiida_common_workflows.common.cleanup import validate_policy as validate_cleanup_policy
+from aiida_common_workflows.common.pools import (
+    POLICIES,
+    balance_engines,
+    get_queue_depths,
+    get_resource_models,
+    validate_engine_pools,
+)
+from aiida_common_workflows.common.resources import ResourceModel, get_features, size_engines
+from aiida_common_workflows.common.restart import get_reusable_children, hash_point, register_point, register_reused
+from aiida_common_workflows.common.timing import Stopwatch, record_child, record_step
 from aiida_common_workflows.workflows.relax.generator import ElectronicType, RelaxType, SpinType
 from aiida_common_workflows.workflows.relax.workchain import CommonRelaxWorkChain
 
@@ -20,10 +34,20 @@ def validate_inputs(value, _):
     process_class = WorkflowFactory(value['sub_process_class'])
     generator = process_class.get_input_generator()
 
+    if 'resource_models' in value:
+        unknown = set(value['resource_models'].keys()).difference(value['generator_inputs']['engines'])
+        if unknown:
+            return f'`resource_models` defines models for engines that are not in `generator_inputs.engines`: {unknown}'
+
+    if 'engine_pools' in value:
+        message = validate_engine_pools(value['engine_pools'], value['generator_inputs']['engines'])
+        if message is not None:
+            return message
+
     try:
-        generator.get_builder(structure=value['structure'], **value['generator_inputs'])
+        generator.validate(structure=value['structure'], **value['generator_inputs'])
     except Exception as exc:
-        return f'`{generator.__class__.__name__}.get_builder()` fails for the provided `generator_inputs`: {exc}'
+        return f'`{generator.__class__.__name__}.validate()` fails for the provided `generator_inputs`: {exc}'
 
 
 def validate_sub_process_class(value, _):
@@ -55,6 +79,26 @@ def validate_scale_increment(value, _):
         return 'scale increment needs to be between 0 and 1.'
 
 
+def validate_restart_from(value, _):
+    """Validate the `restart_from` input."""
+    if value is not None and not value.is_terminated:
+        return f'`restart_from` should be a terminated workflow, but `{value.pk}` is still active.'
+
+
+def validate_engine_pools_policy(value, _):
+    """Validate the `engine_pools_policy` input."""
+    if value not in POLICIES:
+        return f'`engine_pools_policy` should be one of {POLICIES}.'
+
+
+def validate_resource_models(value, _):
+    """Validate the `resource_models` input."""
+    if value is not None:
+        for engine, resource_model in value.get_dict().items():
+            if not isinstance(resource_model, dict) or {'model', 'cores_per_machine'}.difference(resource_model):
+                return f'the resource model of engine `{engine}` should define the `model` and `cores_per_machine`.'
+
+
 def validate_relax_type(value, _):
     """Validate the `generator_inputs.relax_type` input."""
     if value is not None and isinstance(value, str):
@@ -109,13 +153,51 @@ class EquationOfStateWorkChain(WorkChain):
             help='Target threshold for the forces in eV/Å.')
         spec.input('generator_inputs.threshold_stress', valid_type=float, required=False, non_db=True,
             help='Target threshold for the stress in eV/Å^3.')
+        spec.input('generator_inputs.walltime_margin', valid_type=int, required=False, non_db=True,
+            help='The number of seconds before the wallclock limit at which the engines should stop gracefully.')
+        spec.input('generator_inputs.file_cache', valid_type=str, required=False, non_db=True,
+            help='The absolute path of the cache directory of the static input files on the remote computer, which '
+                 'should be populated beforehand.')
+        spec.input('generator_inputs.retrieval', valid_type=str, required=False, non_db=True,
+            help='The files to retrieve and the data to parse, `full` or `minimal`.')
+        spec.input('resource_models', valid_type=orm.Dict, required=False, validator=validate_resource_models,
+            serializer=orm.to_aiida_type,
+            help='Models to size the `resources` and `max_wallclock_seconds` options of the engines for the scaled '
+                 'structure of each sub process, as a mapping of the engine names onto the serialized `ResourceModel` '
+                 'under the key `model` and the `cores_per_machine`. See `aiida_common_workflows.common.resources`.')
+        spec.input('engine_pools', valid_type=dict, required=False, non_db=True,
+            help='Pools of equivalent codes across which the sub processes are balanced, as a mapping of the engine '
+                 'names onto a list of members that define the `code` and optionally a `weight` and `options`. See '
+                 '`aiida_common_workflows.common.pools`.')
+        spec.input('engine_pools_policy', valid_type=str, default='queue_depth', non_db=True,
+            validator=validate_engine_pools_policy,
+            help='The policy to balance the sub processes across the `engine_pools`: `weights` to only consider the '
+                 'weights of the members, or `queue_depth` to also consider the number of calculation jobs waiting '
+                 'in the queue of their computers.')
+        spec.input('restart_from', valid_type=orm.WorkflowNode, required=False, non_db=True,
+            validator=validate_restart_from,
+            help='A previous workflow of the same type whose sub processes that finished successfully are reused if '
+                 'their generator inputs match, such that only the missing or failed points are run. See '
+                 '`aiida_common_workflows.common.restart`.')
+        spec.input('cleanup', valid_type=dict, non_db=True, required=False, validator=validate_cleanup_policy,
+            help='The policy to clean the remote folders of the calculations of the sub processes once the workflow '
+                 'finished successfully, except those that are still referenced. See '
+                 '`aiida_common_workflows.common.cleanup` for its keys and their defaults.')
         spec.input_namespace('sub_process', dynamic=True, populate_defaults=False)
         spec.input('sub_process_class', non_db=True, validator=validate_sub_process_class)
         spec.inputs.validator = validate_inputs
         spec.outline(
             cls.run_init,
+            while_(cls.is_waiting_for_admission)(
+                cls.run_admitted,
+            ),
+            cls.wait_for_children,
             cls.inspect_init,
             cls.run_eos,
+            while_(cls.is_waiting_for_admission)(
+                cls.run_admitted,
+            ),
+            cls.wait_for_children,
             cls.inspect_eos,
         )
         spec.output_namespace('structures', valid_type=orm.StructureData,
@@ -127,6 +209,21 @@ class EquationOfStateWorkChain(WorkChain):
         spec.exit_code(400, 'ERROR_SUB_PROCESS_FAILED',
             message='At least one of the `{cls}` sub processes did not finish successfully.')
 
+    def on_terminated(self):
+        """Clean the remote folders of the calculations following the ``cleanup`` policy if finished successfully."""
+        super().on_terminated()
+
+        if 'cleanup' not in self.inputs or not self.node.is_finished_ok:
+            return
+
+        cleaned, failed = clean_workdir(self.node, self.inputs.cleanup)
+
+        if cleaned:
+            self.report(f'cleaned the remote folders: {" ".join(str(pk) for pk in cleaned)}')
+
+        if failed:
+            self.report(f'failed to clean the remote folders: {" ".join(str(pk) for pk in failed)}')
+
     def get_scale_factors(self):
         """Return the list of scale factors."""
         if 'scale_factors' in self.inputs:
@@ -134,9 +231,67 @@ class EquationOfStateWorkChain(WorkChain):
 
         count = self.inputs.scale_count.value
         increment = self.inputs.scale_increment.value
-        return tuple(float(1 + i * increment - (count - 1) * increment / 2) for i in range(count))
 
-    def get_sub_workchain_builder(self, scale_factor, reference_workchain=None):
+        # Round off the representation errors, such that the scale factors are identical to the equivalent explicit
+        # ``scale_factors`` and the sub processes of both can be cached.
+        return tuple(round(1 + i * increment - (count - 1) * increment / 2, 12) for i in range(count))
+
+    def get_submission_order(self, scale_factors):
+        """Return the indices of the scale factors after the first one in the order in which they should be submitted.
+
+        The sub processes are submitted longest expected first, such that the longest ones do not start last and delay
+        the completion of the workflow when not all of them can run at the same time. If ``resource_models`` are
+        defined, the cost is estimated by the models for the volume of each scale factor. Otherwise, it is taken to be
+        proportional to the volume, since the number of plane waves, or basis functions in general, scales with it.
+
+        :param scale_factors: the scale factors of all sub processes, including the first one.
+        :return: list of indices of the scale factors in order of decreasing expected cost.
+        """
+        costs = list(scale_factors)
+
+        if 'resource_models' in self.inputs:
+            features = get_features(self.inputs.structure)
+            models = [
+                ResourceModel.deserialize(value['model']) for value in self.inputs.resource_models.get_dict().values()
+            ]
+            try:
+                costs = [
+                    sum(
+                        model.estimate_core_seconds({**features, 'volume': features['volume'] * scale_factor})
+                        for model in models
+                    )
+                    for scale_factor in scale_factors
+                ]
+            except ValueError:
+                pass
+
+        return sorted(range(1, len(scale_factors)), key=lambda index: costs[index], reverse=True)
+
+    def update_engine_pools(self):
+        """Update the state used to balance the sub processes that are submitted by the current step across the pools.
+
+        With the ``queue_depth`` policy, the queue depths are determined once per step and the assignments are reset,
+        since the calculation jobs of the sub processes that were submitted by the previous steps are part of the queue.
+        """
+        if 'pool_assignments' not in self.ctx or self.inputs.engine_pools_policy == 'queue_depth':
+            self.ctx.pool_assignments = {}
+
+        if 'engine_pools' in self.inputs and self.inputs.engine_pools_policy == 'queue_depth':
+            self.ctx.queue_depths = get_queue_depths(self.inputs.engine_pools)
+
+    def get_engines(self, assignments):
+        """Return the engines of the next sub process, balanced across the ``engine_pools`` if they are defined.
+
+        :param assignments: the assignments of the sub processes to the members of the pools, updated in place.
+        """
+        engines = self.inputs.generator_inputs['engines']
+
+        if 'engine_pools' in self.inputs:
+            engines = balance_engines(engines, self.inputs.engine_pools, assignments, self.ctx.get('queue_depths'))
+
+        return engines
+
+    def get_sub_workchain_builder(self, scale_factor, reference_workchain=None, engines=None):
         """Return the builder for the relax workchain."""
         structure = scale_structure(self.inputs.structure, scale_factor)
         process_class = WorkflowFactory(self.inputs.sub_process_class)
@@ -145,11 +300,113 @@ class EquationOfStateWorkChain(WorkChain):
         if reference_workchain is not None:
             base_inputs['reference_workchain'] = reference_workchain
 
-        builder = process_class.get_input_generator().get_builder(**base_inputs, **self.inputs.generator_inputs)
+        generator_inputs = dict(self.inputs.generator_inputs)
+        generator_inputs['engines'] = (
+            engines if engines is not None else self.get_engines(self.ctx.get('pool_assignments', {}))
+        )
+
+        if 'resource_models' in self.inputs:
+            resource_models = self.inputs.resource_models.get_dict()
+            if 'engine_pools' in self.inputs:
+                resource_models = get_resource_models(
+                    resource_models, generator_inputs['engines'], self.inputs.engine_pools
+                )
+            generator_inputs['engines'] = size_engines(generator_inputs['engines'], resource_models, structure)
+
+        builder = process_class.get_input_generator().get_builder(**base_inputs, **generator_inputs)
         builder._merge(**self.inputs.get('sub_process', {}))
 
         return builder, structure
 
+    def submit_sub_workchain(self, index, engines):
+        """Submit the sub process for the scale factor with the given index and return its node."""
+        scale_factor = orm.Float(self.get_scale_factors()[index])
+        stopwatch = Stopwatch()
+        builder, structure = self.get_sub_workchain_builder(
+            scale_factor, reference_workchain=self.ctx.get('reference_workchain'), engines=engines
+        )
+        generate = stopwatch.lap()
+        self.report(f'submitting `{builder.process_class.__name__}` for scale_factor `{scale_factor.value}`')
+        child = self.submit(builder)
+        record_child(self.node, child, generate=generate, submit=stopwatch.lap())
+        self.ctx.structures.append(structure)
+        self.ctx.indices.append(index)
+        self.ctx.setdefault('children', []).append(child)
+
+        if index == 0:
+            self.ctx.reference_workchain = child
+
+        return child
+
+    def get_point_hash(self, index):
+        """Return the hash that identifies the sub process for the scale_factor with the given index.
+
+        See :mod:`aiida_common_workflows.common.restart`.
+        """
+        return hash_point(
+            self.inputs.sub_process_class,
+            self.inputs.structure,
+            self.get_scale_factors()[index],
+            self.inputs.generator_inputs,
+            self.inputs.get('sub_process', {}),
+            self.ctx.get('reference_workchain'),
+        )
+
+    def reuse_sub_workchain(self, index, child):
+        """Reuse the given sub process of the ``restart_from`` workflow for the scale_factor with the given index."""
+        scale_factor = orm.Float(self.get_scale_factors()[index])
+        self.report(f'reusing `{child.process_label}<{child.pk}>` for scale_factor `{scale_factor.value}`')
+        self.ctx.structures.append(scale_structure(self.inputs.structure, scale_factor))
+        self.ctx.indices.append(index)
+        self.ctx.setdefault('children', []).append(child)
+        register_reused(self.node, child)
+
+        if index == 0:
+            self.ctx.reference_workchain = child
+
+    def submit_admitted(self):
+        """Submit the pending sub processes in order, for as long as they are admitted by the admission controller.
+
+        If a sub process is not admitted, since a quota of its computers, codes or user is exhausted, the workflow waits
+        for the oldest of the active processes that hold the quota to terminate before the ``run_admitted`` step resumes
+        the submission. See :mod:`aiida_common_workflows.common.admission`. The sub processes that finished successfully
+        in the ``restart_from`` workflow are reused instead, without requesting an admission.
+
+        The submitted sub processes are only added to the context, since the workflow would otherwise also wait for them
+        before requesting the next admission. They are awaited by the ``wait_for_children`` step instead.
+        """
+        self.update_engine_pools()
+
+        while self.ctx.pending:
+            point_hash = self.get_point_hash(self.ctx.pending[0])
+
+            if point_hash in self.ctx.get('reusable', {}):
+                self.reuse_sub_workchain(self.ctx.pending.pop(0), self.ctx.reusable[point_hash])
+                continue
+
+            assignments = copy.deepcopy(self.ctx.pool_assignments)
+            engines = self.get_engines(assignments)
+            resources = get_resources(engines, self.node.user)
+            blocking = request_admission(resources)
+
+            if blocking:
+                self.report(
+                    f'waiting for admission: a full quota is held by {len(blocking)} processes, waiting for the oldest '
+                    f'one {blocking[0]}'
+                )
+                self.to_context(admission=orm.load_node(blocking[0]))
+                return
+
+            self.ctx.pool_assignments = assignments
+            child = self.submit_sub_workchain(self.ctx.pending.pop(0), engines)
+            register_admission(child, resources)
+            register_point(child, point_hash)
+
+    def is_waiting_for_admission(self):
+        """Return whether there are pending sub processes that are waiting for their admission."""
+        return bool(self.ctx.pending)
+
+    @record_step
     def run_init(self):
         """
         Run the first workchain.
@@ -159,40 +416,57 @@ class EquationOfStateWorkChain(WorkChain):
         Each plugin should then reuse the relevant parameters from this reference
         calculation, in particular the choice of the k-points grid.
         """
-        scale_factor = orm.Float(self.get_scale_factors()[0])
-        builder, structure = self.get_sub_workchain_builder(scale_factor)
-        self.report(f'submitting `{builder.process_class.__name__}` for scale_factor `{scale_factor}`')
-        self.ctx.reference_workchain = self.submit(builder)
-        self.ctx.structures = [structure]
-        self.to_context(children=append_(self.ctx.reference_workchain))
+        self.ctx.structures = []
+        self.ctx.indices = []
+        self.ctx.pending = [0]
+        self.ctx.reusable = {}
 
+        if 'restart_from' in self.inputs:
+            self.ctx.reusable = get_reusable_children(self.inputs.restart_from)
+            self.report(f'restarting from `{self.inputs.restart_from.pk}`: {len(self.ctx.reusable)} reusable points')
+
+        self.submit_admitted()
+
+    @record_step
     def inspect_init(self):
         """Check that the first workchain finished successfully or abort the workchain."""
         if not self.ctx.children[0].is_finished_ok:
             self.report('Initial sub process did not finish successful so aborting the workchain.')
             return self.exit_codes.ERROR_SUB_PROCESS_FAILED.format(cls=self.inputs.sub_process_class)
 
+    @record_step
     def run_eos(self):
         """Run the sub process at each scale factor to compute the structure volume and total energy."""
-        for scale_factor in self.get_scale_factors()[1:]:
-            reference_workchain = self.ctx.reference_workchain
-            builder, structure = self.get_sub_workchain_builder(
-                orm.Float(scale_factor), reference_workchain=reference_workchain
-            )
-            self.report(f'submitting `{builder.process_class.__name__}` for scale_factor `{scale_factor}`')
-            self.ctx.structures.append(structure)
-            self.to_context(children=append_(self.submit(builder)))
+        self.ctx.pending = self.get_submission_order(self.get_scale_factors())
+        self.submit_admitted()
+
+    @record_step
+    def run_admitted(self):
+        """Submit the pending sub processes that were waiting for their admission."""
+        self.submit_admitted()
 
+    @record_step
+    def wait_for_children(self):
+        """Wait for all the sub processes to terminate, including those that were reused or already terminated."""
+        children = self.ctx.children
+        self.ctx.children = []
+
+        for child in children:
+            self.to_context(children=append_(child))
+
+    @record_step
     def inspect_eos(self):
         """Inspect all children workflows to make sure they finished successfully."""
         if any(not child.is_finished_ok for child in self.ctx.children):
             return self.exit_codes.ERROR_SUB_PROCESS_FAILED.format(cls=self.inputs.sub_process_class)
 
-        for index, child in enumerate(self.ctx.children):
+        points = sorted(zip(self.ctx.indices, self.ctx.children, self.ctx.structures), key=lambda point: point[0])
+
+        for index, child, scaled_structure in points:
             try:
                 structure = child.outputs.relaxed_structure
             except exceptions.NotExistent:
-                structure = self.ctx.structures[index]
+                structure = scaled_structure
 
             volume = structure.get_cell_volume()
             energy = child.outputs.total_energy
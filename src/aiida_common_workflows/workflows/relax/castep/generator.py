@@ -85,6 +85,9 @@ class CastepCommonRelaxInputGenerator(CommonRelaxInputGenerator):
             param['geom_force_tol'] = threshold_forces
         if threshold_stress is not None:
             param['geom_stress_tol'] = threshold_stress * ev_to_gpa
+        run_time = self.get_soft_walltime(engines['relax'].get('options'), kwargs['walltime_margin'])
+        if run_time is not None:
+            param['run_time'] = run_time
 
         # Assign relaxation types
         if relax_type == RelaxType.POSITIONS:
@@ -201,6 +204,9 @@ class CastepCommonRelaxInputGenerator(CommonRelaxInputGenerator):
 
         builder._merge(inputs)
 
+        if run_time is not None:
+            builder.walltime_margin = kwargs['walltime_margin']
+
         return builder
 
 
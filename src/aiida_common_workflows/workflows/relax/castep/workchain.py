@@ -70,6 +70,24 @@ class CastepCommonRelaxWorkChain(CommonRelaxWorkChain):
     _process_class = WorkflowFactory('castep.relax')
     _generator_class = CastepCommonRelaxInputGenerator
 
+    @classmethod
+    def get_restart_inputs(cls, inputs, remote_folder):
+        """Return the inputs that continue from the check file in the remote folder of the previous calculation."""
+        return {**inputs, 'base': {**inputs.get('base', {}), 'continuation_folder': remote_folder}}
+
+    @classmethod
+    def get_soft_walltime_inputs(cls, inputs, margin):
+        """Return the inputs with the ``run_time`` derived from the ``max_wallclock_seconds`` of the options."""
+        run_time = cls._generator_class.get_soft_walltime(inputs['calc']['metadata'].get('options'), margin)
+
+        if run_time is None:
+            return inputs
+
+        parameters = inputs['calc']['parameters'].get_dict()
+        parameters['run_time'] = run_time
+
+        return {**inputs, 'calc': {**inputs['calc'], 'parameters': orm.Dict(parameters)}}
+
     def convert_outputs(self):
         """Convert the outputs of the sub workchain to the common output specification."""
         workchain = self.ctx.workchain
@@ -8,9 +8,10 @@ import yaml
 from aiida import engine, orm, plugins
 
 from aiida_common_workflows.common import ElectronicType, RelaxType, SpinType
+from aiida_common_workflows.common.filecache import get_cached_paths, get_symlink_commands
 from aiida_common_workflows.generators import ChoiceType, CodeType
 
-from ..generator import CommonRelaxInputGenerator
+from ..generator import CommonRelaxInputGenerator, OptionalRelaxFeatures
 
 __all__ = ('Cp2kCommonRelaxInputGenerator',)
 
@@ -73,8 +74,8 @@ def tags_and_magnetization(structure, magnetization_per_site):
         complex_symbols = [
             f'{symbol}_{magn}' for symbol, magn in zip(ase_structure.get_chemical_symbols(), magnetization_per_site)
         ]
-        # Assign a unique tag for every atom kind.
-        combined = {symbol: tag + 1 for tag, symbol in enumerate(set(complex_symbols))}
+        # Assign a unique tag for every atom kind, in order of appearance such that the tags are deterministic.
+        combined = {symbol: tag + 1 for tag, symbol in enumerate(dict.fromkeys(complex_symbols))}
         # Assigning correct tags to every atom.
         tags = [combined[key] for key in complex_symbols]
         ase_structure.set_tags(tags)
@@ -139,6 +140,7 @@ class Cp2kCommonRelaxInputGenerator(CommonRelaxInputGenerator):
     """Input generator for the `Cp2kRelaxWorkChain`."""
 
     _default_protocol = 'moderate'
+    _supported_optional_features = frozenset([OptionalRelaxFeatures.FILE_CACHE])
 
     def __init__(self, *args, **kwargs):
         """Construct an instance of the input generator, validating the class attributes."""
@@ -167,6 +169,35 @@ class Cp2kCommonRelaxInputGenerator(CommonRelaxInputGenerator):
         spec.inputs['electronic_type'].valid_type = ChoiceType((ElectronicType.METAL, ElectronicType.INSULATOR))
         spec.inputs['engines']['relax']['code'].valid_type = CodeType('cp2k')
 
+    def _validate_constraints(self, **kwargs):
+        """Validate the constraints on the inputs that are specific to the CP2K implementation."""
+        magnetization_per_site = kwargs.get('magnetization_per_site', None)
+
+        if kwargs['spin_type'] == SpinType.COLLINEAR and magnetization_per_site:
+            if len(magnetization_per_site) != len(kwargs['structure'].sites):
+                return 'The size of `magnetization_per_site` is different from the number of atoms.'
+
+        if 'sirius' in kwargs['protocol'] and 'file_cache' in kwargs:
+            return (
+                'the `file_cache` is not supported by the `sirius` protocols, which pass the pseudopotentials as nodes.'
+            )
+
+        if 'sirius' not in kwargs['protocol']:
+            basis_pseudo = self.get_protocol(kwargs['protocol'])['basis_pseudo']
+
+            with open(pathlib.Path(__file__).parent / basis_pseudo, 'rb') as fhandle:
+                atom_data = yaml.safe_load(fhandle)
+
+            supported = set(atom_data['basis_set']).intersection(atom_data['pseudopotential'])
+            unsupported = kwargs['structure'].get_symbols_set().difference(supported)
+
+            if unsupported:
+                return f'the elements {sorted(unsupported)} are not supported by the `{basis_pseudo}` basis set.'
+
+    def get_static_files(self) -> list:
+        """Return the basis set and pseudopotential files that are symlinked from the ``file_cache``."""
+        return list(get_file_section().values())
+
     def _construct_builder(self, **kwargs) -> engine.ProcessBuilder:  # noqa: PLR0912,PLR0915
         """Construct a process builder based on the provided keyword arguments.
 
@@ -276,13 +307,11 @@ class Cp2kCommonRelaxInputGenerator(CommonRelaxInputGenerator):
         if threshold_stress is not None:
             parameters['MOTION']['CELL_OPT']['PRESSURE_TOLERANCE'] = f'[GPa] {threshold_stress * EV_A3_TO_GPA}'
 
-        # Lowering runtime by 5 minutes to let CP2K gracefully finish the calculation.
-        try:
-            walltime = engines['relax']['options']['max_wallclock_seconds']
-            walltime = max(300, walltime - 300)
+        # Lowering runtime by the walltime margin to let CP2K gracefully finish the calculation.
+        walltime = self.get_soft_walltime(engines['relax'].get('options'), kwargs['walltime_margin'])
+        if walltime is not None:
             parameters['GLOBAL']['WALLTIME'] = walltime
-        except KeyError:
-            pass
+            builder.walltime_margin = kwargs['walltime_margin']
 
         # Setup a CELL_REF.
         try:
@@ -300,19 +329,27 @@ class Cp2kCommonRelaxInputGenerator(CommonRelaxInputGenerator):
         # Switch on the resubmit_unconverged_geometry which is disabled by default.
         builder.handler_overrides = orm.Dict(dict={'restart_incomplete_calculation': {'enabled': True}})
 
-        # Files.
+        # Files, which are symlinked from the file cache on the remote computer if it is specified.
+        file_cache = None
         if 'sirius' in protocol:
             builder.cp2k.pseudos_upf = get_upf_pseudos_section(structure, basis_pseudo)
+        elif 'file_cache' in kwargs:
+            file_cache = get_cached_paths(kwargs['file_cache'], self.get_static_files())
         else:
             builder.cp2k.file = get_file_section()
 
         # Input structure.
         builder.cp2k.structure = structure
 
-        # Additional files to be retrieved.
-        builder.cp2k.settings = orm.Dict(
-            dict={'additional_retrieve_list': ['aiida-frc-1.xyz', 'aiida-1.stress', 'aiida-requested-forces-1_0.xyz']}
-        )
+        # Additional files to be retrieved. The forces of a geometry optimization are written to `aiida-frc-1.xyz`,
+        # which is retrieved by default, so the minimal retrieval only adds the requested forces for a single point.
+        if kwargs['retrieval'] == 'minimal':
+            additional_retrieve_list = ['aiida-1.stress']
+            if run_type == 'ENERGY_FORCE':
+                additional_retrieve_list.append('aiida-requested-forces-1_0.xyz')
+        else:
+            additional_retrieve_list = ['aiida-frc-1.xyz', 'aiida-1.stress', 'aiida-requested-forces-1_0.xyz']
+        builder.cp2k.settings = orm.Dict(dict={'additional_retrieve_list': additional_retrieve_list})
 
         # CP2K code.
         builder.cp2k.code = engines['relax']['code']
@@ -320,8 +357,17 @@ class Cp2kCommonRelaxInputGenerator(CommonRelaxInputGenerator):
         # Run options.
         builder.cp2k.metadata.options = engines['relax']['options']
 
-        # Use advanced parser to parse more data.
-        builder.cp2k.metadata.options['parser_name'] = 'cp2k_advanced_parser'
+        # Use advanced parser to parse more data, unless only the energy is needed from the output file.
+        if kwargs['retrieval'] == 'minimal':
+            builder.cp2k.metadata.options['parser_name'] = 'cp2k_base_parser'
+        else:
+            builder.cp2k.metadata.options['parser_name'] = 'cp2k_advanced_parser'
+
+        if file_cache is not None:
+            prepend_text = builder.cp2k.metadata.options.get('prepend_text', '')
+            builder.cp2k.metadata.options['prepend_text'] = '\n'.join(
+                text for text in (prepend_text, get_symlink_commands(file_cache)) if text
+            )
 
         return builder
 
@@ -354,8 +400,10 @@ class Cp2kCommonRelaxInputGenerator(CommonRelaxInputGenerator):
 
         cell = [[v * scale_factor ** (1 / 3) for v in row] for row in structure.cell]
 
-        # start with an A, B, C:
-        cell_ref = {idx: f'[angstrom] {row[0]:<15} {row[1]:<15} {row[2]:<15}' for idx, row in zip('ABC', cell)}
+        # start with an A, B, C, with a fixed precision such that round-off errors do not change the parameters:
+        cell_ref = {
+            idx: f'[angstrom] {row[0]:<15.10f} {row[1]:<15.10f} {row[2]:<15.10f}' for idx, row in zip('ABC', cell)
+        }
         # then add periodicity information matching the structure
         cell_ref['PERIODIC'] = ''.join(axis * enabled for axis, enabled in zip('XYZ', structure.pbc))
         return cell_ref
@@ -5,6 +5,7 @@ import numpy as np
 from aiida import orm
 from aiida.engine import calcfunction
 from aiida.plugins import WorkflowFactory
+from aiida_cp2k.utils import add_ext_restart_section
 
 from ..workchain import CommonRelaxWorkChain
 from .generator import Cp2kCommonRelaxInputGenerator
@@ -73,6 +74,30 @@ class Cp2kCommonRelaxWorkChain(CommonRelaxWorkChain):
     _process_class = Cp2kBaseWorkChain
     _generator_class = Cp2kCommonRelaxInputGenerator
 
+    @classmethod
+    def get_restart_inputs(cls, inputs, remote_folder):
+        """Return the inputs that continue from the restart file in the remote folder of the previous calculation."""
+        cp2k = {
+            **inputs['cp2k'],
+            'parent_calc_folder': remote_folder,
+            'parameters': add_ext_restart_section(inputs['cp2k']['parameters']),
+        }
+
+        return {**inputs, 'cp2k': cp2k}
+
+    @classmethod
+    def get_soft_walltime_inputs(cls, inputs, margin):
+        """Return the inputs with the ``GLOBAL.WALLTIME`` derived from the ``max_wallclock_seconds`` of the options."""
+        walltime = cls._generator_class.get_soft_walltime(inputs['cp2k']['metadata'].get('options'), margin)
+
+        if walltime is None:
+            return inputs
+
+        parameters = inputs['cp2k']['parameters'].get_dict()
+        parameters.setdefault('GLOBAL', {})['WALLTIME'] = walltime
+
+        return {**inputs, 'cp2k': {**inputs['cp2k'], 'parameters': orm.Dict(parameters)}}
+
     def convert_outputs(self):
         """Convert the outputs of the sub workchain to the common output specification."""
         if 'output_structure' in self.ctx.workchain.outputs:
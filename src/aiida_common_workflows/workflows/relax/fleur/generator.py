@@ -201,6 +201,11 @@ class FleurCommonRelaxInputGenerator(CommonRelaxInputGenerator):
             'wf_parameters': wf_para,
         }
 
+        # The charge density is copied from the remote folder when a calculation is continued, so it does not have to be
+        # retrieved if only the outputs of the common workflow are needed.
+        if kwargs['retrieval'] == 'minimal':
+            inputs['scf']['settings'] = orm.Dict(dict={'remove_from_retrieve_list': ['cdn_last.hdf', 'cdn1']})
+
         builder._merge(inputs)
 
         return builder
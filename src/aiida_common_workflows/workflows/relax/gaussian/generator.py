@@ -66,6 +66,13 @@ class GaussianCommonRelaxInputGenerator(CommonRelaxInputGenerator):
         spec.inputs['electronic_type'].valid_type = ChoiceType((ElectronicType.METAL, ElectronicType.INSULATOR))
         spec.inputs['engines']['relax']['code'].valid_type = CodeType('gaussian')
 
+    def _validate_constraints(self, **kwargs):
+        """Validate that a spin-restricted calculation is not requested for an odd number of electrons."""
+        num_electrons = kwargs['structure'].get_pymatgen_molecule().nelectrons
+
+        if num_electrons % 2 == 1 and kwargs['spin_type'] == SpinType.NONE:
+            return f'Spin-restricted calculation does not support odd number of electrons ({num_electrons})'
+
     def _construct_builder(self, **kwargs) -> engine.ProcessBuilder:  # noqa: PLR0912,PLR0915
         """Construct a process builder based on the provided keyword arguments.
 
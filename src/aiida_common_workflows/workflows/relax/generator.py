@@ -1,5 +1,7 @@
 """Module with base input generator for the common structure relax workchains."""
 import abc
+import pathlib
+import typing as t
 
 from aiida import orm, plugins
 
@@ -18,8 +20,21 @@ def validate_inputs(value, _):
         return 'the inputs `magnetization_per_site` and ' '`fixed_total_cell_magnetization` are mutually exclusive.'
 
 
+def validate_walltime_margin(value, _):
+    """Validate that the walltime margin is not negative."""
+    if value < 0:
+        return f'the `walltime_margin` should not be negative, but got {value}.'
+
+
+def validate_file_cache(value, _):
+    """Validate that the file cache is an absolute path."""
+    if not pathlib.PurePosixPath(value).is_absolute():
+        return f'the `file_cache` should be an absolute path, but got `{value}`.'
+
+
 class OptionalRelaxFeatures(OptionalFeature):
     FIXED_MAGNETIZATION = 'fixed_total_cell_magnetization'
+    FILE_CACHE = 'file_cache'
 
 
 class CommonRelaxInputGenerator(InputGenerator, ProtocolRegistry, metaclass=abc.ABCMeta):
@@ -106,6 +121,36 @@ class CommonRelaxInputGenerator(InputGenerator, ProtocolRegistry, metaclass=abc.
             help='A real positive number indicating the target threshold for the stress in eV/Å^3. If not specified, '
             'the protocol specification will select an appropriate value.',
         )
+        spec.input(
+            'walltime_margin',
+            valid_type=int,
+            default=300,
+            non_db=True,
+            validator=validate_walltime_margin,
+            help='The number of seconds before the `max_wallclock_seconds` of the relax engine at which the engine '
+            'should stop gracefully, such that it writes the files needed to restart the relaxation. Only used by the '
+            'engines that support a soft time limit.',
+        )
+        spec.input(
+            'file_cache',
+            valid_type=OptionalFeatureType(str),
+            required=False,
+            non_db=True,
+            validator=validate_file_cache,
+            help='The absolute path of a directory on the computer of the relax engine that is used as a cache of the '
+            'static input files, like basis sets and pseudopotentials. The files are symlinked from the cache into the '
+            'working directory of each calculation, so the cache should be populated beforehand with the files of '
+            '`get_static_files`. See `aiida_common_workflows.common.filecache`.',
+        )
+        spec.input(
+            'retrieval',
+            valid_type=ChoiceType(('full', 'minimal')),
+            default='full',
+            non_db=True,
+            help='The files to retrieve from the calculations of the relax engine and the data to parse from them. '
+            'With `minimal`, only the files and data that are needed to populate the outputs of the common relax '
+            'workflow are retrieved and parsed, which reduces the storage of the provenance graph.',
+        )
         spec.input(
             'reference_workchain',
             valid_type=orm.WorkChainNode,
@@ -138,3 +183,31 @@ class CommonRelaxInputGenerator(InputGenerator, ProtocolRegistry, metaclass=abc.
         )
 
         spec.inputs.validator = validate_inputs
+
+    def get_static_files(self) -> list:
+        """Return the static input files that are symlinked from the ``file_cache`` instead of being uploaded.
+
+        The base implementation returns an empty list, which is correct for the engines that do not support the
+        ``file_cache`` optional feature.
+
+        :return: the ``SinglefileData`` nodes of the files that should be uploaded to the cache beforehand.
+        """
+        return []
+
+    @staticmethod
+    def get_soft_walltime(options: t.Optional[dict], margin: int) -> t.Optional[int]:
+        """Return the number of seconds after which an engine should stop gracefully.
+
+        The soft time limit is the ``max_wallclock_seconds`` of the options minus the margin, but at least half of the
+        ``max_wallclock_seconds``, such that the margin does not consume all the time of short calculations.
+
+        :param options: the options of the engine.
+        :param margin: the number of seconds that are reserved for the engine to stop gracefully.
+        :return: the soft time limit, or ``None`` if the options do not define the ``max_wallclock_seconds``.
+        """
+        walltime = (options or {}).get('max_wallclock_seconds')
+
+        if not walltime:
+            return None
+
+        return int(max(walltime - margin, walltime // 2))
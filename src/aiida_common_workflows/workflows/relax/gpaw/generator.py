@@ -78,20 +78,6 @@ class GpawCommonRelaxInputGenerator(CommonRelaxInputGenerator):
         """
         protocol = protocol or self.get_default_protocol_name()
 
-        super().get_builder(
-            structure,
-            engines,
-            protocol=protocol,
-            relax_type=relax_type,
-            electronic_type=electronic_type,
-            spin_type=spin_type,
-            magnetization_per_site=magnetization_per_site,
-            threshold_forces=threshold_forces,
-            threshold_stress=threshold_stress,
-            reference_workchain=reference_workchain,
-            **kwargs,
-        )
-
         if isinstance(electronic_type, str):
             electronic_type = ElectronicType(electronic_type)
 
@@ -0,0 +1,11 @@
+"""Module with the mock implementation of the common structure relaxation workchain.
+
+The mock implementation runs a fast classical energy model on the local machine instead of a quantum engine. It is meant
+for testing the common workflows and the infrastructure that runs them, and can inject artificial latency and failures.
+"""
+from .base import *
+from .calculation import *
+from .generator import *
+from .workchain import *
+
+__all__ = base.__all__ + calculation.__all__ + generator.__all__ + workchain.__all__
@@ -0,0 +1,36 @@
+"""Base work chain of the mock engine that restarts the ``MockCalculation`` when it fails."""
+from aiida.engine import BaseRestartWorkChain, while_
+
+from .calculation import MockCalculation
+
+__all__ = ('MockBaseWorkChain',)
+
+
+class MockBaseWorkChain(BaseRestartWorkChain):
+    """Work chain that runs the ``MockCalculation`` and restarts it if it fails with an unhandled failure.
+
+    This mirrors the base work chains of the plugin packages of the quantum engines, which are wrapped by their
+    implementations of the ``CommonRelaxWorkChain``.
+    """
+
+    _process_class = MockCalculation
+
+    @classmethod
+    def define(cls, spec):
+        # yapf: disable
+        super().define(spec)
+        spec.expose_inputs(MockCalculation, namespace='mock')
+        spec.expose_outputs(MockCalculation)
+        spec.outline(
+            cls.setup,
+            while_(cls.should_run_process)(
+                cls.run_process,
+                cls.inspect_process,
+            ),
+            cls.results,
+        )
+
+    def setup(self):
+        """Set the inputs of the ``MockCalculation`` in the context."""
+        super().setup()
+        self.ctx.inputs = self.exposed_inputs(MockCalculation, 'mock')
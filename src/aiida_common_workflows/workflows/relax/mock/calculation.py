@@ -0,0 +1,168 @@
+"""Calculation job and parser of the mock engine."""
+import json
+
+import numpy
+from aiida import orm
+from aiida.common import datastructures
+from aiida.engine import CalcJob
+from aiida.parsers import Parser
+
+from .engine import MODELS
+
+__all__ = ('MockCalculation', 'MockParser')
+
+
+def validate_failure_rate(value, _):
+    """Validate that the failure rate is a probability."""
+    if not 0 <= value <= 1:
+        return f'the failure rate should be between 0 and 1, but got {value}.'
+
+
+def validate_latency(value, _):
+    """Validate that the latency is not negative."""
+    if value < 0:
+        return f'the latency should not be negative, but got {value}.'
+
+
+def validate_model(value, _):
+    """Validate that the model is supported by the mock engine."""
+    if value not in MODELS:
+        return f'unsupported model `{value}`, choose one of {MODELS}.'
+
+
+class MockCalculation(CalcJob):
+    """Calculation job that runs the mock engine, which relaxes a structure with a classical energy model.
+
+    The code should be an installed code whose executable is a Python interpreter in which this package is installed.
+    Besides the model, the options define an artificial latency and a failure rate, which can be used to mimic the
+    behavior of a real quantum engine on a busy machine.
+    """
+
+    _DEFAULT_INPUT_FILE = 'aiida.json'
+    _DEFAULT_OUTPUT_FILE = 'aiida.out'
+
+    @classmethod
+    def define(cls, spec):
+        # yapf: disable
+        super().define(spec)
+        spec.input('structure', valid_type=orm.StructureData,
+            help='The input structure.')
+        spec.input('parameters', valid_type=orm.Dict,
+            help='The parameters with the `relax_type`, the `threshold_forces` in eV/Å and the `max_steps`.')
+        spec.input('metadata.options.model', valid_type=str, default='emt', validator=validate_model,
+            help=f'The classical energy model, one of {MODELS}.')
+        spec.input('metadata.options.latency', valid_type=(int, float), default=0.0, validator=validate_latency,
+            help='The time in seconds that the engine sleeps before it starts the calculation.')
+        spec.input('metadata.options.failure_rate', valid_type=(int, float), default=0.0,
+            validator=validate_failure_rate,
+            help='The probability between 0 and 1 that the engine fails after the latency.')
+        spec.input('metadata.options.seed', valid_type=int, required=False,
+            help='The seed of the random number generator that determines whether the engine fails. It is combined '
+                 'with the UUID of the calculation, such that a restarted calculation does not fail again for sure.')
+        spec.inputs['metadata']['options']['resources'].default = {'num_machines': 1, 'num_mpiprocs_per_machine': 1}
+        spec.inputs['metadata']['options']['parser_name'].default = 'common_workflows.mock'
+        spec.output('output_parameters', valid_type=orm.Dict,
+            help='The total `energy` in eV, whether the relaxation `converged` and the `number_of_steps`.')
+        spec.output('output_structure', valid_type=orm.StructureData, required=False,
+            help='The relaxed structure, only returned if the structure was relaxed.')
+        spec.output('forces', valid_type=orm.ArrayData,
+            help='The final forces on all atoms in eV/Å.')
+        spec.output('stress', valid_type=orm.ArrayData, required=False,
+            help='The final stress tensor in eV/Å^3, only returned for periodic structures.')
+        spec.exit_code(300, 'ERROR_OUTPUT_FILE_MISSING',
+            message='The output file was not retrieved.')
+        spec.exit_code(310, 'ERROR_OUTPUT_FILE_INVALID',
+            message='The output file could not be parsed.')
+        spec.exit_code(400, 'ERROR_INJECTED_FAILURE',
+            message='The engine failed on purpose: {message}')
+        spec.exit_code(410, 'ERROR_RELAXATION_NOT_CONVERGED',
+            message='The relaxation did not converge within the maximum number of steps.')
+
+    def prepare_for_submission(self, folder):
+        """Write the input file of the mock engine and return the instructions to run it.
+
+        :param folder: a sandbox folder to temporarily write files on disk.
+        :return: :class:`~aiida.common.datastructures.CalcInfo` instance.
+        """
+        atoms = self.inputs.structure.get_ase()
+        options = self.inputs.metadata.options
+
+        inputs = {
+            'uuid': self.node.uuid,
+            'symbols': atoms.get_chemical_symbols(),
+            'positions': atoms.positions.tolist(),
+            'cell': atoms.cell.tolist(),
+            'pbc': atoms.pbc.tolist(),
+            'parameters': self.inputs.parameters.get_dict(),
+            'options': {
+                'model': options.model,
+                'latency': options.latency,
+                'failure_rate': options.failure_rate,
+                'seed': options.get('seed', None),
+            },
+        }
+
+        with folder.open(self._DEFAULT_INPUT_FILE, 'w', encoding='utf-8') as handle:
+            json.dump(inputs, handle, indent=4)
+
+        codeinfo = datastructures.CodeInfo()
+        codeinfo.code_uuid = self.inputs.code.uuid
+        codeinfo.cmdline_params = ['-m', 'aiida_common_workflows.workflows.relax.mock.engine', self._DEFAULT_INPUT_FILE]
+        codeinfo.stdout_name = self._DEFAULT_OUTPUT_FILE
+
+        calcinfo = datastructures.CalcInfo()
+        calcinfo.codes_info = [codeinfo]
+        calcinfo.retrieve_list = [self._DEFAULT_OUTPUT_FILE]
+
+        return calcinfo
+
+
+class MockParser(Parser):
+    """Parser for the output of the ``MockCalculation``."""
+
+    def parse(self, **kwargs):
+        """Parse the results written by the mock engine to the standard output."""
+        filename = self.node.process_class._DEFAULT_OUTPUT_FILE
+
+        try:
+            with self.retrieved.base.repository.open(filename, 'r') as handle:
+                results = json.load(handle)
+        except FileNotFoundError:
+            return self.exit_codes.ERROR_OUTPUT_FILE_MISSING
+        except ValueError:
+            return self.exit_codes.ERROR_OUTPUT_FILE_INVALID
+
+        if 'error' in results:
+            return self.exit_codes.ERROR_INJECTED_FAILURE.format(message=results['error'])
+
+        parameters = self.node.inputs.parameters.get_dict()
+
+        self.out(
+            'output_parameters',
+            orm.Dict(
+                {
+                    'energy': results['energy'],
+                    'energy_units': 'eV',
+                    'converged': results['converged'],
+                    'number_of_steps': results['number_of_steps'],
+                }
+            ),
+        )
+
+        forces = orm.ArrayData()
+        forces.set_array('forces', numpy.array(results['forces'], dtype=float))
+        self.out('forces', forces)
+
+        if 'stress' in results:
+            stress = orm.ArrayData()
+            stress.set_array('stress', numpy.array(results['stress'], dtype=float))
+            self.out('stress', stress)
+
+        if parameters['relax_type'] != 'none':
+            structure = self.node.inputs.structure.clone()
+            structure.reset_cell(results['cell'])
+            structure.reset_sites_positions(results['positions'])
+            self.out('output_structure', structure)
+
+        if not results['converged']:
+            return self.exit_codes.ERROR_RELAXATION_NOT_CONVERGED
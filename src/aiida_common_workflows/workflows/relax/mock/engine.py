@@ -0,0 +1,120 @@
+"""Executable of the mock engine that computes the energy, forces and stress of a structure with a classical model.
+
+The script is run as ``python -m aiida_common_workflows.workflows.relax.mock.engine <input>`` by the
+``MockCalculation``. The input file is the JSON written by the calculation and the results are written as JSON to the
+standard output. Before doing anything, the script sleeps for ``latency`` seconds, after which it fails with a
+probability of ``failure_rate``, to mimic the behavior of a real quantum engine on a busy machine. If a ``seed`` is
+given, it is combined with the UUID of the calculation, such that the failures are reproducible for a calculation but
+independent between the calculations of a workflow, including the restarts of a failed calculation.
+"""
+import json
+import random
+import sys
+import time
+
+MODELS = ('emt', 'lennard_jones')
+
+
+def get_calculator(model: str):
+    """Return the ASE calculator of the given model.
+
+    :param model: the name of the model, one of ``MODELS``.
+    :raises ValueError: if the model is not supported.
+    """
+    if model == 'emt':
+        from ase.calculators.emt import EMT
+
+        return EMT()
+
+    if model == 'lennard_jones':
+        from ase.calculators.lj import LennardJones
+
+        return LennardJones(sigma=2.0, epsilon=1.0, rc=6.0, smooth=True)
+
+    raise ValueError(f'unsupported model `{model}`, choose one of {MODELS}.')
+
+
+def relax(atoms, relax_type: str, threshold_forces: float, max_steps: int) -> tuple:
+    """Relax the atoms in place with the BFGS optimizer.
+
+    :param atoms: the atoms with a calculator attached.
+    :param relax_type: the value of the ``RelaxType`` that defines the degrees of freedom.
+    :param threshold_forces: the threshold on the forces in eV/Å for the relaxation to be converged.
+    :param max_steps: the maximum number of optimization steps.
+    :return: tuple of whether the relaxation converged and the number of steps taken.
+    """
+    from ase.optimize import BFGS
+
+    try:
+        from ase.filters import FrechetCellFilter as CellFilter
+    except ImportError:
+        # The ``FrechetCellFilter`` was added in ``ase==3.23``, older versions only provide the ``ExpCellFilter``.
+        from ase.constraints import ExpCellFilter as CellFilter
+
+    if relax_type == 'none':
+        return True, 0
+
+    if relax_type == 'positions':
+        target = atoms
+    else:
+        target = CellFilter(atoms, constant_volume=relax_type == 'positions_shape')
+
+    optimizer = BFGS(target, logfile=None)
+    converged = optimizer.run(fmax=threshold_forces, steps=max_steps)
+
+    return bool(converged), optimizer.get_number_of_steps()
+
+
+def run(inputs: dict) -> dict:
+    """Run the mock engine for the given inputs.
+
+    :param inputs: the inputs written by the ``MockCalculation``.
+    :return: the results, or a dictionary with the key ``error`` if a failure was injected.
+    """
+    from ase import Atoms
+    from ase.stress import voigt_6_to_full_3x3_stress
+
+    options = inputs['options']
+    parameters = inputs['parameters']
+
+    time.sleep(options['latency'])
+
+    seed = None if options['seed'] is None else f'{options["seed"]}:{inputs.get("uuid")}'
+
+    if random.Random(seed).random() < options['failure_rate']:
+        return {'error': f'injected failure with a failure rate of {options["failure_rate"]}.'}
+
+    atoms = Atoms(symbols=inputs['symbols'], positions=inputs['positions'], cell=inputs['cell'], pbc=inputs['pbc'])
+    atoms.calc = get_calculator(options['model'])
+
+    converged, number_of_steps = relax(
+        atoms, parameters['relax_type'], parameters['threshold_forces'], parameters['max_steps']
+    )
+
+    results = {
+        'energy': float(atoms.get_potential_energy()),
+        'forces': atoms.get_forces().tolist(),
+        'cell': atoms.cell.tolist(),
+        'positions': atoms.positions.tolist(),
+        'converged': converged,
+        'number_of_steps': number_of_steps,
+    }
+
+    if all(atoms.pbc):
+        results['stress'] = voigt_6_to_full_3x3_stress(atoms.get_stress()).tolist()
+
+    return results
+
+
+def main(argv: list) -> int:
+    """Read the inputs from the file given as the only argument and print the results to the standard output."""
+    with open(argv[1], encoding='utf-8') as handle:
+        results = run(json.load(handle))
+
+    print(json.dumps(results))
+
+    return 1 if 'error' in results else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,92 @@
+"""Implementation of `aiida_common_workflows.common.relax.generator.CommonRelaxInputGenerator` for the mock engine."""
+import typing as t
+
+from aiida import engine, orm
+
+from aiida_common_workflows.common import ElectronicType, RelaxType, SpinType
+from aiida_common_workflows.generators import ChoiceType, CodeType
+
+from ..generator import CommonRelaxInputGenerator
+
+__all__ = ('MockCommonRelaxInputGenerator',)
+
+
+class MockCommonRelaxInputGenerator(CommonRelaxInputGenerator):
+    """Input generator for the `MockCommonRelaxWorkChain`.
+
+    The classical energy model, the artificial latency and the failure rate of the mock engine are set through the
+    ``model``, ``latency``, ``failure_rate`` and ``seed`` keys of the options of the ``relax`` engine.
+    """
+
+    _default_protocol = 'moderate'
+    _protocols: t.ClassVar = {
+        'fast': {
+            'description': 'Optimal performance, minimal accuracy.',
+            'threshold_forces': 0.1,
+            'max_steps': 50,
+        },
+        'moderate': {
+            'description': 'Moderate performance, moderate accuracy.',
+            'threshold_forces': 0.05,
+            'max_steps': 100,
+        },
+        'precise': {
+            'description': 'Low performance, high accuracy.',
+            'threshold_forces': 0.01,
+            'max_steps': 200,
+        },
+    }
+
+    @classmethod
+    def define(cls, spec):
+        """Define the specification of the input generator.
+
+        The ports defined on the specification are the inputs that will be accepted by the ``get_builder`` method.
+        """
+        super().define(spec)
+        spec.inputs['spin_type'].valid_type = ChoiceType((SpinType.NONE,))
+        spec.inputs['relax_type'].valid_type = ChoiceType(
+            (RelaxType.NONE, RelaxType.POSITIONS, RelaxType.POSITIONS_CELL, RelaxType.POSITIONS_SHAPE)
+        )
+        spec.inputs['electronic_type'].valid_type = ChoiceType((ElectronicType.METAL, ElectronicType.INSULATOR))
+        spec.inputs['engines']['relax']['code'].valid_type = CodeType('common_workflows.mock')
+
+    def _validate_constraints(self, **kwargs):
+        """Validate that the elements of the structure are supported by the EMT model, if it is selected."""
+        from ase.calculators.emt import parameters
+
+        if kwargs['engines']['relax'].get('options', {}).get('model', 'emt') != 'emt':
+            return
+
+        unsupported = kwargs['structure'].get_symbols_set().difference(parameters)
+
+        if unsupported:
+            return f'the elements {sorted(unsupported)} are not supported by the `emt` model of the mock engine.'
+
+    def _construct_builder(self, **kwargs) -> engine.ProcessBuilder:
+        """Construct a process builder based on the provided keyword arguments.
+
+        The keyword arguments will have been validated against the input generator specification.
+        """
+        validation_error = self._validate_constraints(**kwargs)
+
+        if validation_error is not None:
+            raise ValueError(validation_error)
+
+        engines = kwargs['engines']
+        protocol = self.get_protocol(kwargs['protocol'])
+        threshold_forces = kwargs.get('threshold_forces', None)
+
+        parameters = {
+            'relax_type': kwargs['relax_type'].value,
+            'threshold_forces': threshold_forces if threshold_forces is not None else protocol['threshold_forces'],
+            'max_steps': protocol['max_steps'],
+        }
+
+        builder = self.process_class.get_builder()
+        builder.mock.structure = kwargs['structure']
+        builder.mock.parameters = orm.Dict(parameters)
+        builder.mock.code = engines['relax']['code']
+        builder.mock.metadata.options = engines['relax'].get('options', {})
+
+        return builder
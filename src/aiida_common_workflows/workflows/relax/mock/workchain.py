@@ -0,0 +1,36 @@
+"""Implementation of `aiida_common_workflows.common.relax.workchain.CommonRelaxWorkChain` for the mock engine."""
+from aiida import orm
+from aiida.engine import calcfunction
+
+from ..workchain import CommonRelaxWorkChain
+from .base import MockBaseWorkChain
+from .generator import MockCommonRelaxInputGenerator
+
+__all__ = ('MockCommonRelaxWorkChain',)
+
+
+@calcfunction
+def get_total_energy(parameters):
+    """Return the total energy [eV] from the output parameters node."""
+    return orm.Float(parameters['energy'])
+
+
+class MockCommonRelaxWorkChain(CommonRelaxWorkChain):
+    """Implementation of `aiida_common_workflows.common.relax.workchain.CommonRelaxWorkChain` for the mock engine."""
+
+    _process_class = MockBaseWorkChain
+    _generator_class = MockCommonRelaxInputGenerator
+
+    def convert_outputs(self):
+        """Convert the outputs of the sub workchain to the common output specification."""
+        outputs = self.ctx.workchain.outputs
+
+        self.out('total_energy', get_total_energy(outputs.output_parameters))
+        self.out('forces', outputs.forces)
+        self.out('remote_folder', outputs.remote_folder)
+
+        if 'stress' in outputs:
+            self.out('stress', outputs.stress)
+
+        if 'output_structure' in outputs:
+            self.out('relaxed_structure', outputs.output_structure)
@@ -47,6 +47,14 @@ class NwchemCommonRelaxInputGenerator(CommonRelaxInputGenerator):
         spec.inputs['electronic_type'].valid_type = ChoiceType((ElectronicType.METAL, ElectronicType.INSULATOR))
         spec.inputs['engines']['relax']['code'].valid_type = CodeType('nwchem.nwchem')
 
+    def _validate_constraints(self, **kwargs):
+        """Validate the constraints on the inputs that are specific to the NWChem implementation."""
+        if kwargs.get('magnetization_per_site', None):
+            return 'magnetization per site not yet supported'
+
+        if kwargs.get('threshold_stress', None) is not None:
+            return 'Overall stress is not used as a stopping criterion in NWChem'
+
     def _construct_builder(self, **kwargs) -> engine.ProcessBuilder:  # noqa: PLR0912,PLR0915
         """Construct a process builder based on the provided keyword arguments.
 
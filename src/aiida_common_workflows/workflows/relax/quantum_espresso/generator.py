@@ -30,7 +30,7 @@ def create_magnetic_allotrope(structure, magnetization_per_site):
     allotrope = StructureData(cell=structure.cell, pbc=structure.pbc)
     allotrope_magnetic_moments = {}
 
-    for element in structure.get_symbols_set():
+    for element in sorted(structure.get_symbols_set()):
         # Filter the sites and magnetic moments on the site element
         element_sites, element_magnetic_moments = zip(
             *[
@@ -39,18 +39,18 @@ def create_magnetic_allotrope(structure, magnetization_per_site):
                 if site.kind_name.rstrip(string.digits) == element
             ]
         )
-        magnetic_moment_set = set(element_magnetic_moments)
-        if len(magnetic_moment_set) > 10:
+        unique_magnetic_moments = list(dict.fromkeys(element_magnetic_moments))
+        if len(unique_magnetic_moments) > 10:
             raise ValueError(
                 'The requested magnetic configuration would require more than 10 different kind names for element '
                 f'{element}. This is currently not supported to due the character limit for kind names in Quantum '
                 'ESPRESSO.'
             )
-        if len(magnetic_moment_set) == 1:
+        if len(unique_magnetic_moments) == 1:
             magnetic_moment_kinds = {element_magnetic_moments[0]: element}
         else:
             magnetic_moment_kinds = {
-                magmom: f'{element}{index}' for magmom, index in zip(magnetic_moment_set, string.digits)
+                magmom: f'{element}{index}' for magmom, index in zip(unique_magnetic_moments, string.digits)
             }
         for site, magnetic_moment in zip(element_sites, element_magnetic_moments):
             allotrope.append_atom(
@@ -106,6 +106,103 @@ class QuantumEspressoCommonRelaxInputGenerator(CommonRelaxInputGenerator):
         spec.inputs['electronic_type'].valid_type = ChoiceType((ElectronicType.METAL, ElectronicType.INSULATOR))
         spec.inputs['engines']['relax']['code'].valid_type = CodeType('quantumespresso.pw')
 
+    def _get_protocol_overrides(self, protocol):
+        """Return the protocol of the ``aiida-quantumespresso`` plugin and its overrides for the given protocol.
+
+        Currently, the ``aiida-quantumespresso`` workflows will expect one of the basic protocols to be passed to the
+        ``get_builder_from_protocol()`` method. For the local protocols, the default protocol of the
+        ``aiida-quantumespresso`` plugin is used instead and the local protocol is passed as the ``overrides``.
+
+        :param protocol: the name of the protocol.
+        :return: tuple of the name of the protocol of the ``aiida-quantumespresso`` plugin and the overrides.
+        """
+        process_class = self.process_class._process_class
+        available_protocols = process_class.get_available_protocols()
+
+        if protocol not in available_protocols and process_class._check_if_alias(protocol) not in available_protocols:
+            return self._default_protocol, self._load_local_protocols()[protocol]
+
+        return protocol, {}
+
+    def _validate_constraints(self, **kwargs):
+        """Validate the constraints on the inputs that are specific to the Quantum ESPRESSO implementation."""
+        import string
+
+        structure = kwargs['structure']
+        magnetization_per_site = kwargs.get('magnetization_per_site', None)
+        protocol, overrides = self._get_protocol_overrides(kwargs['protocol'])
+
+        if kwargs.get('fixed_total_cell_magnetization', None) is not None:
+            if kwargs['spin_type'] != SpinType.COLLINEAR:
+                return (
+                    'The `fixed_total_cell_magnetization` input can only be used when `spin_type` is set to '
+                    '`SpinType.COLLINEAR`.'
+                )
+
+            for namespace in ('base', 'base_final_scf'):
+                system = overrides.get(namespace, {}).get('pw', {}).get('parameters', {}).get('SYSTEM', {})
+                if system.get('tot_magnetization') is not None:
+                    return (
+                        'The `tot_magnetization` parameter for fixed spin moment calculations has been specified both '
+                        'via `fixed_total_cell_magnetization` and in the protocol overrides. '
+                        'Please only specify it in one place.'
+                    )
+
+        if magnetization_per_site:
+            if len(magnetization_per_site) != len(structure.sites):
+                return 'The size of `magnetization_per_site` is different from the number of sites.'
+            if structure.is_alloy:
+                return 'Alloys are currently not supported.'
+
+            kind_to_magnetization = set(zip([site.kind_name for site in structure.sites], magnetization_per_site))
+
+            if len(structure.kinds) != len(kind_to_magnetization):
+                for element in structure.get_symbols_set():
+                    magnetic_moments = {
+                        magnetic_moment
+                        for site, magnetic_moment in zip(structure.sites, magnetization_per_site)
+                        if site.kind_name.rstrip(string.digits) == element
+                    }
+                    if len(magnetic_moments) > 10:
+                        return (
+                            'The requested magnetic configuration would require more than 10 different kind names '
+                            f'for element {element}. This is currently not supported to due the character limit for '
+                            'kind names in Quantum ESPRESSO.'
+                        )
+
+        return self._validate_pseudo_family(structure, protocol, overrides)
+
+    def _validate_pseudo_family(self, structure, protocol, overrides):
+        """Validate that the pseudo family of the protocol is installed and provides the pseudos for the structure.
+
+        :return: an error message if the pseudo family cannot be used, ``None`` otherwise.
+        """
+        from aiida.common import exceptions
+
+        base_overrides = self.process_class._process_class.get_protocol_inputs(protocol, overrides).get('base', {})
+
+        if 'pseudos' in base_overrides.get('pw', {}):
+            return
+
+        pseudo_family = plugins.WorkflowFactory('quantumespresso.pw.base').get_protocol_inputs(
+            protocol, base_overrides
+        )['pseudo_family']
+        pseudo_set = tuple(
+            plugins.GroupFactory(entry_point)
+            for entry_point in ('pseudo.family.pseudo_dojo', 'pseudo.family.sssp', 'pseudo.family.cutoffs')
+        )
+
+        try:
+            family = orm.QueryBuilder().append(pseudo_set, filters={'label': pseudo_family}).one()[0]
+        except exceptions.NotExistent:
+            return f'required pseudo family `{pseudo_family}` is not installed.'
+
+        try:
+            family.get_recommended_cutoffs(structure=structure, unit='Ry')
+            family.get_pseudos(structure=structure)
+        except ValueError as exception:
+            return f'failed to obtain recommended cutoffs for pseudo family `{pseudo_family}`: {exception}'
+
     def _construct_builder(self, **kwargs) -> engine.ProcessBuilder:  # noqa: PLR0912,PLR0915
         """Construct a process builder based on the provided keyword arguments.
 
@@ -152,18 +249,7 @@ class QuantumEspressoCommonRelaxInputGenerator(CommonRelaxInputGenerator):
         else:
             initial_magnetic_moments = None
 
-        # Currently, the `aiida-quantumespresso` workflows will expect one of the basic protocols to be passed to the
-        # `get_builder_from_protocol()` method. Here, we switch to using the default protocol for the
-        # `aiida-quantumespresso` plugin and pass the local protocols as `overrides`.
-        if (
-            protocol not in self.process_class._process_class.get_available_protocols()
-            and self.process_class._process_class._check_if_alias(protocol)
-            not in self.process_class._process_class.get_available_protocols()
-        ):
-            overrides = self._load_local_protocols()[protocol]
-            protocol = self._default_protocol
-        else:
-            overrides = {}
+        protocol, overrides = self._get_protocol_overrides(protocol)
 
         if fixed_total_cell_magnetization is not None:
             base_parameters_overrides = (
@@ -225,6 +311,14 @@ class QuantumEspressoCommonRelaxInputGenerator(CommonRelaxInputGenerator):
             parameters.setdefault('CELL', {})['press_conv_thr'] = threshold
             builder.base['pw']['parameters'] = orm.Dict(dict=parameters)
 
+        max_seconds = self.get_soft_walltime(engines['relax'].get('options'), kwargs['walltime_margin'])
+        if max_seconds is not None:
+            for namespace in (builder.base, builder.base_final_scf):
+                if 'parameters' in namespace['pw']:
+                    parameters = namespace['pw']['parameters'].get_dict()
+                    parameters.setdefault('CONTROL', {})['max_seconds'] = max_seconds
+                    namespace['pw']['parameters'] = orm.Dict(dict=parameters)
+
         if reference_workchain:
             relax = reference_workchain.base.links.get_outgoing(node_class=orm.WorkChainNode).one().node
             base = sorted(relax.called, key=lambda x: x.ctime)[-1]
@@ -240,7 +334,11 @@ class QuantumEspressoCommonRelaxInputGenerator(CommonRelaxInputGenerator):
             builder.base_final_scf['kpoints'] = kpoints
 
         # Currently the builder is set for the `PwRelaxWorkChain`, but we should return one for the wrapper workchain
-        # `QuantumEspressoCommonRelaxWorkChain` for which this input generator is built
-        builder._process_class = self.process_class
+        # `QuantumEspressoCommonRelaxWorkChain` for which this input generator is built, including its own inputs.
+        wrapper = self.process_class.get_builder()
+        wrapper._merge(builder._inputs(prune=True))
+
+        if max_seconds is not None:
+            wrapper.walltime_margin = kwargs['walltime_margin']
 
-        return builder
+        return wrapper
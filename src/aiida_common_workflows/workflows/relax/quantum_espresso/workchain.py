@@ -48,6 +48,25 @@ class QuantumEspressoCommonRelaxWorkChain(CommonRelaxWorkChain):
     _process_class = WorkflowFactory('quantumespresso.pw.relax')
     _generator_class = QuantumEspressoCommonRelaxInputGenerator
 
+    @classmethod
+    def get_soft_walltime_inputs(cls, inputs, margin):
+        """Return the inputs with the ``max_seconds`` derived from the ``max_wallclock_seconds`` of the options."""
+        inputs = dict(inputs)
+
+        for namespace in ('base', 'base_final_scf'):
+            if namespace not in inputs or 'parameters' not in inputs[namespace]['pw']:
+                continue
+
+            pw = inputs[namespace]['pw']
+            max_seconds = cls._generator_class.get_soft_walltime(pw['metadata'].get('options'), margin)
+
+            if max_seconds is not None:
+                parameters = pw['parameters'].get_dict()
+                parameters.setdefault('CONTROL', {})['max_seconds'] = max_seconds
+                inputs[namespace] = {**inputs[namespace], 'pw': {**pw, 'parameters': orm.Dict(parameters)}}
+
+        return inputs
+
     def convert_outputs(self):
         """Convert the outputs of the sub workchain to the common output specification."""
         outputs = self.ctx.workchain.outputs
@@ -122,6 +122,11 @@ class SiestaCommonRelaxInputGenerator(CommonRelaxInputGenerator):
             parameters['md-max-force-tol'] = str(threshold_forces) + ' eV/Ang'
         if threshold_stress:
             parameters['md-max-stress-tol'] = str(threshold_stress) + ' eV/Ang**3'
+        # ... walltime margin, the ``max-walltime`` is set by the plugin to the ``max_wallclock_seconds`` ...
+        soft_walltime = self.get_soft_walltime(engines['relax'].get('options'), kwargs['walltime_margin'])
+        if soft_walltime is not None:
+            slack = engines['relax']['options']['max_wallclock_seconds'] - soft_walltime
+            parameters['max-walltime-slack'] = f'{slack} s'
         # ... spin options (including initial magentization) ...
         if spin_type == SpinType.COLLINEAR:
             parameters['spin'] = 'polarized'
@@ -152,6 +157,8 @@ class SiestaCommonRelaxInputGenerator(CommonRelaxInputGenerator):
         builder.pseudo_family = pseudo_family
         builder.options = orm.Dict(dict=engines['relax']['options'])
         builder.code = engines['relax']['code']
+        if soft_walltime is not None:
+            builder.walltime_margin = kwargs['walltime_margin']
 
         return builder
 
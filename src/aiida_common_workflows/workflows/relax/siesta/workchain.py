@@ -47,6 +47,20 @@ class SiestaCommonRelaxWorkChain(CommonRelaxWorkChain):
     _process_class = WorkflowFactory('siesta.base')
     _generator_class = SiestaCommonRelaxInputGenerator
 
+    @classmethod
+    def get_soft_walltime_inputs(cls, inputs, margin):
+        """Return the inputs with the ``max-walltime-slack`` derived from the scaled ``max_wallclock_seconds``."""
+        options = inputs['options'].get_dict()
+        soft_walltime = cls._generator_class.get_soft_walltime(options, margin)
+
+        if soft_walltime is None:
+            return inputs
+
+        parameters = inputs['parameters'].get_dict()
+        parameters['max-walltime-slack'] = f'{options["max_wallclock_seconds"] - soft_walltime} s'
+
+        return {**inputs, 'parameters': orm.Dict(parameters)}
+
     def convert_outputs(self):
         """Convert the outputs of the sub workchain to the common output specification."""
         self.report('Relaxation task concluded sucessfully, converting outputs')
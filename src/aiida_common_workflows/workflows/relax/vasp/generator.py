@@ -16,6 +16,7 @@ from ..generator import CommonRelaxInputGenerator
 __all__ = ('VaspCommonRelaxInputGenerator',)
 
 StructureData = plugins.DataFactory('core.structure')
+STOPCAR_COMMAND = "(sleep {} && echo 'LSTOP = .TRUE.' > STOPCAR) & acwf_stopcar=$!"
 
 
 class VaspCommonRelaxInputGenerator(CommonRelaxInputGenerator):
@@ -88,8 +89,19 @@ class VaspCommonRelaxInputGenerator(CommonRelaxInputGenerator):
         # Set structure
         builder.structure = structure
 
-        # Set options
-        builder.vasp.calc.metadata.options = engines['relax']['options']
+        # Set options, VASP has no soft time limit, so a ``STOPCAR`` is written in the background once the walltime
+        # margin is reached, which lets VASP finish the current ionic step and write the files to restart from.
+        options = dict(engines['relax']['options'])
+        stop_after = self.get_soft_walltime(options, kwargs['walltime_margin'])
+        if stop_after is not None:
+            stopcar = STOPCAR_COMMAND.format(stop_after)
+            options['prepend_text'] = '\n'.join(filter(None, (options.get('prepend_text'), stopcar)))
+            options['append_text'] = '\n'.join(
+                filter(None, ('kill $acwf_stopcar 2> /dev/null', options.get('append_text')))
+            )
+        builder.vasp.calc.metadata.options = options
+        if stop_after is not None:
+            builder.walltime_margin = kwargs['walltime_margin']
 
         # Set workchain related inputs, in this case, give more explicit output to report
         builder.verbose = True
@@ -140,6 +152,11 @@ class VaspCommonRelaxInputGenerator(CommonRelaxInputGenerator):
                 }
             }
         )
+        # The files that are retrieved are fixed by the calculation, but the parser can skip the quantities that are not
+        # needed for the outputs of the common workflow.
+        if kwargs['retrieval'] == 'minimal':
+            settings.parser_settings['energy_type'] = ['energy_free']
+            settings.parser_settings['exclude_quantity'] = ['band_properties']
         builder.vasp.settings = settings
 
         # Configure the handlers
@@ -1,4 +1,6 @@
 """Implementation of `aiida_common_workflows.common.relax.workchain.CommonRelaxWorkChain` for VASP."""
+import re
+
 import numpy as np
 from aiida import orm
 from aiida.common.exceptions import NotExistentAttributeError
@@ -6,7 +8,7 @@ from aiida.engine import calcfunction
 from aiida.plugins import WorkflowFactory
 
 from ..workchain import CommonRelaxWorkChain
-from .generator import VaspCommonRelaxInputGenerator
+from .generator import STOPCAR_COMMAND, VaspCommonRelaxInputGenerator
 
 __all__ = ('VaspCommonRelaxWorkChain',)
 
@@ -61,6 +63,22 @@ class VaspCommonRelaxWorkChain(CommonRelaxWorkChain):
     _process_class = WorkflowFactory('vasp.relax')
     _generator_class = VaspCommonRelaxInputGenerator
 
+    @classmethod
+    def get_soft_walltime_inputs(cls, inputs, margin):
+        """Return the inputs in which the ``STOPCAR`` is written after the scaled ``max_wallclock_seconds``."""
+        options = inputs['vasp']['calc']['metadata'].get('options', {})
+        stop_after = cls._generator_class.get_soft_walltime(options, margin)
+        pattern = re.escape(STOPCAR_COMMAND).replace(r'\{\}', r'\d+')
+
+        if stop_after is None or not re.search(pattern, options.get('prepend_text', '')):
+            return inputs
+
+        prepend_text = re.sub(pattern, STOPCAR_COMMAND.format(stop_after), options['prepend_text'])
+        metadata = {**inputs['vasp']['calc']['metadata'], 'options': {**options, 'prepend_text': prepend_text}}
+        calc = {**inputs['vasp']['calc'], 'metadata': metadata}
+
+        return {**inputs, 'vasp': {**inputs['vasp'], 'calc': calc}}
+
     def convert_outputs(self):
         """Convert the outputs of the sub workchain to the common output specification."""
         try:
@@ -1,10 +1,25 @@
 """Module with base wrapper workchain for common structure relaxation workchains."""
+import typing as t
 from abc import ABCMeta, abstractmethod
 
-from aiida.engine import ToContext, WorkChain
+from aiida.common import AttributeDict
+from aiida.engine import ToContext, WorkChain, while_
 from aiida.orm import ArrayData, Float, RemoteData, StructureData, TrajectoryData
 
-from .generator import CommonRelaxInputGenerator
+from aiida_common_workflows.common.cleanup import clean_workdir
+from aiida_common_workflows.common.cleanup import validate_policy as validate_cleanup_policy
+from aiida_common_workflows.common.resubmission import (
+    DEFAULT_POLICY,
+    get_failed_calculation,
+    get_resource_failure,
+    restore_unstored_nodes,
+    scale_resources,
+    strip_unstored_nodes,
+    validate_policy,
+)
+from aiida_common_workflows.common.timing import Stopwatch, record_child, record_step
+
+from .generator import CommonRelaxInputGenerator, validate_walltime_margin
 
 __all__ = ('CommonRelaxWorkChain',)
 
@@ -15,6 +30,13 @@ class CommonRelaxWorkChain(WorkChain, metaclass=ABCMeta):
     Subclasses should simply define the concrete plugin-specific relaxation workchain for the `_process_class` attribute
     and implement the `convert_outputs` class method to map the plugin specific outputs to the output spec of this
     common wrapper workchain.
+
+    If the wrapped workchain fails because its last calculation exhausted its wallclock time or memory, it is
+    resubmitted with scaled resources following the `resubmission` policy, see
+    :mod:`aiida_common_workflows.common.resubmission`. Subclasses can implement the `get_restart_inputs` class method
+    such that the resubmitted workchain continues from the remote folder of the last calculation, and the
+    `get_soft_walltime_inputs` class method such that the soft time limit of the engine grows with the scaled wallclock
+    time.
     """
 
     _process_class = None
@@ -33,10 +55,25 @@ class CommonRelaxWorkChain(WorkChain, metaclass=ABCMeta):
         # yapf: disable
         super().define(spec)
         spec.expose_inputs(cls._process_class)
+        spec.input('resubmission', valid_type=dict, non_db=True, required=False, validator=validate_policy,
+            help='The policy to resubmit the workchain with scaled resources if it exhausted its wallclock time or '
+                 'memory. See `aiida_common_workflows.common.resubmission` for its keys and their defaults.')
+        spec.input('cleanup', valid_type=dict, non_db=True, required=False, validator=validate_cleanup_policy,
+            help='The policy to clean the remote folders of the calculations once the workchain finished successfully, '
+                 'except those that are still referenced. See `aiida_common_workflows.common.cleanup` for its keys and '
+                 'their defaults.')
+        spec.input('walltime_margin', valid_type=int, non_db=True, required=False, validator=validate_walltime_margin,
+            help='The number of seconds before the `max_wallclock_seconds` at which the engine should stop gracefully. '
+                 'Set by the input generator for the engines that support a soft time limit, such that the limit is '
+                 'derived again from the scaled `max_wallclock_seconds` when the workchain is resubmitted.')
         spec.outline(
-            cls.run_workchain,
-            cls.inspect_workchain,
-            cls.convert_outputs,
+            cls.setup,
+            while_(cls.should_run_workchain)(
+                cls.run_workchain,
+                cls.inspect_workchain,
+            ),
+            # The ``convert_outputs`` step is implemented by the plugins, so it is wrapped here instead of decorated.
+            record_step(cls.convert_outputs),
         )
         spec.output('relaxed_structure', valid_type=StructureData, required=False,
             help='All cell dimensions and atomic positions are in Ångstrom.')
@@ -75,20 +112,135 @@ class CommonRelaxWorkChain(WorkChain, metaclass=ABCMeta):
         spec.exit_code(400, 'ERROR_SUB_PROCESS_FAILED',
             message='The `{cls}` workchain failed with exit status {exit_status}.')
 
+    @classmethod
+    def get_restart_inputs(cls, inputs: dict, remote_folder: RemoteData) -> t.Optional[dict]:
+        """Return the inputs of the wrapped workchain that continue from the remote folder of a previous calculation.
+
+        This is called when the workchain is resubmitted because its last calculation exhausted its wallclock time. The
+        base implementation returns ``None``, which means that the plugin does not support restarts and the workchain
+        starts from scratch.
+
+        :param inputs: the inputs of the wrapped workchain.
+        :param remote_folder: the remote folder of the last calculation of the failed workchain.
+        :return: the inputs that restart from the remote folder, or ``None`` if restarts are not supported.
+        """
+        return None
+
+    @classmethod
+    def get_soft_walltime_inputs(cls, inputs: dict, margin: int) -> dict:
+        """Return the inputs of the wrapped workchain with the soft time limit of the engine derived from their options.
+
+        This is called when the workchain is resubmitted with a scaled ``max_wallclock_seconds``, such that the engine
+        still stops gracefully ``margin`` seconds before it is killed by the scheduler. The base implementation returns
+        the inputs unchanged, which is correct for the engines without a soft time limit.
+
+        :param inputs: the inputs of the wrapped workchain with the scaled options.
+        :param margin: the number of seconds that are reserved for the engine to stop gracefully.
+        :return: the inputs with the soft time limit of the engine updated.
+        """
+        return inputs
+
+    @record_step
+    def setup(self):
+        """Set the inputs of the wrapped workchain and the resubmission policy in the context."""
+        self.ctx.inputs = AttributeDict(self.exposed_inputs(self._process_class))
+        self.ctx.policy = {**DEFAULT_POLICY, **self.inputs.get('resubmission', {})}
+        self.ctx.resubmissions = 0
+        self.ctx.is_finished = False
+
+    def should_run_workchain(self):
+        """Return whether the wrapped workchain should be (re)submitted."""
+        return not self.ctx.is_finished
+
+    @record_step
     def run_workchain(self):
         """Run the wrapped workchain."""
-        inputs = self.exposed_inputs(self._process_class)
-        return ToContext(workchain=self.submit(self._process_class, **inputs))
+        stopwatch = Stopwatch()
+        workchain = self.submit(self._process_class, **self.get_workchain_inputs())
+        record_child(self.node, workchain, submit=stopwatch.lap())
+        return ToContext(workchain=workchain)
 
+    @record_step
     def inspect_workchain(self):
-        """Inspect the terminated workchain."""
+        """Inspect the terminated workchain and resubmit it with scaled resources if they were exhausted."""
         cls = self._process_class.__name__
-        if not self.ctx.workchain.is_finished_ok:
-            exit_status = self.ctx.workchain.exit_status
-            self.report(f'{cls}<{self.ctx.workchain.pk}> failed with exit status {exit_status}.')
-            return self.exit_codes.ERROR_SUB_PROCESS_FAILED.format(cls=cls, exit_status=exit_status)
+        workchain = self.ctx.workchain
+
+        if workchain.is_finished_ok:
+            self.report(f'{cls}<{workchain.pk}> finished successfully.')
+            self.ctx.is_finished = True
+            return None
+
+        exit_status = workchain.exit_status
+        self.report(f'{cls}<{workchain.pk}> failed with exit status {exit_status}.')
+
+        if self.resubmit(workchain):
+            return None
+
+        return self.exit_codes.ERROR_SUB_PROCESS_FAILED.format(cls=cls, exit_status=exit_status)
+
+    def get_workchain_inputs(self) -> dict:
+        """Return the inputs of the wrapped workchain from the context, with the ``Dict`` nodes created again.
+
+        The inputs in the context contain plain dictionaries instead of the ``Dict`` nodes that were created when the
+        workchain was resubmitted, since unstored nodes cannot be checkpointed.
+        """
+        return restore_unstored_nodes(self.ctx.inputs, self._process_class.spec().inputs)
+
+    def resubmit(self, workchain) -> bool:
+        """Update the inputs in the context to resubmit the failed workchain if it exhausted its resources.
+
+        :param workchain: the node of the failed workchain.
+        :return: whether the workchain should be resubmitted.
+        """
+        failure = get_resource_failure(workchain)
+
+        if failure is None:
+            return False
+
+        if self.ctx.resubmissions >= self.ctx.policy['max_resubmissions']:
+            self.report(f'the {failure} was exhausted but the maximum number of resubmissions was reached.')
+            return False
+
+        inputs, scaled = scale_resources(self.get_workchain_inputs(), failure, self.ctx.policy)
+
+        if scaled and failure == 'walltime' and 'walltime_margin' in self.inputs:
+            inputs = self.get_soft_walltime_inputs(inputs, self.inputs.walltime_margin)
+
+        calculation = get_failed_calculation(workchain)
+        restart = None
+
+        if failure == 'walltime' and calculation is not None and 'remote_folder' in calculation.outputs:
+            restart = self.get_restart_inputs(inputs, calculation.outputs.remote_folder)
+
+        if not scaled and restart is None:
+            self.report(f'the {failure} was exhausted but the resources cannot be scaled any further.')
+            return False
+
+        self.ctx.inputs = AttributeDict(strip_unstored_nodes(restart if restart is not None else inputs))
+        self.ctx.resubmissions += 1
+
+        message = 'with scaled resources' if scaled else 'with the same resources'
+        if restart is not None:
+            message += f' from the remote folder of {calculation.process_label}<{calculation.pk}>'
+        self.report(f'the {failure} was exhausted, resubmitting {message}.')
+
+        return True
+
+    def on_terminated(self):
+        """Clean the remote folders of the calculations following the ``cleanup`` policy if finished successfully."""
+        super().on_terminated()
+
+        if 'cleanup' not in self.inputs or not self.node.is_finished_ok:
+            return
+
+        cleaned, failed = clean_workdir(self.node, self.inputs.cleanup)
+
+        if cleaned:
+            self.report(f'cleaned the remote folders: {" ".join(str(pk) for pk in cleaned)}')
 
-        self.report(f'{cls}<{self.ctx.workchain.pk}> finished successfully.')
+        if failed:
+            self.report(f'failed to clean the remote folders: {" ".join(str(pk) for pk in failed)}')
 
     @abstractmethod
     def convert_outputs(self):
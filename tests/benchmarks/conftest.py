@@ -0,0 +1,94 @@
+"""Fixtures for the benchmarks of the input generators and the validators of the common workflows.
+
+The benchmarks use the ``benchmark`` fixture of ``pytest-benchmark``. Since the input generators are too slow to be
+calibrated automatically within a reasonable time, all benchmarks run a fixed number of ``ROUNDS``. To store the results
+and compare against the last stored run, failing if the mean of any benchmark regressed by more than 50%, run::
+
+    pytest tests/benchmarks --benchmark-only --benchmark-autosave --benchmark-compare --benchmark-compare-fail=mean:50%
+
+The threshold is loose since the timings on shared machines vary between runs. Pass a tighter threshold, e.g.
+``--benchmark-compare-fail=mean:25%``, to catch smaller regressions on a quiet machine.
+
+The benchmarks are skipped in the normal test run with ``--benchmark-skip``.
+"""
+import pytest
+
+ROUNDS = 5
+
+#: The numbers of atoms of the benchmark structures, which are supercells of the two-atom diamond cell.
+NUMBER_OF_ATOMS = (2, 16, 128)
+
+#: The elements that are cycled over to generate a structure with a given number of kinds.
+ELEMENTS = ('Si', 'Ge', 'C', 'Sn')
+
+
+@pytest.fixture
+def generate_benchmark_structure():
+    """Return a factory for a supercell of the diamond structure with the given number of atoms and kinds."""
+
+    def _generate_benchmark_structure(number_of_atoms=2, number_of_kinds=1):
+        from aiida.orm import StructureData
+        from ase.build import bulk
+
+        repetitions = round((number_of_atoms / 2) ** (1 / 3))
+        atoms = bulk('Si', 'diamond', a=5.43).repeat(repetitions)
+        atoms.set_chemical_symbols([ELEMENTS[index % number_of_kinds] for index in range(len(atoms))])
+
+        return StructureData(ase=atoms)
+
+    return _generate_benchmark_structure
+
+
+@pytest.fixture
+def run_benchmark(benchmark):
+    """Return a function that benchmarks a callable for a fixed number of rounds and returns its result.
+
+    The cache of successful validations of the input generators is cleared before every round, such that the warmup
+    round does not turn all measured calls into cache hits, unless ``cached=True`` is passed to benchmark the calls that
+    hit the cache.
+    """
+    from aiida_common_workflows.generators import InputGenerator
+
+    def _run_benchmark(function, *args, cached=False, **kwargs):
+        def setup():
+            if not cached:
+                InputGenerator._validation_cache.clear()
+            return args, kwargs
+
+        return benchmark.pedantic(function, setup=setup, rounds=ROUNDS, iterations=1, warmup_rounds=1)
+
+    return _run_benchmark
+
+
+@pytest.fixture
+def generate_siesta_parent_folder(aiida_localhost, generate_code, psml_family):
+    """Return a factory for the ``remote_folder`` of a completed ``SiestaCalculation`` for the given structure."""
+
+    def _generate_siesta_parent_folder(structure):
+        from aiida.common import LinkType
+        from aiida.orm import CalcJobNode, Dict, RemoteData
+
+        node = CalcJobNode(computer=aiida_localhost, process_type='aiida.calculations:siesta.siesta')
+        options = {'resources': {'num_machines': 1, 'tot_num_mpiprocs': 1}, 'max_wallclock_seconds': 3600}
+        node.set_metadata_inputs({'metadata': {'options': options}})
+
+        inputs = {
+            'code': generate_code('siesta.siesta').store(),
+            'structure': structure.store(),
+            'parameters': Dict({'xc-functional': 'GGA', 'xc-authors': 'PBE'}).store(),
+        }
+        inputs.update(
+            {f'pseudos__{kind}': pseudo for kind, pseudo in psml_family.get_pseudos(structure=structure).items()}
+        )
+
+        for link_label, value in inputs.items():
+            node.base.links.add_incoming(value, link_type=LinkType.INPUT_CALC, link_label=link_label)
+
+        node.store()
+
+        remote_folder = RemoteData(computer=aiida_localhost, remote_path='/tmp')
+        remote_folder.base.links.add_incoming(node, link_type=LinkType.CREATE, link_label='remote_folder')
+
+        return remote_folder.store()
+
+    return _generate_siesta_parent_folder
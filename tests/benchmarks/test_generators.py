@@ -0,0 +1,89 @@
+"""Benchmarks of the ``get_builder`` method of the input generators of all plugins."""
+import pytest
+from aiida import engine
+from aiida.plugins import WorkflowFactory
+from aiida_common_workflows.common.types import SpinType
+from aiida_common_workflows.plugins import get_workflow_entry_point_names
+
+from ..conftest import PSEUDO_FAMILIES
+from .conftest import NUMBER_OF_ATOMS
+
+
+@pytest.fixture(params=get_workflow_entry_point_names('relax'))
+def generator(request):
+    """Parametrize over the input generators of all implementations of the ``CommonRelaxWorkChain``."""
+    plugin = request.param.rsplit('.', 1)[-1]
+
+    if plugin in PSEUDO_FAMILIES:
+        request.getfixturevalue(PSEUDO_FAMILIES[plugin])
+
+    return WorkflowFactory(request.param).get_input_generator()
+
+
+@pytest.mark.benchmark(group='relax-number-of-atoms')
+@pytest.mark.parametrize('number_of_atoms', NUMBER_OF_ATOMS)
+def test_relax_number_of_atoms(
+    run_benchmark, generator, generate_inputs, generate_benchmark_structure, number_of_atoms
+):
+    """Benchmark ``get_builder`` of the relax input generators for structures of increasing size."""
+    inputs = generate_inputs(generator, generate_benchmark_structure(number_of_atoms))
+    builder = run_benchmark(generator.get_builder, **inputs)
+    assert isinstance(builder, engine.ProcessBuilder)
+
+
+@pytest.mark.benchmark(group='relax-number-of-kinds')
+@pytest.mark.parametrize('number_of_kinds', (1, 2, 4))
+def test_relax_number_of_kinds(
+    run_benchmark, generator, generate_inputs, generate_benchmark_structure, number_of_kinds
+):
+    """Benchmark ``get_builder`` of the relax input generators for structures with an increasing number of kinds."""
+    inputs = generate_inputs(generator, generate_benchmark_structure(16, number_of_kinds))
+    builder = run_benchmark(generator.get_builder, **inputs)
+    assert isinstance(builder, engine.ProcessBuilder)
+
+
+@pytest.mark.benchmark(group='relax-magnetization')
+@pytest.mark.parametrize('number_of_atoms', NUMBER_OF_ATOMS)
+def test_relax_magnetization(run_benchmark, generator, generate_inputs, generate_benchmark_structure, number_of_atoms):
+    """Benchmark ``get_builder`` of the relax input generators with an initial magnetization for each site.
+
+    Input generators that do not support an initial magnetization per site are skipped.
+    """
+    inputs = generate_inputs(
+        generator,
+        generate_benchmark_structure(number_of_atoms),
+        spin_type=SpinType.COLLINEAR,
+        magnetization_per_site=[0.5] * number_of_atoms,
+    )
+
+    try:
+        generator.get_builder(**inputs)
+    except Exception as exception:
+        pytest.skip(f'the input generator does not support `magnetization_per_site`: {exception}')
+
+    builder = run_benchmark(generator.get_builder, **inputs)
+    assert isinstance(builder, engine.ProcessBuilder)
+
+
+@pytest.mark.benchmark(group='bands-number-of-atoms')
+@pytest.mark.parametrize('number_of_atoms', NUMBER_OF_ATOMS)
+def test_bands_siesta(
+    run_benchmark, generate_code, generate_benchmark_structure, generate_siesta_parent_folder, number_of_atoms
+):
+    """Benchmark ``get_builder`` of the SIESTA bands input generator for structures of increasing size."""
+    from aiida.orm import KpointsData
+
+    generator = WorkflowFactory('common_workflows.bands.siesta').get_input_generator()
+    structure = generate_benchmark_structure(number_of_atoms)
+
+    bands_kpoints = KpointsData()
+    bands_kpoints.set_cell_from_structure(structure)
+    bands_kpoints.set_kpoints([[0.0, 0.0, index / 100] for index in range(100)])
+
+    inputs = {
+        'parent_folder': generate_siesta_parent_folder(structure),
+        'bands_kpoints': bands_kpoints,
+        'engines': {'bands': {'code': generate_code('siesta.siesta').store()}},
+    }
+    builder = run_benchmark(generator.get_builder, **inputs)
+    assert isinstance(builder, engine.ProcessBuilder)
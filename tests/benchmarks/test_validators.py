@@ -0,0 +1,61 @@
+"""Benchmarks of the input validators of the ``EquationOfStateWorkChain`` and ``DissociationCurveWorkChain``.
+
+The validators of the entire input namespace call the ``validate`` method of the input generator of the sub process,
+which is run for every workflow that is launched, so they are benchmarked for all plugins. Since the successful
+validations are cached by the input generators, the first call with given inputs and the calls that hit the cache are
+benchmarked separately.
+"""
+import pytest
+from aiida.plugins import WorkflowFactory
+from aiida_common_workflows.plugins import get_workflow_entry_point_names
+from aiida_common_workflows.workflows import dissociation, eos
+
+from ..conftest import PSEUDO_FAMILIES
+from .conftest import NUMBER_OF_ATOMS
+
+
+@pytest.fixture(params=get_workflow_entry_point_names('relax'))
+def sub_process_class(request):
+    """Parametrize over the entry point names of all implementations of the ``CommonRelaxWorkChain``."""
+    plugin = request.param.rsplit('.', 1)[-1]
+
+    if plugin in PSEUDO_FAMILIES:
+        request.getfixturevalue(PSEUDO_FAMILIES[plugin])
+
+    return request.param
+
+
+@pytest.mark.benchmark(group='validate-eos')
+@pytest.mark.parametrize('cached', (False, True), ids=('cold', 'warm'))
+@pytest.mark.parametrize('number_of_atoms', NUMBER_OF_ATOMS)
+def test_eos_validate_inputs(  # noqa: PLR0913
+    run_benchmark, sub_process_class, generate_inputs, generate_benchmark_structure, number_of_atoms, cached
+):
+    """Benchmark the ``validate_inputs`` validator of the ``EquationOfStateWorkChain`` for increasing system sizes."""
+    generator = WorkflowFactory(sub_process_class).get_input_generator()
+    generator_inputs = generate_inputs(generator, generate_benchmark_structure(number_of_atoms))
+    value = {
+        'structure': generator_inputs.pop('structure'),
+        'scale_count': 7,
+        'scale_increment': 0.02,
+        'sub_process_class': sub_process_class,
+        'generator_inputs': generator_inputs,
+    }
+    assert run_benchmark(eos.validate_inputs, value, None, cached=cached) is None
+
+
+@pytest.mark.benchmark(group='validate-dissociation-curve')
+@pytest.mark.parametrize('cached', (False, True), ids=('cold', 'warm'))
+def test_dissociation_validate_inputs(run_benchmark, sub_process_class, generate_inputs, generate_structure, cached):
+    """Benchmark the ``validate_inputs`` validator of the ``DissociationCurveWorkChain``."""
+    generator = WorkflowFactory(sub_process_class).get_input_generator()
+    generator_inputs = generate_inputs(generator, generate_structure(symbols=('H', 'H')))
+    value = {
+        'molecule': generator_inputs.pop('structure'),
+        'distances_count': 5,
+        'distance_min': 0.5,
+        'distance_max': 1.5,
+        'sub_process_class': sub_process_class,
+        'generator_inputs': generator_inputs,
+    }
+    assert run_benchmark(dissociation.validate_inputs, value, None, cached=cached) is None
@@ -0,0 +1,34 @@
+"""Tests for the :mod:`aiida_common_workflows.cli.admission` module."""
+import click
+import pytest
+from aiida import orm
+from aiida_common_workflows.cli import admission
+from aiida_common_workflows.common.admission import get_quotas, set_quota
+
+
+def test_admission(run_cli_command, generate_code):
+    """Test the `admission set`, `show` and `unset` commands."""
+    code = generate_code('quantumespresso.pw').store()
+    user = orm.User.collection.get_default()
+
+    try:
+        run_cli_command(admission.cmd_admission_set, ['code', code.full_label, '5'])
+        run_cli_command(admission.cmd_admission_set, ['user', user.email, '20'])
+        assert get_quotas()['code'][code.uuid] == 5
+
+        result = run_cli_command(admission.cmd_admission_show)
+        assert ['code', code.full_label, '5', '0'] in [line.split() for line in result.output_lines]
+        assert ['user', user.email, '20'] in [line.split()[:3] for line in result.output_lines]
+
+        run_cli_command(admission.cmd_admission_unset, ['code', str(code.pk)])
+        assert code.uuid not in get_quotas()['code']
+    finally:
+        set_quota('code', code.uuid, None)
+        set_quota('user', user.email, None)
+
+
+@pytest.mark.parametrize('kind', ('computer', 'code', 'user'))
+def test_admission_set_unknown(run_cli_command, kind):
+    """Test the `admission set` command raises for resources that do not exist."""
+    result = run_cli_command(admission.cmd_admission_set, [kind, 'unknown@example', '5'], raises=click.BadParameter)
+    assert f'could not load the {kind} `unknown@example`' in result.output
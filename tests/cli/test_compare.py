@@ -0,0 +1,21 @@
+"""Tests for the :mod:`aiida_common_workflows.cli.compare` module."""
+import uuid
+
+from aiida import orm
+from aiida_common_workflows.cli import compare
+
+
+def test_compare(run_cli_command, generate_eos_node_birch_murnaghan, generate_structure, tmp_path):
+    """Test the `compare` command."""
+    structure = generate_structure(symbols=('Al',)).store()
+    groups = [orm.Group(f'eos-{uuid.uuid4()}').store() for _ in range(2)]
+    groups[0].add_nodes(generate_eos_node_birch_murnaghan(structure))
+    groups[1].add_nodes(generate_eos_node_birch_murnaghan(structure, bulk_modulus=0.55))
+
+    result = run_cli_command(compare.cmd_compare, [str(group.pk) for group in groups])
+    assert result.output_lines[0].split()[:4] == ['formula', 'workflow_a', 'workflow_b', 'delta']
+    assert result.output_lines[2].split()[0] == 'Al'
+
+    filepath = tmp_path / 'comparison.csv'
+    run_cli_command(compare.cmd_compare, [str(group.pk) for group in groups] + ['-o', str(filepath)])
+    assert len(filepath.read_text().splitlines()) == 2
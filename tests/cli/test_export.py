@@ -0,0 +1,32 @@
+"""Tests for the :mod:`aiida_common_workflows.cli.export` module."""
+import click
+import numpy
+from aiida_common_workflows.cli import export
+
+
+def test_export_eos(run_cli_command, generate_eos_node, tmp_path):
+    """Test the `export eos` command."""
+    nodes = [generate_eos_node(), generate_eos_node()]
+    filepath = tmp_path / 'eos.npz'
+
+    options = [str(node.pk) for node in nodes] + ['--output-file', str(filepath)]
+    result = run_cli_command(export.cmd_export_eos, options)
+    assert f'Exported 10 points of 2 workflows to {filepath}' in result.output
+    assert numpy.load(filepath)['workflow'].tolist() == [nodes[0].pk] * 5 + [nodes[1].pk] * 5
+
+
+def test_export_dissociation_curve(run_cli_command, generate_dissociation_curve_node, tmp_path):
+    """Test the `export dissociation-curve` command."""
+    node = generate_dissociation_curve_node()
+    filepath = tmp_path / 'dissociation'
+
+    options = [str(node.pk), '--output-file', str(filepath), '--format', 'csv']
+    run_cli_command(export.cmd_export_dissociation_curve, options)
+    assert filepath.read_text().splitlines()[0] == 'workflow,index,distance,energy,magnetization'
+
+
+def test_export_no_workflows(run_cli_command, tmp_path):
+    """Test that the workflows have to be specified."""
+    options = ['--output-file', str(tmp_path / 'eos.csv')]
+    result = run_cli_command(export.cmd_export_eos, options, raises=click.UsageError)
+    assert 'specify the workflows either by their pks or with the `--group` option' in result.output
@@ -0,0 +1,17 @@
+"""Tests for the :mod:`aiida_common_workflows.cli.farm` module."""
+import click
+from aiida_common_workflows.cli import farm
+from aiida_common_workflows.common.farm import get_worker_script
+
+
+def test_farm_worker(run_cli_command):
+    """Test the `farm-worker` command."""
+    options = ['--slots', '4', '--idle-timeout', '60', '--lifetime', '3600', '--poll-interval', '10']
+    result = run_cli_command(farm.cmd_farm_worker, options)
+    assert result.output == get_worker_script(4, idle_timeout=60, lifetime=3600, poll_interval=10)
+
+
+def test_farm_worker_invalid(run_cli_command):
+    """Test the `farm-worker` command raises if the lifetime is shorter than the poll interval."""
+    result = run_cli_command(farm.cmd_farm_worker, ['--slots', '4', '--lifetime', '2'], raises=click.BadParameter)
+    assert 'the idle timeout and lifetime should not be shorter than the poll interval.' in result.output
@@ -0,0 +1,35 @@
+"""Tests for the :mod:`aiida_common_workflows.cli.footprint` module."""
+import click
+from aiida.common import LinkType
+from aiida.orm import CalcFunctionNode, WorkflowNode
+from aiida_common_workflows.cli import footprint
+
+
+def test_footprint(run_cli_command):
+    """Test the `footprint` command."""
+    nodes = []
+
+    for _ in range(2):
+        node = WorkflowNode().store()
+        child = CalcFunctionNode()
+        child.base.links.add_incoming(node, link_type=LinkType.CALL_CALC, link_label='call')
+        child.store()
+        nodes.append(node)
+
+    result = run_cli_command(footprint.cmd_footprint, [str(node.pk) for node in nodes])
+    rows = [line.split() for line in result.output_lines[2:]]
+
+    assert [row[:2] for row in rows[:4]] == [
+        [str(nodes[0].pk), 'generator'],
+        [str(nodes[0].pk), 'orchestration'],
+        [str(nodes[0].pk), 'conversion'],
+        [str(nodes[0].pk), 'calculation'],
+    ]
+    assert rows[1][2:] == ['2', '1', '0', '0']
+    assert rows[-3] == ['total', 'orchestration', '4', '2', '0', '0']
+
+
+def test_footprint_no_workflows(run_cli_command):
+    """Test that the workflows have to be specified."""
+    result = run_cli_command(footprint.cmd_footprint, [], raises=click.UsageError)
+    assert 'specify the workflows either by their pks or with the `--group` option' in result.output
@@ -1,8 +1,11 @@
 """Tests for the :mod:`aiida_common_workflows.cli.launch` module."""
+import math
 import re
+import uuid
 
 import click
 import pytest
+from aiida import orm
 from aiida_common_workflows.cli import launch, utils
 
 
@@ -17,6 +20,20 @@ def test_relax(run_cli_command, generate_structure, generate_code):
     assert re.search(r'.*Submitted GaussianCommonRelaxWorkChain<.*> to the daemon.*', result.output)
 
 
+def test_relax_show_engines(run_cli_command):
+    """Test the `--show-engines` option."""
+    options = ['--show-engines', 'quantum_espresso']
+    result = run_cli_command(launch.cmd_relax, options)
+    assert result.output_lines[:2] == ['relax', 'Required code plugin: quantumespresso.pw']
+
+
+def test_relax_invalid_protocol(run_cli_command):
+    """Test that a protocol that is not implemented by the plugin raises."""
+    options = ['-p', 'verification-PBE-v1-sirius', 'quantum_espresso']
+    result = run_cli_command(launch.cmd_relax, options, raises=click.BadParameter)
+    assert '`verification-PBE-v1-sirius` is not implemented by the `quantum_espresso` plugin' in result.output
+
+
 def test_relax_wallclock_seconds(run_cli_command, generate_structure, generate_code):
     """Test the `--wallclock-seconds` option."""
     structure = generate_structure().store()
@@ -88,6 +105,60 @@ def test_relax_codes(run_cli_command, generate_structure, generate_code, monkeyp
     result = run_cli_command(launch.cmd_relax, options)
 
 
+@pytest.mark.parametrize('command', ('relax', 'eos', 'dissociation_curve'))
+def test_structures(run_cli_command, generate_structure, generate_code, monkeypatch, command):
+    """Test the `--structures` option."""
+    submitted = []
+
+    def submit_processes(processes, max_concurrent, rate_limit, manifest):
+        submitted.extend(processes)
+        assert (max_concurrent, rate_limit, manifest) == (2, 0.5, 'manifest.json')
+
+    monkeypatch.setattr(utils, 'submit_processes', submit_processes)
+    structures = [generate_structure(symbols=['N', 'N']).store(), generate_structure(symbols=['H', 'H']).store()]
+    group = orm.Group(f'structures-{uuid.uuid4()}').store()
+    group.add_nodes(structures)
+    generate_code('gaussian').store()
+
+    options = ['--structures', group.uuid, '--max-concurrent', '2', '--rate-limit', '0.5']
+    options += ['--manifest', 'manifest.json', '--', 'gaussian']
+    run_cli_command(getattr(launch, f'cmd_{command}'), options)
+    assert [entry[0].uuid for entry in submitted] == [structure.uuid for structure in structures]
+
+
+@pytest.mark.parametrize('command', ('relax', 'eos', 'dissociation_curve'))
+def test_profile(run_cli_command, generate_structure, generate_code, monkeypatch, tmp_path, command):  # noqa: PLR0913
+    """Test the `--profile` option profiles the input generation without submitting anything."""
+    import pstats
+
+    from aiida.engine import launch as engine_launch
+
+    def submit(*_, **__):
+        raise AssertionError('nothing should be submitted when profiling.')
+
+    monkeypatch.setattr(engine_launch, 'submit', submit)
+    monkeypatch.setattr(utils, 'submit_processes', submit)
+    structure = generate_structure(symbols=['H', 'H']).store()
+    generate_code('gaussian').store()
+    filepath = tmp_path / 'launch.prof'
+
+    options = ['-S', str(structure.pk), '--profile', '--profile-output', str(filepath), '--', 'gaussian']
+    result = run_cli_command(getattr(launch, f'cmd_{command}'), options)
+
+    header = next(index for index, line in enumerate(result.output_lines) if line.startswith('Phase'))
+    phases = {line.split()[0] for line in result.output_lines[header + 2 : header + 6]}
+    assert phases == {'parse', 'load', 'look', 'generate'}
+    assert 'function calls' in result.output
+    assert pstats.Stats(str(filepath)).total_calls > 0
+
+
+def test_profile_output_requires_profile(run_cli_command):
+    """Test that the `--profile-output` option raises if the `--profile` flag is not specified."""
+    options = ['--profile-output', 'launch.prof', 'gaussian']
+    result = run_cli_command(launch.cmd_relax, options, raises=click.BadParameter)
+    assert 'can only be specified together with the `--profile` flag' in result.output
+
+
 @pytest.mark.usefixtures('aiida_profile')
 def test_eos(run_cli_command, generate_structure, generate_code):
     """Test the `launch eos` command."""
@@ -221,3 +292,80 @@ def test_relax_magn_per_type(run_cli_command, generate_structure, generate_code)
     options = ['-S', str(structure.pk), '--magnetization-per-site', 'str', '--', 'quantum_espresso']
     result = run_cli_command(launch.cmd_relax, options, raises=click.BadParameter)
     assert "Error: Invalid value for '--magnetization-per-site': 'str' is not a valid float." in result.output
+
+
+def test_auto_resources_exclusive(run_cli_command):
+    """Test that the `--auto-resources` flag cannot be combined with explicit resources."""
+    options = ['--auto-resources', '-w', '100', '--', 'quantum_espresso']
+    result = run_cli_command(launch.cmd_relax, options, raises=click.BadParameter)
+    assert 'cannot be combined with `--number-machines`' in result.output
+
+
+@pytest.mark.parametrize('command', ('relax', 'eos', 'dissociation_curve'))
+def test_auto_resources(run_cli_command, generate_structure, generate_code, monkeypatch, command):
+    """Test the `--auto-resources` flag passes the calibrated resource models to the workflow or builder."""
+    from aiida_common_workflows.common.resources import ResourceModel
+
+    launched = {}
+    resource_model = {'model': ResourceModel(('atoms',), (math.log(5000.25), 1), 0, 10).serialize()}
+    resource_model['cores_per_machine'] = 4
+
+    def launch_process(process, _, **inputs):
+        launched.update(process=process, inputs=inputs)
+
+    monkeypatch.setattr(utils, 'launch_process', launch_process)
+    monkeypatch.setattr(utils, 'get_resource_model', lambda code, entry_point: resource_model)
+    structure = generate_structure(symbols=['H', 'H']).store()
+    generate_code('gaussian').store()
+
+    options = ['-S', str(structure.pk), '--auto-resources', '--', 'gaussian']
+    run_cli_command(getattr(launch, f'cmd_{command}'), options)
+
+    if command == 'relax':
+        options = launched['process'].gaussian.metadata.options
+        assert options.resources == {'num_machines': 1, 'num_mpiprocs_per_machine': 3}
+        assert options.max_wallclock_seconds == 3334
+    else:
+        assert launched['inputs']['resource_models'] == {'relax': resource_model}
+
+
+def test_auto_resources_fallback(run_cli_command, generate_structure, generate_code, monkeypatch):
+    """Test the `--auto-resources` flag falls back to the default resources if the model cannot be calibrated."""
+    launched = {}
+
+    def launch_process(process, _, **inputs):
+        launched.update(process=process, inputs=inputs)
+
+    monkeypatch.setattr(utils, 'launch_process', launch_process)
+    structure = generate_structure(symbols=['H', 'H']).store()
+    generate_code('gaussian').store()
+
+    options = ['-S', str(structure.pk), '--auto-resources', '--', 'gaussian']
+    result = run_cli_command(launch.cmd_eos, options)
+
+    assert 'Using the default resources instead.' in result.output
+    assert 'resource_models' not in launched['inputs']
+    assert launched['inputs']['generator_inputs']['engines']['relax']['options']['max_wallclock_seconds'] == 3600
+
+
+@pytest.mark.parametrize('command', ('eos', 'dissociation_curve'))
+def test_engine_pools(run_cli_command, generate_structure, generate_code, monkeypatch, command):
+    """Test that multiple codes of the same plugin form a pool of the engine."""
+    launched = {}
+
+    def launch_process(process, _, **inputs):
+        launched.update(process=process, inputs=inputs)
+
+    monkeypatch.setattr(utils, 'launch_process', launch_process)
+    structure = generate_structure(symbols=['H', 'H']).store()
+    codes = [generate_code('gaussian').store() for _ in range(2)]
+
+    options = ['-S', str(structure.pk), '-X', *[str(code.pk) for code in codes], '--', 'gaussian']
+    run_cli_command(getattr(launch, f'cmd_{command}'), options)
+
+    assert launched['inputs']['engine_pools'] == {'relax': [{'code': code.full_label} for code in codes]}
+
+    options = ['-S', str(structure.pk), '-X', str(codes[0].pk), '--', 'gaussian']
+    run_cli_command(getattr(launch, f'cmd_{command}'), options)
+
+    assert 'engine_pools' not in launched['inputs']
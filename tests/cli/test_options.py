@@ -1,6 +1,7 @@
 """Tests for the :mod:`aiida_common_workflows.cli.launch` module."""
 import json
 import pathlib
+import uuid
 
 import click
 import pytest
@@ -86,6 +87,43 @@ class TestStructureDataParamType:
         assert result.get_formula() == formula
 
 
+class TestStructuresParamType:
+    """Test the ``StructuresParamType``."""
+
+    @pytest.fixture
+    def directory(self, tmp_path, filepath_cif):
+        """Return a directory containing two structure files."""
+        for filename in ('Si.cif', 'Si-copy.cif'):
+            (tmp_path / filename).write_text(filepath_cif.read_text())
+        return tmp_path
+
+    @pytest.mark.parametrize(
+        'value, expected',
+        (('{directory}', 2), ('{directory}/*.cif', 2), ('{directory}/Si-*.cif', 1), ('{filepath}', 1)),
+    )
+    def test_from_filepaths(self, directory, filepath_cif, value, expected):
+        """Test loading from a directory, a glob pattern and a single file."""
+        result = options.StructuresParamType().convert(
+            value.format(directory=directory, filepath=filepath_cif), None, None
+        )
+        assert len(result) == expected
+        assert all(isinstance(structure, orm.StructureData) for structure in result)
+
+    def test_from_group(self, generate_structure):
+        """Test loading from a group identifier."""
+        structures = [generate_structure().store(), generate_structure().store()]
+        group = orm.Group(f'structures-{uuid.uuid4()}').store()
+        group.add_nodes([*structures, orm.Int(1).store()])
+
+        result = options.StructuresParamType().convert(group.uuid, None, None)
+        assert [structure.uuid for structure in result] == [structure.uuid for structure in structures]
+
+    def test_invalid(self):
+        """Test that a value that is neither a file, glob pattern nor group identifier raises."""
+        with pytest.raises(click.BadParameter, match=r'`non-existing/\*.cif` is not a directory, file or glob pattern'):
+            options.StructuresParamType().convert('non-existing/*.cif', None, None)
+
+
 class TestJsonParamType:
     """Test the ``JsonParamType``."""
 
@@ -177,3 +177,61 @@ def test_plot_dissociation_curve_missing_outputs(run_cli_command, generate_disso
     options = [str(node.pk)]
     result = run_cli_command(plot.cmd_plot_dissociation_curve, options, raises=SystemExit)
     assert "is missing required outputs: ('total_energies',)" in result.output
+
+
+def test_plot_eos_group(run_cli_command, generate_eos_node_birch_murnaghan, generate_eos_node, tmp_path):
+    """Test the `plot_eos` command with the `--group` option.
+
+    The node without energies has no results to plot and should be skipped.
+    """
+    import uuid
+
+    from aiida.orm import Group
+
+    nodes = [generate_eos_node_birch_murnaghan(), generate_eos_node_birch_murnaghan(volume=22.0)]
+    nodes.append(generate_eos_node(include_energy=False))
+    group = Group(label=f'plot-eos-{uuid.uuid4()}').store()
+    group.add_nodes(nodes)
+
+    options = ['--group', group.uuid, '--output-directory', str(tmp_path), '--max-workers', '2']
+    result = run_cli_command(plot.cmd_plot_eos, options)
+
+    assert f'Saved 2 of 2 plots to {tmp_path}' in result.output
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(f'{node.pk}.png' for node in nodes[:2])
+
+
+def test_plot_dissociation_curve_group(run_cli_command, generate_dissociation_curve_node, tmp_path):
+    """Test the `plot_dissociation_curve` command with the `--group` option."""
+    import uuid
+
+    from aiida.orm import Group
+
+    nodes = [generate_dissociation_curve_node() for _ in range(2)]
+    group = Group(label=f'plot-dissociation-{uuid.uuid4()}').store()
+    group.add_nodes(nodes)
+
+    options = ['--group', group.uuid, '--output-directory', str(tmp_path / 'plots')]
+    result = run_cli_command(plot.cmd_plot_dissociation_curve, options)
+
+    assert 'Saved 2 of 2 plots' in result.output
+    assert sorted(path.name for path in (tmp_path / 'plots').iterdir()) == sorted(f'{node.pk}.png' for node in nodes)
+
+
+@pytest.mark.parametrize(
+    'options, message',
+    (
+        ([], 'specify either a WORKFLOW or the `--group` option.'),
+        (['--group', 'GROUP'], 'the `--output-directory` option is required'),
+    ),
+)
+def test_plot_eos_group_invalid(run_cli_command, options, message):
+    """Test the `plot_eos` command with invalid combinations of the `--group` option."""
+    import uuid
+
+    from aiida.orm import Group
+
+    group = Group(label=f'plot-eos-{uuid.uuid4()}').store()
+    options = [group.uuid if option == 'GROUP' else option for option in options]
+
+    result = run_cli_command(plot.cmd_plot_eos, options, raises=True)
+    assert message in result.output
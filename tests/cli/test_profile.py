@@ -0,0 +1,30 @@
+"""Tests for the :mod:`aiida_common_workflows.cli.profile` module."""
+import click
+from aiida.orm import WorkflowNode
+from aiida_common_workflows.cli import profile
+from aiida_common_workflows.common import timing
+
+
+def test_profile(run_cli_command):
+    """Test the `profile` command."""
+    node = WorkflowNode().store()
+    timing.record_child(node, WorkflowNode().store(), generate=2.0, submit=0.5)
+
+    result = run_cli_command(profile.cmd_profile, [str(node.pk)])
+    assert [line.split()[:3] for line in result.output_lines[2:]] == [
+        ['generate', '1', '2.000'],
+        ['submit', '1', '0.500'],
+    ]
+
+
+def test_profile_no_timings(run_cli_command):
+    """Test the `profile` command for a workflow without timings."""
+    node = WorkflowNode().store()
+    result = run_cli_command(profile.cmd_profile, [str(node.pk)], raises=True)
+    assert 'no timings were recorded' in result.output
+
+
+def test_profile_no_workflows(run_cli_command):
+    """Test that the workflows have to be specified."""
+    result = run_cli_command(profile.cmd_profile, [], raises=click.UsageError)
+    assert 'specify the workflows either by their pks or with the `--group` option' in result.output
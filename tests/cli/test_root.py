@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import subprocess
+import sys
 
 import click
 import pytest
@@ -16,7 +17,7 @@ def recurse_commands(command: click.Command, parents: list[str] | None = None):
     :returns: A list of strings denoting the full path to the current command.
     """
     if isinstance(command, click.Group):
-        for command_name in command.commands:
+        for command_name in command.list_commands(None):
             subcommand = command.get_command(None, command_name)
             if parents is not None:
                 subparents = [*parents, command.name]
@@ -44,3 +45,49 @@ def test_commands_help_option(command, help_option):
     result = subprocess.run([*command, help_option], check=False, capture_output=True, text=True)
     assert result.returncode == 0, result.stderr
     assert 'Usage:' in result.stdout
+
+
+#: Maximum cumulative import time in seconds of the command line interface, as reported by ``python -X importtime``.
+STARTUP_BUDGET = 1.0
+
+#: Modules that should not be imported by simply calling the root command.
+HEAVY_MODULES = (
+    'aiida.engine',
+    'aiida.orm',
+    'matplotlib',
+    'scipy',
+    'aiida_common_workflows.workflows',
+)
+
+
+@pytest.mark.minimal_install
+def test_import_time():
+    """Test that importing the command line interface stays within the startup budget."""
+    command = [sys.executable, '-X', 'importtime', '-c', 'import aiida_common_workflows.cli']
+    result = subprocess.run(command, check=True, capture_output=True, text=True)
+
+    for line in result.stderr.splitlines():
+        _, _, cumulative, name = (column.strip() for column in line.replace('|', ':').split(':'))
+        if name == 'aiida_common_workflows.cli':
+            assert int(cumulative) * 1e-6 < STARTUP_BUDGET
+            break
+    else:
+        pytest.fail('`aiida_common_workflows.cli` not found in the output of `python -X importtime`.')
+
+
+@pytest.mark.minimal_install
+def test_lazy_subcommands():
+    """Test that the help of the root command lists all subcommands without importing heavy dependencies."""
+    script = (
+        'import sys\n'
+        'from aiida_common_workflows.cli import cmd_root\n'
+        'try:\n'
+        '    cmd_root(["--help"])\n'
+        'except SystemExit:\n'
+        '    pass\n'
+        f'print([module for module in {HEAVY_MODULES!r} if module in sys.modules])\n'
+    )
+    result = subprocess.run([sys.executable, '-c', script], check=True, capture_output=True, text=True)
+    assert 'launch' in result.stdout
+    assert 'plot' in result.stdout
+    assert result.stdout.splitlines()[-1] == '[]'
@@ -0,0 +1,18 @@
+"""Tests for the :mod:`aiida_common_workflows.cli.structures` module."""
+import uuid
+
+import ase.build
+import ase.io
+from aiida import orm
+from aiida_common_workflows.cli import structures
+
+
+def test_import_structures(run_cli_command, tmp_path):
+    """Test the `import-structures` command."""
+    for index, lattice_parameter in enumerate((4.01234, 4.01234, 4.56789)):
+        ase.io.write(tmp_path / f'{index}.xyz', ase.build.bulk('Al', a=lattice_parameter), format='extxyz')
+
+    label = f'structures-{uuid.uuid4()}'
+    result = run_cli_command(structures.cmd_import_structures, [str(tmp_path), '--group-label', label])
+    assert 'Imported 3 files corresponding to 2 unique structures.' in result.output
+    assert orm.load_group(label).count() == 2
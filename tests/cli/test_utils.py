@@ -1,6 +1,10 @@
 """Tests for the :mod:`aiida_common_workflows.cli.utils` module."""
+import json
+
 import pytest
-from aiida_common_workflows.cli.utils import get_code_from_list_or_database
+from aiida import orm
+from aiida.engine import ProcessState, launch
+from aiida_common_workflows.cli.utils import LaunchProfiler, get_code_from_list_or_database, submit_processes
 
 
 @pytest.mark.usefixtures('with_clean_database')
@@ -18,3 +22,59 @@ def test_get_code_from_list_or_database(generate_code):
 
     # Empty list, but database contains a code. Note that order is random here, so we don't know which code is returned.
     assert get_code_from_list_or_database([], entry_point).uuid in [code.uuid for code in codes]
+
+
+def test_submit_processes(generate_structure, monkeypatch, tmp_path):
+    """Test `submit_processes` method."""
+    submitted = []
+
+    def submit(process, **inputs):
+        node = orm.WorkflowNode()
+        node.set_process_label(process)
+        node.set_process_state(ProcessState.FINISHED)
+        submitted.append(inputs)
+        return node.store()
+
+    monkeypatch.setattr(launch, 'submit', submit)
+    structures = [generate_structure(), generate_structure(symbols=('Al',))]
+    processes = [(structure.store(), 'Workflow', {'structure': structure}) for structure in structures]
+    manifest = tmp_path / 'manifest.json'
+
+    nodes = submit_processes(processes, max_concurrent=1, rate_limit=100, manifest=str(manifest), poll_interval=0)
+    assert len(nodes) == len(submitted) == 2
+
+    entries = json.loads(manifest.read_text())
+    assert [entry['pk'] for entry in entries] == [node.pk for node in nodes]
+    assert [entry['structure']['uuid'] for entry in entries] == [structure.uuid for structure in structures]
+
+
+def test_launch_profiler(capsys, tmp_path):
+    """Test the ``LaunchProfiler`` class."""
+    import pstats
+
+    profiler = LaunchProfiler()
+    profiler.lap('first')
+    sorted(range(100000))
+    profiler.lap('second')
+    profiler.lap('first')
+
+    assert list(profiler.phases) == ['first', 'second']
+    assert profiler.phases['second'] > 0
+
+    filepath = tmp_path / 'launch.prof'
+    profiler.report(filepath)
+    output = capsys.readouterr().out
+
+    assert output.index('second') < output.index('first')
+    assert 'function calls' in output
+    assert pstats.Stats(str(filepath)).total_calls > 0
+
+
+def test_launch_profiler_disabled(capsys):
+    """Test that a disabled ``LaunchProfiler`` only records and reports the phases."""
+    profiler = LaunchProfiler(enabled=False)
+    profiler.lap('phase')
+    profiler.report()
+
+    assert list(profiler.phases) == ['phase']
+    assert 'function calls' not in capsys.readouterr().out
@@ -0,0 +1,93 @@
+"""Tests for the :mod:`aiida_common_workflows.common.admission` module."""
+import uuid
+
+import pytest
+from aiida import orm
+from aiida_common_workflows.common import admission
+
+
+@pytest.fixture
+def clear_quotas():
+    """Remove all quotas of the admission controller after the test."""
+    yield
+    group = admission._get_group()
+    if group is not None:
+        group.base.extras.set(admission.QUOTAS_EXTRA, [])
+
+
+@pytest.fixture
+def generate_process():
+    """Return a factory for a stored process node with the given process state that holds the given resources."""
+
+    def _generate_process(resources, process_state='waiting'):
+        node = orm.WorkflowNode()
+        node.set_process_state(process_state)
+        node.store()
+        admission.register_admission(node, resources)
+        return node
+
+    return _generate_process
+
+
+@pytest.mark.usefixtures('clear_quotas')
+def test_set_quota():
+    """Test the ``set_quota`` and ``get_quotas`` functions."""
+    identifier = str(uuid.uuid4())
+
+    admission.set_quota('code', identifier, 2)
+    admission.set_quota('user', 'user@example.com', 10)
+    admission.set_quota('code', identifier, 3)
+    assert admission.get_quotas()['code'][identifier] == 3
+    assert admission.get_quotas()['user']['user@example.com'] == 10
+
+    admission.set_quota('code', identifier, None)
+    assert identifier not in admission.get_quotas()['code']
+
+    with pytest.raises(ValueError, match=r'the kind `group` is not one of'):
+        admission.set_quota('group', identifier, 1)
+
+    with pytest.raises(ValueError, match=r'the quota should be a positive integer.'):
+        admission.set_quota('code', identifier, 0)
+
+
+def test_get_resources(generate_code):
+    """Test the ``get_resources`` function."""
+    code = generate_code('quantumespresso.pw').store()
+    engines = {'relax': {'code': code}, 'scf': {'code': code.full_label}}
+    user = orm.User.collection.get_default()
+
+    assert admission.get_resources(engines, user) == {
+        'computer': [code.computer.uuid],
+        'code': [code.uuid],
+        'user': [user.email],
+    }
+
+
+def test_get_usage(generate_process):
+    """Test ``get_usage`` only counts the active processes."""
+    identifier = str(uuid.uuid4())
+    active = generate_process({'code': [identifier]})
+    generate_process({'code': [identifier]}, process_state='finished')
+
+    assert admission.get_usage()['code'][identifier] == [active.pk]
+
+
+@pytest.mark.usefixtures('clear_quotas')
+def test_request_admission(generate_process):
+    """Test ``request_admission`` returns the processes that hold the exhausted quotas."""
+    code, computer = str(uuid.uuid4()), str(uuid.uuid4())
+    resources = {'computer': [computer], 'code': [code], 'user': ['user@example.com']}
+
+    assert admission.request_admission(resources) == []
+
+    admission.set_quota('code', code, 2)
+    admission.set_quota('computer', computer, 1)
+    holders = [generate_process({'code': [code]}) for _ in range(2)]
+    assert admission.request_admission(resources) == sorted(node.pk for node in holders)
+
+    # Once a holder terminates, the quota of the code has a free slot, but the quota of the computer can be exhausted.
+    holders[0].set_process_state('finished')
+    assert admission.request_admission(resources) == []
+
+    other = generate_process({'computer': [computer]})
+    assert admission.request_admission(resources) == [other.pk]
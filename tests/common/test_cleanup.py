@@ -0,0 +1,169 @@
+"""Tests for the :mod:`aiida_common_workflows.common.cleanup` module."""
+import pytest
+from aiida import orm
+from aiida.common.links import LinkType
+from aiida_common_workflows.common import cleanup, restart
+
+
+@pytest.fixture
+def generate_calculation(aiida_localhost, tmp_path):
+    """Return a factory for a finished calculation job called by the given parent with a remote folder."""
+
+    def _generate_calculation(parent, label):
+        calculation = orm.CalcJobNode(computer=aiida_localhost)
+        calculation.set_process_state('finished')
+        calculation.set_exit_status(0)
+        calculation.base.links.add_incoming(parent, LinkType.CALL_CALC, 'CALL')
+        calculation.store()
+
+        workdir = tmp_path / label
+        workdir.mkdir()
+        (workdir / 'restart').write_text('restart')
+
+        remote = orm.RemoteData(computer=aiida_localhost, remote_path=str(workdir))
+        remote.base.links.add_incoming(calculation, LinkType.CREATE, 'remote_folder')
+        remote.store()
+
+        return remote
+
+    return _generate_calculation
+
+
+@pytest.mark.parametrize(
+    'value, message',
+    (
+        ({}, None),
+        ({'keep_outputs': True, 'batch_size': 5}, None),
+        ({'keep': True}, r'the cleanup policy contains unknown keys'),
+        ({'keep_outputs': 'yes'}, r'the `keep_outputs` should be a boolean.'),
+        ({'batch_size': 0}, r'the `batch_size` should be a positive integer.'),
+        ({'batch_size': True}, r'the `batch_size` should be a positive integer.'),
+    ),
+)
+def test_validate_policy(value, message):
+    """Test the ``validate_policy`` function."""
+    result = cleanup.validate_policy(value, None)
+
+    if message is None:
+        assert result is None
+    else:
+        assert message in result
+
+
+def test_get_remote_folders(generate_calculation):
+    """Test the ``get_remote_folders`` function skips the remote folders that are still referenced."""
+    workflow = orm.WorkflowNode().store()
+    cleanable = generate_calculation(workflow, 'cleanable')
+
+    returned = generate_calculation(workflow, 'returned')
+    returned.base.links.add_incoming(workflow, LinkType.RETURN, 'remote_folder')
+
+    consumer = orm.WorkflowNode()
+    consumer.set_process_state('running')
+    consumer.base.links.add_incoming(generate_calculation(workflow, 'consumed'), LinkType.INPUT_WORK, 'parent_folder')
+    consumer.store()
+
+    child = orm.WorkflowNode()
+    child.base.links.add_incoming(workflow, LinkType.CALL_WORK, 'CALL')
+    child.store()
+    generate_calculation(child, 'reused')
+    restarted = orm.WorkflowNode()
+    restarted.set_process_state('waiting')
+    restarted.store()
+    restart.register_reused(restarted, child)
+
+    cleaned = generate_calculation(workflow, 'cleaned')
+    cleaned.base.extras.set(orm.RemoteData.KEY_EXTRA_CLEANED, True)
+
+    assert cleanup.get_remote_folders(workflow, keep_outputs=False) == [cleanable, returned]
+    assert cleanup.get_remote_folders(workflow) == [cleanable]
+
+    consumer.set_process_state('finished')
+    restarted.set_process_state('finished')
+    assert len(cleanup.get_remote_folders(workflow, keep_outputs=False)) == 4
+
+
+def test_clean_remote_folders(generate_calculation, monkeypatch):
+    """Test the ``clean_remote_folders`` function cleans the remote folders in batches that share a transport."""
+    workflow = orm.WorkflowNode().store()
+    remotes = [generate_calculation(workflow, f'calculation_{index}') for index in range(5)]
+
+    transports = []
+    get_transport = orm.AuthInfo.get_transport
+
+    def counting_get_transport(self):
+        transports.append(self.pk)
+        return get_transport(self)
+
+    clean = orm.RemoteData._clean
+
+    def failing_clean(self, transport=None):
+        if self.pk == remotes[1].pk:
+            raise OSError('permission denied')
+        clean(self, transport=transport)
+
+    monkeypatch.setattr(orm.AuthInfo, 'get_transport', counting_get_transport)
+    monkeypatch.setattr(orm.RemoteData, '_clean', failing_clean)
+
+    cleaned, failed = cleanup.clean_remote_folders(remotes, batch_size=2)
+
+    assert len(transports) == 3
+    assert cleaned == [remote.pk for index, remote in enumerate(remotes) if index != 1]
+    assert failed == [remotes[1].pk]
+    assert all(remote.is_cleaned for remote in remotes if remote.pk in cleaned)
+    assert not remotes[1].is_cleaned
+
+
+def test_clean_workdir_relax_then_bands(generate_calculation):
+    """Test the default policy keeps the ``remote_folder`` output of a relaxation for a later bands workflow."""
+    relax = orm.WorkflowNode()
+    relax.set_process_state('finished')
+    relax.set_exit_status(0)
+    relax.store()
+    intermediate = generate_calculation(relax, 'intermediate')
+    last = generate_calculation(relax, 'last')
+    last.base.links.add_incoming(relax, LinkType.RETURN, 'remote_folder')
+
+    assert cleanup.clean_workdir(relax, {}) == ([intermediate.pk], [])
+    assert intermediate.is_cleaned
+    assert not last.is_cleaned
+    assert not last.is_empty
+
+    bands = orm.WorkflowNode()
+    bands.base.links.add_incoming(last, LinkType.INPUT_WORK, 'parent_folder')
+    bands.store()
+
+    assert bands.base.links.get_incoming().get_node_by_label('parent_folder').pk == last.pk
+
+
+def test_get_remote_folders_nested(generate_calculation):
+    """Test the default policy only keeps the remote folders returned by the workflow itself and not by its children.
+
+    The final remote folder of a relaxation is returned by the base and relax workflows, but it should still be cleaned
+    by the cleanup of the equation of state workflow that called the relaxation.
+    """
+    eos = orm.WorkflowNode()
+    eos.set_process_state('finished')
+    eos.set_exit_status(0)
+    eos.store()
+
+    relax = orm.WorkflowNode()
+    relax.set_process_state('finished')
+    relax.base.links.add_incoming(eos, LinkType.CALL_WORK, 'CALL')
+    relax.store()
+
+    base = orm.WorkflowNode()
+    base.set_process_state('finished')
+    base.base.links.add_incoming(relax, LinkType.CALL_WORK, 'CALL')
+    base.store()
+
+    intermediate = generate_calculation(base, 'intermediate')
+    last = generate_calculation(base, 'last')
+    last.base.links.add_incoming(base, LinkType.RETURN, 'remote_folder')
+    last.base.links.add_incoming(relax, LinkType.RETURN, 'remote_folder')
+
+    assert cleanup.get_remote_folders(relax) == [intermediate]
+    assert cleanup.get_remote_folders(eos) == [intermediate, last]
+
+    assert cleanup.clean_workdir(eos, {}) == ([intermediate.pk, last.pk], [])
+    assert last.is_cleaned
@@ -0,0 +1,101 @@
+"""Tests for the :mod:`aiida_common_workflows.common.comparison` module."""
+import uuid
+
+import numpy
+import pytest
+from aiida import orm
+from aiida_common_workflows.common import comparison
+
+
+def test_metrics_identical():
+    """Test that all metrics vanish for identical equations of state."""
+    params = [numpy.array([20.0, 10.0]), numpy.array([0.5, 1.0]), numpy.array([4.5, 5.0])]
+
+    assert numpy.allclose(comparison.calculate_delta(params, params), 0)
+    assert numpy.allclose(comparison.calculate_nu(params, params), 0)
+    assert numpy.allclose(comparison.calculate_epsilon(params, params), 0)
+
+
+def test_metrics():
+    """Test the metrics for equations of state that differ in a single parameter."""
+    params_a = [numpy.array([20.0]), numpy.array([0.5]), numpy.array([4.5])]
+    params_b = [numpy.array([20.2]), numpy.array([0.5]), numpy.array([4.5])]
+
+    assert numpy.allclose(comparison.calculate_nu(params_a, params_b), 100 * 0.2 / 20.1)
+    assert comparison.calculate_delta(params_a, params_b)[0] > 0
+    assert comparison.calculate_delta(params_a, params_b) == pytest.approx(
+        comparison.calculate_delta(params_b, params_a)
+    )
+    assert comparison.calculate_epsilon(params_a, params_b)[0] > 0
+
+
+def test_get_eos_fits(generate_eos_node_birch_murnaghan, monkeypatch):
+    """Test that the fits are computed correctly and cached in the extras."""
+    node = generate_eos_node_birch_murnaghan(volume=18.0, bulk_modulus=0.6, bulk_deriv=4.2)
+
+    fit = comparison.get_eos_fits([node])[node.pk]
+    assert fit['formula'] == 'Si2'
+    assert fit['number_of_atoms'] == 2
+    assert (fit['V0'], fit['B0'], fit['B1']) == pytest.approx((18.0, 0.6, 4.2), rel=1e-4)
+    assert node.base.extras.get(comparison.FIT_EXTRA_KEY)['version'] == comparison.FIT_VERSION
+
+    def _fit_workflows(*_):
+        raise AssertionError('the cached fit should have been used.')
+
+    monkeypatch.setattr(comparison, '_fit_workflows', _fit_workflows)
+    cached = comparison.get_eos_fits([node.pk])[node.pk]
+    assert cached.keys() == fit.keys()
+    assert [cached[key] for key in ('E0', 'V0', 'B0', 'B1')] == pytest.approx(
+        [fit[key] for key in ('E0', 'V0', 'B0', 'B1')]
+    )
+
+
+def test_compare_eos(generate_eos_node_birch_murnaghan, generate_structure):
+    """Test the ``compare_eos`` function."""
+    structures = [generate_structure(symbols=('Al',)).store(), generate_structure(symbols=('Si', 'Si')).store()]
+    groups = [orm.Group(f'eos-{uuid.uuid4()}').store() for _ in range(2)]
+
+    groups[0].add_nodes([generate_eos_node_birch_murnaghan(structure) for structure in structures])
+    groups[1].add_nodes([generate_eos_node_birch_murnaghan(structures[1], volume=20.2)])
+
+    columns = comparison.compare_eos(*groups)
+    assert columns['formula'].tolist() == ['Si2']
+    assert columns['V0_rel'] == pytest.approx(-0.2 / 20.1, rel=1e-3)
+    assert columns['B0_rel'] == pytest.approx(0, abs=1e-4)
+    assert columns['nu'] == pytest.approx(100 * 0.2 / 20.1, rel=1e-2)
+
+
+@pytest.mark.parametrize(('process_state', 'exit_status'), (('running', None), ('finished', 300)))
+def test_get_eos_fits_unsuccessful(generate_eos_node_birch_murnaghan, process_state, exit_status):
+    """Test that workflows that are running or failed are neither fitted nor cached."""
+    from plumpy.process_states import ProcessState
+
+    node = generate_eos_node_birch_murnaghan()
+    node.set_process_state(ProcessState(process_state))
+    node.set_exit_status(exit_status)
+
+    assert 'error' in comparison.get_eos_fits([node])[node.pk]
+    assert comparison.FIT_EXTRA_KEY not in node.base.extras.keys()
+
+    node.set_process_state(ProcessState.FINISHED)
+    node.set_exit_status(0)
+    assert 'error' not in comparison.get_eos_fits([node])[node.pk]
+
+
+def test_get_eos_fits_error_not_cached(generate_eos_node_birch_murnaghan, monkeypatch):
+    """Test that the error of a failed fit is not cached in the extras, such that it is retried on the next call."""
+    from aiida_common_workflows.common import export
+
+    node = generate_eos_node_birch_murnaghan()
+    get_eos_data = export.get_eos_data
+
+    def get_eos_data_truncated(pks):
+        return {key: values[:3] for key, values in get_eos_data(pks).items()}
+
+    monkeypatch.setattr(export, 'get_eos_data', get_eos_data_truncated)
+    assert 'at least 4 points' in comparison.get_eos_fits([node])[node.pk]['error']
+    assert comparison.FIT_EXTRA_KEY not in node.base.extras.keys()
+
+    monkeypatch.setattr(export, 'get_eos_data', get_eos_data)
+    assert 'error' not in comparison.get_eos_fits([node])[node.pk]
+    assert comparison.FIT_EXTRA_KEY in node.base.extras.keys()
@@ -0,0 +1,95 @@
+"""Tests for the :mod:`aiida_common_workflows.common.export` module."""
+import csv
+import uuid
+
+import numpy
+import pytest
+from aiida import orm
+from aiida_common_workflows.common import export
+
+
+def test_get_eos_data(generate_eos_node):
+    """Test the ``get_eos_data`` function."""
+    nodes = [generate_eos_node(), generate_eos_node(include_magnetization=False)]
+    columns = export.get_eos_data(nodes)
+
+    assert list(columns) == ['workflow', 'index', 'volume', 'energy', 'magnetization']
+    assert columns['workflow'].tolist() == [nodes[0].pk] * 5 + [nodes[1].pk] * 5
+    assert columns['index'].tolist() == list(range(5)) * 2
+    assert columns['energy'].tolist() == [float(index) for index in range(5)] * 2
+    assert numpy.isnan(columns['magnetization'][5:]).all()
+
+    volume = nodes[0].outputs.structures['0'].get_cell_volume()
+    assert numpy.allclose(columns['volume'], volume)
+
+
+def test_get_eos_data_group(generate_eos_node, generate_dissociation_curve_node):
+    """Test the ``get_eos_data`` function for a group, which should ignore workflows of another type."""
+    nodes = [generate_eos_node(), generate_eos_node(include_energy=False), generate_dissociation_curve_node()]
+    group = orm.Group(label=f'eos-{uuid.uuid4()}').store()
+    group.add_nodes(nodes)
+
+    columns = export.get_eos_data(group)
+    assert columns['workflow'].tolist() == [nodes[0].pk] * 5
+
+
+def test_get_eos_data_invalid(generate_dissociation_curve_node):
+    """Test that the ``get_eos_data`` function raises for workflows of another type."""
+    node = generate_dissociation_curve_node()
+
+    with pytest.raises(ValueError, match=rf'the workflows with pks \[{node.pk}\] do not have the process type'):
+        export.get_eos_data([node.pk])
+
+
+def test_get_dissociation_curve_data(generate_dissociation_curve_node):
+    """Test the ``get_dissociation_curve_data`` function."""
+    node = generate_dissociation_curve_node()
+    columns = export.get_dissociation_curve_data([node])
+
+    assert list(columns) == ['workflow', 'index', 'distance', 'energy', 'magnetization']
+    assert columns['distance'].tolist() == [index / 10 for index in range(5)]
+    assert columns['magnetization'].tolist() == [float(index) for index in range(5)]
+
+
+@pytest.mark.parametrize('file_format', ('csv', 'npz'))
+def test_write_columns(tmp_path, file_format):
+    """Test the ``write_columns`` function."""
+    columns = {'workflow': numpy.array([1, 1]), 'energy': numpy.array([0.5, numpy.nan])}
+    filepath = tmp_path / f'export.{file_format}'
+    export.write_columns(columns, filepath)
+
+    if file_format == 'csv':
+        with filepath.open() as handle:
+            assert list(csv.reader(handle)) == [['workflow', 'energy'], ['1', '0.5'], ['1', 'nan']]
+    else:
+        data = numpy.load(filepath)
+        assert data['workflow'].tolist() == [1, 1]
+        assert numpy.isnan(data['energy'][1])
+
+
+def test_write_columns_invalid_format(tmp_path):
+    """Test that the ``write_columns`` function raises for an unsupported format."""
+    with pytest.raises(ValueError, match=r'unsupported file format `txt`'):
+        export.write_columns({}, tmp_path / 'export.txt')
+
+
+def test_query_call_tree():
+    """Test ``_query_call_tree`` returns the workflows and the processes they called with their callers."""
+    from aiida.common import LinkType
+
+    workflow = orm.WorkflowNode(process_type='aiida.workflows:common_workflows.eos').store()
+    relax = orm.WorkflowNode(process_type='aiida.workflows:common_workflows.relax.gaussian')
+    relax.base.links.add_incoming(workflow, link_type=LinkType.CALL_WORK, link_label='relax')
+    relax.store()
+    calculation = orm.CalcFunctionNode()
+    calculation.base.links.add_incoming(relax, link_type=LinkType.CALL_CALC, link_label='convert')
+    calculation.store()
+
+    tree = export._query_call_tree([workflow], ['process_type'])
+    assert tree == {
+        workflow.pk: (None, ['aiida.workflows:common_workflows.eos']),
+        relax.pk: (workflow.pk, ['aiida.workflows:common_workflows.relax.gaussian']),
+        calculation.pk: (relax.pk, [None]),
+    }
+    assert list(tree) == [workflow.pk, relax.pk, calculation.pk]
+    assert export._query_call_tree([], ['process_type']) == {}
@@ -0,0 +1,175 @@
+"""Tests for the :mod:`aiida_common_workflows.common.farm` module."""
+import subprocess
+import time
+
+import pytest
+from aiida.schedulers import SchedulerError
+from aiida.schedulers.datastructures import JobState, JobTemplate
+from aiida.transports.plugins.local import LocalTransport
+from aiida_common_workflows.common.farm import FarmScheduler, get_worker_script
+
+
+@pytest.fixture
+def scheduler(tmp_path, monkeypatch):
+    """Return a ``FarmScheduler`` with a local transport whose task farm is in a temporary directory."""
+    monkeypatch.setenv('ACWF_FARM_DIRECTORY', str(tmp_path / 'farm'))
+    scheduler = FarmScheduler()
+    scheduler.set_transport(LocalTransport())
+    return scheduler
+
+
+def generate_submit_script(scheduler, directory, command, num_mpiprocs=1, max_wallclock_seconds=60):
+    """Write a submit script for the ``FarmScheduler`` running the given command to the given directory."""
+    job_tmpl = JobTemplate()
+    job_tmpl.job_resource = scheduler.create_job_resource(num_machines=1, num_mpiprocs_per_machine=num_mpiprocs)
+    job_tmpl.max_wallclock_seconds = max_wallclock_seconds
+    job_tmpl.import_sys_environment = True
+
+    directory.mkdir()
+    (directory / 'aiida.sh').write_text(f'#!/bin/bash\n{scheduler._get_submit_script_header(job_tmpl)}\n{command}\n')
+
+
+def wait_for(condition, timeout=30):
+    """Wait until the condition is satisfied and return whether it was satisfied before the timeout."""
+    start = time.time()
+
+    while time.time() - start < timeout:
+        if condition():
+            return True
+        time.sleep(0.2)
+
+    return False
+
+
+@pytest.mark.parametrize(
+    'kwargs, message',
+    (
+        ({'slots': 0}, r'the number of slots should be a positive integer.'),
+        ({'slots': 1, 'lifetime': -1}, r'the idle timeout and lifetime should be non-negative'),
+        ({'slots': 1, 'poll_interval': 0}, r'the idle timeout and lifetime should be non-negative'),
+        ({'slots': 1, 'idle_timeout': 2, 'poll_interval': 5}, r'should not be shorter than the poll interval.'),
+    ),
+)
+def test_get_worker_script_invalid(kwargs, message):
+    """Test ``get_worker_script`` validates its arguments."""
+    with pytest.raises(ValueError, match=message):
+        get_worker_script(**kwargs)
+
+
+def test_get_worker_script():
+    """Test ``get_worker_script`` returns a valid bash script with the given settings."""
+    script = get_worker_script(slots=8, idle_timeout=60, lifetime=3600, poll_interval=10)
+
+    assert script.startswith('#!/bin/bash\n')
+    assert 'slots=8\n' in script
+    assert 'idle_timeout=60\n' in script
+    assert 'lifetime=3600\n' in script
+    assert 'sleep 10\n' in script
+    assert subprocess.run(['bash', '-n'], input=script, text=True, check=False).returncode == 0
+
+
+def test_submit_script_header(scheduler):
+    """Test the header of the submit script declares the slots and wallclock time of the job."""
+    job_tmpl = JobTemplate()
+    job_tmpl.job_resource = scheduler.create_job_resource(num_machines=1, num_mpiprocs_per_machine=4)
+    job_tmpl.max_wallclock_seconds = 1800
+
+    lines = scheduler._get_submit_script_header(job_tmpl).splitlines()
+    assert lines[:2] == ['#FARM slots=4', '#FARM walltime=1800']
+
+
+def test_parse_output(scheduler):
+    """Test the parsing of the output of the commands of the ``FarmScheduler``."""
+    assert scheduler._parse_submit_output(0, '123-4\n', '') == '123-4'
+
+    with pytest.raises(SchedulerError, match=r'failed to add the job to the task farm'):
+        scheduler._parse_submit_output(1, '', 'Permission denied')
+
+    jobs = scheduler._parse_joblist_output(0, '1-2 Q\n3-4 R\n\n', '')
+    assert [(job.job_id, job.job_state) for job in jobs] == [('1-2', JobState.QUEUED), ('3-4', JobState.RUNNING)]
+
+    with pytest.raises(SchedulerError, match=r'failed to list the jobs of the task farm'):
+        scheduler._parse_joblist_output(1, '', '')
+
+
+def test_task_farm(scheduler, tmp_path):
+    """Test jobs submitted to the task farm are run by a worker, side by side as long as it has free slots."""
+    for name, num_mpiprocs in (('first', 2), ('second', 1), ('third', 1)):
+        command = f'touch started; while [ ! -e {tmp_path}/release ]; do sleep 0.1; done; echo {name} > result'
+        generate_submit_script(scheduler, tmp_path / name, command, num_mpiprocs)
+
+    with scheduler.transport:
+        job_ids = [scheduler.submit_job(str(tmp_path / name), 'aiida.sh') for name in ('first', 'second', 'third')]
+
+    assert {job_id: job.job_state for job_id, job in scheduler.get_jobs(as_dict=True).items()} == dict.fromkeys(
+        job_ids, JobState.QUEUED
+    )
+
+    script = get_worker_script(slots=3, idle_timeout=1, poll_interval=1)
+    worker = subprocess.Popen(['bash', '-c', script])
+
+    try:
+        assert wait_for(
+            lambda: (tmp_path / 'first' / 'started').exists() and (tmp_path / 'second' / 'started').exists()
+        )
+        jobs = scheduler.get_jobs(as_dict=True)
+        assert [jobs[job_id].job_state for job_id in job_ids] == [JobState.RUNNING, JobState.RUNNING, JobState.QUEUED]
+
+        (tmp_path / 'release').touch()
+        assert wait_for(lambda: not scheduler.get_jobs())
+        assert worker.wait(timeout=30) == 0
+    finally:
+        worker.kill()
+
+    for name in ('first', 'second', 'third'):
+        assert (tmp_path / name / 'result').read_text().strip() == name
+
+
+def test_task_farm_oversized(scheduler, tmp_path):
+    """Test a job that needs more slots than the worker has is skipped and left in the queue for a larger worker."""
+    for name, num_mpiprocs in (('large', 4), ('small', 1)):
+        generate_submit_script(scheduler, tmp_path / name, f'echo {name} > result', num_mpiprocs)
+
+    with scheduler.transport:
+        large, small = (scheduler.submit_job(str(tmp_path / name), 'aiida.sh') for name in ('large', 'small'))
+
+    worker = subprocess.Popen(['bash', '-c', get_worker_script(slots=2, idle_timeout=1, poll_interval=1)])
+
+    try:
+        assert worker.wait(timeout=30) == 0
+    finally:
+        worker.kill()
+
+    assert (tmp_path / 'small' / 'result').read_text().strip() == 'small'
+    assert not (tmp_path / 'large' / 'result').exists()
+    assert {job_id: job.job_state for job_id, job in scheduler.get_jobs(as_dict=True).items()} == {
+        large: JobState.QUEUED
+    }
+
+
+def test_kill_job(scheduler, tmp_path):
+    """Test killing a job removes it from the queue or, if it is running, stops it."""
+    for name in ('running', 'queued'):
+        generate_submit_script(scheduler, tmp_path / name, 'touch started; sleep 60; touch finished')
+
+    with scheduler.transport:
+        running = scheduler.submit_job(str(tmp_path / 'running'), 'aiida.sh')
+        queued = scheduler.submit_job(str(tmp_path / 'queued'), 'aiida.sh')
+
+    script = get_worker_script(slots=1, idle_timeout=1, poll_interval=1)
+    worker = subprocess.Popen(['bash', '-c', script])
+
+    try:
+        assert wait_for(lambda: (tmp_path / 'running' / 'started').exists())
+
+        with scheduler.transport:
+            assert scheduler.kill_job(queued)
+            assert scheduler.kill_job(running)
+
+        assert wait_for(lambda: not scheduler.get_jobs())
+        assert worker.wait(timeout=30) == 0
+    finally:
+        worker.kill()
+
+    assert not (tmp_path / 'running' / 'finished').exists()
+    assert not (tmp_path / 'queued' / 'started').exists()
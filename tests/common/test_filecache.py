@@ -0,0 +1,59 @@
+"""Tests for the :mod:`aiida_common_workflows.common.filecache` module."""
+import hashlib
+import io
+
+from aiida import orm
+from aiida.transports.plugins.local import LocalTransport
+from aiida_common_workflows.common import filecache
+
+
+def test_get_cached_path():
+    """Test the ``get_cached_path`` function returns a path that is addressed by the content of the file."""
+    node = orm.SinglefileData(io.BytesIO(b'content'), filename='BASIS')
+    digest = hashlib.sha256(b'content').hexdigest()
+
+    assert filecache.get_file_hash(node) == digest
+    assert filecache.get_cached_path('/scratch/cache/', node) == f'/scratch/cache/{digest}/BASIS'
+
+
+def test_get_cached_paths():
+    """Test the ``get_cached_paths`` function maps the filenames onto their paths in the cache."""
+    nodes = [
+        orm.SinglefileData(io.BytesIO(b'basis'), filename='BASIS'),
+        orm.SinglefileData(io.BytesIO(b'potential'), filename='POTENTIAL'),
+    ]
+    assert filecache.get_cached_paths('/scratch/cache', nodes) == {
+        node.filename: filecache.get_cached_path('/scratch/cache', node) for node in nodes
+    }
+
+
+def test_get_symlink_commands():
+    """Test the ``get_symlink_commands`` function."""
+    paths = {'POTENTIAL': '/cache/b/POTENTIAL', 'BASIS SET': '/cache/a/BASIS SET'}
+    assert filecache.get_symlink_commands(paths) == (
+        "ln -sf '/cache/a/BASIS SET' 'BASIS SET'\nln -sf /cache/b/POTENTIAL POTENTIAL"
+    )
+
+
+def test_upload_files(aiida_localhost, tmp_path, monkeypatch):
+    """Test the ``upload_files`` function only uploads the files that are not yet cached."""
+    nodes = [
+        orm.SinglefileData(io.BytesIO(b'basis'), filename='BASIS'),
+        orm.SinglefileData(io.BytesIO(b'potential'), filename='POTENTIAL'),
+    ]
+    paths = filecache.upload_files(aiida_localhost, str(tmp_path), nodes[:1])
+
+    assert paths == {'BASIS': filecache.get_cached_path(str(tmp_path), nodes[0])}
+    assert (tmp_path / filecache.get_file_hash(nodes[0]) / 'BASIS').read_bytes() == b'basis'
+
+    uploaded = []
+    putfile = LocalTransport.putfile
+    monkeypatch.setattr(
+        LocalTransport, 'putfile', lambda self, source, target: uploaded.append(target) or putfile(self, source, target)
+    )
+    paths = filecache.upload_files(aiida_localhost, str(tmp_path), nodes)
+
+    assert list(paths) == ['BASIS', 'POTENTIAL']
+    assert len(uploaded) == 1
+    assert (tmp_path / filecache.get_file_hash(nodes[1]) / 'POTENTIAL').read_bytes() == b'potential'
+    assert not list(tmp_path.glob('*/*.tmp'))
@@ -0,0 +1,118 @@
+"""Tests for the :mod:`aiida_common_workflows.common.footprint` module."""
+import datetime
+import io
+import uuid
+
+import pytest
+from aiida import orm
+from aiida.common import LinkType
+from aiida_common_workflows.common.footprint import get_footprint
+
+
+def add_incoming(node, *links):
+    """Add the incoming links to the node, each specified as a tuple of the source, the link type and the label."""
+    for source, link_type, label in links:
+        node.base.links.add_incoming(source, link_type=link_type, link_label=label)
+    return node.store()
+
+
+@pytest.fixture
+def generate_workflow(aiida_localhost):
+    """Return a factory for the provenance graph of an equation of state workflow with a single point.
+
+    The graph contains one node of the ``generator`` origin, four of the ``orchestration`` origin, two of the
+    ``conversion`` origin and three of the ``calculation`` origin, with 2, 12, 1 and 4 links, respectively. The
+    ``retrieved`` folder contains 7 bytes and the calculation job has a single log record.
+    """
+
+    def _generate_workflow():
+        code = orm.Data().store()
+        structure = orm.StructureData(cell=[[1, 0, 0], [0, 1, 0], [0, 0, 1]]).store()
+
+        workflow = orm.WorkflowNode(process_type='aiida.workflows:common_workflows.eos')
+        workflow = add_incoming(workflow, (structure, LinkType.INPUT_WORK, 'structure'))
+
+        scale = orm.CalcFunctionNode(process_type='aiida.calculations:scale_structure')
+        scale = add_incoming(
+            scale, (workflow, LinkType.CALL_CALC, 'scale'), (structure, LinkType.INPUT_CALC, 'structure')
+        )
+        scaled = add_incoming(
+            orm.StructureData(cell=[[2, 0, 0], [0, 2, 0], [0, 0, 2]]), (scale, LinkType.CREATE, 'result')
+        )
+
+        parameters = orm.Dict({'generated': True}).store()
+        relax = orm.WorkflowNode(process_type='aiida.workflows:common_workflows.relax.gaussian')
+        relax = add_incoming(
+            relax,
+            (workflow, LinkType.CALL_WORK, 'relax'),
+            (scaled, LinkType.INPUT_WORK, 'structure'),
+            (parameters, LinkType.INPUT_WORK, 'parameters'),
+            (code, LinkType.INPUT_WORK, 'code'),
+        )
+
+        calcjob = orm.CalcJobNode(computer=aiida_localhost)
+        calcjob = add_incoming(
+            calcjob,
+            (relax, LinkType.CALL_CALC, 'calcjob'),
+            (scaled, LinkType.INPUT_CALC, 'structure'),
+            (parameters, LinkType.INPUT_CALC, 'parameters'),
+            (code, LinkType.INPUT_CALC, 'code'),
+        )
+        retrieved = orm.FolderData()
+        retrieved.base.repository.put_object_from_filelike(io.BytesIO(b'content'), 'aiida.out')
+        add_incoming(retrieved, (calcjob, LinkType.CREATE, 'retrieved'))
+        output_parameters = add_incoming(orm.Dict({'energy': 1.0}), (calcjob, LinkType.CREATE, 'output_parameters'))
+        orm.Log(datetime.datetime.now(datetime.timezone.utc), 'logger', 'WARNING', calcjob.pk, 'message').store()
+
+        conversion = orm.CalcFunctionNode(process_type='aiida.calculations:get_total_energy')
+        conversion = add_incoming(
+            conversion,
+            (relax, LinkType.CALL_CALC, 'get_total_energy'),
+            (output_parameters, LinkType.INPUT_CALC, 'parameters'),
+        )
+        energy = add_incoming(orm.Float(1.0), (conversion, LinkType.CREATE, 'result'))
+        energy.base.links.add_incoming(relax, link_type=LinkType.RETURN, link_label='total_energy')
+        energy.base.links.add_incoming(workflow, link_type=LinkType.RETURN, link_label='total_energies__0')
+
+        # A subsequent use of the outputs of the workflow is not part of its footprint.
+        add_incoming(orm.WorkflowNode(), (energy, LinkType.INPUT_WORK, 'energy'))
+
+        return workflow
+
+    return _generate_workflow
+
+
+def test_get_footprint(generate_workflow):
+    """Test the ``get_footprint`` function."""
+    workflow = generate_workflow()
+
+    assert get_footprint([workflow.pk]) == {
+        workflow.pk: {
+            'generator': {'nodes': 1, 'links': 2, 'repository_bytes': 0, 'logs': 0},
+            'orchestration': {'nodes': 4, 'links': 12, 'repository_bytes': 0, 'logs': 0},
+            'conversion': {'nodes': 2, 'links': 1, 'repository_bytes': 0, 'logs': 0},
+            'calculation': {'nodes': 3, 'links': 4, 'repository_bytes': 7, 'logs': 1},
+        }
+    }
+
+
+def test_get_footprint_group(generate_workflow):
+    """Test the ``get_footprint`` function for a group of workflows."""
+    workflows = [generate_workflow(), generate_workflow()]
+    group = orm.Group(f'footprint-{uuid.uuid4()}').store()
+    group.add_nodes(workflows)
+
+    footprint = get_footprint(group)
+
+    assert set(footprint) == {workflow.pk for workflow in workflows}
+    assert footprint[workflows[0].pk] == footprint[workflows[1].pk]
+
+
+def test_get_footprint_empty():
+    """Test the ``get_footprint`` function for a workflow without any sub processes."""
+    workflow = orm.WorkflowNode().store()
+    footprint = get_footprint([workflow])
+
+    assert footprint[workflow.pk]['orchestration'] == {'nodes': 1, 'links': 0, 'repository_bytes': 0, 'logs': 0}
+    assert all(metrics['nodes'] == 0 for origin, metrics in footprint[workflow.pk].items() if origin != 'orchestration')
+    assert get_footprint([]) == {}
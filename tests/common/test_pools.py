@@ -0,0 +1,118 @@
+"""Tests for the :mod:`aiida_common_workflows.common.pools` module."""
+import uuid
+
+import pytest
+from aiida import orm
+from aiida.schedulers.datastructures import JobState
+from aiida_common_workflows.common.pools import (
+    balance_engines,
+    get_queue_depths,
+    get_resource_models,
+    validate_engine_pools,
+)
+
+
+@pytest.fixture
+def generate_pool_code():
+    """Return a factory for a stored code of the given plugin on a new computer."""
+
+    def _generate_pool_code(entry_point='quantumespresso.pw'):
+        computer = orm.Computer(
+            label=str(uuid.uuid4()), hostname='localhost', transport_type='core.local', scheduler_type='core.direct'
+        ).store()
+        return orm.InstalledCode(
+            label='code', default_calc_job_plugin=entry_point, computer=computer, filepath_executable='/bin/bash'
+        ).store()
+
+    return _generate_pool_code
+
+
+def test_validate_engine_pools(generate_pool_code):
+    """Test the ``validate_engine_pools`` function."""
+    first, second = generate_pool_code(), generate_pool_code()
+    engines = {'relax': {'code': first.full_label, 'options': {}}}
+    pool = [{'code': first}, {'code': second.full_label, 'weight': 2, 'options': {'queue_name': 'debug'}}]
+
+    assert validate_engine_pools({'relax': pool}, engines) is None
+    assert "pools for engines that are not in `generator_inputs.engines`: {'scf'}" in validate_engine_pools(
+        {'scf': pool}, engines
+    )
+    assert validate_engine_pools({'relax': []}, engines) == 'the pool of engine `relax` should be a non-empty list.'
+    assert 'should be a dictionary that defines the `code`.' in validate_engine_pools({'relax': [{}]}, engines)
+    assert 'could not be loaded' in validate_engine_pools({'relax': [{'code': str(uuid.uuid4())}]}, engines)
+    assert 'is not a `quantumespresso.pw` code.' in validate_engine_pools(
+        {'relax': [{'code': generate_pool_code('gaussian')}]}, engines
+    )
+    assert 'should be positive.' in validate_engine_pools({'relax': [{'code': second, 'weight': 0}]}, engines)
+    assert 'should be a dictionary.' in validate_engine_pools({'relax': [{'code': second, 'options': 1}]}, engines)
+
+
+def test_get_queue_depths(generate_pool_code):
+    """Test ``get_queue_depths`` counts the active calculation jobs that are not running on each computer."""
+    busy, idle = generate_pool_code(), generate_pool_code()
+
+    for process_state, scheduler_state in (
+        ('created', None),
+        ('waiting', JobState.QUEUED),
+        ('waiting', JobState.RUNNING),
+        ('finished', JobState.DONE),
+    ):
+        node = orm.CalcJobNode(computer=busy.computer)
+        node.set_process_state(process_state)
+        if scheduler_state is not None:
+            node.set_scheduler_state(scheduler_state)
+        node.store()
+
+    pools = {'relax': [{'code': busy}, {'code': idle.full_label}]}
+    assert get_queue_depths(pools) == {busy.computer.pk: 2, idle.computer.pk: 0}
+
+
+def test_balance_engines(generate_pool_code):
+    """Test ``balance_engines`` spreads the sub processes across the pool according to the weights."""
+    first, second = generate_pool_code(), generate_pool_code()
+    engines = {'relax': {'code': first, 'options': {'resources': {'num_machines': 1}, 'queue_name': 'default'}}}
+    pools = {'relax': [{'code': first}, {'code': second, 'weight': 2, 'options': {'queue_name': 'debug'}}]}
+    assignments = {}
+
+    selected = [balance_engines(engines, pools, assignments)['relax'] for _ in range(6)]
+
+    assert [engine['code'].pk for engine in selected] == [
+        second.pk,
+        first.pk,
+        second.pk,
+        second.pk,
+        first.pk,
+        second.pk,
+    ]
+    assert assignments == {'relax': [2, 4]}
+    assert selected[0]['options'] == {'resources': {'num_machines': 1}, 'queue_name': 'debug'}
+    assert selected[1]['options'] == engines['relax']['options']
+    assert engines['relax']['code'] is first
+
+
+def test_balance_engines_queue_depths(generate_pool_code):
+    """Test ``balance_engines`` assigns fewer sub processes to the members whose computer has a deeper queue."""
+    first, second = generate_pool_code(), generate_pool_code()
+    engines = {'relax': {'code': first}}
+    pools = {'relax': [{'code': first}, {'code': second}]}
+    queue_depths = {first.computer.pk: 0, second.computer.pk: 3}
+    assignments = {}
+
+    selected = [balance_engines(engines, pools, assignments, queue_depths)['relax']['code'] for _ in range(5)]
+
+    assert [code.pk for code in selected] == [first.pk, first.pk, first.pk, first.pk, second.pk]
+
+
+def test_get_resource_models(generate_pool_code):
+    """Test ``get_resource_models`` uses the ``cores_per_machine`` of the computer of the selected member."""
+    default, member, undefined = generate_pool_code(), generate_pool_code(), generate_pool_code()
+    member.computer.set_default_mpiprocs_per_machine(16)
+    resource_models = {'relax': {'model': {}, 'cores_per_machine': 4}, 'scf': {'model': {}, 'cores_per_machine': 4}}
+    engines = {'relax': {'code': member}, 'scf': {'code': default}}
+
+    updated = get_resource_models(resource_models, engines, {'relax': [{'code': default}, {'code': member}]})
+    assert updated == {'relax': {'model': {}, 'cores_per_machine': 16}, 'scf': {'model': {}, 'cores_per_machine': 4}}
+    assert resource_models['relax']['cores_per_machine'] == 4
+
+    engines = {'relax': {'code': undefined.uuid}, 'scf': {'code': default}}
+    assert get_resource_models(resource_models, engines, {'relax': [{'code': undefined}]}) == resource_models
@@ -0,0 +1,211 @@
+"""Tests for the :mod:`aiida_common_workflows.common.resources` module."""
+import math
+import uuid
+
+import numpy
+import pytest
+from aiida import orm
+from aiida.common import LinkType
+from aiida.schedulers.datastructures import JobInfo
+from aiida_common_workflows.common import resources
+from aiida_common_workflows.common.resources import ResourceModel, get_features, size_engines
+
+
+@pytest.fixture
+def generate_calcjob(aiida_localhost, generate_structure):
+    """Return a factory for a stored ``CalcJobNode`` of the given plugin with a structure of hydrogen atoms."""
+
+    def _generate_calcjob(entry_point, atoms, wallclock, exit_status=0, mesh=None, cutoff=None):  # noqa: PLR0913
+        node = orm.CalcJobNode(computer=aiida_localhost, process_type=f'aiida.calculations:{entry_point}')
+        node.set_option('resources', {'num_machines': 1, 'num_mpiprocs_per_machine': 2})
+        node.set_exit_status(exit_status)
+
+        if wallclock is not None:
+            job_info = JobInfo()
+            job_info.wallclock_time_seconds = wallclock
+            node.set_last_job_info(job_info)
+
+        structure = generate_structure(symbols=['H'] * atoms).store()
+        node.base.links.add_incoming(structure, link_type=LinkType.INPUT_CALC, link_label='structure')
+
+        if mesh is not None:
+            kpoints = orm.KpointsData()
+            kpoints.set_kpoints_mesh(mesh)
+            node.base.links.add_incoming(kpoints.store(), link_type=LinkType.INPUT_CALC, link_label='kpoints')
+
+        if cutoff is not None:
+            parameters = orm.Dict({'SYSTEM': {'ecutwfc': cutoff}}).store()
+            node.base.links.add_incoming(parameters, link_type=LinkType.INPUT_CALC, link_label='parameters')
+
+        return node.store()
+
+    return _generate_calcjob
+
+
+def test_get_features(generate_structure):
+    """Test the ``get_features`` function."""
+    structure = generate_structure(symbols=['Si', 'O'])
+    structure.set_cell([[2, 0, 0], [0, 2, 0], [0, 0, 2]])
+
+    kpoints = orm.KpointsData()
+    kpoints.set_kpoints_mesh([2, 2, 3])
+
+    features = get_features(structure, kpoints, 30.0)
+    assert features == {'atoms': 2, 'electrons': 22, 'volume': pytest.approx(8), 'kpoints': 12, 'cutoff': 30.0}
+
+    kpoints = orm.KpointsData()
+    kpoints.set_kpoints([[0.0, 0.0, 0.0]] * 5)
+    assert get_features(structure, kpoints)['kpoints'] == 5
+    assert get_features(structure)['kpoints'] is None
+
+
+def test_fit():
+    """Test ``ResourceModel.fit`` recovers a power law and ignores features that are constant or undefined."""
+    samples = [
+        ({'atoms': atoms, 'volume': volume, 'cutoff': 30, 'kpoints': None}, 3 * atoms**2 * volume)
+        for atoms, volume in ((1, 10), (2, 15), (4, 20), (8, 60), (16, 100), (32, 120))
+    ]
+    model = ResourceModel.fit(samples)
+
+    assert model.features == ('atoms', 'volume')
+    assert model.coefficients == pytest.approx((math.log(3), 2, 1))
+    assert model.sigma == pytest.approx(0, abs=1e-6)
+    assert model.samples == 6
+
+
+def test_fit_too_few_samples():
+    """Test ``ResourceModel.fit`` raises if there are not enough samples with a positive cost."""
+    samples = [({'atoms': atoms}, 10 * atoms) for atoms in range(1, resources.MINIMUM_SAMPLES)]
+
+    with pytest.raises(ValueError, match=r'4 samples are available while at least 5 are required.'):
+        ResourceModel.fit([*samples, ({'atoms': 10}, 0)])
+
+
+def test_serialize():
+    """Test the serialization of a ``ResourceModel``."""
+    model = ResourceModel(('atoms', 'volume'), (1.0, 2.0, 0.5), 0.1, 10)
+    serialized = model.serialize()
+
+    assert orm.Dict(serialized).get_dict() == serialized
+    assert ResourceModel.deserialize(serialized).__dict__ == model.__dict__
+
+    with pytest.raises(ValueError, match=r'the number of coefficients should be the number of features plus one.'):
+        ResourceModel(('atoms',), (1.0,), 0.1, 10)
+
+
+def test_estimate_core_seconds():
+    """Test ``ResourceModel.estimate_core_seconds``."""
+    model = ResourceModel(('atoms',), (math.log(100), 1), 0.5, 10)
+
+    assert model.estimate_core_seconds({'atoms': 10}, confidence=0) == pytest.approx(1000)
+    assert model.estimate_core_seconds({'atoms': 10}) == pytest.approx(1000 * math.exp(1))
+
+    with pytest.raises(ValueError, match=r"the features \['atoms'\] of the model are not defined."):
+        model.estimate_core_seconds({'atoms': None})
+
+
+@pytest.mark.parametrize(
+    'atoms, expected',
+    (
+        (1, {'resources': {'num_machines': 1, 'num_mpiprocs_per_machine': 1}, 'max_wallclock_seconds': 600}),
+        (10, {'resources': {'num_machines': 1, 'num_mpiprocs_per_machine': 1}, 'max_wallclock_seconds': 1003}),
+        (
+            100,
+            {
+                'resources': {'num_machines': 1, 'num_mpiprocs_per_machine': 3},
+                'max_wallclock_seconds': 3342,
+                'withmpi': True,
+            },
+        ),
+        (
+            1000,
+            {
+                'resources': {'num_machines': 2, 'num_mpiprocs_per_machine': 16},
+                'max_wallclock_seconds': 3133,
+                'withmpi': True,
+            },
+        ),
+    ),
+)
+def test_get_options(atoms, expected):
+    """Test ``ResourceModel.get_options``."""
+    model = ResourceModel(('atoms',), (math.log(100.25), 1), 0, 10)
+    assert model.get_options({'atoms': atoms}, cores_per_machine=16) == expected
+
+
+def test_calibrate(generate_calcjob):
+    """Test ``ResourceModel.calibrate`` on the calculation jobs in the database."""
+    entry_point = f'test.{uuid.uuid4()}'
+
+    for atoms in (1, 2, 3, 5, 8):
+        generate_calcjob(entry_point, atoms, wallclock=10 * atoms)
+
+    # Calculation jobs that failed or for which the wallclock time was not recorded should be ignored.
+    generate_calcjob(entry_point, 4, wallclock=1000, exit_status=400)
+    generate_calcjob(entry_point, 4, wallclock=None)
+
+    model = ResourceModel.calibrate(entry_point, features=resources.STRUCTURE_FEATURES)
+
+    assert model.samples == 5
+    assert model.estimate_core_seconds({'atoms': 10, 'electrons': 10, 'volume': 1}) == pytest.approx(200)
+
+    with pytest.raises(ValueError, match=r'cannot calibrate the model for `test.unknown`'):
+        ResourceModel.calibrate('test.unknown')
+
+
+def test_calibrate_kpoints_cutoff(generate_calcjob, monkeypatch):
+    """Test ``ResourceModel.calibrate`` uses the number of k-points and the cutoff if they are defined."""
+    entry_point = f'test.{uuid.uuid4()}'
+    monkeypatch.setitem(resources.CUTOFF_KEYS, entry_point, ('SYSTEM', 'ecutwfc'))
+    rng = numpy.random.default_rng(0)
+
+    for _ in range(8):
+        mesh, cutoff = [int(rng.integers(1, 5)), 1, 1], float(rng.integers(20, 60))
+        generate_calcjob(entry_point, 2, wallclock=mesh[0] * cutoff**1.5, mesh=mesh, cutoff=cutoff)
+
+    model = ResourceModel.calibrate(entry_point)
+
+    assert model.features == ('kpoints', 'cutoff')
+    assert model.coefficients == pytest.approx((math.log(2), 1, 1.5))
+
+
+def test_size_engines(generate_structure):
+    """Test the ``size_engines`` function."""
+    model = ResourceModel(('atoms',), (math.log(1000), 1), 0, 10)
+    options = {'resources': {'num_machines': 1, 'num_cores_per_mpiproc': 2}, 'max_wallclock_seconds': 60}
+    engines = {
+        'relax': {'code': 'code@localhost', 'options': {**options, 'queue_name': 'debug'}},
+        'scf': {'code': 'code@localhost', 'options': options},
+    }
+    resource_models = {'relax': {'model': model.serialize(), 'cores_per_machine': 4}}
+
+    sized = size_engines(engines, resource_models, generate_structure(symbols=['H'] * 10))
+
+    assert sized['relax'] == {
+        'code': 'code@localhost',
+        'options': {
+            'resources': {'num_machines': 1, 'num_mpiprocs_per_machine': 3, 'num_cores_per_mpiproc': 2},
+            'max_wallclock_seconds': 3334,
+            'queue_name': 'debug',
+            'withmpi': True,
+        },
+    }
+    assert sized['scf'] == engines['scf']
+    assert engines['relax']['options']['resources'] == {'num_machines': 1, 'num_cores_per_mpiproc': 2}
+    assert size_engines(engines, {}, None) == engines
+
+
+def test_size_engines_replace_resources(generate_structure):
+    """Test the ``size_engines`` function replaces the resources that contradict the estimates."""
+    model = ResourceModel(('atoms',), (math.log(1000), 1), 0, 10)
+    resources = {'num_machines': 4, 'tot_num_mpiprocs': 128, 'num_mpiprocs_per_machine': 32, 'num_cores_per_mpiproc': 2}
+    engines = {'relax': {'code': 'code@localhost', 'options': {'resources': resources}}}
+    resource_models = {'relax': {'model': model.serialize(), 'cores_per_machine': 4}}
+
+    sized = size_engines(engines, resource_models, generate_structure(symbols=['H'] * 10))
+
+    assert sized['relax']['options']['resources'] == {
+        'num_machines': 1,
+        'num_mpiprocs_per_machine': 3,
+        'num_cores_per_mpiproc': 2,
+    }
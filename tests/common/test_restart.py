@@ -0,0 +1,78 @@
+"""Tests for the :mod:`aiida_common_workflows.common.restart` module."""
+import pytest
+from aiida import orm
+from aiida.common.links import LinkType
+from aiida_common_workflows.common import restart
+from aiida_common_workflows.workflows.relax.generator import RelaxType
+
+
+@pytest.fixture
+def generate_child():
+    """Return a factory for a stored work chain node called by the given parent that registers the given point."""
+
+    def _generate_child(parent, point_hash=None, exit_status=0):
+        child = orm.WorkflowNode()
+        child.set_process_state('finished')
+        child.set_exit_status(exit_status)
+        child.base.links.add_incoming(parent, LinkType.CALL_WORK, 'CALL')
+        child.store()
+
+        if point_hash is not None:
+            restart.register_point(child, point_hash)
+
+        return child
+
+    return _generate_child
+
+
+def test_hash_point(generate_structure, generate_code):
+    """Test the ``hash_point`` function only depends on the content that defines the sub process."""
+    code = generate_code('quantumespresso.pw').store()
+    generator_inputs = {
+        'protocol': 'fast',
+        'engines': {'relax': {'code': code, 'options': {'resources': {'num_machines': 1}}}},
+        'relax_type': RelaxType.POSITIONS,
+    }
+    reference = orm.WorkflowNode().store()
+
+    def get_hash(**kwargs):
+        arguments = {
+            'sub_process_class': 'common_workflows.relax.quantum_espresso',
+            'structure': generate_structure(symbols=('Si',)).store(),
+            'point': 0.98,
+            'generator_inputs': generator_inputs,
+        }
+        return restart.hash_point(**{**arguments, **kwargs})
+
+    point_hash = get_hash()
+    options = {'resources': {'num_machines': 4}, 'max_wallclock_seconds': 3600}
+
+    assert point_hash == get_hash()
+    assert point_hash == get_hash(generator_inputs={**generator_inputs, 'relax_type': 'positions'})
+    assert point_hash == get_hash(
+        generator_inputs={**generator_inputs, 'engines': {'relax': {'code': code, 'options': options}}}
+    )
+    assert point_hash != get_hash(point=1.02)
+    assert point_hash != get_hash(structure=generate_structure(symbols=('Ge',)).store())
+    assert point_hash != get_hash(generator_inputs={**generator_inputs, 'protocol': 'moderate'})
+    assert point_hash != get_hash(sub_process={'base': {'kpoints_distance': orm.Float(0.1)}})
+    assert point_hash != get_hash(reference_workchain=reference)
+
+
+def test_get_reusable_children(generate_child):
+    """Test the ``get_reusable_children`` function returns the successful children with a point, including reused."""
+    parent = orm.WorkflowNode().store()
+    first = generate_child(parent, 'first')
+    generate_child(parent, 'failed', exit_status=400)
+    generate_child(parent)
+
+    restarted = orm.WorkflowNode().store()
+    restart.register_reused(restarted, first)
+    second = generate_child(restarted, 'second')
+
+    assert restart.get_reusable_children(parent) == {'first': first}
+    assert restart.get_reusable_children(restarted) == {'first': first, 'second': second}
+    assert restarted.base.extras.get(restart.REUSED_EXTRA) == [first.uuid]
+
+    replaced = generate_child(restarted, 'first')
+    assert restart.get_reusable_children(restarted)['first'] == replaced
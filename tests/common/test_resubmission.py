@@ -0,0 +1,116 @@
+"""Tests for the :mod:`aiida_common_workflows.common.resubmission` module."""
+import pytest
+from aiida import orm
+from aiida_common_workflows.common import resubmission
+
+
+@pytest.mark.parametrize(
+    'value, message',
+    (
+        ({}, None),
+        ({'max_resubmissions': 0, 'max_machines': 4}, None),
+        ({'factor': 2}, r'the resubmission policy contains unknown keys'),
+        ({'max_resubmissions': -1}, r'the `max_resubmissions` should be a non-negative integer.'),
+        ({'wallclock_factor': 0.5}, r'the `wallclock_factor` should be a number not smaller than one.'),
+        ({'max_machines': 0}, r'the `max_machines` should be a positive integer.'),
+    ),
+)
+def test_validate_policy(value, message):
+    """Test the ``validate_policy`` function."""
+    result = resubmission.validate_policy(value, None)
+
+    if message is None:
+        assert result is None
+    else:
+        assert message in result
+
+
+@pytest.mark.parametrize(
+    'labels, expected',
+    (
+        ((), None),
+        (('ERROR_INJECTED_FAILURE',), None),
+        (('ERROR_SCHEDULER_OUT_OF_WALLTIME',), 'walltime'),
+        (('ERROR_INJECTED_FAILURE', 'ERROR_SCHEDULER_OUT_OF_MEMORY'), 'memory'),
+        (('ERROR_SCHEDULER_OUT_OF_MEMORY', 'ERROR_INJECTED_FAILURE'), None),
+    ),
+)
+def test_get_resource_failure(generate_failed_workchain, labels, expected):
+    """Test the ``get_resource_failure`` function only considers the last calculation of the failed work chain."""
+    workchain = generate_failed_workchain(*labels)
+    assert resubmission.get_resource_failure(workchain) == expected
+
+
+def test_get_failed_calculation(generate_failed_workchain):
+    """Test the ``get_failed_calculation`` function returns the calculation that was created last."""
+    assert resubmission.get_failed_calculation(generate_failed_workchain()) is None
+
+    workchain = generate_failed_workchain('ERROR_INJECTED_FAILURE', 'ERROR_SCHEDULER_OUT_OF_MEMORY')
+    calculation = max(workchain.called, key=lambda node: node.ctime)
+    assert resubmission.get_failed_calculation(workchain).pk == calculation.pk
+
+
+def test_scale_resources():
+    """Test the ``scale_resources`` function scales the options in ``metadata.options`` and ``Dict`` inputs."""
+    options = {'resources': {'num_machines': 2}, 'max_wallclock_seconds': 600}
+    inputs = {
+        'calc': {'metadata': {'options': options}, 'parameters': orm.Dict({'threshold_forces': 0.05})},
+        'options': orm.Dict(options),
+    }
+    policy = {**resubmission.DEFAULT_POLICY, 'max_wallclock_seconds': 1000}
+
+    scaled, is_scaled = resubmission.scale_resources(inputs, 'walltime', policy)
+    assert is_scaled
+    assert scaled['calc']['metadata']['options']['max_wallclock_seconds'] == 1000
+    assert scaled['options'].get_dict()['max_wallclock_seconds'] == 1000
+    assert scaled['calc']['parameters'] is inputs['calc']['parameters']
+    assert options['max_wallclock_seconds'] == 600
+
+    scaled, is_scaled = resubmission.scale_resources(scaled, 'walltime', policy)
+    assert not is_scaled
+
+    scaled, is_scaled = resubmission.scale_resources(inputs, 'memory', policy)
+    assert is_scaled
+    assert scaled['calc']['metadata']['options']['resources'] == {'num_machines': 4}
+    assert scaled['options'].get_dict()['resources'] == {'num_machines': 4}
+
+    inputs = {'calc': {'metadata': {'options': {'resources': {'tot_num_mpiprocs': 4}}}}}
+    assert resubmission.scale_resources(inputs, 'memory', policy) == (inputs, False)
+    assert resubmission.scale_resources(inputs, 'walltime', policy) == (inputs, False)
+
+
+def test_strip_restore_unstored_nodes():
+    """Test the ``strip_unstored_nodes`` and ``restore_unstored_nodes`` functions are each other's inverse."""
+    from aiida.engine import WorkChain
+
+    class ParentWorkChain(WorkChain):
+        @classmethod
+        def define(cls, spec):
+            super().define(spec)
+            spec.input('parameters', valid_type=orm.Dict)
+            spec.input('settings', valid_type=orm.Dict)
+            spec.input('policy', valid_type=dict, non_db=True)
+
+    stored = orm.Dict({'a': 1}).store()
+    options = {'resources': {'num_machines': 2}}
+    inputs = {
+        'metadata': {'options': options},
+        'parameters': orm.Dict({'b': 2}),
+        'settings': stored,
+        'policy': {'c': 3},
+    }
+
+    stripped = resubmission.strip_unstored_nodes(inputs)
+    assert stripped == {
+        'metadata': {'options': options},
+        'parameters': {'b': 2},
+        'settings': stored,
+        'policy': {'c': 3},
+    }
+
+    restored = resubmission.restore_unstored_nodes(stripped, ParentWorkChain.spec().inputs)
+    assert isinstance(restored['parameters'], orm.Dict)
+    assert restored['parameters'].get_dict() == {'b': 2}
+    assert restored['settings'] is stored
+    assert restored['metadata'] == {'options': options}
+    assert restored['policy'] == {'c': 3}
@@ -0,0 +1,64 @@
+"""Tests for the :mod:`aiida_common_workflows.common.structures` module."""
+import random
+
+import pytest
+from aiida import orm
+from aiida_common_workflows.common.structures import import_structures
+
+
+@pytest.fixture
+def generate_filepath(tmp_path):
+    """Return a factory to write a structure with a random lattice parameter to a file, returning its path."""
+    import ase.build
+    import ase.io
+
+    def _generate_filepath(symbol, lattice_parameter=None):
+        filepath = tmp_path / f'{symbol}-{len(list(tmp_path.iterdir()))}.xyz'
+        atoms = ase.build.bulk(symbol, a=lattice_parameter or random.uniform(3, 6))
+        ase.io.write(filepath, atoms, format='extxyz')
+        return filepath
+
+    return _generate_filepath
+
+
+@pytest.fixture
+def filepaths(generate_filepath):
+    """Return paths of three structure files of which the first and last define the same new structure."""
+    lattice_parameter = random.uniform(3, 6)
+    return [
+        generate_filepath('Al', lattice_parameter),
+        generate_filepath('Cu'),
+        generate_filepath('Al', lattice_parameter),
+    ]
+
+
+@pytest.mark.parametrize('max_workers', (1, 2))
+def test_import_structures(filepaths, max_workers):
+    """Test that new structures are stored once and existing structures are reused."""
+    structures = import_structures(filepaths, max_workers=max_workers)
+    assert [structure.get_formula() for structure in structures] == ['Al', 'Cu', 'Al']
+    assert all(structure.is_stored for structure in structures)
+    assert structures[0].uuid == structures[2].uuid
+
+    count = orm.QueryBuilder().append(orm.StructureData).count()
+    assert [structure.uuid for structure in import_structures(filepaths)] == [node.uuid for node in structures]
+    assert orm.QueryBuilder().append(orm.StructureData).count() == count
+
+
+def test_import_structures_store(filepaths, generate_filepath):
+    """Test that only the structures that do not yet exist are returned unstored if ``store=False``."""
+    filepath = generate_filepath('Si')
+    import_structures([filepath])
+
+    structures = import_structures([filepath, *filepaths], store=False)
+    assert structures[0].is_stored
+    assert [structure.is_stored for structure in structures[1:]] == [False, False, False]
+
+
+def test_import_structures_invalid(tmp_path):
+    """Test that a file that cannot be parsed raises."""
+    filepath = tmp_path / 'invalid.cif'
+    filepath.write_text('invalid')
+
+    with pytest.raises(ValueError, match=r'file `.*invalid.cif` could not be parsed into a `StructureData`'):
+        import_structures([filepath])
@@ -0,0 +1,127 @@
+"""Tests for the :mod:`aiida_common_workflows.common.timing` module."""
+import datetime
+
+import pytest
+from aiida.common import LinkType
+from aiida.orm import CalcJobNode, WorkflowNode
+from aiida.schedulers.datastructures import JobInfo
+from aiida_common_workflows.common import timing
+
+
+class Workflow:
+    """Minimal stand-in for a workflow with the attributes used by the instrumentation."""
+
+    def __init__(self):
+        self.node = WorkflowNode().store()
+
+    @timing.record_step
+    def run_step(self):
+        """Step that returns a value."""
+        return 'result'
+
+    @timing.record_step
+    def failing_step(self):
+        """Step that raises an exception."""
+        raise RuntimeError('failure')
+
+
+@pytest.fixture
+def generate_calcjob_node(aiida_localhost):
+    """Return a factory for ``CalcJobNode`` instances with scheduler information called by the given workflow."""
+
+    def _generate_calcjob_node(workflow, queue, run):
+        ctime = datetime.datetime.now(datetime.timezone.utc)
+        node = CalcJobNode(computer=aiida_localhost)
+        node.base.links.add_incoming(workflow, link_type=LinkType.CALL_CALC, link_label='call')
+        node.store()
+
+        job_info = JobInfo()
+        job_info.submission_time = ctime + datetime.timedelta(seconds=1)
+        job_info.dispatch_time = job_info.submission_time + datetime.timedelta(seconds=queue)
+        job_info.wallclock_time_seconds = run
+        node.set_last_job_info(job_info)
+
+        return node
+
+    return _generate_calcjob_node
+
+
+def test_stopwatch():
+    """Test the ``Stopwatch`` class."""
+    stopwatch = timing.Stopwatch()
+    assert stopwatch.lap() >= 0
+    assert stopwatch.lap() >= 0
+
+
+def test_record_step():
+    """Test the ``record_step`` decorator records every invocation, also if the step raises."""
+    workflow = Workflow()
+    assert workflow.run_step() == 'result'
+    assert workflow.run_step() == 'result'
+
+    with pytest.raises(RuntimeError):
+        workflow.failing_step()
+
+    timings = workflow.node.base.extras.get(timing.TIMING_EXTRA_KEY)
+    assert timings['version'] == timing.TIMING_VERSION
+    assert len(timings['steps']['run_step']) == 2
+    assert len(timings['steps']['failing_step']) == 1
+    assert set(timings['steps']['run_step'][0]) == {'start', 'duration'}
+
+
+def test_record_child():
+    """Test the ``record_child`` function."""
+    node = WorkflowNode().store()
+    child = WorkflowNode().store()
+    timing.record_child(node, child, generate=1.0, submit=0.5)
+
+    timings = node.base.extras.get(timing.TIMING_EXTRA_KEY)
+    assert timings['children'] == {str(child.pk): {'generate': 1.0, 'submit': 0.5}}
+
+    other = WorkflowNode().store()
+    timing.record_child(node, other, submit=0.5)
+
+    timings = node.base.extras.get(timing.TIMING_EXTRA_KEY)
+    assert timings['children'][str(other.pk)] == {'submit': 0.5}
+    assert timing.get_timings([node.pk])['generate'] == [1.0]
+
+
+def test_get_timings(generate_calcjob_node):
+    """Test the ``get_timings`` function aggregates the timings of the workflows and of all their descendants."""
+    root = WorkflowNode().store()
+    child = WorkflowNode()
+    child.base.links.add_incoming(root, link_type=LinkType.CALL_WORK, link_label='call')
+    child.store()
+
+    timing.record_child(root, child, generate=2.0, submit=0.5)
+    root.base.extras.set(
+        timing.TIMING_EXTRA_KEY,
+        {**root.base.extras.get(timing.TIMING_EXTRA_KEY), 'steps': {'run': [{'start': 0, 'duration': 3.0}]}},
+    )
+    generate_calcjob_node(child, queue=10, run=100)
+    generate_calcjob_node(child, queue=20, run=200)
+
+    timings = timing.get_timings([root.pk])
+
+    assert timings['step:run'] == [3.0]
+    assert timings['generate'] == [2.0]
+    assert timings['submit'] == [0.5]
+    assert sorted(timings['queue']) == [10.0, 20.0]
+    assert sorted(timings['run']) == [100.0, 200.0]
+    assert all(duration == pytest.approx(1.0, abs=1.0) for duration in timings['daemon'])
+
+
+def test_get_timings_group():
+    """Test the ``get_timings`` function for a group of workflows."""
+    import uuid
+
+    from aiida.orm import Group
+
+    nodes = [WorkflowNode().store() for _ in range(2)]
+    for node in nodes:
+        timing.record_child(node, WorkflowNode().store(), generate=1.0, submit=1.0)
+
+    group = Group(label=f'timing-{uuid.uuid4()}').store()
+    group.add_nodes(nodes)
+
+    assert timing.get_timings(group) == {'generate': [1.0, 1.0], 'submit': [1.0, 1.0]}
@@ -0,0 +1,56 @@
+"""Tests for the :mod:`aiida_common_workflows.common.visualization.render` module."""
+import matplotlib.pyplot as plt
+import numpy
+import pytest
+from aiida_common_workflows.common.visualization.dissociation import get_dissociation_figure
+from aiida_common_workflows.common.visualization.eos import birch_murnaghan, get_eos_figure
+from aiida_common_workflows.common.visualization.render import save_figure, save_figures
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+def get_eos_dataset():
+    """Return volumes and energies that follow a Birch-Murnaghan equation of state."""
+    volumes = numpy.linspace(18, 22, 7)
+    return volumes.tolist(), birch_murnaghan(volumes, -5.0, 20.0, 0.5, 4.5).tolist()
+
+
+@pytest.mark.parametrize(
+    'get_figure, arguments',
+    ((get_eos_figure, get_eos_dataset()), (get_dissociation_figure, ([1.0, 2.0, 3.0], [0.5, -1.0, -0.8]))),
+)
+def test_get_figure(get_figure, arguments):
+    """Test that the figure functions return a figure on the Agg backend that is not registered with ``pyplot``."""
+    figure_numbers = plt.get_fignums()
+    figure = get_figure(*arguments)
+
+    assert isinstance(figure, Figure)
+    assert isinstance(figure.canvas, FigureCanvasAgg)
+    assert len(figure.axes) == 1
+    assert plt.get_fignums() == figure_numbers
+
+
+def test_get_figure_invalid():
+    """Test that the figure functions validate the data."""
+    with pytest.raises(ValueError, match='not of the same length'):
+        get_dissociation_figure([1.0, 2.0], [1.0])
+
+
+def test_save_figure(tmp_path):
+    """Test the ``save_figure`` function."""
+    filepath = tmp_path / 'eos.png'
+    assert save_figure(get_eos_figure, filepath, *get_eos_dataset()) == str(filepath)
+    assert filepath.read_bytes().startswith(b'\x89PNG')
+
+
+def test_save_figures(tmp_path):
+    """Test the ``save_figures`` function, including a dataset for which the figure cannot be created."""
+    valid = [(tmp_path / f'{index}.png', get_eos_dataset()) for index in range(3)]
+    invalid = (tmp_path / 'invalid.png', ([1.0], [1.0, 2.0]))
+
+    results = dict(save_figures(get_eos_figure, [*valid, invalid], max_workers=2))
+
+    assert set(results) == {str(filepath) for filepath, _ in [*valid, invalid]}
+    assert all(results[str(filepath)] is None for filepath, _ in valid)
+    assert isinstance(results[str(invalid[0])], ValueError)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['0.png', '1.png', '2.png']
@@ -6,6 +6,7 @@ import tempfile
 import typing as t
 
 import click
+import numpy
 import pytest
 from aiida import engine
 from aiida.common import exceptions
@@ -13,6 +14,18 @@ from aiida.common.constants import elements
 
 pytest_plugins = ['aiida.manage.tests.pytest_fixtures']
 
+#: The pseudopotential families that are required by the input generator of each plugin.
+PSEUDO_FAMILIES = {
+    'abinit': 'pseudo_dojo_jthxml_family',
+    'quantum_espresso': 'sssp',
+    'siesta': 'psml_family',
+}
+#: Additional engine options per code entry point, e.g. because the default model of the mock engine does not support
+#: silicon, which is used by the structures of the tests that run for all plugins.
+ENGINE_OPTIONS = {
+    'common_workflows.mock': {'model': 'lennard_jones'},
+}
+
 
 @pytest.fixture(scope='session', autouse=True)
 def with_database(aiida_profile):
@@ -167,6 +180,68 @@ def generate_workchain():
     return _generate_workchain
 
 
+@pytest.fixture
+def generate_inputs(generate_code):
+    """Return a factory for the inputs of ``get_builder`` of the given input generator with a mocked code per engine.
+
+    The relax type is only set if the input generator does not support relaxing the positions, in which case the first
+    supported choice is used.
+    """
+
+    def _generate_inputs(generator, structure, **kwargs):
+        from aiida_common_workflows.common.types import RelaxType
+
+        choices = generator.spec().inputs['relax_type'].choices
+        engines = {}
+
+        for name, namespace in generator.spec().inputs['engines'].items():
+            code_entry_point = namespace['code'].code_entry_point
+            code = generate_code(code_entry_point)
+            code.label = name
+            engines[name] = {
+                'code': code.store(),
+                'options': {
+                    'resources': {'num_machines': 1, 'tot_num_mpiprocs': 1},
+                    'max_wallclock_seconds': 3600,
+                    **ENGINE_OPTIONS.get(code_entry_point, {}),
+                },
+            }
+
+        inputs = {'structure': structure, 'engines': engines, **kwargs}
+
+        if choices and RelaxType.POSITIONS not in choices:
+            inputs['relax_type'] = choices[0]
+
+        return inputs
+
+    return _generate_inputs
+
+
+@pytest.fixture
+def generate_failed_workchain(aiida_localhost):
+    """Return a factory for a failed work chain of the mock engine whose calculations failed with the given labels."""
+    from aiida import orm
+    from aiida.common.links import LinkType
+    from aiida_common_workflows.workflows.relax.mock import MockBaseWorkChain, MockCalculation
+
+    def _generate_failed_workchain(*labels):
+        workchain = orm.WorkflowNode(process_type=MockBaseWorkChain.build_process_type())
+        workchain.set_process_state('finished')
+        workchain.set_exit_status(MockBaseWorkChain.exit_codes.ERROR_UNHANDLED_FAILURE.status)
+        workchain.store()
+
+        for index, label in enumerate(labels):
+            calculation = orm.CalcJobNode(process_type=MockCalculation.build_process_type(), computer=aiida_localhost)
+            calculation.set_process_state('finished')
+            calculation.set_exit_status(MockCalculation.exit_codes[label].status)
+            calculation.base.links.add_incoming(workchain, LinkType.CALL_CALC, f'iteration_{index:02d}')
+            calculation.store()
+
+        return workchain
+
+    return _generate_failed_workchain
+
+
 @pytest.fixture
 def generate_eos_node(generate_structure):
     """Generate an instance of ``EquationOfStateWorkChain``."""
@@ -198,6 +273,42 @@ def generate_eos_node(generate_structure):
     return _generate_eos_node
 
 
+@pytest.fixture
+def generate_eos_node_birch_murnaghan(generate_structure):
+    """Generate an instance of ``EquationOfStateWorkChain`` with energies that follow a Birch-Murnaghan equation."""
+
+    def _generate_eos_node_birch_murnaghan(structure=None, volume=20.0, bulk_modulus=0.5, bulk_deriv=4.5):
+        from aiida.common import LinkType
+        from aiida.orm import Float, WorkflowNode
+        from aiida_common_workflows.common.visualization.eos import birch_murnaghan
+        from plumpy.process_states import ProcessState
+
+        if structure is None:
+            structure = generate_structure(symbols=('Si', 'Si')).store()
+
+        number_of_atoms = len(structure.sites)
+        node = WorkflowNode(process_type='aiida.workflows:common_workflows.eos')
+        node.base.links.add_incoming(structure, link_type=LinkType.INPUT_WORK, link_label='structure')
+        node.store()
+
+        for index, scale_factor in enumerate(numpy.linspace(0.94, 1.06, 7)):
+            scaled = structure.clone()
+            scaled.set_cell((numpy.eye(3) * (volume * scale_factor * number_of_atoms) ** (1 / 3)).tolist())
+            scaled.store()
+            scaled.base.links.add_incoming(node, link_type=LinkType.RETURN, link_label=f'structures__{index}')
+
+            energy = birch_murnaghan(volume * scale_factor, -5.0, volume, bulk_modulus, bulk_deriv) * number_of_atoms
+            energy = Float(energy).store()
+            energy.base.links.add_incoming(node, link_type=LinkType.RETURN, link_label=f'total_energies__{index}')
+
+        node.set_process_state(ProcessState.FINISHED)
+        node.set_exit_status(0)
+
+        return node
+
+    return _generate_eos_node_birch_murnaghan
+
+
 @pytest.fixture
 def generate_dissociation_curve_node():
     """Generate an instance of ``DissociationCurveWorkChain``."""
@@ -306,9 +417,12 @@ def generate_psp8_data():
     return _generate_psp8_data
 
 
-@pytest.fixture(scope='session')
+@pytest.fixture
 def sssp(generate_upf_data):
-    """Create an SSSP pseudo potential family from scratch."""
+    """Create an SSSP pseudo potential family from scratch.
+
+    The family is only created if it does not exist yet, for example because a test cleaned the database.
+    """
     from aiida.plugins import GroupFactory
 
     SsspFamily = GroupFactory('pseudo.family.sssp')  # noqa: N806
@@ -344,9 +458,12 @@ def sssp(generate_upf_data):
     return family
 
 
-@pytest.fixture(scope='session')
+@pytest.fixture
 def pseudo_dojo_jthxml_family(generate_jthxml_data):
-    """Create a PseudoDojo JTH-XML pseudo potential family from scratch."""
+    """Create a PseudoDojo JTH-XML pseudo potential family from scratch.
+
+    The family is only created if it does not exist yet, for example because a test cleaned the database.
+    """
     from aiida import plugins
 
     PseudoDojoFamily = plugins.GroupFactory('pseudo.family.pseudo_dojo')  # noqa: N806
@@ -384,9 +501,12 @@ def pseudo_dojo_jthxml_family(generate_jthxml_data):
     return family
 
 
-@pytest.fixture(scope='session')
+@pytest.fixture
 def pseudo_dojo_psp8_family(generate_psp8_data):
-    """Create a PseudoDojo PSP8 pseudo potential family from scratch."""
+    """Create a PseudoDojo PSP8 pseudo potential family from scratch.
+
+    The family is only created if it does not exist yet, for example because a test cleaned the database.
+    """
     from aiida import plugins
 
     PseudoDojoFamily = plugins.GroupFactory('pseudo.family.pseudo_dojo')  # noqa: N806
@@ -424,9 +544,12 @@ def pseudo_dojo_psp8_family(generate_psp8_data):
     return family
 
 
-@pytest.fixture(scope='session')
+@pytest.fixture
 def psml_family(generate_psml_data):
-    """Create a pseudopotential family with PsmlData potentials from scratch."""
+    """Create a pseudopotential family with PsmlData potentials from scratch.
+
+    The family is only created if it does not exist yet, for example because a test cleaned the database.
+    """
     from aiida import plugins
 
     PsmlData = plugins.DataFactory('pseudo.psml')  # noqa: N806
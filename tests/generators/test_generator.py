@@ -98,3 +98,82 @@ def test_get_builder_immutable_kwargs_nested(generate_input_generator_cls, gener
     kwargs = {'space': {'structure': structure}}
     generator.get_builder(**kwargs)
     assert kwargs['space']['structure'].uuid == structure.uuid
+
+
+def test_validate(generate_input_generator_cls, generate_structure, monkeypatch):
+    """Test that ``validate`` validates the inputs without constructing a builder."""
+
+    def construct_builder(self, **kwargs):
+        raise AssertionError('`_construct_builder` should not be called by `validate`.')
+
+    cls = generate_input_generator_cls(inputs_dict={'structure': orm.StructureData, 'count': int})
+    monkeypatch.setattr(cls, '_construct_builder', construct_builder)
+    monkeypatch.setattr(cls, '_validate_constraints', lambda self, **kwargs: None)
+    generator = cls(process_class=WorkflowFactory('common_workflows.relax.siesta'))
+
+    structure = generate_structure(symbols=('Si',))
+    generator.validate(structure=structure, count=1)
+    assert not structure.is_stored
+
+    with pytest.raises(ValueError):
+        generator.validate(structure=structure, count='invalid')
+
+
+def test_validate_constraints(generate_input_generator_cls, monkeypatch):
+    """Test that ``validate`` raises if the plugin specific constraints returned an error message."""
+
+    def validate_constraints(self, **kwargs):
+        if kwargs['count'] < 0:
+            return '`count` cannot be negative.'
+
+    cls = generate_input_generator_cls(inputs_dict={'count': int})
+    monkeypatch.setattr(cls, '_validate_constraints', validate_constraints)
+    generator = cls(process_class=WorkflowFactory('common_workflows.relax.siesta'))
+
+    generator.validate(count=1)
+
+    with pytest.raises(ValueError, match=r'`count` cannot be negative.'):
+        generator.validate(count=-1)
+
+
+def test_validate_constraints_fallback(generate_input_generator_cls, monkeypatch):
+    """Test that ``validate`` constructs the builder if the generator does not implement ``_validate_constraints``."""
+
+    def construct_builder(self, **kwargs):
+        if kwargs['count'] < 0:
+            raise ValueError('`count` cannot be negative.')
+
+    cls = generate_input_generator_cls(inputs_dict={'count': int})
+    monkeypatch.setattr(cls, '_construct_builder', construct_builder)
+    generator = cls(process_class=WorkflowFactory('common_workflows.relax.siesta'))
+
+    generator.validate(count=1)
+
+    with pytest.raises(ValueError, match=r'`count` cannot be negative.'):
+        generator.validate(count=-1)
+
+
+def test_validate_memoized(generate_input_generator_cls, generate_structure, monkeypatch):
+    """Test that successful validations are memoized."""
+    calls = []
+
+    def validate_constraints(self, **kwargs):
+        calls.append(kwargs)
+
+    cls = generate_input_generator_cls(inputs_dict={'structure': orm.StructureData, 'space.count': int})
+    monkeypatch.setattr(cls, '_validate_constraints', validate_constraints)
+    generator = cls(process_class=WorkflowFactory('common_workflows.relax.siesta'))
+
+    structure = generate_structure(symbols=('Si',)).store()
+
+    generator.validate(structure=structure, space={'count': 1})
+    generator.validate(structure=structure, space={'count': 1})
+    assert len(calls) == 1
+
+    # A new instance of the same generator class should share the memoized result.
+    other = cls(process_class=WorkflowFactory('common_workflows.relax.siesta'))
+    other.validate(structure=structure, space={'count': 1})
+    assert len(calls) == 1
+
+    generator.validate(structure=structure, space={'count': 2})
+    assert len(calls) == 2
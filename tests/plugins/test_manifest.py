@@ -0,0 +1,41 @@
+"""Tests for the :mod:`aiida_common_workflows.plugins.manifest` module."""
+import pytest
+from aiida_common_workflows.plugins import WorkflowFactory, get_workflow_entry_point_names, manifest
+
+
+def test_manifest_up_to_date():
+    """Test that the capability manifest shipped with the package corresponds to the input generator specifications.
+
+    If this test fails, regenerate the manifest by running ``python dev/generate_capability_manifest.py``.
+    """
+    assert manifest.generate_capability_manifest() == manifest.get_capability_manifest()
+
+
+@pytest.mark.parametrize('entry_point_name', get_workflow_entry_point_names('relax'))
+def test_manifest_entry_points(entry_point_name):
+    """Test that the capability manifest contains all registered implementations of the common relax workflow."""
+    assert entry_point_name in manifest.get_capability_manifest()
+
+
+def test_get_workflow_capabilities():
+    """Test the ``get_workflow_capabilities`` function."""
+    capabilities = manifest.get_workflow_capabilities('relax', 'quantum_espresso')
+    generator = WorkflowFactory('common_workflows.relax.quantum_espresso').get_input_generator()
+
+    assert capabilities['engines'] == {
+        'relax': {
+            'code_entry_point': 'quantumespresso.pw',
+            'description': generator.spec().inputs['engines']['relax'].help,
+        }
+    }
+    assert capabilities['choices']['spin_type'] == ['none', 'collinear']
+    assert capabilities['optional_features'] == ['fixed_total_cell_magnetization']
+    assert capabilities['protocols'] == generator.get_protocol_names()
+    assert capabilities['default_protocol'] == generator.get_default_protocol_name()
+
+
+def test_get_workflow_capabilities_not_in_manifest(monkeypatch):
+    """Test that ``get_workflow_capabilities`` loads the implementation if it is not contained in the manifest."""
+    expected = manifest.get_workflow_capabilities('relax', 'quantum_espresso')
+    monkeypatch.setattr(manifest, 'get_capability_manifest', dict)
+    assert manifest.get_workflow_capabilities('relax', 'quantum_espresso') == expected
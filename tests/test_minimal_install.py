@@ -19,11 +19,16 @@ def test_imports():
     import aiida_common_workflows.utils
     import aiida_common_workflows.workflows
     import aiida_common_workflows.workflows.dissociation
-    import aiida_common_workflows.workflows.eos  # noqa: F401
+    import aiida_common_workflows.workflows.eos
+    import aiida_common_workflows.workflows.relax.mock  # noqa: F401
 
 
 @pytest.mark.minimal_install
-@pytest.mark.parametrize('entry_point_name', get_workflow_entry_point_names('relax'))
+@pytest.mark.parametrize(
+    'entry_point_name',
+    # The mock implementation does not depend on any plugin package and so can always be loaded.
+    [name for name in get_workflow_entry_point_names('relax') if name != 'common_workflows.relax.mock'],
+)
 def test_workflow_factory_relax(entry_point_name):
     """Test that trying to load common relax workflow implementations will raise if not installed.
 
@@ -46,3 +51,15 @@ def test_workflow_factory_bands(entry_point_name):
     match = rf'.*plugin package is not installed.*`pip install aiida-common-workflows\[{plugin_name}\]`.*'
     with pytest.raises(exceptions.MissingEntryPointError, match=match):
         WorkflowFactory(entry_point_name)
+
+
+@pytest.mark.minimal_install
+@pytest.mark.parametrize('entry_point_name', get_workflow_entry_point_names('relax'))
+def test_get_workflow_capabilities(entry_point_name):
+    """Test that the capabilities of common relax workflow implementations can be queried even if not installed."""
+    from aiida_common_workflows.plugins import get_workflow_capabilities
+
+    plugin_name = entry_point_name.removeprefix('common_workflows.relax.')
+    capabilities = get_workflow_capabilities('relax', plugin_name)
+    assert 'relax' in capabilities['engines']
+    assert capabilities['protocols']
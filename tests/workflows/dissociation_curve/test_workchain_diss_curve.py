@@ -155,3 +155,62 @@ def test_validate_distance_min(ctx):
     assert dissociation.validate_distance_min(None, ctx) is None
     assert dissociation.validate_distance_min(orm.Float(0.5), ctx) is None
     assert dissociation.validate_distance_min(orm.Float(-0.5), ctx) == '`distance_min` must be bigger than zero.'
+
+
+def test_validate_resource_models(ctx):
+    """Test the `validate_resource_models` validator."""
+    assert dissociation.validate_resource_models(None, ctx) is None
+    assert (
+        dissociation.validate_resource_models(orm.Dict({'relax': {'model': {}, 'cores_per_machine': 4}}), ctx) is None
+    )
+    assert (
+        dissociation.validate_resource_models(orm.Dict({'relax': {'cores_per_machine': 4}}), ctx)
+        == 'the resource model of engine `relax` should define the `model` and `cores_per_machine`.'
+    )
+
+
+@pytest.mark.usefixtures('sssp')
+def test_get_submission_order(generate_workchain, generate_code, generate_structure):
+    """Test the ``DissociationCurveWorkChain.get_submission_order`` method submits the largest distances first."""
+    inputs = {
+        'distances': orm.List([0.5, 1.0, 1.5, 2.0]),
+        'molecule': generate_structure(symbols=('H', 'H')),
+        'sub_process_class': 'common_workflows.relax.quantum_espresso',
+        'generator_inputs': {
+            'engines': {
+                'relax': {
+                    'code': generate_code('quantumespresso.pw').store(),
+                    'options': {'resources': {'num_machines': 1}},
+                }
+            },
+            'protocol': 'fast',
+            'relax_type': 'none',
+        },
+    }
+    process = generate_workchain('common_workflows.dissociation_curve', inputs)
+    assert process.get_submission_order(process.get_distances()) == [3, 2, 1]
+
+
+def test_validate_restart_from(ctx):
+    """Test the `validate_restart_from` validator."""
+    node = orm.WorkflowNode()
+    node.set_process_state('running')
+    node.store()
+
+    assert dissociation.validate_restart_from(None, ctx) is None
+    assert dissociation.validate_restart_from(node, ctx) == (
+        f'`restart_from` should be a terminated workflow, but `{node.pk}` is still active.'
+    )
+
+    node.set_process_state('excepted')
+    assert dissociation.validate_restart_from(node, ctx) is None
+
+
+def test_validate_engine_pools_policy(ctx):
+    """Test the `validate_engine_pools_policy` validator."""
+    assert dissociation.validate_engine_pools_policy('weights', ctx) is None
+    assert dissociation.validate_engine_pools_policy('queue_depth', ctx) is None
+    assert (
+        dissociation.validate_engine_pools_policy('random', ctx)
+        == "`engine_pools_policy` should be one of ('weights', 'queue_depth')."
+    )
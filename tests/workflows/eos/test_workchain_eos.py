@@ -1,5 +1,7 @@
 """Tests for the :mod:`aiida_common_workflows.workflows.eos` module."""
 import copy
+import math
+import uuid
 
 import pytest
 from aiida import orm
@@ -145,6 +147,7 @@ def test_validate_relax_type(ctx):
     (
         ({'scale_factors': [0.98, 1.0, 1.02]}, (0.98, 1.0, 1.02)),
         ({'scale_count': 3, 'scale_increment': 0.02}, (0.98, 1.0, 1.02)),
+        ({'scale_count': 5, 'scale_increment': 0.05}, (0.9, 0.95, 1.0, 1.05, 1.1)),
     ),
 )
 @pytest.mark.usefixtures('sssp')
@@ -162,3 +165,249 @@ def test_get_scale_factors(generate_workchain, generate_eos_inputs, scaling_inpu
     inputs.update(scaling_inputs)
     process = generate_workchain('common_workflows.eos', inputs)
     assert process.get_scale_factors() == expected
+
+
+def test_validate_resource_models(ctx):
+    """Test the `validate_resource_models` validator."""
+    assert eos.validate_resource_models(None, ctx) is None
+    assert eos.validate_resource_models(orm.Dict({'relax': {'model': {}, 'cores_per_machine': 4}}), ctx) is None
+    assert (
+        eos.validate_resource_models(orm.Dict({'relax': {'model': {}}}), ctx)
+        == 'the resource model of engine `relax` should define the `model` and `cores_per_machine`.'
+    )
+
+
+@pytest.mark.usefixtures('sssp')
+def test_validate_inputs_resource_models(ctx, generate_eos_inputs):
+    """Test the ``validate_inputs`` validator for resource models of unknown engines."""
+    value = generate_eos_inputs()
+    value['scale_factors'] = []
+    value['resource_models'] = orm.Dict({'relax': {'model': {}, 'cores_per_machine': 4}})
+    assert eos.validate_inputs(value, ctx) is None
+
+    value['resource_models'] = orm.Dict({'scf': {'model': {}, 'cores_per_machine': 4}})
+    assert "models for engines that are not in `generator_inputs.engines`: {'scf'}" in eos.validate_inputs(value, ctx)
+
+
+@pytest.mark.usefixtures('sssp')
+def test_get_sub_workchain_builder_resource_models(generate_workchain, generate_eos_inputs):
+    """Test the ``EquationOfStateWorkChain.get_sub_workchain_builder`` sizes the resources for each scale factor."""
+    from aiida_common_workflows.common.resources import ResourceModel
+
+    model = ResourceModel(('volume',), (math.log(1000.25), 1), 0, 10)
+    inputs = generate_eos_inputs()
+    inputs['scale_factors'] = orm.List([0.9, 1.0, 4.0])
+    inputs['resource_models'] = orm.Dict({'relax': {'model': model.serialize(), 'cores_per_machine': 4}})
+    process = generate_workchain('common_workflows.eos', inputs)
+
+    builder, _ = process.get_sub_workchain_builder(orm.Float(1.0))
+    assert builder.base.pw.metadata.options.resources == {'num_machines': 1, 'num_mpiprocs_per_machine': 1}
+    assert builder.base.pw.metadata.options.max_wallclock_seconds == 1001
+
+    builder, _ = process.get_sub_workchain_builder(orm.Float(4.0))
+    assert builder.base.pw.metadata.options.resources == {'num_machines': 1, 'num_mpiprocs_per_machine': 2}
+    assert builder.base.pw.metadata.options.max_wallclock_seconds == 2001
+
+
+@pytest.mark.usefixtures('sssp')
+def test_get_sub_workchain_builder_resource_models_engine_pools(generate_workchain, generate_eos_inputs):
+    """Test the resources are sized with the number of cores of the computer of the selected member of the pool."""
+    from aiida_common_workflows.common.resources import ResourceModel
+
+    computer = orm.Computer(
+        label=str(uuid.uuid4()), hostname='localhost', transport_type='core.local', scheduler_type='core.direct'
+    ).store()
+    computer.set_default_mpiprocs_per_machine(1)
+    code = orm.InstalledCode(
+        label='pw', default_calc_job_plugin='quantumespresso.pw', computer=computer, filepath_executable='/bin/bash'
+    ).store()
+
+    model = ResourceModel(('volume',), (math.log(1000.25), 1), 0, 10)
+    inputs = generate_eos_inputs()
+    inputs['scale_factors'] = orm.List([0.9, 1.0, 4.0])
+    inputs['resource_models'] = orm.Dict({'relax': {'model': model.serialize(), 'cores_per_machine': 4}})
+    inputs['engine_pools'] = {'relax': [{'code': code}]}
+    process = generate_workchain('common_workflows.eos', inputs)
+    process.update_engine_pools()
+
+    builder, _ = process.get_sub_workchain_builder(orm.Float(4.0))
+    assert builder.base.pw.code.pk == code.pk
+    assert builder.base.pw.metadata.options.resources == {'num_machines': 2, 'num_mpiprocs_per_machine': 1}
+
+
+@pytest.mark.usefixtures('sssp')
+def test_get_submission_order(generate_workchain, generate_eos_inputs):
+    """Test the ``EquationOfStateWorkChain.get_submission_order`` method submits the largest volumes first."""
+    from aiida_common_workflows.common.resources import ResourceModel
+
+    inputs = generate_eos_inputs()
+    inputs['scale_factors'] = orm.List([0.96, 0.98, 1.0, 1.02, 1.04])
+    process = generate_workchain('common_workflows.eos', inputs)
+    assert process.get_submission_order(process.get_scale_factors()) == [4, 3, 2, 1]
+
+    # A resource model for which the cost decreases with the volume should reverse the order.
+    model = ResourceModel(('volume',), (0, -1), 0, 10)
+    inputs['resource_models'] = orm.Dict({'relax': {'model': model.serialize(), 'cores_per_machine': 4}})
+    process = generate_workchain('common_workflows.eos', inputs)
+    assert process.get_submission_order(process.get_scale_factors()) == [1, 2, 3, 4]
+
+
+def test_validate_engine_pools_policy(ctx):
+    """Test the `validate_engine_pools_policy` validator."""
+    assert eos.validate_engine_pools_policy('weights', ctx) is None
+    assert (
+        eos.validate_engine_pools_policy('random', ctx)
+        == "`engine_pools_policy` should be one of ('weights', 'queue_depth')."
+    )
+
+
+@pytest.mark.usefixtures('sssp')
+def test_validate_inputs_engine_pools(ctx, generate_eos_inputs, generate_code):
+    """Test the ``validate_inputs`` validator for the engine pools."""
+    value = generate_eos_inputs()
+    value['scale_factors'] = []
+    value['engine_pools'] = {'relax': [{'code': generate_code('quantumespresso.pw').store()}]}
+    assert eos.validate_inputs(value, ctx) is None
+
+    value['engine_pools'] = {'relax': [{'code': generate_code('gaussian').store()}]}
+    assert 'is not a `quantumespresso.pw` code.' in eos.validate_inputs(value, ctx)
+
+
+@pytest.mark.usefixtures('sssp')
+def test_get_sub_workchain_builder_engine_pools(generate_workchain, generate_eos_inputs, generate_code):
+    """Test the ``EquationOfStateWorkChain.get_sub_workchain_builder`` spreads the sub processes across the pool."""
+    codes = [generate_code('quantumespresso.pw').store() for _ in range(2)]
+    inputs = generate_eos_inputs()
+    inputs['scale_factors'] = orm.List([0.98, 1.0, 1.02])
+    inputs['engine_pools'] = {'relax': [{'code': codes[0]}, {'code': codes[1], 'weight': 2}]}
+    inputs['engine_pools_policy'] = 'weights'
+    process = generate_workchain('common_workflows.eos', inputs)
+    process.update_engine_pools()
+
+    selected = [process.get_sub_workchain_builder(orm.Float(1.0))[0].base.pw.code.pk for _ in range(3)]
+    assert selected == [codes[1].pk, codes[0].pk, codes[1].pk]
+
+    # With the ``weights`` policy, the assignments are kept across the steps of the workflow.
+    process.update_engine_pools()
+    assert process.ctx.pool_assignments == {'relax': [1, 2]}
+
+
+@pytest.mark.usefixtures('sssp')
+def test_update_engine_pools_queue_depth(generate_workchain, generate_eos_inputs, generate_code):
+    """Test the ``EquationOfStateWorkChain.update_engine_pools`` method with the ``queue_depth`` policy."""
+    code = generate_code('quantumespresso.pw').store()
+    inputs = generate_eos_inputs()
+    inputs['engine_pools'] = {'relax': [{'code': code}]}
+    process = generate_workchain('common_workflows.eos', inputs)
+
+    process.update_engine_pools()
+    process.get_sub_workchain_builder(orm.Float(1.0))
+    assert process.ctx.pool_assignments == {'relax': [1]}
+    assert code.computer.pk in process.ctx.queue_depths
+
+    # The assignments of the previous step are part of the queue depths, so they are reset for each step.
+    process.update_engine_pools()
+    assert process.ctx.pool_assignments == {}
+
+
+@pytest.mark.usefixtures('sssp')
+def test_submit_admitted(generate_workchain, generate_eos_inputs, monkeypatch):
+    """Test the ``EquationOfStateWorkChain.submit_admitted`` method waits once the quota of the code is full.
+
+    The workflow should only wait for the oldest process that holds the quota and not for the sub processes that it
+    submitted itself, which are only awaited by the ``wait_for_children`` step.
+    """
+    from aiida_common_workflows.common import admission
+
+    inputs = generate_eos_inputs()
+    code = inputs['generator_inputs']['engines']['relax']['code']
+    process = generate_workchain('common_workflows.eos', inputs)
+    submitted = []
+
+    def submit(builder):
+        node = orm.WorkflowNode()
+        node.set_process_state('waiting')
+        submitted.append(node.store())
+        return node
+
+    monkeypatch.setattr(process, 'submit', submit)
+    admission.set_quota('code', code.uuid, 2)
+
+    try:
+        process.ctx.structures = []
+        process.ctx.indices = []
+        process.ctx.pending = [1, 2, 3]
+        process.submit_admitted()
+    finally:
+        admission.set_quota('code', code.uuid, None)
+        for node in submitted:
+            node.set_process_state('finished')
+
+    assert len(submitted) == 2
+    assert process.ctx.indices == [1, 2]
+    assert process.ctx.pending == [3]
+    assert process.ctx.children == submitted
+    assert process.is_waiting_for_admission()
+    assert [(awaitable.key, awaitable.pk) for awaitable in process._awaitables] == [('admission', submitted[0].pk)]
+
+    process._awaitables = []
+    process.wait_for_children()
+    assert [(awaitable.key, awaitable.pk) for awaitable in process._awaitables] == [
+        ('children', node.pk) for node in submitted
+    ]
+
+
+def test_validate_restart_from(ctx):
+    """Test the `validate_restart_from` validator."""
+    node = orm.WorkflowNode()
+    node.set_process_state('waiting')
+    node.store()
+
+    assert eos.validate_restart_from(None, ctx) is None
+    assert eos.validate_restart_from(node, ctx) == (
+        f'`restart_from` should be a terminated workflow, but `{node.pk}` is still active.'
+    )
+
+    node.set_process_state('killed')
+    assert eos.validate_restart_from(node, ctx) is None
+
+
+@pytest.mark.usefixtures('sssp')
+def test_submit_admitted_restart(generate_workchain, generate_eos_inputs, monkeypatch):
+    """Test the ``EquationOfStateWorkChain.submit_admitted`` method reuses the matching children of ``restart_from``."""
+    from aiida.common.links import LinkType
+    from aiida_common_workflows.common import restart
+
+    process = generate_workchain('common_workflows.eos', generate_eos_inputs())
+    previous = orm.WorkflowNode().store()
+    submitted = {}
+
+    def generate_child(index, exit_status):
+        child = orm.WorkflowNode()
+        child.set_process_state('finished')
+        child.set_exit_status(exit_status)
+        child.base.links.add_incoming(previous, LinkType.CALL_WORK, 'CALL')
+        child.store()
+        restart.register_point(child, process.get_point_hash(index))
+        return child
+
+    def submit_sub_workchain(index, engines):
+        submitted[index] = orm.WorkflowNode().store()
+        return submitted[index]
+
+    monkeypatch.setattr(process, 'submit_sub_workchain', submit_sub_workchain)
+    reused = generate_child(1, 0)
+    generate_child(2, 400)
+
+    process.ctx.structures = []
+    process.ctx.indices = []
+    process.ctx.reusable = restart.get_reusable_children(previous)
+    process.ctx.pending = [1, 2]
+    process.submit_admitted()
+
+    assert list(submitted) == [2]
+    assert process.ctx.indices == [1]
+    assert process.ctx.children == [reused]
+    assert math.isclose(process.ctx.structures[0].creator.inputs.scale_factor.value, process.get_scale_factors()[1])
+    assert process.node.base.extras.get(restart.REUSED_EXTRA) == [reused.uuid]
+    assert submitted[2].base.extras.get(restart.POINT_EXTRA) == process.get_point_hash(2)
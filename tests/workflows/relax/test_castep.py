@@ -241,3 +241,23 @@ def test_otfg_upload(with_otfg):
             assert node.entry == 'La 2|2.3|5|6|7|50U:60:51:52:43{4f0.1}(qc=4.5)'
             found = True
     assert found
+
+
+def test_walltime_margin(generator, default_builder_inputs):
+    """Test the ``run_time`` is set to the ``max_wallclock_seconds`` minus the ``walltime_margin``."""
+    default_builder_inputs['engines']['relax']['options']['max_wallclock_seconds'] = 3600
+    builder = generator.get_builder(**default_builder_inputs, walltime_margin=600)
+    assert builder.calc.parameters['run_time'] == 3000
+
+
+def test_resubmit_walltime(generator, default_builder_inputs, generate_workchain, generate_failed_workchain):
+    """Test the ``run_time`` grows with the ``max_wallclock_seconds`` when resubmitted after a timeout."""
+    default_builder_inputs['engines']['relax']['options']['max_wallclock_seconds'] = 3600
+    builder = generator.get_builder(**default_builder_inputs, walltime_margin=600)
+
+    process = generate_workchain('common_workflows.relax.castep', builder._inputs(prune=True))
+    process.setup()
+
+    assert process.resubmit(generate_failed_workchain('ERROR_SCHEDULER_OUT_OF_WALLTIME'))
+    assert process.ctx.inputs.calc['metadata']['options']['max_wallclock_seconds'] == 7200
+    assert process.ctx.inputs.calc['parameters']['run_time'] == 6600
@@ -1,6 +1,9 @@
 """Tests for the :mod:`aiida_common_workflows.workflows.relax.cp2k` module."""
+import pathlib
+
 import pytest
-from aiida import engine, plugins
+from aiida import engine, orm, plugins
+from aiida_common_workflows.common import filecache
 
 
 @pytest.fixture
@@ -66,3 +69,104 @@ def test_supported_spin_types(generator, default_builder_inputs):
         inputs['spin_type'] = spin_type
         builder = generator.get_builder(**inputs)
         assert isinstance(builder, engine.ProcessBuilder)
+
+
+def test_tags_and_magnetization(generate_structure):
+    """Test the ``tags_and_magnetization`` function assigns the tags in order of appearance of the kinds."""
+    from aiida_common_workflows.workflows.relax.cp2k.generator import tags_and_magnetization
+
+    structure, magnetization_tags = tags_and_magnetization(
+        generate_structure(symbols=('Ni', 'O', 'Ni', 'O')), [1.0, 0.0, -1.0, 0.0]
+    )
+
+    assert structure.get_ase().get_tags().tolist() == [1, 2, 3, 2]
+    assert magnetization_tags.get_dict() == {'1': 1.0, '2': 0.0, '3': -1.0}
+
+
+def test_get_restart_inputs(generator, default_builder_inputs, aiida_localhost):
+    """Test the ``get_restart_inputs`` restarts from the restart file in the remote folder."""
+    builder = generator.get_builder(**default_builder_inputs)
+    remote_folder = orm.RemoteData(computer=aiida_localhost, remote_path='/tmp').store()
+
+    inputs = plugins.WorkflowFactory('common_workflows.relax.cp2k').get_restart_inputs(
+        builder._inputs(prune=True), remote_folder
+    )
+    assert inputs['cp2k']['parent_calc_folder'] is remote_folder
+    assert inputs['cp2k']['parameters']['EXT_RESTART']['RESTART_FILE_NAME'] == './parent_calc/aiida-1.restart'
+    assert inputs['cp2k']['structure'] is builder.cp2k.structure
+
+
+def test_walltime_margin(generator, default_builder_inputs):
+    """Test the ``WALLTIME`` is set to the ``max_wallclock_seconds`` minus the ``walltime_margin``."""
+    default_builder_inputs['engines']['relax']['options']['max_wallclock_seconds'] = 3600
+    builder = generator.get_builder(**default_builder_inputs)
+    assert builder.cp2k.parameters['GLOBAL']['WALLTIME'] == 3300
+
+    builder = generator.get_builder(**default_builder_inputs, walltime_margin=600)
+    assert builder.cp2k.parameters['GLOBAL']['WALLTIME'] == 3000
+
+
+def test_resubmit_walltime(generator, default_builder_inputs, generate_workchain, generate_failed_workchain):
+    """Test the ``WALLTIME`` grows with the ``max_wallclock_seconds`` when resubmitted after a timeout."""
+    default_builder_inputs['engines']['relax']['options']['max_wallclock_seconds'] = 3600
+    builder = generator.get_builder(**default_builder_inputs, walltime_margin=600)
+
+    process = generate_workchain('common_workflows.relax.cp2k', builder._inputs(prune=True))
+    process.setup()
+
+    assert process.resubmit(generate_failed_workchain('ERROR_SCHEDULER_OUT_OF_WALLTIME'))
+    assert process.ctx.inputs.cp2k['metadata']['options']['max_wallclock_seconds'] == 7200
+    assert process.ctx.inputs.cp2k['parameters']['GLOBAL']['WALLTIME'] == 6600
+
+
+def test_file_cache(generator, default_builder_inputs, tmp_path, monkeypatch):
+    """Test the ``file_cache`` input symlinks the files from the cache instead of passing them as inputs.
+
+    The generator should only emit the symlinks, without opening a transport to populate the cache.
+    """
+    code = orm.load_code(default_builder_inputs['engines']['relax']['code'])
+    paths = filecache.upload_files(code.computer, str(tmp_path), generator.get_static_files())
+
+    def get_transport(self):
+        raise AssertionError('the generator should not open a transport.')
+
+    monkeypatch.setattr(orm.AuthInfo, 'get_transport', get_transport)
+    builder = generator.get_builder(**default_builder_inputs, file_cache=str(tmp_path))
+    commands = builder.cp2k.metadata.options['prepend_text'].splitlines()
+
+    assert 'file' not in builder._inputs(prune=True)['cp2k']
+    assert commands == filecache.get_symlink_commands(paths).splitlines()
+    assert len(commands) == 5
+    for command in commands:
+        _, _, path, filename = command.split()
+        assert path.startswith(str(tmp_path))
+        assert pathlib.Path(path).name == filename
+        assert pathlib.Path(path).is_file()
+
+
+@pytest.mark.parametrize(
+    'relax_type, expected',
+    (('positions', ['aiida-1.stress']), ('none', ['aiida-1.stress', 'aiida-requested-forces-1_0.xyz'])),
+)
+def test_retrieval_minimal(generator, default_builder_inputs, relax_type, expected):
+    """Test the minimal ``retrieval`` only retrieves the additional files and uses the parser needed for the outputs."""
+    builder = generator.get_builder(**default_builder_inputs, relax_type=relax_type, retrieval='minimal')
+    assert builder.cp2k.settings['additional_retrieve_list'] == expected
+    assert builder.cp2k.metadata.options['parser_name'] == 'cp2k_base_parser'
+
+
+def test_validate(generator, default_builder_inputs, generate_structure):
+    """Test the ``validate`` method rejects elements that are not supported by the basis set of the protocol."""
+    generator.validate(**default_builder_inputs)
+
+    default_builder_inputs['structure'] = generate_structure(symbols=('U',))
+    with pytest.raises(ValueError, match=r"the elements \['U'\] are not supported by the `.*` basis set."):
+        generator.validate(**default_builder_inputs)
+
+
+def test_validate_file_cache_sirius(generator, default_builder_inputs, tmp_path):
+    """Test the ``validate`` method rejects the ``file_cache`` for the ``sirius`` protocols, which do not use it."""
+    generator.validate(**default_builder_inputs, file_cache=str(tmp_path))
+
+    with pytest.raises(ValueError, match=r'the `file_cache` is not supported by the `sirius` protocols'):
+        generator.validate(**default_builder_inputs, protocol='verification-PBE-v1-sirius', file_cache=str(tmp_path))
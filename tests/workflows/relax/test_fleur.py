@@ -70,3 +70,12 @@ def test_supported_spin_types(generator, default_builder_inputs):
         inputs['spin_type'] = spin_type
         builder = generator.get_builder(**inputs)
         assert isinstance(builder, engine.ProcessBuilder)
+
+
+def test_retrieval_minimal(generator, default_builder_inputs):
+    """Test the minimal ``retrieval`` does not retrieve the charge density."""
+    builder = generator.get_builder(**default_builder_inputs)
+    assert 'settings' not in builder._inputs(prune=True)['scf']
+
+    builder = generator.get_builder(**default_builder_inputs, retrieval='minimal')
+    assert builder.scf.settings['remove_from_retrieve_list'] == ['cdn_last.hdf', 'cdn1']
@@ -0,0 +1,28 @@
+"""Tests for the :mod:`aiida_common_workflows.workflows.relax.gpaw` module."""
+import pytest
+from aiida import engine, plugins
+
+
+@pytest.fixture
+def generator():
+    return plugins.WorkflowFactory('common_workflows.relax.gpaw').get_input_generator()
+
+
+@pytest.fixture
+def default_builder_inputs(generate_code, generate_structure):
+    """Return a dictionary with minimum required inputs for the ``get_builder`` method of the inputs generator."""
+    return {
+        'structure': generate_structure(symbols=('Si',)),
+        'engines': {
+            'relax': {
+                'code': generate_code('ase.ase').store().uuid,
+                'options': {'resources': {'num_machines': 1, 'tot_num_mpiprocs': 1}},
+            }
+        },
+    }
+
+
+def test_get_builder(generator, default_builder_inputs):
+    """Test the ``get_builder`` with default arguments."""
+    builder = generator.get_builder(**default_builder_inputs)
+    assert isinstance(builder, engine.ProcessBuilder)
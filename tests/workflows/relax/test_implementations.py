@@ -1,12 +1,48 @@
 """Tests for the :mod:`aiida_common_workflows.workflows.relax.quantum_espresso` module."""
+import json
+import os
+import subprocess
+import sys
 
 import pytest
 from aiida import engine, orm, plugins
 from aiida_common_workflows.common.types import ElectronicType, RelaxType, SpinType
 from aiida_common_workflows.generators.ports import InputGeneratorPort
 from aiida_common_workflows.plugins import get_workflow_entry_point_names
+from aiida_common_workflows.workflows.relax.generator import CommonRelaxInputGenerator
 from aiida_common_workflows.workflows.relax.workchain import CommonRelaxWorkChain
 
+from ...conftest import PSEUDO_FAMILIES
+
+#: Plugins that support a collinear spin polarization but not the ``magnetization_per_site`` input.
+MAGNETIZATION_UNSUPPORTED = ('bigdft', 'nwchem')
+
+#: Script that prints the inputs of the builder of the input generator in which all nodes are replaced by their hash.
+GET_BUILDER_HASHES = """
+import json
+import sys
+from collections.abc import Mapping
+
+from aiida import load_profile, orm, plugins
+
+load_profile()
+
+entry_point, inputs = json.loads(sys.argv[1])
+inputs['structure'] = orm.load_node(inputs['structure'])
+builder = plugins.WorkflowFactory(entry_point).get_input_generator().get_builder(**inputs)
+
+
+def get_hashes(value):
+    if isinstance(value, orm.Node):
+        return value.base.caching.get_hash()
+    if isinstance(value, Mapping):
+        return {key: get_hashes(item) for key, item in value.items()}
+    return value
+
+
+print(json.dumps(get_hashes(builder._inputs(prune=True)), sort_keys=True, default=str))
+"""
+
 
 @pytest.fixture(scope='function', params=get_workflow_entry_point_names('relax'))
 def workchain(request) -> CommonRelaxWorkChain:
@@ -28,6 +64,8 @@ def test_spec(workchain):
         'magnetization_per_site': {'valid_type': list},
         'threshold_forces': {'valid_type': float},
         'threshold_stress': {'valid_type': float},
+        'walltime_margin': {'valid_type': int},
+        'retrieval': {'valid_type': str},
         'reference_workchain': {'valid_type': orm.WorkChainNode},
         'engines': {},
     }
@@ -37,3 +75,67 @@ def test_spec(workchain):
 
         if 'valid_type' in values:
             assert generator_spec.inputs.get_port(port_name).valid_type is values['valid_type']
+
+
+@pytest.mark.parametrize(
+    'options, margin, expected',
+    (
+        ({}, 300, None),
+        ({'max_wallclock_seconds': 3600}, 300, 3300),
+        ({'max_wallclock_seconds': 3600}, 0, 3600),
+        ({'max_wallclock_seconds': 400}, 300, 200),
+    ),
+)
+def test_get_soft_walltime(options, margin, expected):
+    """Test the ``CommonRelaxInputGenerator.get_soft_walltime`` method."""
+    assert CommonRelaxInputGenerator.get_soft_walltime(options, margin) == expected
+
+
+@pytest.mark.parametrize('entry_point', get_workflow_entry_point_names('relax'))
+def test_get_builder_deterministic(request, entry_point, generate_inputs):
+    """Test the ``get_builder`` returns inputs with identical hashes in interpreters with different hash seeds.
+
+    The builders are created in subprocesses, since the iteration order of sets of strings only differs between
+    interpreters. The magnetization per site is specified where supported, since some plugins create new kinds from the
+    sites with different magnetizations.
+    """
+    from aiida import get_profile
+    from aiida.manage.configuration import get_config
+    from ase.build import bulk
+
+    plugin = entry_point.rsplit('.', 1)[-1]
+
+    if plugin in PSEUDO_FAMILIES:
+        request.getfixturevalue(PSEUDO_FAMILIES[plugin])
+
+    generator = plugins.WorkflowFactory(entry_point).get_input_generator()
+    structure = orm.StructureData(ase=bulk('Si', 'diamond', a=5.43)).store()
+    inputs = generate_inputs(generator, structure)
+    inputs['structure'] = structure.uuid
+
+    for engine_inputs in inputs['engines'].values():
+        engine_inputs['code'] = engine_inputs['code'].uuid
+
+    if SpinType.COLLINEAR in (generator.spec().inputs['spin_type'].choices or ()):
+        inputs['spin_type'] = SpinType.COLLINEAR.value
+
+        if plugin not in MAGNETIZATION_UNSUPPORTED:
+            inputs['magnetization_per_site'] = [0.5, -0.5]
+
+    hashes = []
+
+    for seed in ('1', '2'):
+        env = {
+            **os.environ,
+            'PYTHONHASHSEED': seed,
+            'AIIDA_PATH': get_config().dirpath,
+            'AIIDA_PROFILE': get_profile().name,
+        }
+        arguments = json.dumps([entry_point, inputs], default=lambda value: value.value)
+        result = subprocess.run(
+            [sys.executable, '-c', GET_BUILDER_HASHES, arguments], env=env, capture_output=True, text=True, check=False
+        )
+        assert result.returncode == 0, result.stderr
+        hashes.append(json.loads(result.stdout.splitlines()[-1]))
+
+    assert hashes[0] == hashes[1]
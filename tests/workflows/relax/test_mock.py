@@ -0,0 +1,242 @@
+"""Tests for the :mod:`aiida_common_workflows.workflows.relax.mock` module."""
+import sys
+
+import pytest
+from aiida import engine, orm, plugins
+from aiida_common_workflows.common import RelaxType
+from aiida_common_workflows.workflows.relax.mock import engine as mock_engine
+
+
+@pytest.fixture
+def generator():
+    return plugins.WorkflowFactory('common_workflows.relax.mock').get_input_generator()
+
+
+@pytest.fixture
+def generate_mock_code(aiida_localhost):
+    """Return a code that runs the mock engine with the current Python interpreter on the localhost."""
+
+    def _generate_mock_code():
+        aiida_localhost.set_default_mpiprocs_per_machine(1)
+        aiida_localhost.set_minimum_job_poll_interval(0)
+        return orm.InstalledCode(
+            label='mock',
+            computer=aiida_localhost,
+            filepath_executable=sys.executable,
+            default_calc_job_plugin='common_workflows.mock',
+        ).store()
+
+    return _generate_mock_code
+
+
+@pytest.fixture
+def default_builder_inputs(generate_mock_code):
+    """Return a dictionary with minimum required inputs for the ``get_builder`` method of the inputs generator."""
+    from ase.build import bulk
+
+    structure = orm.StructureData(ase=bulk('Cu', 'fcc', a=3.7, cubic=True))
+    structure.set_pbc(True)
+
+    return {
+        'structure': structure,
+        'engines': {
+            'relax': {
+                'code': generate_mock_code().uuid,
+                'options': {'resources': {'num_machines': 1, 'num_mpiprocs_per_machine': 1}},
+            }
+        },
+    }
+
+
+def test_get_builder(generator, default_builder_inputs):
+    """Test the ``get_builder`` with default arguments."""
+    builder = generator.get_builder(**default_builder_inputs)
+    assert isinstance(builder, engine.ProcessBuilder)
+    assert builder.mock.parameters.get_dict() == {'relax_type': 'positions', 'threshold_forces': 0.05, 'max_steps': 100}
+
+
+def test_supported_relax_types(generator, default_builder_inputs):
+    """Test calling ``get_builder`` for the supported ``relax_types``."""
+    inputs = default_builder_inputs
+
+    for relax_type in generator.spec().inputs['relax_type'].choices:
+        inputs['relax_type'] = relax_type
+        builder = generator.get_builder(**inputs)
+        assert builder.mock.parameters['relax_type'] == relax_type.value
+
+
+def test_threshold_forces(generator, default_builder_inputs):
+    """Test that the ``threshold_forces`` overrides the value of the protocol."""
+    builder = generator.get_builder(**default_builder_inputs, threshold_forces=0.001)
+    assert builder.mock.parameters['threshold_forces'] == 0.001
+
+
+def test_unsupported_elements(generator, default_builder_inputs, generate_structure):
+    """Test that elements that are not supported by the EMT model raise, unless another model is selected."""
+    inputs = default_builder_inputs
+    inputs['structure'] = generate_structure(symbols=('Si',))
+
+    with pytest.raises(ValueError, match=r'the elements \[\'Si\'\] are not supported by the `emt` model'):
+        generator.get_builder(**inputs)
+
+    with pytest.raises(ValueError, match=r'the elements \[\'Si\'\] are not supported by the `emt` model'):
+        generator.validate(**inputs)
+
+    inputs['engines']['relax']['options']['model'] = 'lennard_jones'
+    assert isinstance(generator.get_builder(**inputs), engine.ProcessBuilder)
+
+
+@pytest.mark.parametrize(
+    'options, message',
+    (
+        ({'model': 'invalid'}, r'unsupported model `invalid`'),
+        ({'latency': -1}, r'the latency should not be negative'),
+        ({'failure_rate': 1.5}, r'the failure rate should be between 0 and 1'),
+    ),
+)
+def test_invalid_options(generator, default_builder_inputs, options, message):
+    """Test that invalid options of the mock engine are detected when the builder is constructed."""
+    default_builder_inputs['engines']['relax']['options'].update(options)
+
+    with pytest.raises(ValueError, match=message):
+        generator.get_builder(**default_builder_inputs)
+
+
+def get_engine_inputs(relax_type='positions_cell', uuid=None, **kwargs):
+    """Return the inputs of the mock engine for a slightly compressed and perturbed copper crystal."""
+    import uuid as uuid_module
+
+    from ase.build import bulk
+
+    atoms = bulk('Cu', 'fcc', a=3.5, cubic=True)
+    atoms.rattle(0.05, seed=1)
+
+    options = {'model': 'emt', 'latency': 0, 'failure_rate': 0, 'seed': None}
+    options.update(kwargs)
+
+    return {
+        'uuid': uuid or str(uuid_module.uuid4()),
+        'symbols': atoms.get_chemical_symbols(),
+        'positions': atoms.positions.tolist(),
+        'cell': atoms.cell.tolist(),
+        'pbc': atoms.pbc.tolist(),
+        'parameters': {'relax_type': relax_type, 'threshold_forces': 0.01, 'max_steps': 200},
+        'options': options,
+    }
+
+
+@pytest.mark.parametrize('model', mock_engine.MODELS)
+@pytest.mark.parametrize('relax_type', ('none', 'positions', 'positions_cell', 'positions_shape'))
+def test_engine_run(model, relax_type):
+    """Test the ``run`` function of the mock engine for all models and relax types."""
+    import numpy
+
+    inputs = get_engine_inputs(relax_type, model=model)
+    results = mock_engine.run(inputs)
+
+    assert results['converged']
+    assert numpy.array(results['stress']).shape == (3, 3)
+
+    volume_initial = abs(numpy.linalg.det(inputs['cell']))
+    volume_final = abs(numpy.linalg.det(results['cell']))
+
+    if relax_type == 'none':
+        assert results['number_of_steps'] == 0
+        assert results['positions'] == inputs['positions']
+    else:
+        assert numpy.abs(results['forces']).max() < 0.01
+
+    if relax_type in ('none', 'positions', 'positions_shape'):
+        assert volume_final == pytest.approx(volume_initial)
+    else:
+        assert volume_final != pytest.approx(volume_initial)
+
+
+def test_engine_failure_rate():
+    """Test that the mock engine fails with the configured failure rate."""
+    assert 'error' in mock_engine.run(get_engine_inputs(failure_rate=1))
+    assert 'error' not in mock_engine.run(get_engine_inputs(failure_rate=0))
+
+    failures = sum(
+        'error' in mock_engine.run(get_engine_inputs('none', failure_rate=0.5, seed=seed)) for seed in range(100)
+    )
+    assert 30 < failures < 70
+
+
+def test_engine_seed():
+    """Test that the failures of the mock engine are reproducible per calculation but independent between them."""
+    outcomes = ['error' in mock_engine.run(get_engine_inputs('none', failure_rate=0.5, seed=1)) for _ in range(100)]
+    assert 30 < sum(outcomes) < 70
+
+    inputs = get_engine_inputs('none', failure_rate=0.5, seed=1)
+    assert len({'error' in mock_engine.run(inputs) for _ in range(10)}) == 1
+
+
+def test_engine_latency(monkeypatch):
+    """Test that the mock engine sleeps for the configured latency."""
+    slept = []
+    monkeypatch.setattr(mock_engine.time, 'sleep', slept.append)
+    mock_engine.run(get_engine_inputs('none', latency=2.5))
+    assert slept == [2.5]
+
+
+def test_run(generator, default_builder_inputs):
+    """Test running the ``MockCommonRelaxWorkChain`` through the direct scheduler on the localhost."""
+    default_builder_inputs['relax_type'] = RelaxType.POSITIONS_CELL
+    builder = generator.get_builder(**default_builder_inputs)
+
+    results, node = engine.run_get_node(builder)
+
+    assert node.is_finished_ok, node.exit_status
+    assert set(results) == {'total_energy', 'forces', 'stress', 'relaxed_structure', 'remote_folder'}
+    assert results['relaxed_structure'].get_cell_volume() != pytest.approx(builder.mock.structure.get_cell_volume())
+
+
+@pytest.mark.parametrize('policy, is_cleaned', (({}, False), ({'keep_outputs': False}, True)))
+def test_run_cleanup(generator, default_builder_inputs, policy, is_cleaned):
+    """Test the ``cleanup`` policy cleans the remote folders once the ``MockCommonRelaxWorkChain`` finished.
+
+    By default, the ``remote_folder`` output is kept such that a bands workflow can still continue from it.
+    """
+    builder = generator.get_builder(**default_builder_inputs)
+    builder.cleanup = policy
+
+    results, node = engine.run_get_node(builder)
+
+    assert node.is_finished_ok, node.exit_status
+    assert results['remote_folder'].is_cleaned is is_cleaned
+
+
+def test_run_failure(generator, default_builder_inputs):
+    """Test that an injected failure of the mock engine is reported by the ``MockCommonRelaxWorkChain``."""
+    default_builder_inputs['engines']['relax']['options']['failure_rate'] = 1
+    builder = generator.get_builder(**default_builder_inputs)
+
+    _, node = engine.run_get_node(builder)
+
+    assert node.exit_status == 400
+    assert node.called[0].exit_status == 402
+    assert all(calculation.exit_status == 400 for calculation in node.called[0].called)
+
+
+def test_resubmit(generator, default_builder_inputs, generate_workchain, generate_failed_workchain):
+    """Test the ``MockCommonRelaxWorkChain`` is resubmitted with scaled resources if it exhausted its resources."""
+    default_builder_inputs['engines']['relax']['options']['max_wallclock_seconds'] = 600
+    builder = generator.get_builder(**default_builder_inputs)
+    builder.resubmission = {'max_resubmissions': 2, 'max_wallclock_seconds': 1000}
+
+    process = generate_workchain('common_workflows.relax.mock', builder._inputs(prune=True))
+    process.setup()
+
+    assert not process.resubmit(generate_failed_workchain('ERROR_INJECTED_FAILURE'))
+
+    assert process.resubmit(generate_failed_workchain('ERROR_SCHEDULER_OUT_OF_WALLTIME'))
+    assert process.ctx.inputs.mock.metadata.options['max_wallclock_seconds'] == 1000
+
+    assert not process.resubmit(generate_failed_workchain('ERROR_SCHEDULER_OUT_OF_WALLTIME'))
+
+    assert process.resubmit(generate_failed_workchain('ERROR_SCHEDULER_OUT_OF_MEMORY'))
+    assert process.ctx.inputs.mock.metadata.options['resources']['num_machines'] == 2
+    assert process.ctx.resubmissions == 2
+
+    assert not process.resubmit(generate_failed_workchain('ERROR_SCHEDULER_OUT_OF_MEMORY'))
@@ -1,6 +1,6 @@
 """Tests for the :mod:`aiida_common_workflows.workflows.relax.quantum_espresso` module."""
 import pytest
-from aiida import engine, plugins
+from aiida import engine, orm, plugins
 from aiida_common_workflows.workflows.relax.generator import ElectronicType, RelaxType, SpinType
 
 
@@ -205,3 +205,75 @@ def test_magnetization_per_site(generator, generate_code, generate_structure):
         spin_type=SpinType.COLLINEAR,
     )
     assert builder['base']['pw']['parameters']['SYSTEM']['starting_magnetization'] == {'Si': 0.0, 'Ge': 0.025}
+
+
+def test_create_magnetic_allotrope(generate_structure):
+    """Test the ``create_magnetic_allotrope`` function creates the kinds in a deterministic order."""
+    from aiida_common_workflows.workflows.relax.quantum_espresso.generator import create_magnetic_allotrope
+
+    structure = generate_structure(symbols=('Fe', 'Fe', 'Co', 'Fe'))
+    allotrope, magnetic_moments = create_magnetic_allotrope(structure, [2.0, -2.0, 1.0, 2.0])
+
+    assert [site.kind_name for site in allotrope.sites] == ['Co', 'Fe0', 'Fe1', 'Fe0']
+    assert magnetic_moments == {'Co': 1.0, 'Fe0': 2.0, 'Fe1': -2.0}
+
+
+@pytest.mark.usefixtures('sssp')
+def test_validate(generator, default_builder_inputs):
+    """Test the ``validate`` method for the constraints that are specific to Quantum ESPRESSO."""
+    inputs = default_builder_inputs
+    generator.validate(**inputs)
+
+    inputs['fixed_total_cell_magnetization'] = 1.0
+    with pytest.raises(ValueError, match=r'can only be used when `spin_type` is set to `SpinType.COLLINEAR`'):
+        generator.validate(**inputs)
+
+    inputs['spin_type'] = SpinType.COLLINEAR
+    generator.validate(**inputs)
+
+
+@pytest.mark.usefixtures('sssp')
+def test_walltime_margin(generator, default_builder_inputs):
+    """Test the ``max_seconds`` is set to the ``max_wallclock_seconds`` minus the ``walltime_margin``."""
+    builder = generator.get_builder(**default_builder_inputs)
+    assert 'max_seconds' not in builder.base.pw.parameters['CONTROL']
+
+    default_builder_inputs['engines']['relax']['options']['max_wallclock_seconds'] = 3600
+    builder = generator.get_builder(**default_builder_inputs, walltime_margin=600)
+    assert builder.base.pw.parameters['CONTROL']['max_seconds'] == 3000
+    assert builder.base_final_scf.pw.parameters['CONTROL']['max_seconds'] == 3000
+
+
+@pytest.mark.usefixtures('sssp')
+def test_resubmit_walltime(generator, default_builder_inputs, generate_workchain, generate_failed_workchain):
+    """Test the ``max_seconds`` grows with the ``max_wallclock_seconds`` when resubmitted after a timeout."""
+    from aiida.orm.utils import serialize
+
+    default_builder_inputs['engines']['relax']['options']['max_wallclock_seconds'] = 3600
+    builder = generator.get_builder(**default_builder_inputs, walltime_margin=600)
+
+    process = generate_workchain('common_workflows.relax.quantum_espresso', builder._inputs(prune=True))
+    process.setup()
+
+    assert process.resubmit(generate_failed_workchain('ERROR_SCHEDULER_OUT_OF_WALLTIME'))
+
+    for namespace in ('base', 'base_final_scf'):
+        assert process.ctx.inputs[namespace]['pw']['metadata']['options']['max_wallclock_seconds'] == 7200
+        assert process.ctx.inputs[namespace]['pw']['parameters']['CONTROL']['max_seconds'] == 6600
+
+    serialize.serialize(process.ctx.inputs)
+
+    inputs = process.get_workchain_inputs()
+    assert isinstance(process.ctx.inputs['base']['pw']['parameters'], dict)
+    assert isinstance(inputs['base']['pw']['parameters'], orm.Dict)
+    assert inputs['base']['pw']['parameters']['CONTROL']['max_seconds'] == 6600
+
+
+@pytest.mark.usefixtures('sssp')
+def test_validate_pseudo_family(generator, default_builder_inputs):
+    """Test the ``validate`` method checks that the pseudo family of the protocol is installed."""
+    generator.validate(**default_builder_inputs)
+
+    default_builder_inputs['protocol'] = 'precise'
+    with pytest.raises(ValueError, match=r'required pseudo family `.*` is not installed.'):
+        generator.validate(**default_builder_inputs)
@@ -71,3 +71,25 @@ def test_supported_spin_types(generator, default_builder_inputs):
         inputs['spin_type'] = spin_type
         builder = generator.get_builder(**inputs)
         assert isinstance(builder, engine.ProcessBuilder)
+
+
+@pytest.mark.usefixtures('psml_family')
+def test_walltime_margin(generator, default_builder_inputs):
+    """Test the ``max-walltime-slack`` is set to the ``walltime_margin``."""
+    builder = generator.get_builder(**default_builder_inputs, walltime_margin=600)
+    assert builder.parameters['max-walltime-slack'] == '600 s'
+
+
+@pytest.mark.usefixtures('psml_family')
+def test_resubmit_walltime(generator, default_builder_inputs, generate_workchain, generate_failed_workchain):
+    """Test the ``max-walltime-slack`` follows the ``max_wallclock_seconds`` when resubmitted after a timeout."""
+    default_builder_inputs['engines']['relax']['options']['max_wallclock_seconds'] = 1000
+    builder = generator.get_builder(**default_builder_inputs, walltime_margin=600)
+    assert builder.parameters['max-walltime-slack'] == '500 s'
+
+    process = generate_workchain('common_workflows.relax.siesta', builder._inputs(prune=True))
+    process.setup()
+
+    assert process.resubmit(generate_failed_workchain('ERROR_SCHEDULER_OUT_OF_WALLTIME'))
+    assert process.ctx.inputs.options['max_wallclock_seconds'] == 2000
+    assert process.ctx.inputs.parameters['max-walltime-slack'] == '600 s'
@@ -66,3 +66,43 @@ def test_supported_spin_types(generator, default_builder_inputs):
         inputs['spin_type'] = spin_type
         builder = generator.get_builder(**inputs)
         assert isinstance(builder, engine.ProcessBuilder)
+
+
+def test_walltime_margin(generator, default_builder_inputs):
+    """Test a ``STOPCAR`` is written once the ``max_wallclock_seconds`` minus the ``walltime_margin`` has passed."""
+    builder = generator.get_builder(**default_builder_inputs)
+    assert 'prepend_text' not in builder.vasp.calc.metadata.options
+
+    options = default_builder_inputs['engines']['relax']['options']
+    options.update({'max_wallclock_seconds': 3600, 'prepend_text': 'module load vasp'})
+    builder = generator.get_builder(**default_builder_inputs, walltime_margin=600)
+    prepend_text = builder.vasp.calc.metadata.options['prepend_text'].splitlines()
+    assert prepend_text[0] == 'module load vasp'
+    assert prepend_text[1].startswith("(sleep 3000 && echo 'LSTOP = .TRUE.' > STOPCAR) &")
+    assert 'kill' in builder.vasp.calc.metadata.options['append_text']
+
+
+def test_resubmit_walltime(generator, default_builder_inputs, generate_workchain, generate_failed_workchain):
+    """Test the ``STOPCAR`` is written later when resubmitted with a scaled ``max_wallclock_seconds``."""
+    default_builder_inputs['engines']['relax']['options']['max_wallclock_seconds'] = 3600
+    builder = generator.get_builder(**default_builder_inputs, walltime_margin=600)
+
+    process = generate_workchain('common_workflows.relax.vasp', builder._inputs(prune=True))
+    process.setup()
+
+    assert process.resubmit(generate_failed_workchain('ERROR_SCHEDULER_OUT_OF_WALLTIME'))
+
+    options = process.ctx.inputs.vasp['calc']['metadata']['options']
+    assert options['max_wallclock_seconds'] == 7200
+    assert options['prepend_text'].startswith("(sleep 6600 && echo 'LSTOP = .TRUE.' > STOPCAR) &")
+
+
+def test_retrieval_minimal(generator, default_builder_inputs):
+    """Test the minimal ``retrieval`` only parses the quantities needed for the outputs."""
+    builder = generator.get_builder(**default_builder_inputs)
+    assert 'exclude_quantity' not in builder.vasp.settings['parser_settings']
+
+    builder = generator.get_builder(**default_builder_inputs, retrieval='minimal')
+    parser_settings = builder.vasp.settings['parser_settings']
+    assert parser_settings['energy_type'] == ['energy_free']
+    assert parser_settings['exclude_quantity'] == ['band_properties']